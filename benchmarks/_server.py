@@ -0,0 +1,55 @@
+"""
+Local stand-in for the OFAuth API, used by the benchmarks.
+
+Serves a fixed JSON body for every request over HTTP/1.1 keep-alive, so
+results measure the SDK and the connection pool rather than the network.
+"""
+import json
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+
+@contextmanager
+def stand_in_server(payload: Any = None, latency: float = 0.0) -> Iterator[str]:
+    """Run a server in a background thread; yields its base URL."""
+    body = json.dumps(payload if payload is not None else {"ok": True}).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _reply(self, send_body: bool) -> None:
+            length = int(self.headers.get("content-length") or 0)
+            if length:
+                self.rfile.read(length)
+            if latency:
+                threading.Event().wait(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            self._reply(True)
+
+        do_POST = do_PUT = do_GET
+
+        def do_HEAD(self) -> None:
+            self._reply(False)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,61 @@
+"""
+Request-body encoding cost for pydantic request models.
+
+Encodes a mass message (``models.V2AccessMassMessagesPostRequest``) with
+thousands of ``userIds`` the ways a caller could, next to ``encode_body``
+(what the clients use) and the same body as a plain dict.
+
+    python benchmarks/bench_body.py [--repeat 50] [--users 1000 10000 100000]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from onlyfans_sdk import models  # noqa: E402
+from onlyfans_sdk.codec import default_codec, encode_body  # noqa: E402
+
+
+def mass_message(users: int) -> dict:
+    return {
+        "text": "New set just dropped! 🔥 Unlock it below.",
+        "mediaItems": [9000001, 9000002, "https://cdn.example.com/teaser.jpg"],
+        "price": 14.99,
+        "previewMediaCount": 1,
+        "userIds": list(range(100000, 100000 + users)),
+        "excludeUserLists": [1, 2],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    codec = default_codec()
+    dump = {"by_alias": True, "exclude_none": True}
+    print(f"codec: {codec.name}\n")
+    print(f"{'userIds':>8}  {'method':<44}{'ms':>9}{'size':>10}")
+    for users in args.users:
+        payload = mass_message(users)
+        model = models.V2AccessMassMessagesPostRequest.model_validate(payload)
+        methods = {
+            "json.dumps(model.model_dump(...))": lambda: json.dumps(model.model_dump(**dump)).encode(),
+            f"{codec.name} encode(model.model_dump(...))": lambda: codec.encode(model.model_dump(**dump)),
+            "model.model_dump_json(...).encode()": lambda: model.model_dump_json(**dump).encode(),
+            "encode_body(model)": lambda: encode_body(model, codec),
+            "encode_body(dict)": lambda: encode_body(payload, codec),
+        }
+        for name, encode in methods.items():
+            size = len(encode())
+            elapsed = timeit.timeit(encode, number=args.repeat) / args.repeat * 1000
+            print(f"{users:>8}  {name:<44}{elapsed:>9.3f}{size // 1024:>8}KB")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+JSON decode/encode cost per codec on representative payloads.
+
+Compares the codecs in ``onlyfans_sdk.codec`` that are installed, plus
+httpx's ``Response.json()`` (what the client used before codecs), on
+synthetic pages shaped like transactions, chats with users and vault
+media batches.
+
+    python benchmarks/bench_codec.py [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from onlyfans_sdk.codec import MsgspecCodec, OrjsonCodec, StdlibCodec  # noqa: E402
+
+
+def _user(i: int) -> dict:
+    return {
+        "id": 100000 + i,
+        "username": f"fan_{i}",
+        "name": f"Fan Number {i} 🌟",
+        "avatar": f"https://public.onlyfans.com/files/{i}/avatar.jpg",
+        "isVerified": i % 3 == 0,
+        "subscribedBy": True,
+        "subscribedByData": {"price": 9.99, "status": "active", "renewedAt": "2024-05-01T10:00:00+00:00"},
+        "lists": [{"id": j, "name": f"list {j}"} for j in range(3)],
+    }
+
+
+def transactions_page(n: int = 100) -> dict:
+    return {
+        "list": [
+            {
+                "id": f"tx_{i:08d}",
+                "amount": 12.5 + i,
+                "net": 10.0 + i,
+                "fee": 2.5,
+                "currency": "USD",
+                "createdAt": "2024-05-01T10:00:00+00:00",
+                "description": "Tip from <a href='https://onlyfans.com/fan'>fan</a>",
+                "status": "done",
+                "user": _user(i),
+            }
+            for i in range(n)
+        ],
+        "hasMore": True,
+        "nextMarker": "1714557600",
+    }
+
+
+def chats_page(n: int = 50) -> dict:
+    return {
+        "list": [
+            {
+                "withUser": _user(i),
+                "unreadMessagesCount": i % 5,
+                "lastMessage": {
+                    "id": 5000000 + i,
+                    "text": "Hey! " * 20,
+                    "price": 0,
+                    "media": [{"id": j, "type": "photo", "canView": True} for j in range(2)],
+                    "createdAt": "2024-05-01T10:00:00+00:00",
+                },
+            }
+            for i in range(n)
+        ],
+        "hasMore": False,
+        "nextOffset": n,
+    }
+
+
+def vault_batch(n: int = 200) -> dict:
+    return {
+        "items": [
+            {
+                "id": 9000000 + i,
+                "type": "video" if i % 4 == 0 else "photo",
+                "duration": 31.5,
+                "createdAt": "2024-05-01T10:00:00+00:00",
+                "files": {
+                    size: {"url": f"https://cdn.example.com/{i}/{size}.jpg", "width": w, "height": w}
+                    for size, w in (("thumb", 300), ("preview", 960), ("full", 2048))
+                },
+                "counters": {"likesCount": i, "tipsSumm": 0.0},
+            }
+            for i in range(n)
+        ],
+        "nextCursor": "eyJvZmZzZXQiOjIwMH0=",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    codecs = [StdlibCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"({codec_class.__name__} skipped: not installed)")
+
+    payloads = {
+        "transactions x100": transactions_page(),
+        "chats x50": chats_page(),
+        "vault batch x200": vault_batch(),
+    }
+    print(f"\n{'payload':<20}{'size':>9}  {'codec':<16}{'decode µs':>11}{'encode µs':>11}")
+    for name, payload in payloads.items():
+        raw = StdlibCodec().encode(payload)
+        response = httpx.Response(200, content=raw, headers={"content-type": "application/json"})
+        baseline = timeit.timeit(response.json, number=args.repeat) / args.repeat * 1e6
+        print(f"{name:<20}{len(raw) // 1024:>7}KB  {'Response.json()':<16}{baseline:>11.0f}{'':>11}")
+        for codec in codecs:
+            decode = timeit.timeit(lambda: codec.decode(raw), number=args.repeat) / args.repeat * 1e6
+            encode = timeit.timeit(lambda: codec.encode(payload), number=args.repeat) / args.repeat * 1e6
+            print(f"{'':<20}{'':>9}  {codec.name:<16}{decode:>11.0f}{encode:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Import-time regression benchmark.
+
+Times common entry points of the package, each in a fresh interpreter, and
+checks that the light ones do not drag in the generated models. Exits
+non-zero when a check fails or a median exceeds ``--budget-ms``, so it can
+run in CI.
+
+    python benchmarks/bench_import.py [--runs 7] [--budget-ms 250]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# (statement, modules that must NOT be loaded afterwards, counts against the budget)
+CASES = [
+    ("import onlyfans_sdk", ["onlyfans_sdk.models", "httpx"], True),
+    ("from onlyfans_sdk import webhooks", ["onlyfans_sdk.models", "httpx"], True),
+    ("from onlyfans_sdk import OFAuthClient", ["onlyfans_sdk.models"], True),
+    ("from onlyfans_sdk import users, messages, earnings", ["onlyfans_sdk.models"], True),
+    ("from onlyfans_sdk.models import V2AccessEarningsTransactionsGetResponse", ["onlyfans_sdk.models.messages"], False),
+    ("from onlyfans_sdk.models import *", [], False),
+]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str, forbidden: list) -> dict:
+    code = PROBE.format(statement=statement, forbidden=forbidden)
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if a light import is slower")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'statement':<76}{'median ms':>10}{'min ms':>9}  check")
+    for statement, forbidden, budgeted in CASES:
+        results = [measure(statement, forbidden) for _ in range(args.runs)]
+        times = [result["ms"] for result in results]
+        loaded = sorted({name for result in results for name in result["loaded"]})
+        median = statistics.median(times)
+        problems = [f"loaded {name}" for name in loaded]
+        if budgeted and args.budget_ms is not None and median > args.budget_ms:
+            problems.append(f"over {args.budget_ms:.0f} ms budget")
+        failed = failed or bool(problems)
+        print(f"{statement:<76}{median:>10.1f}{min(times):>9.1f}  {', '.join(problems) or 'ok'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Requests/second at different connection pool settings.
+
+Runs concurrent ``client.request`` calls from a thread pool against a local
+stand-in server, for a few pool configurations, with and without warm-up.
+
+    python benchmarks/bench_pool.py [--threads 32] [--requests 2000] [--latency 0.005]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from onlyfans_sdk import OFAuthClient  # noqa: E402
+
+from _server import stand_in_server  # noqa: E402
+
+CONFIGS = [
+    ("no keep-alive", dict(max_connections=100, max_keepalive_connections=0)),
+    ("pool 4", dict(max_connections=4, max_keepalive_connections=4)),
+    ("pool 16", dict(max_connections=16, max_keepalive_connections=16)),
+    ("default (100/20)", dict()),
+    ("pool 64", dict(max_connections=64, max_keepalive_connections=64)),
+]
+
+
+def run(base_url: str, options: dict, threads: int, requests: int, warm: bool) -> float:
+    with OFAuthClient(api_key="bench", base_url=base_url, **options) as client:
+        if warm:
+            client.warm_up(min(threads, options.get("max_keepalive_connections", 20)) or 1)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: client.request("GET", "/v2/access/self"), range(requests)))
+        return requests / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.005, help="server delay per request (s)")
+    args = parser.parse_args()
+
+    with stand_in_server({"id": 1, "username": "creator"}, latency=args.latency) as base_url:
+        print(f"{args.threads} threads, {args.requests} requests, {args.latency * 1000:.0f} ms server latency\n")
+        print(f"{'pool':<20}{'cold req/s':>12}{'warm req/s':>12}")
+        for name, options in CONFIGS:
+            cold = run(base_url, options, args.threads, args.requests, warm=False)
+            warm = run(base_url, options, args.threads, args.requests, warm=True)
+            print(f"{name:<20}{cold:>12.0f}{warm:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
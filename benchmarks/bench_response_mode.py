@@ -0,0 +1,146 @@
+"""
+Cost of each client ``response_mode`` on representative list pages.
+
+Calls ``earnings.list_transactions`` and ``messages.list_chats`` through an
+``OFAuthClient`` whose transport answers from memory, so the numbers are
+the SDK's own per-call cost (decode + parse), with no network. The second
+column adds reading two fields of every item, the typical paging loop,
+which is where ``lazy`` views differ from the other modes.
+
+    python benchmarks/bench_response_mode.py [--repeat 200] [--items 100]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from onlyfans_sdk import OFAuthClient, earnings, messages  # noqa: E402
+from onlyfans_sdk.codec import StdlibCodec  # noqa: E402
+
+MODES = ("raw", "validated", "trusted", "lazy")
+
+
+def transactions_page(n: int) -> dict:
+    return {
+        "list": [
+            {
+                "id": f"tx_{i:08d}",
+                "type": "tip",
+                "createdAt": "2024-05-01T10:00:00+00:00",
+                "amounts": {"gross": 12.5 + i, "net": 10.0 + i, "fee": 2.5, "vat": 0.0, "tax": 0.0},
+                "currency": "USD",
+                "description": "Tip from <a href='https://onlyfans.com/fan'>fan</a>",
+                "status": "done",
+                "payoutPendingDays": 7,
+                "user": {
+                    "id": 100000 + i,
+                    "name": f"Fan Number {i}",
+                    "username": f"fan_{i}",
+                    "avatar": f"https://public.onlyfans.com/files/{i}/avatar.jpg",
+                },
+            }
+            for i in range(n)
+        ],
+        "hasMore": True,
+        "nextMarker": 1714557600,
+    }
+
+
+def _media(i: int) -> dict:
+    return {
+        "id": 9000000 + i,
+        "type": "photo",
+        "convertedToVideo": False,
+        "canView": True,
+        "hasError": False,
+        "createdAt": "2024-05-01T10:00:00+00:00",
+        "isReady": True,
+        "releaseForms": [],
+        "files": {
+            "full": {"url": f"https://cdn.example.com/{i}/full.jpg", "width": 2048, "height": 2048, "sources": []},
+            "thumb": {"url": f"https://cdn.example.com/{i}/thumb.jpg", "width": 300, "height": 300},
+        },
+    }
+
+
+def chats_page(n: int) -> dict:
+    return {
+        "list": [
+            {
+                "withUser": {"id": 100000 + i, "_view": "s"},
+                "canSendMessage": True,
+                "unreadMessagesCount": i % 5,
+                "hasUnreadTips": False,
+                "lastMessage": {
+                    "id": 5000000 + i,
+                    "text": "Hey! " * 20,
+                    "fromUser": {"id": 100000 + i, "_view": "s"},
+                    "media": [_media(j) for j in range(2)],
+                    "previews": [],
+                    "isFree": True,
+                    "createdAt": "2024-05-01T10:00:00+00:00",
+                },
+            }
+            for i in range(n)
+        ],
+        "hasMore": False,
+        "nextOffset": n,
+    }
+
+
+def read_transaction(item):
+    if isinstance(item, dict):
+        return item["id"], item["amounts"]["net"]
+    return item.id, item.amounts.net
+
+
+def read_chat(item):
+    if isinstance(item, dict):
+        return item["withUser"]["id"], item["lastMessage"]["text"]
+    return item.withUser.id, item.lastMessage.text
+
+
+def read_page(page, read) -> list:
+    items = page["list"] if isinstance(page, dict) else page.list
+    return [read(item) for item in items]
+
+
+def client_for(body: bytes, mode: str) -> OFAuthClient:
+    headers = {"content-type": "application/json"}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body, headers=headers))
+    return OFAuthClient(api_key="bench", transport=transport, response_mode=mode)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--items", type=int, default=100, help="items per page")
+    args = parser.parse_args()
+
+    cases = {
+        f"transactions x{args.items}": (earnings.list_transactions, transactions_page(args.items), read_transaction),
+        f"chats x{args.items}": (messages.list_chats, chats_page(args.items), read_chat),
+    }
+    print(f"{'payload':<22}{'mode':<12}{'µs/call':>10}{'vs raw':>9}{'+ read 2 fields':>17}{'vs raw':>9}")
+    for name, (fetch, payload, read) in cases.items():
+        body = StdlibCodec().encode(payload)
+        raw = raw_read = None
+        for mode in MODES:
+            client = client_for(body, mode)
+            read_page(fetch(client), read)  # build validators, plans and views outside the timing
+            elapsed = timeit.timeit(lambda: fetch(client), number=args.repeat) / args.repeat * 1e6
+            with_read = timeit.timeit(lambda: read_page(fetch(client), read), number=args.repeat) / args.repeat * 1e6
+            raw, raw_read = raw or elapsed, raw_read or with_read
+            print(
+                f"{name:<22}{mode:<12}{elapsed:>10.0f}{elapsed / raw:>8.1f}x"
+                f"{with_read:>17.0f}{with_read / raw_read:>8.1f}x"
+            )
+            client.close()
+
+
+if __name__ == "__main__":
+    main()
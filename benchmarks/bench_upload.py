@@ -0,0 +1,94 @@
+"""
+Peak memory and wall time of ``upload_media`` by file size and workers.
+
+Uploads temporary files of each size in parts through an ``OFAuthClient``
+whose transport answers from memory after a simulated per-part latency,
+passing the file as bytes, as a path and as an open file, and reports the
+peak Python allocation during each upload (``tracemalloc``). Streamed inputs
+should stay near ``workers`` parts whatever the file size.
+
+    python benchmarks/bench_upload.py [--sizes 16 64 256] [--part-size 5] [--workers 1 4] [--latency 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from onlyfans_sdk import OFAuthClient  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def client_for(part_size: int, latency: float) -> OFAuthClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/init"):
+            filesize = int(request.content.split(b'"filesize":')[1].split(b",")[0])
+            headers = {
+                "x-ofauth-upload-total-parts": str(max(1, -(-filesize // part_size))),
+                "x-ofauth-upload-part-size": str(part_size),
+            }
+            return httpx.Response(200, json={"mediaUploadId": "upl_bench"}, headers=headers)
+        if "/parts/" in request.url.path:
+            time.sleep(latency)
+        return httpx.Response(200, json={"mediaId": 1})
+
+    return OFAuthClient(api_key="bench", transport=httpx.MockTransport(handler))
+
+
+def measure(upload) -> tuple:
+    """(peak MB, seconds) of one upload"""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        upload()
+        return tracemalloc.get_traced_memory()[1] / MB, time.perf_counter() - start
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256], help="file sizes in MB")
+    parser.add_argument("--part-size", type=int, default=5, help="part size in MB")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="parts in flight")
+    parser.add_argument("--latency", type=float, default=20, help="simulated ms per part")
+    args = parser.parse_args()
+
+    client = client_for(args.part_size * MB, args.latency / 1000)
+    print(f"part size: {args.part_size} MB, {args.latency:g} ms per part\n")
+    print(f"{'file':>8}  {'input':<10}{'workers':>8}{'peak MB':>10}{'s':>8}")
+    for size in args.sizes:
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
+            for _ in range(size):
+                f.write(os.urandom(MB))
+        try:
+            def as_bytes(workers):
+                with open(f.name, "rb") as src:
+                    data = src.read()
+                client.upload_media("conn_bench", "bench.mp4", data, "video/mp4", workers=workers)
+
+            def as_path(workers):
+                client.upload_media("conn_bench", "bench.mp4", f.name, "video/mp4", workers=workers)
+
+            def as_file(workers):
+                with open(f.name, "rb") as src:
+                    client.upload_media("conn_bench", "bench.mp4", src, "video/mp4", workers=workers)
+
+            for name, upload in {"bytes": as_bytes, "path": as_path, "file": as_file}.items():
+                for workers in args.workers:
+                    peak, elapsed = measure(lambda: upload(workers))
+                    print(f"{size:>6}MB  {name:<10}{workers:>8}{peak:>10.1f}{elapsed:>8.2f}")
+        finally:
+            os.unlink(f.name)
+        print()
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
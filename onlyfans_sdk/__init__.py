@@ -2,42 +2,114 @@
 OFAuth Python SDK v2
 
 Includes Pydantic models for type-safe API responses.
+
+Everything here is imported lazily on first attribute access, so
+``from onlyfans_sdk import webhooks`` or ``from onlyfans_sdk import
+OFAuthClient`` does not load every resource module or build the model
+graph.
 """
-from ._client import OFAuthClient, OFAuthError, BASE_URL
-
-# Import all API modules
-from . import account
-from . import self
-from . import earnings
-from . import analytics
-from . import posts
-from . import messages
-from . import subscribers
-from . import subscriptions
-from . import promotions
-from . import users
-from . import user_lists
-from . import vault
-from . import vault_lists
-from . import upload
-from . import link
-from . import dynamic_rules
-from . import vault_store
-from . import vault_stats
-from . import vault_media
-
-# Import generated Pydantic models for type safety
-from . import models
-
-# Import webhook utilities
-from . import webhooks
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from ._client import OFAuthClient, AsyncOFAuthClient, OFAuthError, BASE_URL
+    from .retry import RetryPolicy
+    from .ratelimit import RateLimit, RateLimiter
+    from .cache import ResponseCache
+    from .middleware import Middleware
+    from . import (
+        account,
+        self,
+        earnings,
+        analytics,
+        posts,
+        messages,
+        subscribers,
+        subscriptions,
+        promotions,
+        users,
+        user_lists,
+        vault,
+        vault_lists,
+        upload,
+        link,
+        dynamic_rules,
+        vault_store,
+        vault_stats,
+        vault_media,
+        models,
+        pagination,
+        webhooks,
+    )
+
+# Public names defined in submodules, by submodule
+_ATTRIBUTES = {
+    "OFAuthClient": "._client",
+    "AsyncOFAuthClient": "._client",
+    "OFAuthError": "._client",
+    "BASE_URL": "._client",
+    "RetryPolicy": ".retry",
+    "RateLimit": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "ResponseCache": ".cache",
+    "Middleware": ".middleware",
+}
+
+# API modules, generated Pydantic models, pagination engine and webhook utilities
+_SUBMODULES = {
+    "account",
+    "self",
+    "earnings",
+    "analytics",
+    "posts",
+    "messages",
+    "subscribers",
+    "subscriptions",
+    "promotions",
+    "users",
+    "user_lists",
+    "vault",
+    "vault_lists",
+    "upload",
+    "link",
+    "dynamic_rules",
+    "vault_store",
+    "vault_stats",
+    "vault_media",
+    "models",
+    "pagination",
+    "webhooks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ATTRIBUTES:
+        value = getattr(import_module(_ATTRIBUTES[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "OFAuthClient",
+    "AsyncOFAuthClient",
     "OFAuthError",
     "BASE_URL",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "Middleware",
     "models",
     "webhooks",
+    "pagination",
     "account",
     "self",
     "earnings",
@@ -1,12 +1,33 @@
 """
 OFAuth Python SDK v2 - Minimal, direct API client
 """
-from typing import Any, Dict, Optional, Union, BinaryIO
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union, BinaryIO
+import asyncio
 import json
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import httpx
 
+from .cache import ResponseCache
+from .codec import JSONCodec, default_codec, encode_body
+from .middleware import (
+    Middleware,
+    Request,
+    Response,
+    build_async_pipeline,
+    build_pipeline,
+    default_middleware,
+)
+from .metrics import InstrumentationMiddleware, RequestEvent
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
 BASE_URL = "https://api-next.ofauth.com"
 
+RESPONSE_MODES = ("raw", "validated", "trusted", "lazy")
+
 
 class OFAuthError(Exception):
     """OFAuth API error"""
@@ -17,20 +38,330 @@ class OFAuthError(Exception):
         self.details = details
 
 
-class OFAuthClient:
-    """OFAuth API Client"""
+def _proxy_path(path: str) -> str:
+    """Map an OnlyFans API path onto the OFAuth proxy endpoint"""
+    # Strip /api2/v2 prefix if present
+    target_path = path
+    if target_path.startswith('/api2/v2'):
+        target_path = target_path[8:]
+    elif target_path.startswith('api2/v2'):
+        target_path = '/' + target_path[7:]
+    
+    # Ensure path starts with /
+    if not target_path.startswith('/'):
+        target_path = '/' + target_path
+    
+    return f"/v2/access/proxy{target_path}"
+
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$")
+
+
+def _endpoint_template(path: str) -> str:
+    """Best-effort template for a path without one: numeric and UUID segments become {id}"""
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _proxy_endpoint(proxy_path: str) -> str:
+    """Template for a proxied path: the OnlyFans resource, with anything below it collapsed to *"""
+    target = proxy_path[len("/v2/access/proxy/"):].partition("?")[0]
+    resource, _, rest = target.partition("/")
+    return f"/v2/access/proxy/{resource}/*" if rest else f"/v2/access/proxy/{resource}"
+
+
+def _raise_for_status(response: Response, default_message: Optional[str] = None) -> None:
+    """Raise OFAuthError for a non-2xx response"""
+    if response.is_success:
+        return
+    try:
+        error_body = response.json()
+    except Exception:
+        error_body = {}
+    if not isinstance(error_body, dict):
+        error_body = {}
+    raise OFAuthError(
+        status=response.status_code,
+        message=error_body.get("message", default_message or f"HTTP {response.status_code}"),
+        code=error_body.get("code"),
+        details=error_body.get("details"),
+    )
+
+
+class _UploadSource:
+    """
+    The bytes of an upload, read one part at a time.
+
+    Paths are opened here and closed by ``close()``; file objects are read
+    from their current position and left open. Bytes-like input is sliced
+    through a ``memoryview``, so only the part being sent is copied. Reads
+    are safe from several threads at once (parallel part uploads).
+    """
+
+    def __init__(self, file: Any):
+        self._data: Optional[memoryview] = None
+        self._file: Optional[BinaryIO] = None
+        self._owned = False
+        self._offset = 0
+        self._lock = threading.Lock()
+        if isinstance(file, (bytes, bytearray, memoryview)):
+            self._data = memoryview(file).cast("B")
+            self.size = self._data.nbytes
+        elif isinstance(file, (str, os.PathLike)):
+            self._file = open(file, "rb")
+            self._owned = True
+            self.size = os.fstat(self._file.fileno()).st_size
+        elif getattr(file, "seekable", lambda: False)():
+            self._file = file
+            self._offset = file.tell()
+            self.size = file.seek(0, os.SEEK_END) - self._offset
+        else:
+            # Not seekable: the size is only known once everything is read
+            self._data = memoryview(file.read()).cast("B")
+            self.size = self._data.nbytes
+
+    @property
+    def in_memory(self) -> bool:
+        return self._data is not None
+
+    def read(self, start: int, length: int) -> bytes:
+        """The ``length`` bytes at ``start`` (fewer at the end of the upload)"""
+        length = max(0, min(length, self.size - start))
+        if self._data is not None:
+            obj = self._data.obj
+            if length == self.size and isinstance(obj, bytes) and len(obj) == self.size:
+                # The whole of a bytes object: send it without a copy
+                return obj
+            return self._data[start:start + length].tobytes()
+        with self._lock:
+            self._file.seek(self._offset + start)
+            chunk = self._file.read(length)
+            while len(chunk) < length:
+                more = self._file.read(length - len(chunk))
+                if not more:
+                    raise ValueError("Upload file ended early; was it truncated during the upload?")
+                chunk += more
+        return chunk
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+
+
+def _run_parts(
+    upload_part: Callable[[int], int],
+    total_parts: int,
+    workers: int,
+    part_done: Callable[[int], Any],
+) -> None:
+    """
+    Upload parts ``1..total_parts``, up to ``workers`` at a time on a thread
+    pool, calling ``part_done`` with each part's size (in the calling
+    thread) as it completes. The first failure cancels the parts not started
+    yet and is raised once the ones in flight have finished.
+    """
+    if workers == 1:
+        for part_number in range(1, total_parts + 1):
+            part_done(upload_part(part_number))
+        return
+    in_flight = set()
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ofauth-upload")
+    try:
+        for part_number in range(1, total_parts + 1):
+            in_flight.add(executor.submit(upload_part, part_number))
+            while len(in_flight) >= workers or (in_flight and part_number == total_parts):
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    part_done(future.result())
+    finally:
+        # Parts in flight may still be reading the file: let them finish
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def _arun_parts(
+    upload_part: Callable[[int], Awaitable[int]],
+    total_parts: int,
+    workers: int,
+    part_done: Callable[[int], Any],
+) -> None:
+    """
+    ``_run_parts`` for the async client, with up to ``workers`` parts as
+    tasks. The first failure cancels the other parts.
+    """
+    in_flight = set()
+    try:
+        for part_number in range(1, total_parts + 1):
+            in_flight.add(asyncio.ensure_future(upload_part(part_number)))
+            while len(in_flight) >= workers or (in_flight and part_number == total_parts):
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    part_done(future.result())
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+
+class _BaseClient:
+    """Configuration and request building shared by the sync and async clients"""
     
     def __init__(
         self,
         api_key: str,
         base_url: str = BASE_URL,
         connection_id: Optional[str] = None,
-        timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        codec: Optional[JSONCodec] = None,
+        middleware: Optional[Sequence[Middleware]] = None,
+        on_request: Optional[Callable[[RequestEvent], Any]] = None,
+        response_mode: str = "raw",
     ):
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {', '.join(RESPONSE_MODES)}")
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.connection_id = connection_id
-        self._client = httpx.Client(timeout=timeout)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.coalesce = coalesce
+        self.codec = codec if codec is not None else default_codec()
+        self.response_mode = response_mode
+        # Caller-supplied layers wrap the built-in ones; instrumentation wraps everything
+        self.middleware: List[Middleware] = [
+            *([InstrumentationMiddleware(on_request)] if on_request is not None else []),
+            *(middleware or ()),
+            *default_middleware(retry, rate_limiter, cache, coalesce),
+        ]
+    
+    def _headers(
+        self,
+        connection_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> Dict[str, str]:
+        headers = {"apiKey": self.api_key}
+        conn_id = connection_id or self.connection_id
+        if conn_id:
+            headers["x-connection-id"] = conn_id
+        if content_type:
+            headers["Content-Type"] = content_type
+        return headers
+    
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        query: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        connection_id: Optional[str] = None,
+        *,
+        content: Optional[bytes] = None,
+        content_type: Optional[str] = None,
+        endpoint: Optional[str] = None,
+    ) -> Request:
+        # Filter None values from query
+        if query:
+            query = {k: v for k, v in query.items() if v is not None}
+        
+        if body is not None:
+            content = encode_body(body, self.codec)
+            content_type = "application/json"
+        
+        return Request(
+            method,
+            path,
+            f"{self.base_url}{path}",
+            params=query,
+            headers=self._headers(connection_id, content_type),
+            content=content,
+            endpoint=endpoint if endpoint is not None else _endpoint_template(path),
+        )
+    
+    def _parse(self, response: Response, response_model: Optional[Union[str, type]]) -> Any:
+        """The body of a successful response, shaped per ``response_mode``"""
+        if response_model is None or self.response_mode == "raw":
+            return response.data
+        # pydantic is only imported once a typed mode is in use
+        from .parsing import parse_response
+        return parse_response(response, response_model, self.response_mode)
+
+
+class OFAuthClient(_BaseClient):
+    """
+    OFAuth API Client
+    
+    Connection pooling is tuned with ``max_connections``,
+    ``max_keepalive_connections`` and ``keepalive_expiry`` (seconds an idle
+    connection is kept open). ``http2=True`` multiplexes requests over one
+    connection and needs the ``h2`` package (``pip install onlyfans-sdk[http2]``).
+    A custom ``transport`` (e.g. ``httpx.HTTPTransport(retries=1)`` or
+    ``httpx.MockTransport`` in tests) replaces the default one, so the pool
+    and HTTP/2 options do not apply to it.
+    
+    Bodies are encoded and decoded by ``codec`` (default: the fastest of
+    orjson, msgspec and stdlib ``json`` that is installed; see
+    ``onlyfans_sdk.codec``).
+    
+    ``request``, ``proxy`` and every step of ``upload_media`` run through
+    one middleware pipeline (see ``onlyfans_sdk.middleware``): the layers in
+    ``middleware`` first, then coalescing, caching, retries and rate
+    limiting as configured, then the network.
+    
+    ``response_mode`` sets what the typed endpoint functions return:
+    ``"raw"`` decoded JSON (default), ``"validated"`` pydantic models,
+    ``"trusted"`` top-level models built without validation over decoded
+    JSON, or ``"lazy"`` views that validate fields as they are read (see
+    ``onlyfans_sdk.parsing``).
+    ``proxy`` always returns decoded JSON.
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        connection_id: Optional[str] = None,
+        timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        codec: Optional[JSONCodec] = None,
+        middleware: Optional[Sequence[Middleware]] = None,
+        on_request: Optional[Callable[[RequestEvent], Any]] = None,
+        response_mode: str = "raw",
+    ):
+        super().__init__(
+            api_key,
+            base_url,
+            connection_id,
+            retry,
+            rate_limiter,
+            cache,
+            coalesce,
+            codec,
+            middleware,
+            on_request,
+            response_mode,
+        )
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+        self._pipeline = build_pipeline(self.middleware, self._transmit)
     
     def __enter__(self):
         return self
@@ -41,6 +372,44 @@ class OFAuthClient:
     def close(self):
         self._client.close()
     
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Pre-open up to ``connections`` pooled connections (DNS, TCP and TLS)
+        with concurrent ``HEAD`` requests, so the first real calls do not pay
+        for the handshakes. Any HTTP status counts; transport errors raise.
+        Returns the number of requests that completed (0 when
+        ``connections`` is less than 1).
+        """
+        if connections < 1:
+            return 0
+        
+        def open_one(_):
+            self._client.request("HEAD", self.base_url).close()
+        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return len(list(executor.map(open_one, range(connections))))
+    
+    def _transmit(self, request: Request) -> Response:
+        """Put a request on the wire; the innermost step of the pipeline"""
+        timings = request.context.get("timings")
+        extensions = None
+        if timings is not None:
+            timings.start_attempt()
+            extensions = {"trace": timings.trace}
+        response = self._client.request(
+            request.method,
+            request.url,
+            params=request.params,
+            headers=request.headers,
+            content=request.content,
+            extensions=extensions,
+        )
+        return Response.from_httpx(response, self.codec, request)
+    
+    def _dispatch(self, request: Request) -> Response:
+        """Run a request through the middleware pipeline"""
+        return self._pipeline(request)
+    
     def request(
         self,
         method: str,
@@ -49,48 +418,25 @@ class OFAuthClient:
         query: Optional[Dict[str, Any]] = None,
         body: Optional[Any] = None,
         connection_id: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        response_model: Optional[Union[str, type]] = None,
     ) -> Any:
-        """Make an API request"""
-        url = f"{self.base_url}{path}"
-        conn_id = connection_id or self.connection_id
-        
-        headers = {"apiKey": self.api_key}
-        if conn_id:
-            headers["x-connection-id"] = conn_id
-        if body is not None:
-            headers["Content-Type"] = "application/json"
+        """
+        Make an API request
         
-        # Filter None values from query
-        if query:
-            query = {k: v for k, v in query.items() if v is not None}
+        ``endpoint`` is the path template (e.g. ``/v2/access/users/{user_id}``)
+        reported to ``on_request``; by default numeric and UUID path segments
+        are replaced with ``{id}``.
         
-        response = self._client.request(
-            method,
-            url,
-            params=query,
-            json=body,
-            headers=headers,
+        ``response_model`` is the generated model (or its name in
+        ``onlyfans_sdk.models``) describing the response; it only matters
+        when the client's ``response_mode`` is not ``"raw"``.
+        """
+        response = self._dispatch(
+            self._build_request(method, path, query, body, connection_id, endpoint=endpoint)
         )
-        
-        if not response.is_success:
-            try:
-                error_body = response.json()
-            except Exception:
-                error_body = {}
-            raise OFAuthError(
-                status=response.status_code,
-                message=error_body.get("message", f"HTTP {response.status_code}"),
-                code=error_body.get("code"),
-                details=error_body.get("details"),
-            )
-        
-        if response.status_code == 204:
-            return {}
-        
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            return response.json()
-        return response.text
+        _raise_for_status(response)
+        return self._parse(response, response_model)
     
     def proxy(
         self,
@@ -100,6 +446,7 @@ class OFAuthClient:
         query: Optional[Dict[str, Any]] = None,
         body: Optional[Any] = None,
         connection_id: Optional[str] = None,
+        endpoint: Optional[str] = None,
     ) -> Any:
         """
         Make a proxied request to the OnlyFans API.
@@ -113,6 +460,11 @@ class OFAuthClient:
             query: Query parameters
             body: Request body for POST/PUT/PATCH
             connection_id: Connection ID
+            endpoint: Template reported to ``on_request`` (e.g.
+                ``/v2/access/proxy/users/{username}``). By default everything
+                below the first path segment is collapsed, so usernames and
+                IDs do not each become their own metric label:
+                ``/users/me`` is reported as ``/v2/access/proxy/users/*``.
         
         Returns:
             The API response
@@ -122,99 +474,354 @@ class OFAuthClient:
             user = client.proxy('/users/me', connection_id='conn_xxx')
             user = client.proxy('/api2/v2/users/me', connection_id='conn_xxx')
         """
-        # Strip /api2/v2 prefix if present
-        target_path = path
-        if target_path.startswith('/api2/v2'):
-            target_path = target_path[8:]
-        elif target_path.startswith('api2/v2'):
-            target_path = '/' + target_path[7:]
-        
-        # Ensure path starts with /
-        if not target_path.startswith('/'):
-            target_path = '/' + target_path
-        
-        url = f"{self.base_url}/v2/access/proxy{target_path}"
-        conn_id = connection_id or self.connection_id
+        proxy_path = _proxy_path(path)
+        return self.request(
+            method,
+            proxy_path,
+            query=query,
+            body=body,
+            connection_id=connection_id,
+            endpoint=endpoint if endpoint is not None else _proxy_endpoint(proxy_path),
+        )
+    
+    def upload_media(
+        self,
+        connection_id: str,
+        filename: str,
+        file: Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", BinaryIO],
+        mime_type: str,
+        vault_upload: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[callable] = None,
+        workers: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Upload media file (handles single/multi-part automatically).
         
-        headers = {"apiKey": self.api_key}
-        if conn_id:
-            headers["x-connection-id"] = conn_id
-        if body is not None:
-            headers["Content-Type"] = "application/json"
+        ``file`` may be bytes, a path, or a binary file object (read from its
+        current position). Paths and seekable file objects are streamed: one
+        part is read just before it is sent, so memory use does not grow with
+        the file size. Non-seekable file objects are read whole first.
         
-        if query:
-            query = {k: v for k, v in query.items() if v is not None}
+        ``workers`` parts of a multi-part upload are sent in parallel (on a
+        thread pool when above 1), so up to ``workers`` parts are held in
+        memory. ``on_progress(uploaded, total)`` is called from this thread
+        as each part completes, and the upload is completed only once every
+        part has succeeded; the first failed part raises ``OFAuthError``.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        source = _UploadSource(file)
+        try:
+            return self._upload_parts(
+                connection_id, filename, source, mime_type, vault_upload, on_progress, workers
+            )
+        finally:
+            source.close()
+    
+    def _upload_parts(
+        self,
+        connection_id: str,
+        filename: str,
+        source: _UploadSource,
+        mime_type: str,
+        vault_upload: Optional[Dict[str, Any]],
+        on_progress: Optional[callable],
+        workers: int,
+    ) -> Dict[str, Any]:
+        filesize = source.size
         
-        response = self._client.request(
-            method,
-            url,
-            params=query,
-            json=body,
-            headers=headers,
-        )
+        # Initialize upload
+        init_response = self._dispatch(self._build_request(
+            "POST",
+            "/v2/access/uploads/init",
+            body={
+                "filename": filename,
+                "filesize": filesize,
+                "mimeType": mime_type,
+                "vaultUpload": vault_upload,
+            },
+            connection_id=connection_id,
+        ))
+        _raise_for_status(init_response, "Upload init failed")
+        
+        init_data = init_response.json()
+        media_upload_id = init_data["mediaUploadId"]
+        total_parts = int(init_response.headers.get("x-ofauth-upload-total-parts", "1"))
+        part_size = int(init_response.headers.get("x-ofauth-upload-part-size", str(filesize)))
+        
+        # Single-part upload
+        if total_parts == 1:
+            upload_response = self._dispatch(self._build_request(
+                "PUT",
+                f"/v2/access/uploads/{media_upload_id}",
+                connection_id=connection_id,
+                content=source.read(0, filesize),
+                content_type=mime_type,
+                endpoint="/v2/access/uploads/{media_upload_id}",
+            ))
+            _raise_for_status(upload_response, "Upload failed")
+            
+            if on_progress:
+                on_progress(filesize, filesize)
+            return upload_response.json()
+        
+        # Multi-part upload, up to `workers` parts in flight; each part is
+        # read just before it is sent
+        def upload_part(part_number: int) -> int:
+            start = (part_number - 1) * part_size
+            chunk = source.read(start, part_size)
+            
+            part_response = self._dispatch(self._build_request(
+                "PUT",
+                f"/v2/access/uploads/{media_upload_id}/parts/{part_number}",
+                connection_id=connection_id,
+                content=chunk,
+                content_type=mime_type,
+                endpoint="/v2/access/uploads/{media_upload_id}/parts/{part_number}",
+            ))
+            _raise_for_status(part_response, "Chunk upload failed")
+            return len(chunk)
+        
+        uploaded = 0
         
-        if not response.is_success:
-            try:
-                error_body = response.json()
-            except Exception:
-                error_body = {}
-            raise OFAuthError(
-                status=response.status_code,
-                message=error_body.get("message", f"HTTP {response.status_code}"),
-                code=error_body.get("code"),
-                details=error_body.get("details"),
+        def part_done(size: int) -> None:
+            nonlocal uploaded
+            uploaded += size
+            if on_progress:
+                on_progress(uploaded, filesize)
+        
+        _run_parts(upload_part, total_parts, workers, part_done)
+        
+        # Complete upload
+        complete_response = self._dispatch(self._build_request(
+            "POST",
+            "/v2/access/uploads/complete",
+            body={"mediaUploadId": media_upload_id},
+            connection_id=connection_id,
+        ))
+        _raise_for_status(complete_response, "Upload complete failed")
+        
+        return complete_response.json()
+
+
+class AsyncOFAuthClient(_BaseClient):
+    """
+    OFAuth API Client for asyncio, built on ``httpx.AsyncClient``.
+    
+    Every resource function returns ``client.request(...)`` directly, so
+    passing an async client makes it return an awaitable:
+    
+    Example::
+    
+        async with AsyncOFAuthClient(api_key="...", connection_id="conn_xxx") as client:
+            chats, stats = await asyncio.gather(
+                messages.list_chats(client, limit=10),
+                vault_stats.list_v2_vault_plus_store_stats(client),
             )
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        connection_id: Optional[str] = None,
+        timeout: float = 30.0,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        codec: Optional[JSONCodec] = None,
+        middleware: Optional[Sequence[Middleware]] = None,
+        on_request: Optional[Callable[[RequestEvent], Any]] = None,
+        response_mode: str = "raw",
+    ):
+        super().__init__(
+            api_key,
+            base_url,
+            connection_id,
+            retry,
+            rate_limiter,
+            cache,
+            coalesce,
+            codec,
+            middleware,
+            on_request,
+            response_mode,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            transport=transport,
+        )
+        self._pipeline = build_async_pipeline(self.middleware, self._transmit)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        await self._client.aclose()
+    
+    async def aclose(self):
+        await self._client.aclose()
+    
+    async def warm_up(self, connections: int = 1) -> int:
+        """Pre-open up to ``connections`` pooled connections; see ``OFAuthClient.warm_up``."""
+        async def open_one():
+            response = await self._client.request("HEAD", self.base_url)
+            await response.aclose()
         
-        if response.status_code == 204:
-            return {}
+        return len(await asyncio.gather(*(open_one() for _ in range(connections))))
+    
+    async def _transmit(self, request: Request) -> Response:
+        """Put a request on the wire; the innermost step of the pipeline"""
+        timings = request.context.get("timings")
+        extensions = None
+        if timings is not None:
+            timings.start_attempt()
+            extensions = {"trace": timings.atrace}
+        response = await self._client.request(
+            request.method,
+            request.url,
+            params=request.params,
+            headers=request.headers,
+            content=request.content,
+            extensions=extensions,
+        )
+        return Response.from_httpx(response, self.codec, request)
+    
+    async def _dispatch(self, request: Request) -> Response:
+        """Run a request through the middleware pipeline"""
+        return await self._pipeline(request)
+    
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        connection_id: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        response_model: Optional[Union[str, type]] = None,
+    ) -> Any:
+        """
+        Make an API request
         
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            return response.json()
-        return response.text
+        ``endpoint`` is the path template (e.g. ``/v2/access/users/{user_id}``)
+        reported to ``on_request``; by default numeric and UUID path segments
+        are replaced with ``{id}``.
+        
+        ``response_model`` is the generated model (or its name in
+        ``onlyfans_sdk.models``) describing the response; it only matters
+        when the client's ``response_mode`` is not ``"raw"``.
+        """
+        response = await self._dispatch(
+            self._build_request(method, path, query, body, connection_id, endpoint=endpoint)
+        )
+        _raise_for_status(response)
+        return self._parse(response, response_model)
     
-    def upload_media(
+    async def proxy(
+        self,
+        path: str,
+        method: str = "GET",
+        *,
+        query: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        connection_id: Optional[str] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """
+        Make a proxied request to the OnlyFans API.
+        
+        See ``OFAuthClient.proxy``.
+        """
+        proxy_path = _proxy_path(path)
+        return await self.request(
+            method,
+            proxy_path,
+            query=query,
+            body=body,
+            connection_id=connection_id,
+            endpoint=endpoint if endpoint is not None else _proxy_endpoint(proxy_path),
+        )
+    
+    async def upload_media(
         self,
         connection_id: str,
         filename: str,
-        file: Union[bytes, BinaryIO],
+        file: Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", BinaryIO],
         mime_type: str,
         vault_upload: Optional[Dict[str, Any]] = None,
         on_progress: Optional[callable] = None,
+        workers: int = 1,
     ) -> Dict[str, Any]:
-        """Upload media file (handles single/multi-part automatically)"""
-        if hasattr(file, 'read'):
-            file_data = file.read()
-        else:
-            file_data = file
+        """
+        Upload media file (handles single/multi-part automatically).
         
-        filesize = len(file_data)
+        ``file`` may be bytes, a path, or a binary file object (read from its
+        current position). Paths and seekable file objects are streamed: one
+        part is read just before it is sent, so memory use does not grow with
+        the file size. Non-seekable file objects are read whole first. File
+        reads run in a worker thread, off the event loop.
+        
+        ``workers`` parts of a multi-part upload are sent concurrently as
+        tasks, so up to ``workers`` parts are held in memory.
+        ``on_progress(uploaded, total)`` is called as each part completes,
+        and the upload is completed only once every part has succeeded; the
+        first failed part cancels the others and raises ``OFAuthError``.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        source = _UploadSource(file)
+        try:
+            return await self._upload_parts(
+                connection_id, filename, source, mime_type, vault_upload, on_progress, workers
+            )
+        finally:
+            source.close()
+    
+    @staticmethod
+    async def _read_part(source: _UploadSource, start: int, length: int) -> bytes:
+        if source.in_memory:
+            return source.read(start, length)
+        return await asyncio.to_thread(source.read, start, length)
+    
+    async def _upload_parts(
+        self,
+        connection_id: str,
+        filename: str,
+        source: _UploadSource,
+        mime_type: str,
+        vault_upload: Optional[Dict[str, Any]],
+        on_progress: Optional[callable],
+        workers: int,
+    ) -> Dict[str, Any]:
+        filesize = source.size
         
         # Initialize upload
-        init_response = self._client.post(
-            f"{self.base_url}/v2/access/uploads/init",
-            headers={
-                "apiKey": self.api_key,
-                "x-connection-id": connection_id,
-                "Content-Type": "application/json",
-            },
-            json={
+        init_response = await self._dispatch(self._build_request(
+            "POST",
+            "/v2/access/uploads/init",
+            body={
                 "filename": filename,
                 "filesize": filesize,
                 "mimeType": mime_type,
                 "vaultUpload": vault_upload,
             },
-        )
-        
-        if not init_response.is_success:
-            try:
-                error_body = init_response.json()
-            except Exception:
-                error_body = {}
-            raise OFAuthError(
-                status=init_response.status_code,
-                message=error_body.get("message", "Upload init failed"),
-            )
+            connection_id=connection_id,
+        ))
+        _raise_for_status(init_response, "Upload init failed")
         
         init_data = init_response.json()
         media_upload_id = init_data["mediaUploadId"]
@@ -223,80 +830,54 @@ class OFAuthClient:
         
         # Single-part upload
         if total_parts == 1:
-            upload_response = self._client.put(
-                f"{self.base_url}/v2/access/uploads/{media_upload_id}",
-                headers={
-                    "apiKey": self.api_key,
-                    "x-connection-id": connection_id,
-                    "Content-Type": mime_type,
-                },
-                content=file_data,
-            )
-            
-            if not upload_response.is_success:
-                try:
-                    error_body = upload_response.json()
-                except Exception:
-                    error_body = {}
-                raise OFAuthError(
-                    status=upload_response.status_code,
-                    message=error_body.get("message", "Upload failed"),
-                )
+            upload_response = await self._dispatch(self._build_request(
+                "PUT",
+                f"/v2/access/uploads/{media_upload_id}",
+                connection_id=connection_id,
+                content=await self._read_part(source, 0, filesize),
+                content_type=mime_type,
+                endpoint="/v2/access/uploads/{media_upload_id}",
+            ))
+            _raise_for_status(upload_response, "Upload failed")
             
             if on_progress:
                 on_progress(filesize, filesize)
             return upload_response.json()
         
-        # Multi-part upload
-        uploaded = 0
-        for part_number in range(1, total_parts + 1):
+        # Multi-part upload, up to `workers` parts in flight; each part is
+        # read just before it is sent
+        async def upload_part(part_number: int) -> int:
             start = (part_number - 1) * part_size
-            end = min(start + part_size, filesize)
-            chunk = file_data[start:end]
+            chunk = await self._read_part(source, start, part_size)
             
-            part_response = self._client.put(
-                f"{self.base_url}/v2/access/uploads/{media_upload_id}/parts/{part_number}",
-                headers={
-                    "apiKey": self.api_key,
-                    "x-connection-id": connection_id,
-                    "Content-Type": mime_type,
-                },
+            part_response = await self._dispatch(self._build_request(
+                "PUT",
+                f"/v2/access/uploads/{media_upload_id}/parts/{part_number}",
+                connection_id=connection_id,
                 content=chunk,
-            )
-            
-            if not part_response.is_success:
-                try:
-                    error_body = part_response.json()
-                except Exception:
-                    error_body = {}
-                raise OFAuthError(
-                    status=part_response.status_code,
-                    message=error_body.get("message", "Chunk upload failed"),
-                )
-            
-            uploaded += len(chunk)
+                content_type=mime_type,
+                endpoint="/v2/access/uploads/{media_upload_id}/parts/{part_number}",
+            ))
+            _raise_for_status(part_response, "Chunk upload failed")
+            return len(chunk)
+        
+        uploaded = 0
+        
+        def part_done(size: int) -> None:
+            nonlocal uploaded
+            uploaded += size
             if on_progress:
                 on_progress(uploaded, filesize)
         
-        # Complete upload
-        complete_response = self._client.post(
-            f"{self.base_url}/v2/access/uploads/complete",
-            headers={
-                "apiKey": self.api_key,
-                "x-connection-id": connection_id,
-                "Content-Type": "application/json",
-            },
-            json={"mediaUploadId": media_upload_id},
-        )
+        await _arun_parts(upload_part, total_parts, workers, part_done)
         
-        if not complete_response.is_success:
-            try:
-                error_body = complete_response.json()
-            except Exception:
-                error_body = {}
-            raise OFAuthError(
-                status=complete_response.status_code,
-                message=error_body.get("message", "Upload complete failed"),
-            )
+        # Complete upload
+        complete_response = await self._dispatch(self._build_request(
+            "POST",
+            "/v2/access/uploads/complete",
+            body={"mediaUploadId": media_upload_id},
+            connection_id=connection_id,
+        ))
+        _raise_for_status(complete_response, "Upload complete failed")
         
         return complete_response.json()
@@ -1,18 +1,23 @@
 """
 Account API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccountConnectionsGetResponse,
-    V2AccountConnectionsImportPostRequest,
-    V2AccountConnectionsImportPostResponse,
-    V2AccountSettingsGetResponse,
-    V2AccountSettingsPatchRequest,
-    V2AccountSettingsPatchResponse,
-    V2AccountWhoamiGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.account import (
+        V2AccountConnectionsGetResponse,
+        V2AccountConnectionsImportPostRequest,
+        V2AccountConnectionsImportPostResponse,
+        V2AccountSettingsGetResponse,
+        V2AccountSettingsPatchRequest,
+        V2AccountSettingsPatchResponse,
+        V2AccountWhoamiGetResponse,
+    )
 
 def whoami(
     client: OFAuthClient
@@ -25,6 +30,7 @@ def whoami(
     return client.request(
         "GET",
         path,
+        response_model="V2AccountWhoamiGetResponse",
     )
 
 def delete_connections(
@@ -39,6 +45,7 @@ def delete_connections(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/account/connections/{connection_id}",
     )
 
 def invalidate_connections(
@@ -53,6 +60,7 @@ def invalidate_connections(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/account/connections/{connection_id}/invalidate",
     )
 
 def list_connections(
@@ -77,6 +85,7 @@ def list_connections(
         "GET",
         path,
         query=query,
+        response_model="V2AccountConnectionsGetResponse",
     )
 
 def iter_connections(
@@ -84,17 +93,19 @@ def iter_connections(
     status: Optional[Literal["active", "expired", "awaiting_2fa"]] = None,
     imported: Optional[Literal["true", "false"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List connections
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -103,32 +114,57 @@ def iter_connections(
         for item in iter_connections(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_connections,
+        client,
+        OFFSET,
+        {
+            "status": status,
+            "imported": imported,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_connections(
+    client: AsyncOFAuthClient,
+    status: Optional[Literal["active", "expired", "awaiting_2fa"]] = None,
+    imported: Optional[Literal["true", "false"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List connections
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_connections(
-            client=client,
-            status=status,
-            imported=imported,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_connections(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_connections,
+        client,
+        OFFSET,
+        {
+            "status": status,
+            "imported": imported,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def get_connection_settings(
     client: OFAuthClient,
@@ -142,6 +178,7 @@ def get_connection_settings(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/account/connections/{connection_id}/settings",
     )
 
 def update_connection_settings(
@@ -157,6 +194,7 @@ def update_connection_settings(
     return client.request(
         "PATCH",
         path,
+        endpoint="/v2/account/connections/{connection_id}/settings",
         body=body,
     )
 
@@ -173,6 +211,7 @@ def create_connections_connections_import(
         "POST",
         path,
         body=body,
+        response_model="V2AccountConnectionsImportPostResponse",
     )
 
 def update_connections_connections_import(
@@ -188,6 +227,7 @@ def update_connections_connections_import(
     return client.request(
         "PATCH",
         path,
+        endpoint="/v2/account/connections/import/{connection_id}",
         body=body,
     )
 
@@ -202,6 +242,7 @@ def get_org_settings(
     return client.request(
         "GET",
         path,
+        response_model="V2AccountSettingsGetResponse",
     )
 
 def update_org_settings(
@@ -217,4 +258,5 @@ def update_org_settings(
         "PATCH",
         path,
         body=body,
+        response_model="V2AccountSettingsPatchResponse",
     )
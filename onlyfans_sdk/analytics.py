@@ -1,28 +1,33 @@
 """
 Analytics API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
-
-from ._client import OFAuthClient
-from .models import (
-    V2AccessAnalyticsCampaignsChartGetResponse,
-    V2AccessAnalyticsCampaignsTopGetResponse,
-    V2AccessAnalyticsMassMessagesChartGetResponse,
-    V2AccessAnalyticsMassMessagesPurchasedGetResponse,
-    V2AccessAnalyticsMassMessagesSentGetResponse,
-    V2AccessAnalyticsPostsChartGetResponse,
-    V2AccessAnalyticsPostsTopGetResponse,
-    V2AccessAnalyticsPromotionsChartGetResponse,
-    V2AccessAnalyticsPromotionsTopGetResponse,
-    V2AccessAnalyticsStoriesChartGetResponse,
-    V2AccessAnalyticsStoriesTopGetResponse,
-    V2AccessAnalyticsStreamsChartGetResponse,
-    V2AccessAnalyticsStreamsTopGetResponse,
-    V2AccessAnalyticsTrialsChartGetResponse,
-    V2AccessAnalyticsTrialsTopGetResponse,
-    V2AccessAnalyticsVisitorCountriesChartGetResponse,
-    V2AccessAnalyticsVisitorCountriesTopGetResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, MarkerStrategy, Paginator
+
+if TYPE_CHECKING:
+    from .models.analytics import (
+        V2AccessAnalyticsCampaignsChartGetResponse,
+        V2AccessAnalyticsCampaignsTopGetResponse,
+        V2AccessAnalyticsMassMessagesChartGetResponse,
+        V2AccessAnalyticsMassMessagesPurchasedGetResponse,
+        V2AccessAnalyticsMassMessagesSentGetResponse,
+        V2AccessAnalyticsPostsChartGetResponse,
+        V2AccessAnalyticsPostsTopGetResponse,
+        V2AccessAnalyticsPromotionsChartGetResponse,
+        V2AccessAnalyticsPromotionsTopGetResponse,
+        V2AccessAnalyticsStoriesChartGetResponse,
+        V2AccessAnalyticsStoriesTopGetResponse,
+        V2AccessAnalyticsStreamsChartGetResponse,
+        V2AccessAnalyticsStreamsTopGetResponse,
+        V2AccessAnalyticsTrialsChartGetResponse,
+        V2AccessAnalyticsTrialsTopGetResponse,
+        V2AccessAnalyticsVisitorCountriesChartGetResponse,
+        V2AccessAnalyticsVisitorCountriesTopGetResponse,
+    )
 
 def list_posts_charts(
     client: OFAuthClient,
@@ -48,6 +53,7 @@ def list_posts_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsPostsChartGetResponse",
     )
 
 def list_posts_tops(
@@ -76,6 +82,7 @@ def list_posts_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsPostsTopGetResponse",
     )
 
 def get_posts(
@@ -92,6 +99,7 @@ def get_posts(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/analytics/posts/{post_id}",
     )
 
 def list_streams_charts(
@@ -118,6 +126,7 @@ def list_streams_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsStreamsChartGetResponse",
     )
 
 def list_streams_tops(
@@ -146,6 +155,7 @@ def list_streams_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsStreamsTopGetResponse",
     )
 
 def list_stories_charts(
@@ -172,6 +182,7 @@ def list_stories_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsStoriesChartGetResponse",
     )
 
 def list_stories_tops(
@@ -200,6 +211,7 @@ def list_stories_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsStoriesTopGetResponse",
     )
 
 def list_mass_messages_charts(
@@ -224,6 +236,7 @@ def list_mass_messages_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsMassMessagesChartGetResponse",
     )
 
 def list_mass_messages_sents(
@@ -248,6 +261,7 @@ def list_mass_messages_sents(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsMassMessagesSentGetResponse",
     )
 
 def list_mass_messages_purchaseds(
@@ -270,6 +284,7 @@ def list_mass_messages_purchaseds(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsMassMessagesPurchasedGetResponse",
     )
 
 def list_mass_messages_buyers(
@@ -294,6 +309,7 @@ def list_mass_messages_buyers(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/analytics/mass-messages/{mass_message_id}/buyers",
         query=query,
     )
 
@@ -301,16 +317,19 @@ def iter_mass_messages_buyers(
     client: OFAuthClient,
     mass_message_id: str,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     Mass message buyers
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
+        page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -319,29 +338,54 @@ def iter_mass_messages_buyers(
         for item in iter_mass_messages_buyers(client, connection_id="..."):
             print(item)
     """
-    marker = None
-    fetched = 0
+    return Paginator(
+        list_mass_messages_buyers,
+        client,
+        MarkerStrategy(limit_param="limit"),
+        {
+            "mass_message_id": mass_message_id,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_mass_messages_buyers(
+    client: AsyncOFAuthClient,
+    mass_message_id: str,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    Mass message buyers
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        response = list_mass_messages_buyers(
-            client=client,
-            mass_message_id=mass_message_id,
-            marker=marker,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        marker = response.get("marker")
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_mass_messages_buyers(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_mass_messages_buyers,
+        client,
+        MarkerStrategy(limit_param="limit"),
+        {
+            "mass_message_id": mass_message_id,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_promotions_charts(
     client: OFAuthClient,
@@ -365,6 +409,7 @@ def list_promotions_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsPromotionsChartGetResponse",
     )
 
 def list_promotions_tops(
@@ -391,6 +436,7 @@ def list_promotions_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsPromotionsTopGetResponse",
     )
 
 def list_trials_charts(
@@ -415,6 +461,7 @@ def list_trials_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsTrialsChartGetResponse",
     )
 
 def list_trials_tops(
@@ -441,6 +488,7 @@ def list_trials_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsTrialsTopGetResponse",
     )
 
 def list_campaigns_charts(
@@ -465,6 +513,7 @@ def list_campaigns_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsCampaignsChartGetResponse",
     )
 
 def list_campaigns_tops(
@@ -491,6 +540,7 @@ def list_campaigns_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsCampaignsTopGetResponse",
     )
 
 def iter_campaigns_tops(
@@ -498,17 +548,19 @@ def iter_campaigns_tops(
     start_date: Optional[Union[str, Any]] = None,
     end_date: Optional[Union[str, Any]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     Top campaigns
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -517,32 +569,57 @@ def iter_campaigns_tops(
         for item in iter_campaigns_tops(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_campaigns_tops,
+        client,
+        OFFSET,
+        {
+            "start_date": start_date,
+            "end_date": end_date,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_campaigns_tops(
+    client: AsyncOFAuthClient,
+    start_date: Optional[Union[str, Any]] = None,
+    end_date: Optional[Union[str, Any]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    Top campaigns
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_campaigns_tops(
-            client=client,
-            start_date=start_date,
-            end_date=end_date,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Example:
+        async for item in aiter_campaigns_tops(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_campaigns_tops,
+        client,
+        OFFSET,
+        {
+            "start_date": start_date,
+            "end_date": end_date,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_visitor_countries_charts(
     client: OFAuthClient,
@@ -566,6 +643,7 @@ def list_visitor_countries_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsVisitorCountriesChartGetResponse",
     )
 
 def list_visitor_countries_tops(
@@ -590,4 +668,5 @@ def list_visitor_countries_tops(
         "GET",
         path,
         query=query,
+        response_model="V2AccessAnalyticsVisitorCountriesTopGetResponse",
     )
@@ -0,0 +1,447 @@
+"""
+Response caching for GET requests.
+
+``ResponseCache`` keeps decoded response bodies for a configurable time so
+repeat reads of slowly changing endpoints skip the network. Pass one to
+``OFAuthClient`` / ``AsyncOFAuthClient`` via ``cache=``. Responses carrying
+an ``ETag`` or ``Last-Modified`` header are revalidated with a conditional
+request once they expire, so an unchanged resource costs a bodyless 304
+instead of a full download and decode. Entries live in memory by default,
+or in ``SQLiteCacheStore`` to survive restarts.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from .ratelimit import _fingerprint
+
+# ============================================================================
+# Entries and statistics
+# ============================================================================
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and the request it belongs to."""
+
+    value: Any
+    expires: float
+    path: str
+    connection_id: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """Counters since the cache was created (or ``reset_stats`` was called)."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# ============================================================================
+# Stores
+# ============================================================================
+
+
+class MemoryCacheStore:
+    """
+    In-process LRU store, safe to share between threads.
+
+    Args:
+        max_entries: Least recently used entries are evicted beyond this many.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        """Store ``entry``; return the number of entries evicted to make room."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, path: Optional[str] = None, connection_id: Optional[str] = None) -> int:
+        with self._lock:
+            doomed = [
+                key
+                for key, entry in self._entries.items()
+                if (path is None or entry.path.startswith(path))
+                and (connection_id is None or entry.connection_id == connection_id)
+            ]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheStore:
+    """
+    Persistent store in a SQLite file, for caches that should survive
+    process restarts (e.g. closed historical analytics windows).
+
+    Bodies are stored as zlib-compressed JSON. Once the compressed total
+    exceeds ``max_bytes``, expired entries go first, then the least
+    recently used. Safe to share between threads and between processes
+    opening the same file.
+
+    Args:
+        path: Database file, created if missing.
+        max_bytes: Cap on the total compressed body size (default 64 MiB).
+        compress_level: zlib level, 1 (fastest) to 9 (smallest) (default 6).
+        timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        compress_level: int = 6,
+        timeout: float = 30.0,
+    ) -> None:
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.timeout = timeout
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ofauth_cache ("
+            "key TEXT PRIMARY KEY, path TEXT NOT NULL, connection_id TEXT, "
+            "expires REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL, "
+            "body BLOB NOT NULL, etag TEXT, last_modified TEXT)"
+        )
+        # Files created before validators were tracked lack these columns
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(ofauth_cache)")}
+        for column in ("etag", "last_modified"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE ofauth_cache ADD COLUMN {column} TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS ofauth_cache_accessed ON ofauth_cache (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT path, connection_id, expires, body, etag, last_modified "
+            "FROM ofauth_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        path, connection_id, expires, body, etag, last_modified = row
+        conn.execute("UPDATE ofauth_cache SET accessed = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(
+            json.loads(zlib.decompress(body)), expires, path, connection_id, etag, last_modified
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> int:
+        body = zlib.compress(
+            json.dumps(entry.value, separators=(",", ":")).encode("utf-8"), self.compress_level
+        )
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO ofauth_cache "
+                "(key, path, connection_id, expires, accessed, size, body, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.path,
+                    entry.connection_id,
+                    entry.expires,
+                    time.time(),
+                    len(body),
+                    body,
+                    entry.etag,
+                    entry.last_modified,
+                ),
+            )
+            evicted = self._enforce_cap(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return evicted
+
+    def _enforce_cap(self, conn: sqlite3.Connection) -> int:
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM ofauth_cache").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return 0
+        doomed = []
+        rows = conn.execute(
+            "SELECT key, size FROM ofauth_cache ORDER BY expires > ?, accessed", (time.time(),)
+        )
+        for key, size in rows:
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM ofauth_cache WHERE key = ?", doomed)
+        return len(doomed)
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM ofauth_cache WHERE key = ?", (key,))
+
+    def invalidate(self, path: Optional[str] = None, connection_id: Optional[str] = None) -> int:
+        clauses, args = [], []
+        if path is not None:
+            clauses.append("substr(path, 1, ?) = ?")
+            args += [len(path), path]
+        if connection_id is not None:
+            clauses.append("connection_id = ?")
+            args.append(connection_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._connect().execute(f"DELETE FROM ofauth_cache{where}", args).rowcount
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; return how many were removed."""
+        return self._connect().execute(
+            "DELETE FROM ofauth_cache WHERE expires <= ?", (time.time(),)
+        ).rowcount
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM ofauth_cache")
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM ofauth_cache").fetchone()[0]
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+class ResponseCache:
+    """
+    TTL cache for GET responses, keyed by path, normalized query, connection
+    ID and API key.
+
+    Args:
+        ttl: Default lifetime in seconds for every GET (None: only cache the
+            endpoints listed in ``endpoints``).
+        endpoints: Lifetimes per endpoint family, keyed by path prefix
+            (e.g. ``"/v2/access/self"``). The longest matching prefix wins;
+            None disables caching for that family, and 0 keeps only
+            responses with validators and revalidates them on every call
+            (suits pollers).
+        max_entries: Size of the default in-memory LRU store.
+        store: Where entries live (default: ``MemoryCacheStore(max_entries)``;
+            ``SQLiteCacheStore`` persists them on disk).
+
+    Cached bodies are shared between callers; copy one before mutating it.
+
+    Example::
+
+        cache = ResponseCache(ttl=None, endpoints={
+            "/v2/access/self": 300,
+            "/v2/access/users": 60,
+            "/v2/dynamic-rules/status": 0,
+        })
+        client = OFAuthClient(api_key="...", cache=cache)
+        ...
+        cache.invalidate("/v2/access/self")
+        print(cache.stats.hit_ratio)
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 60.0,
+        endpoints: Optional[Mapping[str, Optional[float]]] = None,
+        max_entries: int = 1024,
+        store: Optional[Any] = None,
+    ) -> None:
+        self.ttl = ttl
+        # Longest prefix first, so the most specific family wins
+        self.endpoints: List[Tuple[str, Optional[float]]] = sorted(
+            (endpoints or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.store = store if store is not None else MemoryCacheStore(max_entries)
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Lifetime in seconds for responses from ``path`` (None: not cached)."""
+        for prefix, ttl in self.endpoints:
+            if path.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def key(
+        self,
+        api_key: str,
+        path: str,
+        query: Optional[Mapping[str, Any]] = None,
+        connection_id: Optional[str] = None,
+    ) -> str:
+        """Cache key for a GET request; query order and None values do not matter."""
+        return request_key(api_key, path, query, connection_id)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Fresh entry for ``key``, or None (counted as a miss)."""
+        entry = self.store.get(key)
+        if entry is not None and not entry.fresh():
+            entry = None
+        self._count("hits" if entry is not None else "misses")
+        return entry
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Entry for ``key`` that is fresh or can be revalidated, or None.
+
+        Only fresh entries count as hits; a stale entry is returned so its
+        ``validators()`` can make the request conditional.
+        """
+        entry = self.store.get(key)
+        if entry is not None and not entry.fresh():
+            self._count("misses")
+            return entry if entry.etag or entry.last_modified else None
+        self._count("hits" if entry is not None else "misses")
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        path: str,
+        connection_id: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Cache ``value`` for the lifetime configured for ``path``, keeping the
+        ``ETag`` / ``Last-Modified`` validators from response ``headers``.
+        """
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return
+        entry = CacheEntry(value, time.time() + ttl, path, connection_id)
+        if headers is not None:
+            entry.etag = headers.get("etag")
+            entry.last_modified = headers.get("last-modified")
+        if ttl <= 0 and not (entry.etag or entry.last_modified):
+            return
+        self._store(key, entry)
+
+    def revalidated(self, key: str, entry: CacheEntry, headers: Mapping[str, str]) -> Any:
+        """Renew ``entry`` after a 304 Not Modified; return its cached value."""
+        entry = CacheEntry(
+            entry.value,
+            time.time() + (self.ttl_for(entry.path) or 0),
+            entry.path,
+            entry.connection_id,
+            headers.get("etag") or entry.etag,
+            headers.get("last-modified") or entry.last_modified,
+        )
+        self._store(key, entry)
+        self._count("revalidations")
+        return entry.value
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        evicted = self.store.set(key, entry)
+        self._count("stores")
+        if evicted:
+            self._count("evictions", evicted)
+
+    def invalidate(self, path: Optional[str] = None, connection_id: Optional[str] = None) -> int:
+        """
+        Drop cached entries whose path starts with ``path`` and, if given,
+        that belong to ``connection_id``. With no arguments, drops everything.
+        Returns the number of entries removed.
+        """
+        removed = self.store.invalidate(path, connection_id)
+        self._count("invalidations", removed)
+        return removed
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = CacheStats()
+
+    def _count(self, field: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + amount)
+
+
+def request_key(
+    api_key: str,
+    path: str,
+    query: Optional[Mapping[str, Any]] = None,
+    connection_id: Optional[str] = None,
+) -> str:
+    """Identity of a GET request: API key, connection, path and normalized query."""
+    params = sorted((k, v) for k, v in (query or {}).items() if v is not None)
+    return f"{_fingerprint(api_key)}:{connection_id or ''} GET {path}?{urlencode(params, doseq=True)}"
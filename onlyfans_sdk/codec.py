@@ -0,0 +1,186 @@
+"""
+JSON codecs for request and response bodies.
+
+Clients decode responses straight from raw bytes and encode bodies to bytes
+through a codec. By default the fastest installed backend is used: orjson,
+then msgspec, then the standard library. Pass ``codec=`` to a client to
+choose one explicitly.
+
+Request bodies go through ``encode_body``: pydantic request models are
+serialized by pydantic itself, dicts and lists by the codec.
+"""
+from __future__ import annotations
+
+import json
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+
+class JSONCodec:
+    """Interface for JSON codecs: ``decode`` bytes to Python, ``encode`` Python to bytes."""
+
+    name = "base"
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibCodec(JSONCodec):
+    """The standard library ``json`` module, always available."""
+
+    name = "json"
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+# Every digit maps to "0", everything else to "x": a run of 20 zeros in the
+# translation is a number too long for 64 bits, which the fast backends
+# would decode as a float
+_DIGITS = bytes(0x30 if 0x30 <= b <= 0x39 else 0x78 for b in range(256))
+_BIG_INT = b"0" * 20
+
+
+def _has_big_int(data: bytes) -> bool:
+    return data.translate(_DIGITS).find(_BIG_INT) != -1
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson backend (``pip install onlyfans-sdk[orjson]``).
+
+    Accepts whatever ``StdlibCodec`` does: non-string dict keys are encoded
+    as strings, and integers beyond 64 bits, a UTF-8 byte-order mark or
+    ``NaN`` are handed to the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "OrjsonCodec requires orjson. Install with: pip install onlyfans-sdk[orjson]"
+            )
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS
+        self._decode_error = orjson.JSONDecodeError
+        self._fallback = StdlibCodec()
+
+    def decode(self, data: bytes) -> Any:
+        if _has_big_int(data):
+            return self._fallback.decode(data)
+        try:
+            return self._loads(data)
+        except self._decode_error:
+            return self._fallback.decode(data)
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return self._dumps(obj, option=self._option)
+        except TypeError:
+            return self._fallback.encode(obj)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    msgspec backend (``pip install onlyfans-sdk[msgspec]``).
+
+    Like ``OrjsonCodec``, hands what msgspec cannot represent to the
+    standard library.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError(
+                "MsgspecCodec requires msgspec. Install with: pip install onlyfans-sdk[msgspec]"
+            )
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._decode_error = msgspec.DecodeError
+        self._fallback = StdlibCodec()
+
+    def decode(self, data: bytes) -> Any:
+        if _has_big_int(data):
+            return self._fallback.decode(data)
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error:
+            return self._fallback.decode(data)
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return self._fallback.encode(obj)
+
+
+def default_codec() -> JSONCodec:
+    """The fastest installed codec: orjson, then msgspec, then stdlib ``json``."""
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibCodec()
+
+
+# ============================================================================
+# Request bodies
+# ============================================================================
+
+
+def encode_body(body: Any, codec: JSONCodec) -> bytes:
+    """
+    Encode a JSON request body.
+
+    Pydantic models (e.g. ``models.V2AccessMassMessagesPostRequest``) are
+    serialized straight to bytes by pydantic-core, using field aliases
+    (``user-id``, ``app-token``) and leaving out fields that are None. A
+    list of models becomes a JSON array of them. Everything else is encoded
+    by ``codec``.
+    """
+    if isinstance(body, dict):
+        return codec.encode(body)
+    if isinstance(body, list):
+        if any(_model_dumper(type(item)) is not None for item in body):
+            return b"[" + b",".join(encode_body(item, codec) for item in body) + b"]"
+        return codec.encode(body)
+    dump = _model_dumper(type(body))
+    if dump is not None:
+        return dump(body)
+    return codec.encode(body)
+
+
+# Model class -> bound serializer with the body dump settings (None: not a model)
+_DUMPERS: Dict[type, Optional[Callable[[Any], bytes]]] = {}
+
+
+def _model_dumper(cls: type) -> Optional[Callable[[Any], bytes]]:
+    try:
+        return _DUMPERS[cls]
+    except KeyError:
+        pass
+    serializer = getattr(cls, "__pydantic_serializer__", None)
+    dump = None
+    if serializer is not None and hasattr(cls, "model_fields"):
+        # What model_dump_json(by_alias=True, exclude_none=True) does, minus
+        # its per-call overhead and the str round trip
+        dump = partial(serializer.to_json, by_alias=True, exclude_none=True)
+    _DUMPERS[cls] = dump
+    return dump
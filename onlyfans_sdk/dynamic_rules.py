@@ -1,15 +1,21 @@
 """
 Dynamic Rules API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
 
 from ._client import OFAuthClient
-from .models import (
-    V2DynamicRulesGetResponse,
-    V2DynamicRulesSignPostRequest,
-    V2DynamicRulesSignPostResponse,
-    V2DynamicRulesStatusGetResponse,
-)
+
+if TYPE_CHECKING:
+    from .models.common import (
+        V2DynamicRulesGetResponse,
+        V2DynamicRulesSignPostRequest,
+        V2DynamicRulesSignPostResponse,
+    )
+    from .models.dynamic_rules import (
+        V2DynamicRulesStatusGetResponse,
+    )
 
 def list_v2_dynamic_rules(
     client: OFAuthClient
@@ -22,6 +28,7 @@ def list_v2_dynamic_rules(
     return client.request(
         "GET",
         path,
+        response_model="V2DynamicRulesGetResponse",
     )
 
 def create_v2_dynamic_rules_sign(
@@ -37,6 +44,7 @@ def create_v2_dynamic_rules_sign(
         "POST",
         path,
         body=body,
+        response_model="V2DynamicRulesSignPostResponse",
     )
 
 def list_v2_dynamic_rules_status(
@@ -50,4 +58,5 @@ def list_v2_dynamic_rules_status(
     return client.request(
         "GET",
         path,
+        response_model="V2DynamicRulesStatusGetResponse",
     )
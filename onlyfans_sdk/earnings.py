@@ -1,14 +1,19 @@
 """
 Earnings API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessEarningsChargebacksGetResponse,
-    V2AccessEarningsChartGetResponse,
-    V2AccessEarningsTransactionsGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import MARKER, Paginator
+
+if TYPE_CHECKING:
+    from .models.earnings import (
+        V2AccessEarningsChargebacksGetResponse,
+        V2AccessEarningsChartGetResponse,
+        V2AccessEarningsTransactionsGetResponse,
+    )
 
 def list_charts(
     client: OFAuthClient,
@@ -36,6 +41,7 @@ def list_charts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessEarningsChartGetResponse",
     )
 
 def list_transactions(
@@ -62,6 +68,7 @@ def list_transactions(
         "GET",
         path,
         query=query,
+        response_model="V2AccessEarningsTransactionsGetResponse",
     )
 
 def iter_transactions(
@@ -70,16 +77,19 @@ def iter_transactions(
     type: Optional[Literal["subscribes", "chat_messages", "post", "stream", "tips"]] = None,
     tips_source: Optional[Literal["chat", "post_all", "profile", "story", "stream"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List transactions
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
+        page_size: Ignored; this endpoint's page size is set by the server
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -88,31 +98,60 @@ def iter_transactions(
         for item in iter_transactions(client, connection_id="..."):
             print(item)
     """
-    marker = None
-    fetched = 0
-    
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        response = list_transactions(
-            client=client,
-            start_date=start_date,
-            type=type,
-            tips_source=tips_source,
-            marker=marker,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        marker = response.get("marker")
+    return Paginator(
+        list_transactions,
+        client,
+        MARKER,
+        {
+            "start_date": start_date,
+            "type": type,
+            "tips_source": tips_source,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_transactions(
+    client: AsyncOFAuthClient,
+    start_date: Optional[str] = None,
+    type: Optional[Literal["subscribes", "chat_messages", "post", "stream", "tips"]] = None,
+    tips_source: Optional[Literal["chat", "post_all", "profile", "story", "stream"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List transactions
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Ignored; this endpoint's page size is set by the server
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_transactions(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_transactions,
+        client,
+        MARKER,
+        {
+            "start_date": start_date,
+            "type": type,
+            "tips_source": tips_source,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_chargebacks(
     client: OFAuthClient,
@@ -136,6 +175,7 @@ def list_chargebacks(
         "GET",
         path,
         query=query,
+        response_model="V2AccessEarningsChargebacksGetResponse",
     )
 
 def iter_chargebacks(
@@ -143,16 +183,19 @@ def iter_chargebacks(
     start_date: Optional[Union[str, Any]] = None,
     end_date: Optional[Union[str, Any]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List chargebacks
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
+        page_size: Ignored; this endpoint's page size is set by the server
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -161,27 +204,54 @@ def iter_chargebacks(
         for item in iter_chargebacks(client, connection_id="..."):
             print(item)
     """
-    marker = None
-    fetched = 0
-    
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        response = list_chargebacks(
-            client=client,
-            start_date=start_date,
-            end_date=end_date,
-            marker=marker,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        marker = response.get("marker")
+    return Paginator(
+        list_chargebacks,
+        client,
+        MARKER,
+        {
+            "start_date": start_date,
+            "end_date": end_date,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_chargebacks(
+    client: AsyncOFAuthClient,
+    start_date: Optional[Union[str, Any]] = None,
+    end_date: Optional[Union[str, Any]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List chargebacks
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Ignored; this endpoint's page size is set by the server
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_chargebacks(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_chargebacks,
+        client,
+        MARKER,
+        {
+            "start_date": start_date,
+            "end_date": end_date,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
@@ -1,13 +1,17 @@
 """
 Link API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
 
 from ._client import OFAuthClient
-from .models import (
-    V2LinkInitPostRequest,
-    V2LinkInitPostResponse,
-)
+
+if TYPE_CHECKING:
+    from .models.link import (
+        V2LinkInitPostRequest,
+        V2LinkInitPostResponse,
+    )
 
 def init_v2_link(
     client: OFAuthClient,
@@ -22,6 +26,7 @@ def init_v2_link(
         "POST",
         path,
         body=body,
+        response_model="V2LinkInitPostResponse",
     )
 
 def get_v2_link(
@@ -36,6 +41,7 @@ def get_v2_link(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/link/{client_secret}",
     )
 
 def delete_v2_link(
@@ -50,4 +56,5 @@ def delete_v2_link(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/link/{client_secret}",
     )
@@ -1,14 +1,19 @@
 """
 Messages API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessChatsGetResponse,
-    V2AccessMassMessagesPostRequest,
-    V2AccessMassMessagesPostResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.messages import (
+        V2AccessChatsGetResponse,
+        V2AccessMassMessagesPostRequest,
+        V2AccessMassMessagesPostResponse,
+    )
 
 def list_chats_chats_messages(
     client: OFAuthClient,
@@ -38,6 +43,7 @@ def list_chats_chats_messages(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/chats/{user_id}/messages",
         query=query,
     )
 
@@ -49,17 +55,19 @@ def iter_chats_chats_messages(
     first_id: Optional[str] = None,
     include_users: Optional[bool] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     Chat messages
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -68,35 +76,66 @@ def iter_chats_chats_messages(
         for item in iter_chats_chats_messages(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_chats_chats_messages,
+        client,
+        OFFSET,
+        {
+            "user_id": user_id,
+            "query": query,
+            "last_id": last_id,
+            "first_id": first_id,
+            "include_users": include_users,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_chats_chats_messages(
+    client: AsyncOFAuthClient,
+    user_id: str,
+    query: Optional[str] = None,
+    last_id: Optional[str] = None,
+    first_id: Optional[str] = None,
+    include_users: Optional[bool] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    Chat messages
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_chats_chats_messages(
-            client=client,
-            user_id=user_id,
-            query=query,
-            last_id=last_id,
-            first_id=first_id,
-            include_users=include_users,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_chats_chats_messages(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_chats_chats_messages,
+        client,
+        OFFSET,
+        {
+            "user_id": user_id,
+            "query": query,
+            "last_id": last_id,
+            "first_id": first_id,
+            "include_users": include_users,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def create_chats_chats_messages(
     client: OFAuthClient,
@@ -113,6 +152,7 @@ def create_chats_chats_messages(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/access/chats/{user_id}/messages",
         body=body,
     )
 
@@ -132,6 +172,7 @@ def delete_chats_chats_messages(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/chats/{user_id}/messages/{message_id}",
         body=body,
     )
 
@@ -150,6 +191,7 @@ def create_mass_messages(
         "POST",
         path,
         body=body,
+        response_model="V2AccessMassMessagesPostResponse",
     )
 
 def get_mass_messages(
@@ -166,6 +208,7 @@ def get_mass_messages(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/mass-messages/{mass_message_id}",
     )
 
 def replace_mass_messages(
@@ -183,6 +226,7 @@ def replace_mass_messages(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/mass-messages/{mass_message_id}",
         body=body,
     )
 
@@ -200,6 +244,7 @@ def delete_mass_messages(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/mass-messages/{mass_message_id}",
     )
 
 def list_chats(
@@ -230,6 +275,7 @@ def list_chats(
         "GET",
         path,
         query=query,
+        response_model="V2AccessChatsGetResponse",
     )
 
 def iter_chats(
@@ -239,17 +285,19 @@ def iter_chats(
     query: Optional[str] = None,
     user_list_id: Optional[int] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     Chats list
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -258,34 +306,63 @@ def iter_chats(
         for item in iter_chats(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_chats,
+        client,
+        OFFSET,
+        {
+            "order": order,
+            "filter": filter,
+            "query": query,
+            "user_list_id": user_list_id,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_chats(
+    client: AsyncOFAuthClient,
+    order: Optional[Literal["recent", "old"]] = None,
+    filter: Optional[Literal["priority", "who_tipped", "unread"]] = None,
+    query: Optional[str] = None,
+    user_list_id: Optional[int] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    Chats list
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_chats(
-            client=client,
-            order=order,
-            filter=filter,
-            query=query,
-            user_list_id=user_list_id,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_chats(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_chats,
+        client,
+        OFFSET,
+        {
+            "order": order,
+            "filter": filter,
+            "query": query,
+            "user_list_id": user_list_id,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_chats_chats_media(
     client: OFAuthClient,
@@ -315,6 +392,7 @@ def list_chats_chats_media(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/chats/{user_id}/media",
         query=query,
     )
 
@@ -326,17 +404,19 @@ def iter_chats_chats_media(
     opened: Optional[Literal["0", "1", "true", "false"]] = None,
     type: Optional[Literal["photos", "videos", "audios"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     Get chat media
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -345,32 +425,63 @@ def iter_chats_chats_media(
         for item in iter_chats_chats_media(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_chats_chats_media,
+        client,
+        OFFSET,
+        {
+            "user_id": user_id,
+            "skip_users": skip_users,
+            "last_id": last_id,
+            "opened": opened,
+            "type": type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_chats_chats_media(
+    client: AsyncOFAuthClient,
+    user_id: str,
+    skip_users: Optional[str] = None,
+    last_id: Optional[str] = None,
+    opened: Optional[Literal["0", "1", "true", "false"]] = None,
+    type: Optional[Literal["photos", "videos", "audios"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    Get chat media
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_chats_chats_media(
-            client=client,
-            user_id=user_id,
-            skip_users=skip_users,
-            last_id=last_id,
-            opened=opened,
-            type=type,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_chats_chats_media(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_chats_chats_media,
+        client,
+        OFFSET,
+        {
+            "user_id": user_id,
+            "skip_users": skip_users,
+            "last_id": last_id,
+            "opened": opened,
+            "type": type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
@@ -0,0 +1,348 @@
+"""
+Per-request instrumentation.
+
+With ``on_request=`` set, a client emits one ``RequestEvent`` per call:
+endpoint template, connection, status, a latency breakdown (connection
+pool queue, TCP/TLS connect, time to first byte, total), body sizes, retry
+count and cache outcome. ``MetricsAggregator`` folds events into
+histograms in-process, and ``to_prometheus`` renders those in the
+Prometheus text format.
+
+Example::
+
+    metrics = MetricsAggregator()
+    client = OFAuthClient(api_key="...", on_request=metrics)
+    ...
+    print(metrics.slowest_endpoints(5))
+    print(to_prometheus(metrics))
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .middleware import AsyncHandler, Handler, Middleware, Request, Response
+
+# ============================================================================
+# Events
+# ============================================================================
+
+
+@dataclass
+class RequestEvent:
+    """
+    One API call, as seen by the caller.
+
+    Durations are in seconds. ``queue``, ``connect`` and ``ttfb`` come from
+    the HTTP transport and are summed over retry attempts (``ttfb`` is for
+    the last attempt); they stay 0 / None for cache hits and for custom
+    transports that do not report connection events.
+    """
+
+    endpoint: str
+    method: str
+    path: str
+    connection_id: Optional[str]
+    status: Optional[int]
+    total: float
+    queue: float = 0.0
+    connect: float = 0.0
+    ttfb: Optional[float] = None
+    throttle: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    cache: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class RequestTimings:
+    """Collects transport timings for one call via the httpx ``trace`` extension."""
+
+    __slots__ = ("queue", "connect", "ttfb", "_attempt_started", "_waiting", "_connect_started")
+
+    def __init__(self) -> None:
+        self.queue = 0.0
+        self.connect = 0.0
+        self.ttfb: Optional[float] = None
+        self._attempt_started = 0.0
+        self._waiting = False
+        self._connect_started = 0.0
+
+    def start_attempt(self) -> None:
+        self._attempt_started = time.perf_counter()
+        self._waiting = True
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if self._waiting:
+            # The first transport event fires once the pool has handed out a connection
+            self.queue += now - self._attempt_started
+            self._waiting = False
+        if name.endswith(("connect_tcp.started", "start_tls.started")):
+            self._connect_started = now
+        elif name.endswith(("connect_tcp.complete", "start_tls.complete")):
+            self.connect += now - self._connect_started
+        elif name.endswith("receive_response_headers.complete"):
+            self.ttfb = now - self._attempt_started
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self.trace(name, info)
+
+
+class InstrumentationMiddleware(Middleware):
+    """Outermost pipeline layer; emits a ``RequestEvent`` to ``listener`` per call."""
+
+    def __init__(self, listener: Callable[[RequestEvent], Any]) -> None:
+        self.listener = listener
+
+    def handle(self, request: Request, call_next: Handler) -> Response:
+        request.context["timings"] = RequestTimings()
+        started = time.perf_counter()
+        response = error = None
+        try:
+            response = call_next(request)
+            return response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self.listener(self._event(request, response, error, time.perf_counter() - started))
+
+    async def ahandle(self, request: Request, call_next: AsyncHandler) -> Response:
+        request.context["timings"] = RequestTimings()
+        started = time.perf_counter()
+        response = error = None
+        try:
+            response = await call_next(request)
+            return response
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self.listener(self._event(request, response, error, time.perf_counter() - started))
+
+    @staticmethod
+    def _event(
+        request: Request,
+        response: Optional[Response],
+        error: Optional[BaseException],
+        total: float,
+    ) -> RequestEvent:
+        context = request.context
+        timings: RequestTimings = context["timings"]
+        return RequestEvent(
+            endpoint=request.endpoint,
+            method=request.method,
+            path=request.path,
+            connection_id=request.connection_id,
+            status=response.status_code if response is not None else None,
+            total=total,
+            queue=timings.queue,
+            connect=timings.connect,
+            ttfb=timings.ttfb,
+            throttle=context.get("throttle", 0.0),
+            request_bytes=len(request.content or b""),
+            response_bytes=len(response.content) if response is not None else 0,
+            retries=context.get("retries", 0),
+            cache=context.get("cache"),
+            error=type(error).__name__ if error is not None else None,
+        )
+
+
+# ============================================================================
+# Aggregation
+# ============================================================================
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PHASES = ("total", "queue", "connect", "ttfb")
+
+
+class Histogram:
+    """Cumulative-bucket histogram, Prometheus style."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        running, out = 0, []
+        for count in self.counts:
+            running += count
+            out.append(running)
+        return out
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        for index, count in enumerate(self.counts):
+            if running + count >= rank and count:
+                lower = self.buckets[index - 1] if index else 0.0
+                if index == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[index] - lower) * (rank - running) / count
+            running += count
+        return self.buckets[-1]
+
+
+class MetricsAggregator:
+    """
+    Thread-safe in-process aggregation of ``RequestEvent``s.
+
+    Pass an instance as ``on_request=``; it keeps per-endpoint latency
+    histograms for each phase, request/byte/retry/cache counters and
+    per-connection totals.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latency: Dict[Tuple[str, str], Dict[str, Histogram]] = {}
+            self.requests: Counter = Counter()  # (endpoint, method, status)
+            self.bytes: Counter = Counter()  # (endpoint, method, direction)
+            self.retries: Counter = Counter()  # (endpoint, method)
+            self.cache: Counter = Counter()  # (endpoint, method, result)
+            self.connections: Dict[str, List[float]] = {}  # id -> [requests, seconds]
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.record(event)
+
+    def record(self, event: RequestEvent) -> None:
+        key = (event.endpoint, event.method)
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            phases = self.latency.get(key)
+            if phases is None:
+                phases = self.latency[key] = {phase: Histogram(self.buckets) for phase in PHASES}
+            phases["total"].observe(event.total)
+            if event.cache != "hit":
+                phases["queue"].observe(event.queue)
+                phases["connect"].observe(event.connect)
+            if event.ttfb is not None:
+                phases["ttfb"].observe(event.ttfb)
+            self.requests[(*key, status)] += 1
+            self.bytes[(*key, "sent")] += event.request_bytes
+            self.bytes[(*key, "received")] += event.response_bytes
+            if event.retries:
+                self.retries[key] += event.retries
+            if event.cache is not None:
+                self.cache[(*key, event.cache)] += 1
+            if event.connection_id:
+                totals = self.connections.setdefault(event.connection_id, [0, 0.0])
+                totals[0] += 1
+                totals[1] += event.total
+
+    def slowest_endpoints(
+        self, n: int = 10, quantile: float = 0.95, phase: str = "total"
+    ) -> List[Tuple[str, str, float]]:
+        """``(method, endpoint, seconds)`` for the ``n`` slowest endpoints at ``quantile``."""
+        with self._lock:
+            ranked = [
+                (method, endpoint, phases[phase].quantile(quantile))
+                for (endpoint, method), phases in self.latency.items()
+            ]
+        return sorted(ranked, key=lambda row: row[2], reverse=True)[:n]
+
+    def hot_connections(self, n: int = 10) -> List[Tuple[str, int, float]]:
+        """``(connection_id, requests, seconds)`` for the ``n`` busiest connections."""
+        with self._lock:
+            rows = [(conn, int(count), seconds) for conn, (count, seconds) in self.connections.items()]
+        return sorted(rows, key=lambda row: (row[1], row[2]), reverse=True)[:n]
+
+
+# ============================================================================
+# Prometheus exporter
+# ============================================================================
+
+
+def to_prometheus(aggregator: MetricsAggregator, namespace: str = "ofauth_sdk") -> str:
+    """Render ``aggregator`` in the Prometheus text exposition format."""
+    lines: List[str] = []
+
+    def header(name: str, kind: str, help_text: str) -> str:
+        lines.append(f"# HELP {namespace}_{name} {help_text}")
+        lines.append(f"# TYPE {namespace}_{name} {kind}")
+        return f"{namespace}_{name}"
+
+    with aggregator._lock:
+        latency = {key: dict(phases) for key, phases in aggregator.latency.items()}
+        counters = {
+            "requests": dict(aggregator.requests),
+            "bytes": dict(aggregator.bytes),
+            "retries": dict(aggregator.retries),
+            "cache": dict(aggregator.cache),
+        }
+        connections = {conn: list(totals) for conn, totals in aggregator.connections.items()}
+
+    for metric, phase, help_text in (
+        ("request_duration_seconds", "total", "End-to-end request duration, including retries and waits"),
+        ("request_queue_seconds", "queue", "Time spent waiting for a pooled connection"),
+        ("request_connect_seconds", "connect", "Time spent opening TCP/TLS connections"),
+        ("request_ttfb_seconds", "ttfb", "Time from sending a request to its response headers"),
+    ):
+        name = header(metric, "histogram", help_text)
+        for (endpoint, method), phases in sorted(latency.items()):
+            hist = phases[phase]
+            labels = _labels(endpoint=endpoint, method=method)
+            for bound, count in zip((*hist.buckets, "+Inf"), hist.cumulative()):
+                le = bound if isinstance(bound, str) else repr(float(bound))
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {hist.sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+    name = header("requests_total", "counter", "Requests by endpoint, method and status")
+    for (endpoint, method, status), count in sorted(counters["requests"].items()):
+        lines.append(f"{name}{{{_labels(endpoint=endpoint, method=method, status=status)}}} {count}")
+
+    name = header("bytes_total", "counter", "Body bytes sent and received")
+    for (endpoint, method, direction), count in sorted(counters["bytes"].items()):
+        lines.append(f"{name}{{{_labels(endpoint=endpoint, method=method, direction=direction)}}} {count}")
+
+    name = header("retries_total", "counter", "Retried attempts")
+    for (endpoint, method), count in sorted(counters["retries"].items()):
+        lines.append(f"{name}{{{_labels(endpoint=endpoint, method=method)}}} {count}")
+
+    name = header("cache_total", "counter", "Response cache lookups by result")
+    for (endpoint, method, result), count in sorted(counters["cache"].items()):
+        lines.append(f"{name}{{{_labels(endpoint=endpoint, method=method, result=result)}}} {count}")
+
+    requests_name = header("connection_requests_total", "counter", "Requests per connection")
+    for conn, (count, _) in sorted(connections.items()):
+        lines.append(f"{requests_name}{{{_labels(connection_id=conn)}}} {int(count)}")
+    seconds_name = header("connection_seconds_total", "counter", "Request time per connection")
+    for conn, (_, seconds) in sorted(connections.items()):
+        lines.append(f"{seconds_name}{{{_labels(connection_id=conn)}}} {seconds!r}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
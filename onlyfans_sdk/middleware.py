@@ -0,0 +1,384 @@
+"""
+Request pipeline.
+
+Every call a client makes — typed endpoint functions, ``proxy()`` and each
+step of ``upload_media()`` — becomes a ``Request`` that passes through a
+chain of middlewares before a single send path puts it on the wire. A
+middleware wraps the rest of the chain:
+
+    class Timing(Middleware):
+        def handle(self, request, call_next):
+            started = time.perf_counter()
+            response = call_next(request)
+            print(request.method, request.path, response.status_code,
+                  time.perf_counter() - started)
+            return response
+
+        async def ahandle(self, request, call_next):
+            ...  # same, with ``await call_next(request)``
+
+    client = OFAuthClient(api_key="...", middleware=[Timing()])
+
+Retries, rate limiting, caching and request coalescing are middlewares
+too; the client's ``retry=``, ``rate_limiter=``, ``cache=`` and
+``coalesce=`` options install them.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional
+
+import httpx
+
+from .cache import ResponseCache, request_key
+from .codec import JSONCodec
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+_UNSET: Any = object()
+
+# ============================================================================
+# Request and response
+# ============================================================================
+
+
+class Request:
+    """
+    An API call on its way through the pipeline.
+
+    Attributes:
+        method: HTTP method, upper case.
+        path: API path without the base URL (e.g. ``/v2/access/users/123``).
+        endpoint: Path template the call belongs to
+            (e.g. ``/v2/access/users/{user_id}``), for grouping metrics.
+        url: Absolute URL.
+        params: Query parameters, ``None`` values already removed.
+        headers: Request headers, including ``apiKey`` and ``x-connection-id``.
+        content: Encoded body, or None.
+        context: Scratch space for middlewares to annotate the call
+            (e.g. ``context["cache"] = "hit"``).
+    """
+
+    __slots__ = ("method", "path", "endpoint", "url", "params", "headers", "content", "context")
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        context: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        self.method = method.upper()
+        self.path = path
+        self.endpoint = endpoint if endpoint is not None else path
+        self.url = url
+        self.params = params
+        self.headers = headers if headers is not None else {}
+        self.content = content
+        self.context = context if context is not None else {}
+
+    @property
+    def api_key(self) -> str:
+        return self.headers.get("apiKey", "")
+
+    @property
+    def connection_id(self) -> Optional[str]:
+        return self.headers.get("x-connection-id")
+
+    def __repr__(self) -> str:
+        return f"<Request {self.method} {self.path}>"
+
+
+class Response:
+    """
+    The outcome of a ``Request``: status, headers, raw body and the decoded
+    body (``data``), decoded at most once and only when asked for.
+
+    Middlewares that answer without the network (e.g. a cache hit) build one
+    with ``data=`` set and no ``content``.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "request", "http_response", "_codec", "_data")
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Optional[Mapping[str, str]] = None,
+        content: bytes = b"",
+        *,
+        data: Any = _UNSET,
+        codec: Optional[JSONCodec] = None,
+        request: Optional[Request] = None,
+        http_response: Optional[httpx.Response] = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers if headers is not None else httpx.Headers()
+        self.content = content
+        self.request = request
+        self.http_response = http_response
+        self._codec = codec
+        self._data = data
+
+    @classmethod
+    def from_httpx(cls, response: httpx.Response, codec: JSONCodec, request: Request) -> "Response":
+        # httpx binds the read stream back to its response; that cycle keeps the
+        # request body (e.g. an upload part) alive until the next cyclic GC.
+        # The body is read by now, so swap in a plain stream and free it now.
+        response.stream = httpx.ByteStream(response.content)
+        return cls(
+            response.status_code,
+            response.headers,
+            response.content,
+            codec=codec,
+            request=request,
+            http_response=response,
+        )
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def is_json(self) -> bool:
+        return "application/json" in self.headers.get("content-type", "")
+
+    @property
+    def decoded(self) -> bool:
+        """Whether ``data`` has been decoded (or was supplied) already."""
+        return self._data is not _UNSET
+
+    @property
+    def data(self) -> Any:
+        """Decoded body: JSON as Python objects, other content as text, ``{}`` for 204."""
+        if self._data is _UNSET:
+            if self.status_code == 204:
+                self._data = {}
+            elif self.is_json:
+                self._data = self.json()
+            else:
+                self._data = self.text
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+
+    @property
+    def text(self) -> str:
+        if self.http_response is not None:
+            return self.http_response.text
+        return self.content.decode("utf-8", "replace")
+
+    def json(self) -> Any:
+        if self._codec is not None:
+            return self._codec.decode(self.content)
+        return httpx.Response(self.status_code, content=self.content).json()
+
+    def __repr__(self) -> str:
+        return f"<Response [{self.status_code}]>"
+
+
+Handler = Callable[[Request], Response]
+AsyncHandler = Callable[[Request], Awaitable[Response]]
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+
+class Middleware:
+    """
+    Base class for pipeline middlewares.
+
+    Override ``handle`` for ``OFAuthClient`` and ``ahandle`` for
+    ``AsyncOFAuthClient``. Both default to passing the request on unchanged.
+    """
+
+    def handle(self, request: Request, call_next: Handler) -> Response:
+        return call_next(request)
+
+    async def ahandle(self, request: Request, call_next: AsyncHandler) -> Response:
+        return await call_next(request)
+
+
+def build_pipeline(middleware: Iterable[Middleware], send: Handler) -> Handler:
+    """Chain ``middleware`` (outermost first) around ``send``."""
+    handler = send
+    for layer in reversed(list(middleware)):
+        handler = _bind(layer.handle, handler)
+    return handler
+
+
+def build_async_pipeline(middleware: Iterable[Middleware], send: AsyncHandler) -> AsyncHandler:
+    """Async counterpart of ``build_pipeline``."""
+    handler = send
+    for layer in reversed(list(middleware)):
+        handler = _bind(layer.ahandle, handler)
+    return handler
+
+
+def _bind(handle: Callable[..., Any], call_next: Callable[..., Any]) -> Callable[[Request], Any]:
+    return lambda request: handle(request, call_next)
+
+
+# ============================================================================
+# Built-in middlewares
+# ============================================================================
+
+
+class RetryMiddleware(Middleware):
+    """Repeats failed attempts per a ``RetryPolicy``; records ``context["retries"]``."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+
+    def handle(self, request: Request, call_next: Handler) -> Response:
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            request.context["retries"] = attempt - 1
+            try:
+                response = call_next(request)
+            except httpx.TransportError as exc:
+                delay = self.policy.delay_after_error(request.method, exc, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.delay_after_response(request.method, response, attempt, time.monotonic() - started)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+
+    async def ahandle(self, request: Request, call_next: AsyncHandler) -> Response:
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            request.context["retries"] = attempt - 1
+            try:
+                response = await call_next(request)
+            except httpx.TransportError as exc:
+                delay = self.policy.delay_after_error(request.method, exc, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.delay_after_response(request.method, response, attempt, time.monotonic() - started)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+
+
+class RateLimitMiddleware(Middleware):
+    """Waits for a ``RateLimiter`` token before every attempt; records ``context["throttle"]``."""
+
+    def __init__(self, limiter: RateLimiter) -> None:
+        self.limiter = limiter
+
+    def handle(self, request: Request, call_next: Handler) -> Response:
+        waited = self.limiter.acquire(request.api_key, request.connection_id, request.path)
+        request.context["throttle"] = request.context.get("throttle", 0.0) + waited
+        return call_next(request)
+
+    async def ahandle(self, request: Request, call_next: AsyncHandler) -> Response:
+        waited = await self.limiter.aacquire(request.api_key, request.connection_id, request.path)
+        request.context["throttle"] = request.context.get("throttle", 0.0) + waited
+        return await call_next(request)
+
+
+class CacheMiddleware(Middleware):
+    """
+    Serves GETs from a ``ResponseCache``, revalidating stale entries with
+    conditional requests. Records ``context["cache"]`` as ``"hit"``,
+    ``"revalidated"`` or ``"miss"``. Requests to endpoints the cache has no
+    lifetime for pass straight through: no lookup, no eager decode.
+    """
+
+    def __init__(self, cache: ResponseCache) -> None:
+        self.cache = cache
+
+    def handle(self, request: Request, call_next: Handler) -> Response:
+        if not self._cacheable(request):
+            return call_next(request)
+        key, entry, response = self._before(request)
+        if response is not None:
+            return response
+        return self._after(request, key, entry, call_next(request))
+
+    async def ahandle(self, request: Request, call_next: AsyncHandler) -> Response:
+        if not self._cacheable(request):
+            return await call_next(request)
+        key, entry, response = self._before(request)
+        if response is not None:
+            return response
+        return self._after(request, key, entry, await call_next(request))
+
+    def _cacheable(self, request: Request) -> bool:
+        return request.method == "GET" and self.cache.ttl_for(request.path) is not None
+
+    def _before(self, request: Request) -> tuple:
+        key = self.cache.key(request.api_key, request.path, request.params, request.connection_id)
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.fresh():
+            request.context["cache"] = "hit"
+            return key, entry, Response(200, data=entry.value, request=request)
+        if entry is not None:
+            request.headers.update(entry.validators())
+        return key, entry, None
+
+    def _after(self, request: Request, key: str, entry: Any, response: Response) -> Response:
+        if response.status_code == 304 and entry is not None:
+            request.context["cache"] = "revalidated"
+            value = self.cache.revalidated(key, entry, response.headers)
+            return Response(200, response.headers, data=value, request=request)
+        request.context["cache"] = "miss"
+        if response.is_success:
+            self.cache.set(key, response.data, request.path, request.connection_id, response.headers)
+        return response
+
+
+class CoalesceMiddleware(Middleware):
+    """Lets identical concurrent GETs share one in-flight call and its response."""
+
+    def __init__(self) -> None:
+        self._flights = SingleFlight()
+        self._async_flights = AsyncSingleFlight()
+
+    def handle(self, request: Request, call_next: Handler) -> Response:
+        if request.method != "GET":
+            return call_next(request)
+        return self._flights.do(self._key(request), lambda: call_next(request))
+
+    async def ahandle(self, request: Request, call_next: AsyncHandler) -> Response:
+        if request.method != "GET":
+            return await call_next(request)
+        return await self._async_flights.do(self._key(request), lambda: call_next(request))
+
+    @staticmethod
+    def _key(request: Request) -> str:
+        return request_key(request.api_key, request.path, request.params, request.connection_id)
+
+
+def default_middleware(
+    retry: Optional[RetryPolicy] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    cache: Optional[ResponseCache] = None,
+    coalesce: bool = False,
+) -> List[Middleware]:
+    """The built-in layers for the client options, outermost first."""
+    layers: List[Middleware] = []
+    if coalesce:
+        layers.append(CoalesceMiddleware())
+    if cache is not None:
+        layers.append(CacheMiddleware(cache))
+    if retry is not None:
+        layers.append(RetryMiddleware(retry))
+    if rate_limiter is not None:
+        layers.append(RateLimitMiddleware(rate_limiter))
+    return layers
@@ -0,0 +1,1331 @@
+"""
+Generated Pydantic models for API requests and responses.
+
+Schemas live in one submodule per API module (``models.earnings``,
+``models.messages``, ...), with schemas used by several API modules in
+``models.common``. Every generated name is also available here; its
+submodule is imported on first access, so only the schemas in use are
+ever built.
+"""
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .common import (
+        V2AccountWhoamiGetResponse1,
+        Imported,
+        AvatarThumbs,
+        List,
+        HeaderSize,
+        HeaderThumbs,
+        Subscribe,
+        SubscribedByData,
+        SubscribedOnData,
+        V2AccessSelfPatchResponse,
+        ChartItem,
+        Type2,
+        User3,
+        ReleaseForm,
+        VideoSources,
+        Source,
+        Full,
+        Thumb,
+        Preview,
+        SquarePreview,
+        Files,
+        MediaItem,
+        Author,
+        Option2,
+        ListItem6,
+        Item5,
+        MediaItems,
+        MediaItems1,
+        User13,
+        Partner,
+        Guest,
+        ReleaseForms,
+        UserTag,
+        V2AccessPostsPostIdDeleteResponse,
+        FromUser,
+        Opened,
+        Online,
+        Type22,
+        List2,
+        Counters2,
+        List9,
+        ListItem26,
+        V2AccessVaultMediaGetResponse,
+        Type33,
+        Rules,
+        V2DynamicRulesGetResponse,
+        V2DynamicRulesGetResponse1,
+        V2DynamicRulesSignPostRequest,
+        Signed,
+        V2DynamicRulesSignPostResponse,
+    )
+    from .account import (
+        V2AccountWhoamiGetResponse,
+        Status,
+        UserData,
+        ListItem,
+        V2AccountConnectionsGetResponse,
+        ImageQuality,
+        VideoQuality,
+        StorageLimitPurgeStrategy,
+        SettingsOverrides,
+        Stats,
+        VaultPlus,
+        V2AccountConnectionsConnectionIdSettingsGetResponse,
+        Settings,
+        VaultPlus1,
+        V2AccountConnectionsConnectionIdSettingsPatchRequest,
+        SettingsOverrides1,
+        VaultPlus2,
+        Settings1,
+        PurgeResult,
+        V2AccountConnectionsConnectionIdSettingsPatchResponse,
+        V2AccountConnectionsImportPostRequest,
+        V2AccountConnectionsImportPostResponse,
+        V2AccountConnectionsImportConnectionIdPatchRequest,
+        V2AccountConnectionsImportConnectionIdPatchResponse,
+        DefaultSettings,
+        VaultPlus3,
+        V2AccountSettingsGetResponse,
+        DefaultSettings1,
+        VaultPlus4,
+        V2AccountSettingsPatchRequest,
+        DefaultSettings2,
+        VaultPlus5,
+        Settings2,
+        PurgeResult1,
+        BroadcastResult,
+        V2AccountSettingsPatchResponse,
+    )
+    from .analytics import (
+        By,
+        By1,
+        V2AccessAnalyticsPostsChartGetResponse1,
+        V2AccessAnalyticsPostsChartGetResponse,
+        By2,
+        Option,
+        UniqueLookChartItem,
+        LookChartItem,
+        LikeChartItem,
+        CommentChartItem,
+        TipChartItem,
+        Stats2,
+        Option1,
+        Voting,
+        Item,
+        V2AccessAnalyticsPostsTopGetResponse,
+        TipSumChartItem,
+        PurchasesChartItem,
+        V2AccessAnalyticsPostsPostIdGetResponse,
+        By3,
+        V2AccessAnalyticsStreamsChartGetResponse1,
+        V2AccessAnalyticsStreamsChartGetResponse,
+        User4,
+        ReleaseForm1,
+        Full1,
+        Preview1,
+        Files1,
+        MediaItem1,
+        Stats3,
+        Item1,
+        V2AccessAnalyticsStreamsTopGetResponse,
+        By5,
+        V2AccessAnalyticsStoriesChartGetResponse1,
+        V2AccessAnalyticsStoriesChartGetResponse,
+        By6,
+        User5,
+        ReleaseForm2,
+        Full2,
+        Preview2,
+        Files2,
+        MediaItem2,
+        Entity,
+        Positions,
+        Question,
+        Viewer,
+        User6,
+        ReleaseForm3,
+        CoordinateParams,
+        Post,
+        Position,
+        Text,
+        Item2,
+        V2AccessAnalyticsStoriesTopGetResponse,
+        GroupMessages,
+        GroupMessagesPurchases,
+        DirectMessages,
+        DirectMessagesPurchases,
+        V2AccessAnalyticsMassMessagesChartGetResponse,
+        User7,
+        ReleaseForm4,
+        Full3,
+        Preview3,
+        Files3,
+        MediaItem3,
+        User8,
+        ReleaseForm5,
+        Full4,
+        Preview5,
+        Files4,
+        Preview4,
+        User9,
+        ReleaseForm6,
+        Item3,
+        V2AccessAnalyticsMassMessagesSentGetResponse,
+        User10,
+        ReleaseForm7,
+        Full5,
+        Preview6,
+        Files5,
+        MediaItem4,
+        User11,
+        ReleaseForm8,
+        Full6,
+        Preview8,
+        Files6,
+        Preview7,
+        User12,
+        ReleaseForm9,
+        Item4,
+        V2AccessAnalyticsMassMessagesPurchasedGetResponse,
+        V2AccessAnalyticsMassMessagesMassMessageIdBuyersGetResponse,
+        V2AccessAnalyticsPromotionsChartGetResponse1,
+        V2AccessAnalyticsPromotionsChartGetResponse,
+        V2AccessAnalyticsPromotionsTopGetResponse,
+        V2AccessAnalyticsTrialsChartGetResponse1,
+        V2AccessAnalyticsTrialsChartGetResponse,
+        Item6,
+        V2AccessAnalyticsTrialsTopGetResponse,
+        V2AccessAnalyticsCampaignsChartGetResponse1,
+        V2AccessAnalyticsCampaignsChartGetResponse,
+        ListItem7,
+        V2AccessAnalyticsCampaignsTopGetResponse,
+        By7,
+        Visitor,
+        DurationItem,
+        Chart,
+        Total,
+        V2AccessAnalyticsVisitorCountriesChartGetResponse,
+        Totals,
+        ViewsCount,
+        Row,
+        TopCountries,
+        V2AccessAnalyticsVisitorCountriesTopGetResponse,
+    )
+    from .dynamic_rules import (
+        V2DynamicRulesSignPostResponse1,
+        V2DynamicRulesStatusGetResponse,
+    )
+    from .earnings import (
+        V2AccessEarningsChartGetResponse,
+        Type1,
+        TipsSource,
+        Amounts,
+        User1,
+        ListItem4,
+        V2AccessEarningsTransactionsGetResponse,
+        Payment,
+        ListItem5,
+        V2AccessEarningsChargebacksGetResponse,
+    )
+    from .link import (
+        Geolocation,
+        V2LinkInitPostRequest,
+        V2LinkInitPostResponse,
+        V2LinkInitPostResponse1,
+        Status4,
+        Option25,
+        PhoneCode,
+        FaceCode,
+        TwoFactorState,
+        Data,
+        Session,
+        UserData3,
+        Data1,
+        V2LinkClientSecretGetResponse,
+    )
+    from .messages import (
+        MediaItems4,
+        MediaItems5,
+        User21,
+        ReleaseForms2,
+        V2AccessChatsUserIdMessagesPostRequest,
+        FromUser1,
+        User22,
+        ReleaseForm16,
+        Full12,
+        Preview14,
+        Files12,
+        MediaItem10,
+        V2AccessChatsUserIdMessagesPostResponse,
+        FromUser2,
+        FromUser3,
+        User23,
+        ReleaseForm17,
+        Full13,
+        Preview15,
+        Files13,
+        MediaItem11,
+        ListItem10,
+        V2AccessChatsUserIdMessagesGetResponse,
+        V2AccessChatsUserIdMessagesMessageIdDeleteRequest,
+        FromUser4,
+        FromUser5,
+        User24,
+        ReleaseForm18,
+        Full14,
+        Preview16,
+        Files14,
+        MediaItem12,
+        MediaTypes,
+        Queue,
+        V2AccessChatsUserIdMessagesMessageIdDeleteResponse,
+        MediaItems6,
+        MediaItems7,
+        User25,
+        ReleaseForms3,
+        UserIds,
+        UserIds1,
+        UserLists,
+        UserLists1,
+        ExcludeUserLists,
+        ExcludeUserLists1,
+        V2AccessMassMessagesPostRequest,
+        V2AccessMassMessagesPostResponse,
+        MediaItems8,
+        MediaItems9,
+        ReleaseForms4,
+        UserIds2,
+        UserIds3,
+        UserLists2,
+        UserLists3,
+        ExcludeUserLists2,
+        ExcludeUserLists3,
+        V2AccessMassMessagesMassMessageIdPutRequest,
+        V2AccessMassMessagesMassMessageIdPutResponse,
+        FromUser6,
+        FromUser7,
+        User27,
+        ReleaseForm19,
+        Full15,
+        Preview17,
+        Files15,
+        MediaItem13,
+        Queue1,
+        V2AccessMassMessagesMassMessageIdDeleteResponse,
+        FromUser8,
+        FromUser9,
+        User28,
+        ReleaseForm20,
+        Full16,
+        Preview18,
+        Files16,
+        MediaItem14,
+        V2AccessMassMessagesMassMessageIdGetResponse,
+        Order,
+        Filter2,
+        WithUser,
+        FromUser10,
+        FromUser11,
+        User29,
+        ReleaseForm21,
+        Full17,
+        Preview19,
+        Files17,
+        MediaItem15,
+        LastMessage,
+        ListItem11,
+        V2AccessChatsGetResponse,
+        Type20,
+        FromUser12,
+        FromUser13,
+        Type21,
+        User30,
+        ReleaseForm22,
+        Full18,
+        Preview20,
+        Files18,
+        MediaItem16,
+        ListItem12,
+        V2AccessChatsUserIdMediaGetResponse,
+    )
+    from .posts import (
+        V2AccessPostsPostRequest,
+        User14,
+        ReleaseForm10,
+        Full7,
+        Preview9,
+        Files7,
+        MediaItem5,
+        V2AccessPostsPostResponse,
+        SortBy2,
+        User15,
+        ReleaseForm11,
+        Full8,
+        Preview10,
+        Files8,
+        MediaItem6,
+        ListItem8,
+        Counters,
+        V2AccessPostsGetResponse,
+        MediaItems2,
+        MediaItems3,
+        User16,
+        ReleaseForms1,
+        V2AccessPostsPostIdPutRequest,
+        User17,
+        ReleaseForm12,
+        Full9,
+        Preview11,
+        Files9,
+        MediaItem7,
+        V2AccessPostsPostIdPutResponse,
+        User18,
+        ReleaseForm13,
+        Full10,
+        Preview12,
+        Files10,
+        MediaItem8,
+        User19,
+        ReleaseForm14,
+        V2AccessPostsPostIdGetResponse1,
+        V2AccessPostsPostIdGetResponse,
+        User20,
+        ReleaseForm15,
+        Full11,
+        Preview13,
+        Files11,
+        MediaItem9,
+        ListItem9,
+        V2AccessUsersUserIdPostsGetResponse,
+    )
+    from .promotions import (
+        Stats4,
+        ListItem16,
+        V2AccessPromotionsTrackingLinksGetResponse,
+        V2AccessPromotionsTrackingLinksPostRequest,
+        V2AccessPromotionsTrackingLinksPostResponseItem,
+        V2AccessPromotionsTrackingLinksPostResponse1,
+        V2AccessPromotionsTrackingLinksPostResponse,
+        V2AccessPromotionsTrackingLinksShareAccessPostRequest,
+        V2AccessPromotionsTrackingLinksShareAccessPostResponse,
+        V2AccessPromotionsTrackingLinksShareAccessDeleteRequest,
+        V2AccessPromotionsTrackingLinksShareAccessDeleteResponse,
+        V2AccessPromotionsTrackingLinksTrackingLinkIdGetResponse,
+        V2AccessPromotionsTrackingLinksTrackingLinkIdPutRequest,
+        V2AccessPromotionsTrackingLinksTrackingLinkIdPutResponse,
+        V2AccessPromotionsTrackingLinksTrackingLinkIdDeleteResponse,
+        V2AccessPromotionsTrackingLinksTrackingLinkIdClaimersGetResponse,
+        ListItem17,
+        V2AccessPromotionsTrialLinksGetResponse1,
+        V2AccessPromotionsTrialLinksGetResponseItem,
+        V2AccessPromotionsTrialLinksGetResponse,
+        V2AccessPromotionsTrialLinksPostRequest,
+        V2AccessPromotionsTrialLinksPostResponse,
+        V2AccessPromotionsTrialLinksShareAccessPostRequest,
+        V2AccessPromotionsTrialLinksShareAccessPostResponse,
+        V2AccessPromotionsTrialLinksShareAccessDeleteRequest,
+        V2AccessPromotionsTrialLinksShareAccessDeleteResponse,
+        V2AccessPromotionsTrialLinksTrialLinkIdGetResponse,
+        V2AccessPromotionsTrialLinksTrialLinkIdPutRequest,
+        V2AccessPromotionsTrialLinksTrialLinkIdPutResponse,
+        V2AccessPromotionsTrialLinksTrialLinkIdDeleteResponse,
+        V2AccessPromotionsBundlesGetResponseItem,
+        ListItem18,
+        V2AccessPromotionsBundlesGetResponse1,
+        V2AccessPromotionsBundlesGetResponse,
+        V2AccessPromotionsBundlesPostRequest,
+        V2AccessPromotionsBundlesPostResponse,
+        V2AccessPromotionsBundlesBundleIdGetResponse,
+        V2AccessPromotionsBundlesBundleIdPutRequest,
+        V2AccessPromotionsBundlesBundleIdPutResponse,
+        V2AccessPromotionsBundlesBundleIdDeleteResponse,
+        V2AccessPromotionsGetResponseItem,
+        ListItem19,
+        V2AccessPromotionsGetResponse1,
+        V2AccessPromotionsGetResponse,
+        V2AccessPromotionsPostRequest,
+        V2AccessPromotionsPostResponseItem,
+        V2AccessPromotionsPostResponse1,
+        V2AccessPromotionsPostResponse,
+        V2AccessPromotionsPromotionIdPutRequest,
+        V2AccessPromotionsPromotionIdPutResponse,
+        V2AccessPromotionsPromotionIdDeleteResponse,
+        V2AccessPromotionsPromotionIdStopPostResponse,
+    )
+    from .self import (
+        IsAuth,
+        V2AccessSelfGetResponse1,
+        IsAuth1,
+        V2AccessSelfGetResponse2,
+        V2AccessSelfGetResponse,
+        V2AccessSelfPatchRequest,
+        Type,
+        ListItem1,
+        V2AccessSelfNotificationsGetResponse,
+        Filter,
+        SortBy,
+        SortDirection,
+        ListItem2,
+        V2AccessSelfReleaseFormsGetResponse,
+        User,
+        ListItem3,
+        V2AccessSelfTaggedFriendUsersGetResponse,
+    )
+    from .subscribers import (
+        Filter3,
+        Type23,
+        LatestType,
+        HistoryItem,
+        Subscription,
+        Spending,
+        Capabilities,
+        List1,
+        ListItem13,
+        V2AccessSubscribersGetResponse,
+        V2AccessSubscribersUserIdNotePutRequest,
+        V2AccessSubscribersUserIdNotePutResponse,
+        V2AccessSubscribersUserIdDiscountPutRequest,
+        V2AccessSubscribersUserIdDiscountPutResponse,
+        V2AccessSubscribersUserIdCustomNamePutRequest,
+        V2AccessSubscribersUserIdCustomNamePutResponse,
+    )
+    from .subscriptions import (
+        Paid,
+        Filter4,
+        Type24,
+        ListItem14,
+        V2AccessSubscriptionsGetResponse,
+        Subscriptions,
+        Subscribers,
+        V2AccessSubscriptionsCountGetResponse,
+        All,
+        ListItem15,
+        V2AccessSubscriptionsSubscriptionIdHistoryGetResponse,
+    )
+    from .upload import (
+        V2AccessUploadsCheckPostRequest,
+        User39,
+        ReleaseForm25,
+        Full21,
+        Preview23,
+        Files21,
+        Media5,
+        V2AccessUploadsCheckPostResponse,
+        Mode,
+        VaultUpload,
+        V2AccessUploadsInitPostRequest,
+        V2AccessUploadsInitPostResponse,
+        V2AccessUploadsMediaUploadIdPartsPartNumberPutResponse,
+        User40,
+        ReleaseForm26,
+        Full22,
+        Preview24,
+        Files22,
+        Media6,
+        V2AccessUploadsMediaUploadIdPutResponse,
+        V2AccessUploadsCompletePostRequest,
+        User41,
+        ReleaseForm27,
+        Full23,
+        Preview25,
+        Files23,
+        Media7,
+        V2AccessUploadsCompletePostResponse,
+    )
+    from .user_lists import (
+        SortListItem,
+        User32,
+        ListItem23,
+        V2AccessUsersListsGetResponse,
+        V2AccessUsersListsPostRequest,
+        User33,
+        V2AccessUsersListsPostResponse,
+        V2AccessUsersListsListIdPatchRequest,
+        User34,
+        V2AccessUsersListsListIdPatchResponse,
+        V2AccessUsersListsListIdDeleteResponse,
+        User35,
+        V2AccessUsersListsListIdGetResponse,
+        ListItem24,
+        V2AccessUsersListsListIdUsersGetResponse,
+        User36,
+        List7,
+        UserState,
+        V2AccessUsersListsListIdUsersUserIdPostResponse1,
+        V2AccessUsersListsListIdUsersUserIdPostResponse,
+        ListItem25,
+        V2AccessUsersListsListIdUsersUserIdDeleteResponse1,
+        V2AccessUsersListsListIdUsersUserIdDeleteResponse,
+        ListId,
+        V2AccessUsersUserIdListsPostRequest,
+        Succes,
+        Error,
+        V2AccessUsersUserIdListsPostResponse,
+    )
+    from .users import (
+        SubscribedByData1,
+        SubscribedOnData1,
+        ListItem21,
+        V2AccessUsersRestrictGetResponse,
+        SubscribedByData2,
+        SubscribedOnData2,
+        ListItem22,
+        V2AccessUsersBlockedGetResponse,
+        UserIds4,
+        UserIds5,
+        SubscribedByData3,
+        SubscribedOnData3,
+        User31,
+        V2AccessUsersListGetResponse,
+        SubscribedByData4,
+        SubscribedOnData4,
+        V2AccessUsersSearchGetResponseItem,
+        V2AccessUsersSearchGetResponse,
+        List8,
+        SubscribedByData5,
+        SubscribedOnData5,
+        V2AccessUsersUserIdGetResponse1,
+        V2AccessUsersUserIdGetResponse,
+        V2AccessUsersUserIdRestrictPostResponse,
+        V2AccessUsersUserIdRestrictDeleteResponse,
+    )
+    from .vault import (
+        SortBy4,
+        MediaType,
+        Type25,
+        User37,
+        ReleaseForm23,
+        Full19,
+        Preview21,
+        Files19,
+    )
+    from .vault_lists import (
+        Type26,
+        Type27,
+        Media,
+        ListItem27,
+        Media1,
+        All1,
+        V2AccessVaultListsGetResponse,
+        V2AccessVaultListsPostRequest,
+        Type28,
+        Type29,
+        Media2,
+        V2AccessVaultListsPostResponse,
+        V2AccessVaultListsListIdPatchRequest,
+        Type30,
+        Type31,
+        Media3,
+        V2AccessVaultListsListIdPatchResponse,
+        V2AccessVaultListsListIdDeleteResponse,
+        MediaId,
+        V2AccessVaultListsListIdMediaPostRequest,
+        Type32,
+        Media4,
+        V2AccessVaultListsListIdMediaPostResponse,
+        User38,
+        ReleaseForm24,
+        Full20,
+        Preview22,
+        Files20,
+        ListItem28,
+        V2AccessVaultListsListIdMediaGetResponse,
+    )
+    from .vault_media import (
+        Type38,
+        Status5,
+        Source24,
+        Media8,
+        V2VaultPlusMediaIdGetResponse,
+        V2VaultPlusMediaIdDeleteResponse,
+        V2VaultPlusBatchPostRequest,
+        Media9,
+        Item7,
+        V2VaultPlusBatchPostResponse,
+        Media10,
+        Item8,
+        V2VaultPlusListGetResponse,
+        V2VaultPlusPurgeDeleteResponse,
+    )
+    from .vault_stats import (
+        V2VaultPlusStoreStatusGetResponse,
+        V2VaultPlusStoreStatsGetResponse,
+    )
+    from .vault_store import (
+        RulesGetResponse,
+        RulesGetResponse1,
+        SignPostRequest,
+        SignPostResponse,
+        SignPostResponse1,
+        V2VaultPlusStoreListListIdPostResponse,
+    )
+
+_SUBMODULES = (
+    "common",
+    "account",
+    "analytics",
+    "dynamic_rules",
+    "earnings",
+    "link",
+    "messages",
+    "posts",
+    "promotions",
+    "self",
+    "subscribers",
+    "subscriptions",
+    "upload",
+    "user_lists",
+    "users",
+    "vault",
+    "vault_lists",
+    "vault_media",
+    "vault_stats",
+    "vault_store",
+)
+
+# Generated name -> submodule defining it
+_SCHEMAS = {
+    "V2AccountWhoamiGetResponse": "account",
+    "V2AccountWhoamiGetResponse1": "common",
+    "Status": "account",
+    "Imported": "common",
+    "UserData": "account",
+    "ListItem": "account",
+    "V2AccountConnectionsGetResponse": "account",
+    "ImageQuality": "account",
+    "VideoQuality": "account",
+    "StorageLimitPurgeStrategy": "account",
+    "SettingsOverrides": "account",
+    "Stats": "account",
+    "VaultPlus": "account",
+    "V2AccountConnectionsConnectionIdSettingsGetResponse": "account",
+    "Settings": "account",
+    "VaultPlus1": "account",
+    "V2AccountConnectionsConnectionIdSettingsPatchRequest": "account",
+    "SettingsOverrides1": "account",
+    "VaultPlus2": "account",
+    "Settings1": "account",
+    "PurgeResult": "account",
+    "V2AccountConnectionsConnectionIdSettingsPatchResponse": "account",
+    "V2AccountConnectionsImportPostRequest": "account",
+    "V2AccountConnectionsImportPostResponse": "account",
+    "V2AccountConnectionsImportConnectionIdPatchRequest": "account",
+    "V2AccountConnectionsImportConnectionIdPatchResponse": "account",
+    "DefaultSettings": "account",
+    "VaultPlus3": "account",
+    "V2AccountSettingsGetResponse": "account",
+    "DefaultSettings1": "account",
+    "VaultPlus4": "account",
+    "V2AccountSettingsPatchRequest": "account",
+    "DefaultSettings2": "account",
+    "VaultPlus5": "account",
+    "Settings2": "account",
+    "PurgeResult1": "account",
+    "BroadcastResult": "account",
+    "V2AccountSettingsPatchResponse": "account",
+    "IsAuth": "self",
+    "V2AccessSelfGetResponse1": "self",
+    "IsAuth1": "self",
+    "V2AccessSelfGetResponse2": "self",
+    "V2AccessSelfGetResponse": "self",
+    "V2AccessSelfPatchRequest": "self",
+    "AvatarThumbs": "common",
+    "List": "common",
+    "HeaderSize": "common",
+    "HeaderThumbs": "common",
+    "Subscribe": "common",
+    "SubscribedByData": "common",
+    "SubscribedOnData": "common",
+    "V2AccessSelfPatchResponse": "common",
+    "Type": "self",
+    "ListItem1": "self",
+    "V2AccessSelfNotificationsGetResponse": "self",
+    "Filter": "self",
+    "SortBy": "self",
+    "SortDirection": "self",
+    "ListItem2": "self",
+    "V2AccessSelfReleaseFormsGetResponse": "self",
+    "User": "self",
+    "ListItem3": "self",
+    "V2AccessSelfTaggedFriendUsersGetResponse": "self",
+    "By": "analytics",
+    "ChartItem": "common",
+    "V2AccessEarningsChartGetResponse": "earnings",
+    "Type1": "earnings",
+    "TipsSource": "earnings",
+    "Amounts": "earnings",
+    "User1": "earnings",
+    "ListItem4": "earnings",
+    "V2AccessEarningsTransactionsGetResponse": "earnings",
+    "Payment": "earnings",
+    "ListItem5": "earnings",
+    "V2AccessEarningsChargebacksGetResponse": "earnings",
+    "By1": "analytics",
+    "V2AccessAnalyticsPostsChartGetResponse1": "analytics",
+    "V2AccessAnalyticsPostsChartGetResponse": "analytics",
+    "By2": "analytics",
+    "Type2": "common",
+    "User3": "common",
+    "ReleaseForm": "common",
+    "VideoSources": "common",
+    "Source": "common",
+    "Full": "common",
+    "Thumb": "common",
+    "Option": "analytics",
+    "Preview": "common",
+    "SquarePreview": "common",
+    "Files": "common",
+    "MediaItem": "common",
+    "Author": "common",
+    "UniqueLookChartItem": "analytics",
+    "LookChartItem": "analytics",
+    "LikeChartItem": "analytics",
+    "CommentChartItem": "analytics",
+    "TipChartItem": "analytics",
+    "Stats2": "analytics",
+    "Option1": "analytics",
+    "Voting": "analytics",
+    "Item": "analytics",
+    "V2AccessAnalyticsPostsTopGetResponse": "analytics",
+    "TipSumChartItem": "analytics",
+    "PurchasesChartItem": "analytics",
+    "V2AccessAnalyticsPostsPostIdGetResponse": "analytics",
+    "By3": "analytics",
+    "V2AccessAnalyticsStreamsChartGetResponse1": "analytics",
+    "V2AccessAnalyticsStreamsChartGetResponse": "analytics",
+    "User4": "analytics",
+    "ReleaseForm1": "analytics",
+    "Full1": "analytics",
+    "Option2": "common",
+    "Preview1": "analytics",
+    "Files1": "analytics",
+    "MediaItem1": "analytics",
+    "Stats3": "analytics",
+    "Item1": "analytics",
+    "V2AccessAnalyticsStreamsTopGetResponse": "analytics",
+    "By5": "analytics",
+    "V2AccessAnalyticsStoriesChartGetResponse1": "analytics",
+    "V2AccessAnalyticsStoriesChartGetResponse": "analytics",
+    "By6": "analytics",
+    "User5": "analytics",
+    "ReleaseForm2": "analytics",
+    "Full2": "analytics",
+    "Preview2": "analytics",
+    "Files2": "analytics",
+    "MediaItem2": "analytics",
+    "Entity": "analytics",
+    "Positions": "analytics",
+    "Question": "analytics",
+    "Viewer": "analytics",
+    "User6": "analytics",
+    "ReleaseForm3": "analytics",
+    "CoordinateParams": "analytics",
+    "Post": "analytics",
+    "Position": "analytics",
+    "Text": "analytics",
+    "Item2": "analytics",
+    "V2AccessAnalyticsStoriesTopGetResponse": "analytics",
+    "GroupMessages": "analytics",
+    "GroupMessagesPurchases": "analytics",
+    "DirectMessages": "analytics",
+    "DirectMessagesPurchases": "analytics",
+    "V2AccessAnalyticsMassMessagesChartGetResponse": "analytics",
+    "User7": "analytics",
+    "ReleaseForm4": "analytics",
+    "Full3": "analytics",
+    "Preview3": "analytics",
+    "Files3": "analytics",
+    "MediaItem3": "analytics",
+    "User8": "analytics",
+    "ReleaseForm5": "analytics",
+    "Full4": "analytics",
+    "Preview5": "analytics",
+    "Files4": "analytics",
+    "Preview4": "analytics",
+    "User9": "analytics",
+    "ReleaseForm6": "analytics",
+    "Item3": "analytics",
+    "V2AccessAnalyticsMassMessagesSentGetResponse": "analytics",
+    "User10": "analytics",
+    "ReleaseForm7": "analytics",
+    "Full5": "analytics",
+    "Preview6": "analytics",
+    "Files5": "analytics",
+    "MediaItem4": "analytics",
+    "User11": "analytics",
+    "ReleaseForm8": "analytics",
+    "Full6": "analytics",
+    "Preview8": "analytics",
+    "Files6": "analytics",
+    "Preview7": "analytics",
+    "User12": "analytics",
+    "ReleaseForm9": "analytics",
+    "Item4": "analytics",
+    "V2AccessAnalyticsMassMessagesPurchasedGetResponse": "analytics",
+    "ListItem6": "common",
+    "V2AccessAnalyticsMassMessagesMassMessageIdBuyersGetResponse": "analytics",
+    "V2AccessAnalyticsPromotionsChartGetResponse1": "analytics",
+    "V2AccessAnalyticsPromotionsChartGetResponse": "analytics",
+    "Item5": "common",
+    "V2AccessAnalyticsPromotionsTopGetResponse": "analytics",
+    "V2AccessAnalyticsTrialsChartGetResponse1": "analytics",
+    "V2AccessAnalyticsTrialsChartGetResponse": "analytics",
+    "Item6": "analytics",
+    "V2AccessAnalyticsTrialsTopGetResponse": "analytics",
+    "V2AccessAnalyticsCampaignsChartGetResponse1": "analytics",
+    "V2AccessAnalyticsCampaignsChartGetResponse": "analytics",
+    "ListItem7": "analytics",
+    "V2AccessAnalyticsCampaignsTopGetResponse": "analytics",
+    "By7": "analytics",
+    "Visitor": "analytics",
+    "DurationItem": "analytics",
+    "Chart": "analytics",
+    "Total": "analytics",
+    "V2AccessAnalyticsVisitorCountriesChartGetResponse": "analytics",
+    "Totals": "analytics",
+    "ViewsCount": "analytics",
+    "Row": "analytics",
+    "TopCountries": "analytics",
+    "V2AccessAnalyticsVisitorCountriesTopGetResponse": "analytics",
+    "MediaItems": "common",
+    "MediaItems1": "common",
+    "User13": "common",
+    "Partner": "common",
+    "Guest": "common",
+    "ReleaseForms": "common",
+    "UserTag": "common",
+    "V2AccessPostsPostRequest": "posts",
+    "User14": "posts",
+    "ReleaseForm10": "posts",
+    "Full7": "posts",
+    "Preview9": "posts",
+    "Files7": "posts",
+    "MediaItem5": "posts",
+    "V2AccessPostsPostResponse": "posts",
+    "SortBy2": "posts",
+    "User15": "posts",
+    "ReleaseForm11": "posts",
+    "Full8": "posts",
+    "Preview10": "posts",
+    "Files8": "posts",
+    "MediaItem6": "posts",
+    "ListItem8": "posts",
+    "Counters": "posts",
+    "V2AccessPostsGetResponse": "posts",
+    "MediaItems2": "posts",
+    "MediaItems3": "posts",
+    "User16": "posts",
+    "ReleaseForms1": "posts",
+    "V2AccessPostsPostIdPutRequest": "posts",
+    "User17": "posts",
+    "ReleaseForm12": "posts",
+    "Full9": "posts",
+    "Preview11": "posts",
+    "Files9": "posts",
+    "MediaItem7": "posts",
+    "V2AccessPostsPostIdPutResponse": "posts",
+    "V2AccessPostsPostIdDeleteResponse": "common",
+    "User18": "posts",
+    "ReleaseForm13": "posts",
+    "Full10": "posts",
+    "Preview12": "posts",
+    "Files10": "posts",
+    "MediaItem8": "posts",
+    "User19": "posts",
+    "ReleaseForm14": "posts",
+    "V2AccessPostsPostIdGetResponse1": "posts",
+    "V2AccessPostsPostIdGetResponse": "posts",
+    "User20": "posts",
+    "ReleaseForm15": "posts",
+    "Full11": "posts",
+    "Preview13": "posts",
+    "Files11": "posts",
+    "MediaItem9": "posts",
+    "ListItem9": "posts",
+    "V2AccessUsersUserIdPostsGetResponse": "posts",
+    "MediaItems4": "messages",
+    "MediaItems5": "messages",
+    "User21": "messages",
+    "ReleaseForms2": "messages",
+    "V2AccessChatsUserIdMessagesPostRequest": "messages",
+    "FromUser": "common",
+    "FromUser1": "messages",
+    "User22": "messages",
+    "ReleaseForm16": "messages",
+    "Full12": "messages",
+    "Preview14": "messages",
+    "Files12": "messages",
+    "MediaItem10": "messages",
+    "V2AccessChatsUserIdMessagesPostResponse": "messages",
+    "FromUser2": "messages",
+    "FromUser3": "messages",
+    "User23": "messages",
+    "ReleaseForm17": "messages",
+    "Full13": "messages",
+    "Preview15": "messages",
+    "Files13": "messages",
+    "MediaItem11": "messages",
+    "ListItem10": "messages",
+    "V2AccessChatsUserIdMessagesGetResponse": "messages",
+    "V2AccessChatsUserIdMessagesMessageIdDeleteRequest": "messages",
+    "FromUser4": "messages",
+    "FromUser5": "messages",
+    "User24": "messages",
+    "ReleaseForm18": "messages",
+    "Full14": "messages",
+    "Preview16": "messages",
+    "Files14": "messages",
+    "MediaItem12": "messages",
+    "MediaTypes": "messages",
+    "Queue": "messages",
+    "V2AccessChatsUserIdMessagesMessageIdDeleteResponse": "messages",
+    "MediaItems6": "messages",
+    "MediaItems7": "messages",
+    "User25": "messages",
+    "ReleaseForms3": "messages",
+    "UserIds": "messages",
+    "UserIds1": "messages",
+    "UserLists": "messages",
+    "UserLists1": "messages",
+    "ExcludeUserLists": "messages",
+    "ExcludeUserLists1": "messages",
+    "V2AccessMassMessagesPostRequest": "messages",
+    "V2AccessMassMessagesPostResponse": "messages",
+    "MediaItems8": "messages",
+    "MediaItems9": "messages",
+    "ReleaseForms4": "messages",
+    "UserIds2": "messages",
+    "UserIds3": "messages",
+    "UserLists2": "messages",
+    "UserLists3": "messages",
+    "ExcludeUserLists2": "messages",
+    "ExcludeUserLists3": "messages",
+    "V2AccessMassMessagesMassMessageIdPutRequest": "messages",
+    "V2AccessMassMessagesMassMessageIdPutResponse": "messages",
+    "FromUser6": "messages",
+    "FromUser7": "messages",
+    "User27": "messages",
+    "ReleaseForm19": "messages",
+    "Full15": "messages",
+    "Preview17": "messages",
+    "Files15": "messages",
+    "MediaItem13": "messages",
+    "Queue1": "messages",
+    "V2AccessMassMessagesMassMessageIdDeleteResponse": "messages",
+    "FromUser8": "messages",
+    "FromUser9": "messages",
+    "User28": "messages",
+    "ReleaseForm20": "messages",
+    "Full16": "messages",
+    "Preview18": "messages",
+    "Files16": "messages",
+    "MediaItem14": "messages",
+    "V2AccessMassMessagesMassMessageIdGetResponse": "messages",
+    "Order": "messages",
+    "Filter2": "messages",
+    "WithUser": "messages",
+    "FromUser10": "messages",
+    "FromUser11": "messages",
+    "User29": "messages",
+    "ReleaseForm21": "messages",
+    "Full17": "messages",
+    "Preview19": "messages",
+    "Files17": "messages",
+    "MediaItem15": "messages",
+    "LastMessage": "messages",
+    "ListItem11": "messages",
+    "V2AccessChatsGetResponse": "messages",
+    "Opened": "common",
+    "Type20": "messages",
+    "FromUser12": "messages",
+    "FromUser13": "messages",
+    "Type21": "messages",
+    "User30": "messages",
+    "ReleaseForm22": "messages",
+    "Full18": "messages",
+    "Preview20": "messages",
+    "Files18": "messages",
+    "MediaItem16": "messages",
+    "ListItem12": "messages",
+    "V2AccessChatsUserIdMediaGetResponse": "messages",
+    "Online": "common",
+    "Filter3": "subscribers",
+    "Type22": "common",
+    "Type23": "subscribers",
+    "LatestType": "subscribers",
+    "HistoryItem": "subscribers",
+    "Subscription": "subscribers",
+    "Spending": "subscribers",
+    "Capabilities": "subscribers",
+    "List1": "subscribers",
+    "ListItem13": "subscribers",
+    "V2AccessSubscribersGetResponse": "subscribers",
+    "V2AccessSubscribersUserIdNotePutRequest": "subscribers",
+    "V2AccessSubscribersUserIdNotePutResponse": "subscribers",
+    "V2AccessSubscribersUserIdDiscountPutRequest": "subscribers",
+    "V2AccessSubscribersUserIdDiscountPutResponse": "subscribers",
+    "V2AccessSubscribersUserIdCustomNamePutRequest": "subscribers",
+    "V2AccessSubscribersUserIdCustomNamePutResponse": "subscribers",
+    "Paid": "subscriptions",
+    "Filter4": "subscriptions",
+    "Type24": "subscriptions",
+    "List2": "common",
+    "ListItem14": "subscriptions",
+    "V2AccessSubscriptionsGetResponse": "subscriptions",
+    "Subscriptions": "subscriptions",
+    "Subscribers": "subscriptions",
+    "V2AccessSubscriptionsCountGetResponse": "subscriptions",
+    "All": "subscriptions",
+    "ListItem15": "subscriptions",
+    "V2AccessSubscriptionsSubscriptionIdHistoryGetResponse": "subscriptions",
+    "Stats4": "promotions",
+    "ListItem16": "promotions",
+    "V2AccessPromotionsTrackingLinksGetResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksPostRequest": "promotions",
+    "V2AccessPromotionsTrackingLinksPostResponseItem": "promotions",
+    "V2AccessPromotionsTrackingLinksPostResponse1": "promotions",
+    "V2AccessPromotionsTrackingLinksPostResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksShareAccessPostRequest": "promotions",
+    "V2AccessPromotionsTrackingLinksShareAccessPostResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksShareAccessDeleteRequest": "promotions",
+    "V2AccessPromotionsTrackingLinksShareAccessDeleteResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksTrackingLinkIdGetResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksTrackingLinkIdPutRequest": "promotions",
+    "V2AccessPromotionsTrackingLinksTrackingLinkIdPutResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksTrackingLinkIdDeleteResponse": "promotions",
+    "V2AccessPromotionsTrackingLinksTrackingLinkIdClaimersGetResponse": "promotions",
+    "ListItem17": "promotions",
+    "V2AccessPromotionsTrialLinksGetResponse1": "promotions",
+    "V2AccessPromotionsTrialLinksGetResponseItem": "promotions",
+    "V2AccessPromotionsTrialLinksGetResponse": "promotions",
+    "V2AccessPromotionsTrialLinksPostRequest": "promotions",
+    "V2AccessPromotionsTrialLinksPostResponse": "promotions",
+    "V2AccessPromotionsTrialLinksShareAccessPostRequest": "promotions",
+    "V2AccessPromotionsTrialLinksShareAccessPostResponse": "promotions",
+    "V2AccessPromotionsTrialLinksShareAccessDeleteRequest": "promotions",
+    "V2AccessPromotionsTrialLinksShareAccessDeleteResponse": "promotions",
+    "V2AccessPromotionsTrialLinksTrialLinkIdGetResponse": "promotions",
+    "V2AccessPromotionsTrialLinksTrialLinkIdPutRequest": "promotions",
+    "V2AccessPromotionsTrialLinksTrialLinkIdPutResponse": "promotions",
+    "V2AccessPromotionsTrialLinksTrialLinkIdDeleteResponse": "promotions",
+    "V2AccessPromotionsBundlesGetResponseItem": "promotions",
+    "ListItem18": "promotions",
+    "V2AccessPromotionsBundlesGetResponse1": "promotions",
+    "V2AccessPromotionsBundlesGetResponse": "promotions",
+    "V2AccessPromotionsBundlesPostRequest": "promotions",
+    "V2AccessPromotionsBundlesPostResponse": "promotions",
+    "V2AccessPromotionsBundlesBundleIdGetResponse": "promotions",
+    "V2AccessPromotionsBundlesBundleIdPutRequest": "promotions",
+    "V2AccessPromotionsBundlesBundleIdPutResponse": "promotions",
+    "V2AccessPromotionsBundlesBundleIdDeleteResponse": "promotions",
+    "V2AccessPromotionsGetResponseItem": "promotions",
+    "ListItem19": "promotions",
+    "V2AccessPromotionsGetResponse1": "promotions",
+    "V2AccessPromotionsGetResponse": "promotions",
+    "V2AccessPromotionsPostRequest": "promotions",
+    "V2AccessPromotionsPostResponseItem": "promotions",
+    "V2AccessPromotionsPostResponse1": "promotions",
+    "V2AccessPromotionsPostResponse": "promotions",
+    "V2AccessPromotionsPromotionIdPutRequest": "promotions",
+    "V2AccessPromotionsPromotionIdPutResponse": "promotions",
+    "V2AccessPromotionsPromotionIdDeleteResponse": "promotions",
+    "V2AccessPromotionsPromotionIdStopPostResponse": "promotions",
+    "SubscribedByData1": "users",
+    "SubscribedOnData1": "users",
+    "ListItem21": "users",
+    "V2AccessUsersRestrictGetResponse": "users",
+    "SubscribedByData2": "users",
+    "SubscribedOnData2": "users",
+    "ListItem22": "users",
+    "V2AccessUsersBlockedGetResponse": "users",
+    "UserIds4": "users",
+    "UserIds5": "users",
+    "SubscribedByData3": "users",
+    "SubscribedOnData3": "users",
+    "User31": "users",
+    "V2AccessUsersListGetResponse": "users",
+    "SubscribedByData4": "users",
+    "SubscribedOnData4": "users",
+    "V2AccessUsersSearchGetResponseItem": "users",
+    "V2AccessUsersSearchGetResponse": "users",
+    "SortListItem": "user_lists",
+    "User32": "user_lists",
+    "ListItem23": "user_lists",
+    "V2AccessUsersListsGetResponse": "user_lists",
+    "V2AccessUsersListsPostRequest": "user_lists",
+    "User33": "user_lists",
+    "V2AccessUsersListsPostResponse": "user_lists",
+    "V2AccessUsersListsListIdPatchRequest": "user_lists",
+    "User34": "user_lists",
+    "V2AccessUsersListsListIdPatchResponse": "user_lists",
+    "V2AccessUsersListsListIdDeleteResponse": "user_lists",
+    "User35": "user_lists",
+    "V2AccessUsersListsListIdGetResponse": "user_lists",
+    "ListItem24": "user_lists",
+    "V2AccessUsersListsListIdUsersGetResponse": "user_lists",
+    "User36": "user_lists",
+    "List7": "user_lists",
+    "UserState": "user_lists",
+    "V2AccessUsersListsListIdUsersUserIdPostResponse1": "user_lists",
+    "V2AccessUsersListsListIdUsersUserIdPostResponse": "user_lists",
+    "ListItem25": "user_lists",
+    "V2AccessUsersListsListIdUsersUserIdDeleteResponse1": "user_lists",
+    "V2AccessUsersListsListIdUsersUserIdDeleteResponse": "user_lists",
+    "ListId": "user_lists",
+    "V2AccessUsersUserIdListsPostRequest": "user_lists",
+    "Succes": "user_lists",
+    "Error": "user_lists",
+    "V2AccessUsersUserIdListsPostResponse": "user_lists",
+    "List8": "users",
+    "SubscribedByData5": "users",
+    "SubscribedOnData5": "users",
+    "V2AccessUsersUserIdGetResponse1": "users",
+    "V2AccessUsersUserIdGetResponse": "users",
+    "V2AccessUsersUserIdRestrictPostResponse": "users",
+    "V2AccessUsersUserIdRestrictDeleteResponse": "users",
+    "SortBy4": "vault",
+    "MediaType": "vault",
+    "Type25": "vault",
+    "User37": "vault",
+    "ReleaseForm23": "vault",
+    "Full19": "vault",
+    "Preview21": "vault",
+    "Files19": "vault",
+    "Counters2": "common",
+    "List9": "common",
+    "ListItem26": "common",
+    "V2AccessVaultMediaGetResponse": "common",
+    "Type26": "vault_lists",
+    "Type27": "vault_lists",
+    "Media": "vault_lists",
+    "ListItem27": "vault_lists",
+    "Media1": "vault_lists",
+    "All1": "vault_lists",
+    "V2AccessVaultListsGetResponse": "vault_lists",
+    "V2AccessVaultListsPostRequest": "vault_lists",
+    "Type28": "vault_lists",
+    "Type29": "vault_lists",
+    "Media2": "vault_lists",
+    "V2AccessVaultListsPostResponse": "vault_lists",
+    "V2AccessVaultListsListIdPatchRequest": "vault_lists",
+    "Type30": "vault_lists",
+    "Type31": "vault_lists",
+    "Media3": "vault_lists",
+    "V2AccessVaultListsListIdPatchResponse": "vault_lists",
+    "V2AccessVaultListsListIdDeleteResponse": "vault_lists",
+    "MediaId": "vault_lists",
+    "V2AccessVaultListsListIdMediaPostRequest": "vault_lists",
+    "Type32": "vault_lists",
+    "Type33": "common",
+    "Media4": "vault_lists",
+    "V2AccessVaultListsListIdMediaPostResponse": "vault_lists",
+    "User38": "vault_lists",
+    "ReleaseForm24": "vault_lists",
+    "Full20": "vault_lists",
+    "Preview22": "vault_lists",
+    "Files20": "vault_lists",
+    "ListItem28": "vault_lists",
+    "V2AccessVaultListsListIdMediaGetResponse": "vault_lists",
+    "V2AccessUploadsCheckPostRequest": "upload",
+    "User39": "upload",
+    "ReleaseForm25": "upload",
+    "Full21": "upload",
+    "Preview23": "upload",
+    "Files21": "upload",
+    "Media5": "upload",
+    "V2AccessUploadsCheckPostResponse": "upload",
+    "Mode": "upload",
+    "VaultUpload": "upload",
+    "V2AccessUploadsInitPostRequest": "upload",
+    "V2AccessUploadsInitPostResponse": "upload",
+    "V2AccessUploadsMediaUploadIdPartsPartNumberPutResponse": "upload",
+    "User40": "upload",
+    "ReleaseForm26": "upload",
+    "Full22": "upload",
+    "Preview24": "upload",
+    "Files22": "upload",
+    "Media6": "upload",
+    "V2AccessUploadsMediaUploadIdPutResponse": "upload",
+    "V2AccessUploadsCompletePostRequest": "upload",
+    "User41": "upload",
+    "ReleaseForm27": "upload",
+    "Full23": "upload",
+    "Preview25": "upload",
+    "Files23": "upload",
+    "Media7": "upload",
+    "V2AccessUploadsCompletePostResponse": "upload",
+    "Geolocation": "link",
+    "V2LinkInitPostRequest": "link",
+    "V2LinkInitPostResponse": "link",
+    "V2LinkInitPostResponse1": "link",
+    "Status4": "link",
+    "Option25": "link",
+    "PhoneCode": "link",
+    "FaceCode": "link",
+    "TwoFactorState": "link",
+    "Data": "link",
+    "Session": "link",
+    "UserData3": "link",
+    "Data1": "link",
+    "V2LinkClientSecretGetResponse": "link",
+    "Rules": "common",
+    "V2DynamicRulesGetResponse": "common",
+    "V2DynamicRulesGetResponse1": "common",
+    "V2DynamicRulesSignPostRequest": "common",
+    "Signed": "common",
+    "V2DynamicRulesSignPostResponse": "common",
+    "V2DynamicRulesSignPostResponse1": "dynamic_rules",
+    "V2DynamicRulesStatusGetResponse": "dynamic_rules",
+    "RulesGetResponse": "vault_store",
+    "RulesGetResponse1": "vault_store",
+    "SignPostRequest": "vault_store",
+    "SignPostResponse": "vault_store",
+    "SignPostResponse1": "vault_store",
+    "V2VaultPlusStoreListListIdPostResponse": "vault_store",
+    "V2VaultPlusStoreStatusGetResponse": "vault_stats",
+    "V2VaultPlusStoreStatsGetResponse": "vault_stats",
+    "Type38": "vault_media",
+    "Status5": "vault_media",
+    "Source24": "vault_media",
+    "Media8": "vault_media",
+    "V2VaultPlusMediaIdGetResponse": "vault_media",
+    "V2VaultPlusMediaIdDeleteResponse": "vault_media",
+    "V2VaultPlusBatchPostRequest": "vault_media",
+    "Media9": "vault_media",
+    "Item7": "vault_media",
+    "V2VaultPlusBatchPostResponse": "vault_media",
+    "Media10": "vault_media",
+    "Item8": "vault_media",
+    "V2VaultPlusListGetResponse": "vault_media",
+    "V2VaultPlusPurgeDeleteResponse": "vault_media",
+}
+
+__all__ = list(_SCHEMAS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _SCHEMAS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
@@ -0,0 +1,268 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class V2AccountWhoamiGetResponse(BaseModel):
+    id: str
+    name: str
+    permissions: list[str]
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    EXPIRED = "expired"
+    AWAITING_2FA = "awaiting_2fa"
+
+
+class UserData(BaseModel):
+    id: str
+    """
+    The ID of the user.
+    """
+    name: str
+    """
+    The name of the user.
+    """
+    username: str
+    """
+    The username of the user.
+    """
+    avatar: str
+    """
+    The avatar of the user.
+    """
+
+
+class ListItem(BaseModel):
+    status: Status
+    """
+    The status of the connection.
+    """
+    id: str
+    """
+    The ID of the connection.
+    """
+    userData: UserData
+    """
+    Data could be outdated if the connection is expired, but will be updated once the account has been reconnected.
+    """
+    permissions: list[str]
+    """
+    The permissions of the connection.
+    """
+    expiredAt: str
+    """
+    The expiration date of the connection.
+    """
+    createdAt: str
+    """
+    The creation date of the connection.
+    """
+    updatedAt: str
+    """
+    The last update date of the connection.
+    """
+    clientReferenceId: str
+    """
+    The client reference ID of the connection.
+    """
+    imported: bool
+    """
+    Whether this is an imported (non-managed) connection.
+    """
+    lastCheckedAt: str
+    """
+    The last time the connection was checked or used.
+    """
+
+
+class V2AccountConnectionsGetResponse(BaseModel):
+    list: list[ListItem]
+    hasMore: bool
+
+
+class ImageQuality(Enum):
+    THUMB = "thumb"
+    PREVIEW = "preview"
+    FULL = "full"
+
+
+class VideoQuality(Enum):
+    PREVIEW = "preview"
+    FIELD_720P = "720p"
+    FIELD_1080P = "1080p"
+    SOURCE = "source"
+
+
+class StorageLimitPurgeStrategy(Enum):
+    PURGE_OLDEST = "purge_oldest"
+    PURGE_LARGEST = "purge_largest"
+    PURGE_SMALLEST = "purge_smallest"
+    BLOCK_NEW = "block_new"
+
+
+class SettingsOverrides(BaseModel):
+    autoCacheVault: bool | None = None
+    autoCacheMessages: bool | None = None
+    autoCachePosts: bool | None = None
+    autoCacheStories: bool | None = None
+    minAccessCountVault: float | None = None
+    minAccessCountMessages: float | None = None
+    minAccessCountPosts: float | None = None
+    minAccessCountStories: float | None = None
+    cacheImages: bool | None = None
+    cacheVideos: bool | None = None
+    cacheAudio: bool | None = None
+    imageQualities: list[ImageQuality] | None = None
+    videoQualities: list[VideoQuality] | None = None
+    retentionDays: float | None = None
+    accessExpiryDays: float | None = None
+    presignedUrlTtlSeconds: float | None = None
+    storageLimitBytes: float | None = None
+    storageLimitPurgeStrategy: StorageLimitPurgeStrategy | None = None
+
+
+class Stats(BaseModel):
+    vaultPlusEnabled: bool
+    totalStorageBytes: float
+    storageLimitBytes: float
+    mediaCount: float
+    storedCount: float
+    storageUsagePercent: float
+
+
+class VaultPlus(BaseModel):
+    enabled: bool
+    settingsOverrides: SettingsOverrides
+    stats: Stats
+
+
+class V2AccountConnectionsConnectionIdSettingsGetResponse(BaseModel):
+    connectionId: str
+    vaultPlus: VaultPlus
+
+
+class VaultPlus1(BaseModel):
+    enabled: bool | None = None
+    settings: SettingsOverrides | None = None
+
+
+class V2AccountConnectionsConnectionIdSettingsPatchRequest(BaseModel):
+    vaultPlus: VaultPlus1 | None = None
+
+
+class PurgeResult(BaseModel):
+    purgedCount: float
+    freedBytes: float
+
+
+class V2AccountConnectionsConnectionIdSettingsPatchResponse(BaseModel):
+    settings: V2AccountConnectionsConnectionIdSettingsGetResponse
+    purgeResult: PurgeResult | None = None
+
+
+class V2AccountConnectionsImportPostRequest(BaseModel):
+    cookie: str
+    """
+    The OnlyFans session cookie string. Must contain `auth_id`, `sess`, and `fp` values.
+    """
+    userAgent: str
+    """
+    The user agent string that was used to create this session.
+    """
+    permissions: list[str] | None = None
+    """
+    Permissions to grant. Defaults to organization permissions.
+    """
+    clientReferenceId: str | None = None
+    """
+    Optional client reference ID for tracking.
+    """
+
+
+class V2AccountConnectionsImportConnectionIdPatchRequest(BaseModel):
+    cookie: str
+    """
+    The OnlyFans session cookie string. Must contain `auth_id`, `sess`, and `fp` values.
+    """
+    userAgent: str
+    """
+    The user agent string that was used to create this session.
+    """
+
+
+class DefaultSettings(BaseModel):
+    autoCacheVault: bool
+    autoCacheMessages: bool
+    autoCachePosts: bool
+    autoCacheStories: bool
+    minAccessCountVault: float
+    minAccessCountMessages: float
+    minAccessCountPosts: float
+    minAccessCountStories: float
+    cacheImages: bool
+    cacheVideos: bool
+    cacheAudio: bool
+    imageQualities: list[str]
+    videoQualities: list[str]
+    retentionDays: float
+    accessExpiryDays: float
+    presignedUrlTtlSeconds: float
+    storageLimitBytes: float
+    storageLimitPurgeStrategy: str
+
+
+class VaultPlus3(BaseModel):
+    autoEnableForNewConnections: bool
+    defaultSettings: DefaultSettings
+
+
+class V2AccountSettingsGetResponse(BaseModel):
+    vaultPlus: VaultPlus3
+
+
+class VaultPlus4(BaseModel):
+    autoEnableForNewConnections: bool | None = None
+    applyToExistingConnections: bool | None = None
+    defaultSettings: SettingsOverrides | None = None
+
+
+class V2AccountSettingsPatchRequest(BaseModel):
+    vaultPlus: VaultPlus4 | None = None
+
+
+class PurgeResult1(BaseModel):
+    connectionId: str
+    purgedCount: float
+    freedBytes: float
+
+
+class BroadcastResult(BaseModel):
+    affectedConnections: float
+    purgeResults: list[PurgeResult1]
+
+
+class V2AccountSettingsPatchResponse(BaseModel):
+    settings: V2AccountSettingsGetResponse
+    broadcastResult: BroadcastResult | None = None
+
+
+# Structural duplicates of the schemas above, under their generated names
+Settings = SettingsOverrides
+SettingsOverrides1 = SettingsOverrides
+VaultPlus2 = VaultPlus
+Settings1 = V2AccountConnectionsConnectionIdSettingsGetResponse
+V2AccountConnectionsImportPostResponse = ListItem
+V2AccountConnectionsImportConnectionIdPatchResponse = ListItem
+DefaultSettings1 = SettingsOverrides
+DefaultSettings2 = DefaultSettings
+VaultPlus5 = VaultPlus3
+Settings2 = V2AccountSettingsGetResponse
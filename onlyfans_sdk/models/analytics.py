@@ -0,0 +1,519 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, RootModel
+
+from .common import (
+    AvatarThumbs,
+    ChartItem,
+    User3,
+    ReleaseForm,
+    Source,
+    Full,
+    Preview,
+    Files,
+    MediaItem,
+    Author,
+    ListItem6,
+    Item5,
+)
+
+
+class By(Enum):
+    TOTAL = "total"
+    MESSAGES = "messages"
+    TIPS = "tips"
+    STREAM = "stream"
+    POST = "post"
+    SUBSCRIBES = "subscribes"
+    TIPS_PROFILE = "tips_profile"
+    TIPS_POST = "tips_post"
+    TIPS_CHAT = "tips_chat"
+    TIPS_STREAM = "tips_stream"
+    TIPS_STORY = "tips_story"
+    REF = "ref"
+
+
+class By1(Enum):
+    PURCHASES = "purchases"
+    POSTS = "posts"
+    TIPS = "tips"
+    VIEWS = "views"
+    LIKES = "likes"
+    COMMENTS = "comments"
+
+
+class V2AccessAnalyticsPostsChartGetResponse1(BaseModel):
+    chart: list[ChartItem]
+    total: float
+    delta: float
+    gross: float | None = None
+
+
+class V2AccessAnalyticsPostsChartGetResponse(
+    RootModel[dict[str, V2AccessAnalyticsPostsChartGetResponse1]]
+):
+    root: dict[str, V2AccessAnalyticsPostsChartGetResponse1]
+
+
+class By2(Enum):
+    PURCHASES = "purchases"
+    TIPS = "tips"
+    VIEWS = "views"
+    LIKES = "likes"
+    COMMENTS = "comments"
+
+
+class Stats2(BaseModel):
+    isAvailable: bool
+    hasStats: bool
+    hasVideo: bool | None = None
+    lookCount: float
+    uniqueLookCount: float
+    uniqueLookChart: list[ChartItem]
+    lookChart: list[ChartItem]
+    lookDuration: float
+    lookDurationAverage: float
+    likeCount: float
+    likeChart: list[ChartItem]
+    commentCount: float
+    commentChart: list[ChartItem]
+    tipCount: float
+    tipChart: list[ChartItem]
+    tipSum: float
+    purchasedCount: float
+    purchasedSumm: float
+
+
+class Option1(BaseModel):
+    id: float
+    text: str | None = None
+    count: float | None = None
+    percent: float | None = None
+    isWinner: bool | None = None
+
+
+class Voting(BaseModel):
+    finishedAt: str
+    options: list[Option1]
+    total: float
+
+
+class Item(BaseModel):
+    id: float
+    canDelete: bool
+    canEdit: bool
+    mediaCount: float
+    media: list[MediaItem]
+    canViewMedia: bool
+    author: Author | None = None
+    responseType: str
+    postedAt: str
+    postedAtPrecise: str
+    isMarkdownDisabled: bool
+    isOpened: bool
+    canToggleFavorite: bool
+    tipsAmount: str
+    text: str
+    isFavorite: bool
+    canComment: bool
+    favoritesCount: float
+    isMediaReady: bool
+    rawText: str
+    stats: Stats2 | None = None
+    hasVoting: bool | None = None
+    votingType: float | None = None
+    voting: Voting | None = None
+
+
+class V2AccessAnalyticsPostsTopGetResponse(BaseModel):
+    hasMore: bool
+    items: list[Item]
+
+
+class V2AccessAnalyticsPostsPostIdGetResponse(BaseModel):
+    isAvailable: bool
+    hasStats: bool
+    hasVideo: bool | None = None
+    lookCount: float
+    uniqueLookCount: float
+    uniqueLookChart: list[ChartItem]
+    lookChart: list[ChartItem]
+    lookDuration: float
+    lookDurationAverage: float
+    likeCount: float
+    likeChart: list[ChartItem]
+    commentCount: float
+    commentChart: list[ChartItem]
+    tipCount: float
+    tipChart: list[ChartItem]
+    tipSum: float
+    purchasedCount: float
+    purchasedSumm: float
+    tipSumChart: list[ChartItem]
+    purchasesChart: list[ChartItem]
+
+
+class By3(Enum):
+    PURCHASES = "purchases"
+    DURATION = "duration"
+    TIPS = "tips"
+    VIEWS = "views"
+    LIKES = "likes"
+    COMMENTS = "comments"
+
+
+class Item1(BaseModel):
+    id: float
+    canDelete: bool
+    canEdit: bool
+    mediaCount: float
+    media: list[MediaItem]
+    canViewMedia: bool
+    author: Author | None = None
+    responseType: str
+    postedAt: str
+    postedAtPrecise: str
+    isMarkdownDisabled: bool
+    isOpened: bool
+    canToggleFavorite: bool
+    tipsAmount: str
+    text: str
+    isFavorite: bool
+    canComment: bool
+    favoritesCount: float
+    isMediaReady: bool
+    rawText: str
+    stats: Stats2 | None = None
+
+
+class V2AccessAnalyticsStreamsTopGetResponse(BaseModel):
+    hasMore: bool
+    items: list[Item1]
+
+
+class By5(Enum):
+    TIPS = "tips"
+    STORIES = "stories"
+    VIEWS = "views"
+    LIKES = "likes"
+    COMMENTS = "comments"
+
+
+class By6(Enum):
+    TIPS = "tips"
+    VIEWS = "views"
+    LIKES = "likes"
+    COMMENTS = "comments"
+
+
+class Entity(BaseModel):
+    id: float
+    text: str
+    createdAt: str
+
+
+class Positions(BaseModel):
+    zIndex: float
+    x: float
+    y: float
+    top: float
+    left: float
+    width: float
+    height: float
+    angle: float
+    color: str
+
+
+class Question(BaseModel):
+    entity: Entity
+    type: str
+    positions: Positions
+
+
+class Viewer(BaseModel):
+    id: float
+    name: str
+    username: str
+    avatar: str
+    avatarThumbs: AvatarThumbs
+    isVerified: bool
+    canLookStory: bool
+    canCommentStory: bool
+    hasNotViewedStory: bool
+    isStoryLiked: bool
+    isStoryBlockedUser: bool
+
+
+class CoordinateParams(BaseModel):
+    top: float
+    left: float
+    angle: float
+    scale: float
+    width: float
+    height: float
+
+
+class Post(BaseModel):
+    id: float
+    author: Author | None = None
+    coordinateParams: CoordinateParams | None = None
+
+
+class Position(BaseModel):
+    x: float
+    y: float
+    width: float
+    height: float
+    angle: float
+
+
+class Text(BaseModel):
+    text: str
+    position: Position
+
+
+class Item2(BaseModel):
+    id: float
+    userId: float
+    isReady: bool
+    hasPost: bool
+    isWatched: bool
+    media: list[MediaItem]
+    createdAt: str
+    canvasHeight: float
+    canvasWidth: float
+    question: Question | None = None
+    viewersCount: float
+    viewers: list[Viewer]
+    commentsCount: float
+    canDelete: bool
+    isHighlightCover: bool
+    isLastInHighlight: bool
+    tipsAmount: str
+    tipsAmountRaw: float
+    tipsCount: float
+    likesCount: float
+    releaseForms: list[ReleaseForm]
+    post: Post | None = None
+    texts: list[Text]
+
+
+class V2AccessAnalyticsStoriesTopGetResponse(BaseModel):
+    hasMore: bool
+    items: list[Item2]
+
+
+class V2AccessAnalyticsMassMessagesChartGetResponse(BaseModel):
+    group_messages: V2AccessAnalyticsPostsChartGetResponse1
+    group_messages_purchases: V2AccessAnalyticsPostsChartGetResponse1
+    direct_messages: V2AccessAnalyticsPostsChartGetResponse1
+    direct_messages_purchases: V2AccessAnalyticsPostsChartGetResponse1
+
+
+class Item3(BaseModel):
+    id: float
+    date: str
+    responseType: str | None = None
+    text: str
+    rawText: str | None = None
+    giphyId: str | None = None
+    isFree: bool | None = None
+    isMediaReady: bool | None = None
+    mediaCount: float | None = None
+    media: list[MediaItem]
+    previews: list[MediaItem]
+    isTip: bool | None = None
+    isReportedByMe: bool | None = None
+    viewedCount: float | None = None
+    sentCount: float | None = None
+    isCanceled: bool | None = None
+    releaseForms: list[ReleaseForm]
+    template: str | None = None
+    canUnsend: bool | None = None
+    unsendSeconds: float | None = None
+    price: str | None = None
+    purchasedCount: float | None = None
+    canSendMessageToBuyers: bool | None = None
+
+
+class V2AccessAnalyticsMassMessagesSentGetResponse(BaseModel):
+    hasMore: bool
+    items: list[Item3]
+
+
+class V2AccessAnalyticsMassMessagesMassMessageIdBuyersGetResponse(BaseModel):
+    list: list[ListItem6]
+    hasMore: bool
+    nextMarker: float | None = None
+
+
+class V2AccessAnalyticsPromotionsTopGetResponse(BaseModel):
+    hasMore: bool
+    items: list[Item5]
+
+
+class Item6(BaseModel):
+    id: float
+    trialLinkName: str
+    url: str
+    subscribeDays: float
+    subscribeCounts: float
+    claimCounts: float
+    expiredAt: str
+    createdAt: str
+    isFinished: bool
+
+
+class V2AccessAnalyticsTrialsTopGetResponse(BaseModel):
+    hasMore: bool
+    items: list[Item6]
+
+
+class ListItem7(BaseModel):
+    id: float
+    countSubscribers: float
+    countTransitions: float
+    campaignCode: float
+    campaignName: str
+    createdAt: str
+    endDate: str
+
+
+class V2AccessAnalyticsCampaignsTopGetResponse(BaseModel):
+    hasMore: bool
+    list: list[ListItem7]
+
+
+class By7(Enum):
+    GUESTS = "guests"
+    TOTAL = "total"
+    USERS = "users"
+
+
+class Chart(BaseModel):
+    visitors: list[ChartItem]
+    duration: list[ChartItem]
+
+
+class Total(BaseModel):
+    current: str
+    delta: float
+
+
+class V2AccessAnalyticsVisitorCountriesChartGetResponse(BaseModel):
+    isAvailable: bool
+    chart: Chart
+    total: Total
+    hasStats: bool
+
+
+class Totals(BaseModel):
+    total: float
+    guests: str
+    users: str
+    subscribers: float
+
+
+class ViewsCount(BaseModel):
+    total: float
+    guests: float
+    users: float
+    subscribers: float
+
+
+class Row(BaseModel):
+    rank: float
+    countryName: str
+    countryCode: str
+    viewsCount: ViewsCount
+
+
+class TopCountries(BaseModel):
+    hasMore: bool
+    totals: Totals
+    rows: list[Row]
+
+
+class V2AccessAnalyticsVisitorCountriesTopGetResponse(BaseModel):
+    isAvailable: bool
+    hasStats: bool
+    topCountries: TopCountries
+
+
+# Structural duplicates of the schemas above, under their generated names
+Option = Source
+UniqueLookChartItem = ChartItem
+LookChartItem = ChartItem
+LikeChartItem = ChartItem
+CommentChartItem = ChartItem
+TipChartItem = ChartItem
+TipSumChartItem = ChartItem
+PurchasesChartItem = ChartItem
+V2AccessAnalyticsStreamsChartGetResponse1 = V2AccessAnalyticsPostsChartGetResponse1
+V2AccessAnalyticsStreamsChartGetResponse = V2AccessAnalyticsPostsChartGetResponse
+User4 = User3
+ReleaseForm1 = ReleaseForm
+Full1 = Full
+Preview1 = Preview
+Files1 = Files
+MediaItem1 = MediaItem
+Stats3 = Stats2
+V2AccessAnalyticsStoriesChartGetResponse1 = V2AccessAnalyticsPostsChartGetResponse1
+V2AccessAnalyticsStoriesChartGetResponse = V2AccessAnalyticsPostsChartGetResponse
+User5 = User3
+ReleaseForm2 = ReleaseForm
+Full2 = Full
+Preview2 = Preview
+Files2 = Files
+MediaItem2 = MediaItem
+User6 = User3
+ReleaseForm3 = ReleaseForm
+GroupMessages = V2AccessAnalyticsPostsChartGetResponse1
+GroupMessagesPurchases = V2AccessAnalyticsPostsChartGetResponse1
+DirectMessages = V2AccessAnalyticsPostsChartGetResponse1
+DirectMessagesPurchases = V2AccessAnalyticsPostsChartGetResponse1
+User7 = User3
+ReleaseForm4 = ReleaseForm
+Full3 = Full
+Preview3 = Preview
+Files3 = Files
+MediaItem3 = MediaItem
+User8 = User3
+ReleaseForm5 = ReleaseForm
+Full4 = Full
+Preview5 = Preview
+Files4 = Files
+Preview4 = MediaItem
+User9 = User3
+ReleaseForm6 = ReleaseForm
+User10 = User3
+ReleaseForm7 = ReleaseForm
+Full5 = Full
+Preview6 = Preview
+Files5 = Files
+MediaItem4 = MediaItem
+User11 = User3
+ReleaseForm8 = ReleaseForm
+Full6 = Full
+Preview8 = Preview
+Files6 = Files
+Preview7 = MediaItem
+User12 = User3
+ReleaseForm9 = ReleaseForm
+Item4 = Item3
+V2AccessAnalyticsMassMessagesPurchasedGetResponse = V2AccessAnalyticsMassMessagesSentGetResponse
+V2AccessAnalyticsPromotionsChartGetResponse1 = V2AccessAnalyticsPostsChartGetResponse1
+V2AccessAnalyticsPromotionsChartGetResponse = V2AccessAnalyticsPostsChartGetResponse
+V2AccessAnalyticsTrialsChartGetResponse1 = V2AccessAnalyticsPostsChartGetResponse1
+V2AccessAnalyticsTrialsChartGetResponse = V2AccessAnalyticsPostsChartGetResponse
+V2AccessAnalyticsCampaignsChartGetResponse1 = V2AccessAnalyticsPostsChartGetResponse1
+V2AccessAnalyticsCampaignsChartGetResponse = V2AccessAnalyticsPostsChartGetResponse
+Visitor = ChartItem
+DurationItem = ChartItem
@@ -0,0 +1,451 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field, RootModel
+
+
+class V2AccountWhoamiGetResponse1(BaseModel):
+    error: str
+
+
+class Imported(Enum):
+    TRUE = "true"
+    FALSE = "false"
+
+
+class AvatarThumbs(BaseModel):
+    c50: str
+    c144: str
+
+
+class List(BaseModel):
+    id: str | float
+    type: str
+    name: str
+
+
+class HeaderSize(BaseModel):
+    width: float
+    height: float
+
+
+class HeaderThumbs(BaseModel):
+    w480: str
+    w760: str
+
+
+class Subscribe(BaseModel):
+    id: float
+    userId: float
+    subscriberId: float
+    date: str
+    duration: float
+    startDate: str
+    expireDate: str
+    cancelDate: str
+    price: float
+    regularPrice: float
+    discount: float
+    earningId: float
+    action: str
+    type: str
+    offerStart: str
+    offerEnd: str
+    isCurrent: bool
+
+
+class SubscribedByData(BaseModel):
+    price: float
+    newPrice: float
+    regularPrice: float
+    subscribePrice: float
+    discountPercent: float
+    discountPeriod: float
+    subscribeAt: str
+    expiredAt: str
+    renewedAt: str
+    discountFinishedAt: str
+    discountStartedAt: str
+    status: str
+    isMuted: bool
+    unsubscribeReason: str
+    duration: str
+    hasActivePaidSubscriptions: bool
+    showPostsInFeed: bool
+    subscribes: list[Subscribe]
+
+
+class SubscribedOnData(BaseModel):
+    price: float
+    newPrice: float
+    regularPrice: float
+    subscribePrice: float
+    discountPercent: float
+    discountPeriod: float
+    subscribeAt: str
+    expiredAt: str
+    renewedAt: str
+    discountFinishedAt: str
+    discountStartedAt: str
+    status: str
+    isMuted: bool
+    unsubscribeReason: str
+    duration: str
+    hasActivePaidSubscriptions: bool
+    subscribes: list[Subscribe]
+    tipsSumm: float
+    subscribesSumm: float
+    messagesSumm: float
+    postsSumm: float
+    streamsSumm: float
+    totalSumm: float
+
+
+class V2AccessSelfPatchResponse(BaseModel):
+    id: float
+    username: str
+    name: str
+    isVerified: bool
+    avatar: str
+    avatarThumbs: AvatarThumbs | None = None
+    lists: list[List]
+    displayName: str | None = None
+    notice: str | None = None
+    about: str | None = None
+    isMarkdownDisabledForAbout: bool | None = None
+    website: str | None = None
+    wishlist: str | None = None
+    location: str | None = None
+    header: str | None = None
+    headerSize: HeaderSize | None = None
+    headerThumbs: HeaderThumbs | None = None
+    subscribersCount: float | None = None
+    postsCount: float | None = None
+    archivedPostsCount: float | None = None
+    privateArchivedPostsCount: float | None = None
+    photosCount: float | None = None
+    videosCount: float | None = None
+    audiosCount: float | None = None
+    mediasCount: float | None = None
+    favoritesCount: float | None = None
+    favoritedCount: float | None = None
+    joinDate: str | None = None
+    lastSeen: str | None = None
+    subscribedBy: bool | None = None
+    subscribedByExpire: bool | None = None
+    subscribedByExpireDate: str | None = None
+    subscribedByAutoprolong: bool | None = None
+    subscribedIsExpiredNow: bool | None = None
+    subscribedByData: SubscribedByData | None = None
+    subscribedOn: bool | None = None
+    subscribedOnExpiredNow: bool | None = None
+    subscribedOnDuration: str | None = None
+    subscribedOnData: SubscribedOnData | None = None
+    subscribePrice: float | None = None
+    currentSubscribePrice: float | None = None
+    canAddSubscriber: bool | None = None
+    tipsEnabled: bool | None = None
+    tipsTextEnabled: bool | None = None
+    tipsMin: float | None = None
+    tipsMinInternal: float | None = None
+    tipsMax: float | None = None
+    canLookStory: bool | None = None
+    canCommentStory: bool | None = None
+    hasNotViewedStory: bool | None = None
+    hasStories: bool | None = None
+    isRestricted: bool | None = None
+    canRestrict: bool | None = None
+    isBlocked: bool | None = None
+    canReport: bool | None = None
+    canUnsubscribe: bool | None = None
+    isPendingAutoprolong: bool | None = None
+    isPerformer: bool | None = None
+    isRealPerformer: bool | None = None
+    canReceiveChatMessage: bool | None = None
+    canChat: bool | None = None
+    showPostsInFeed: bool | None = None
+    hasPinnedPosts: bool | None = None
+    hasLabels: bool | None = None
+    isPrivateRestriction: bool | None = None
+    showSubscribersCount: bool | None = None
+    showMediaCount: bool | None = None
+    isReferrerAllowed: bool | None = None
+    canCreatePromotion: bool | None = None
+    canCreateTrial: bool | None = None
+    isAdultContent: bool | None = None
+    canTrialSend: bool | None = None
+    isFriend: bool | None = None
+    hasScheduledStream: bool | None = None
+    hasStream: bool | None = None
+    canPayInternal: bool | None = None
+
+
+class ChartItem(BaseModel):
+    date: str
+    count: float
+
+
+class Type2(Enum):
+    PHOTO = "photo"
+    VIDEO = "video"
+    GIF = "gif"
+    AUDIO = "audio"
+
+
+class User3(BaseModel):
+    view: str
+    id: float
+    name: str
+    username: str
+    isVerified: bool
+    avatar: str
+    avatarThumbs: AvatarThumbs
+    ivStatus: str
+    isFromGuest: bool
+
+
+class ReleaseForm(BaseModel):
+    id: float
+    name: str
+    partnerSource: str
+    type: str
+    user: User3 | None = None
+
+
+class VideoSources(BaseModel):
+    field_240: str | None = Field(None, alias="240")
+    field_720: str | None = Field(None, alias="720")
+
+
+class Source(BaseModel):
+    url: str
+    width: float | None = None
+    height: float | None = None
+    type: str | None = None
+
+
+class Full(BaseModel):
+    url: str
+    width: float | None = None
+    height: float | None = None
+    size: float | None = None
+    sources: list[Source]
+
+
+class Thumb(BaseModel):
+    url: str
+    width: float | None = None
+    height: float | None = None
+    size: float | None = None
+
+
+class Preview(BaseModel):
+    url: str
+    width: float | None = None
+    height: float | None = None
+    size: float | None = None
+    options: list[Source]
+
+
+class Files(BaseModel):
+    full: Full
+    thumb: Thumb | None = None
+    preview: Preview | None = None
+    squarePreview: Thumb | None = None
+
+
+class MediaItem(BaseModel):
+    id: float
+    type: Type2
+    convertedToVideo: bool
+    canView: bool
+    hasError: bool
+    createdAt: str
+    isReady: bool
+    duration: float | None = None
+    releaseForms: list[ReleaseForm]
+    hasCustomPreview: bool | None = None
+    videoSources: VideoSources | None = None
+    files: Files | None = None
+
+
+class Author(BaseModel):
+    id: float
+    field_view: str = Field(..., alias="_view")
+
+
+class ListItem6(BaseModel):
+    id: float
+    username: str
+    name: str
+    isVerified: bool
+    avatar: str
+    avatarThumbs: AvatarThumbs | None = None
+
+
+class Item5(BaseModel):
+    id: float
+    message: str
+    rawMessage: str
+    hasRelatedPromo: bool
+    price: float
+    type: str
+    canClaim: bool
+    claimsCount: float
+    subscribeCounts: float
+    subscribeDays: float
+    createdAt: str
+    finishedAt: str
+    isFinished: bool
+
+
+class MediaItems(RootModel[int]):
+    root: int = Field(..., gt=0)
+    """
+    OnlyFans media ID
+    """
+
+
+class MediaItems1(RootModel[str]):
+    root: str = Field(..., min_length=1)
+
+
+class User13(RootModel[int]):
+    root: int = Field(..., gt=0)
+    """
+    OnlyFans user ID
+    """
+
+
+class ReleaseForms(BaseModel):
+    users: list[User13] | None = Field(default_factory=list)
+    """
+    Users to add to release form
+    """
+    partners: list[User13] | None = Field(default_factory=list)
+    """
+    Partners to add to release form
+    """
+    guests: list[User13] | None = Field(default_factory=list)
+    """
+    Guests to add to release form
+    """
+
+
+class V2AccessPostsPostIdDeleteResponse(BaseModel):
+    pass
+
+
+class FromUser(BaseModel):
+    id: float
+    name: str
+
+
+class Opened(Enum):
+    FIELD_0 = "0"
+    FIELD_1 = "1"
+    TRUE = "true"
+    FALSE = "false"
+
+
+class Type22(Enum):
+    ALL = "all"
+    ACTIVE = "active"
+    EXPIRED = "expired"
+
+
+class Counters2(BaseModel):
+    likesCount: float
+    tipsSumm: float
+
+
+class List9(BaseModel):
+    id: float
+    type: str
+    name: str
+
+
+class ListItem26(BaseModel):
+    id: float
+    type: Type2
+    convertedToVideo: bool
+    canView: bool
+    hasError: bool
+    createdAt: str
+    isReady: bool
+    duration: float | None = None
+    releaseForms: list[ReleaseForm]
+    hasCustomPreview: bool | None = None
+    videoSources: VideoSources | None = None
+    files: Files | None = None
+    counters: Counters2
+    hasPosts: bool | None = None
+    lists: list[List9]
+
+
+class V2AccessVaultMediaGetResponse(BaseModel):
+    list: list[ListItem26]
+    hasMore: bool
+
+
+class Rules(BaseModel):
+    static_param: str
+    format: str
+    start: str
+    end: str
+    prefix: str
+    suffix: str
+    checksum_constant: float
+    checksum_indexes: list[float]
+    app_token: str
+    revision: str
+
+
+class V2DynamicRulesGetResponse(BaseModel):
+    rules: Rules
+    is_current: bool
+    is_public: bool
+    is_early_access: bool
+
+
+class V2DynamicRulesGetResponse1(BaseModel):
+    error: str
+    is_current: bool | None = None
+    is_public: bool | None = None
+    is_early_access: bool | None = None
+
+
+class V2DynamicRulesSignPostRequest(BaseModel):
+    endpoint: str
+    time: float | str | None = None
+    user_id: float | str | None = Field(None, alias="user-id")
+
+
+class Signed(BaseModel):
+    sign: str
+    time: str
+    user_id: str | None = Field(None, alias="user-id")
+    app_token: str = Field(..., alias="app-token")
+
+
+class V2DynamicRulesSignPostResponse(BaseModel):
+    signed: Signed
+    is_public: bool
+    is_early_access: bool
+
+
+# Structural duplicates of the schemas above, under their generated names
+SquarePreview = Thumb
+Option2 = Source
+Partner = User13
+Guest = User13
+UserTag = User13
+Online = Opened
+List2 = List
+Type33 = Type2
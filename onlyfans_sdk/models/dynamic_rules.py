@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from .common import (
+    V2DynamicRulesGetResponse1,
+)
+
+
+class V2DynamicRulesStatusGetResponse(BaseModel):
+    revision: str
+    early_access_revision: str
+    public_revision: str
+    is_current: bool
+    is_early_access: bool
+    is_public: bool
+    access_granted: bool
+    """
+    Whether the user has access to the latest rules, based on apikey header
+    """
+
+
+# Structural duplicates of the schemas above, under their generated names
+V2DynamicRulesSignPostResponse1 = V2DynamicRulesGetResponse1
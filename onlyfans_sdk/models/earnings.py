@@ -0,0 +1,93 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+from .common import (
+    ChartItem,
+)
+
+
+class V2AccessEarningsChartGetResponse(BaseModel):
+    chart: list[ChartItem]
+    total: float
+    gross: float | None = None
+    delta: float | None = None
+
+
+class Type1(Enum):
+    SUBSCRIBES = "subscribes"
+    CHAT_MESSAGES = "chat_messages"
+    POST = "post"
+    STREAM = "stream"
+    TIPS = "tips"
+
+
+class TipsSource(Enum):
+    CHAT = "chat"
+    POST_ALL = "post_all"
+    PROFILE = "profile"
+    STORY = "story"
+    STREAM = "stream"
+
+
+class Amounts(BaseModel):
+    gross: float
+    net: float
+    fee: float
+    vat: float
+    tax: float
+
+
+class User1(BaseModel):
+    id: float
+    name: str
+    username: str
+    avatar: str
+
+
+class ListItem4(BaseModel):
+    id: str
+    type: str
+    createdAt: str
+    amounts: Amounts
+    currency: str
+    description: str
+    status: str
+    payoutPendingDays: float
+    user: User1
+
+
+class V2AccessEarningsTransactionsGetResponse(BaseModel):
+    list: list[ListItem4]
+    hasMore: bool
+    nextMarker: float
+
+
+class Payment(BaseModel):
+    id: str
+    createdAt: str
+    amounts: Amounts
+    currency: str
+    description: str
+    status: str
+    user: User1
+
+
+class ListItem5(BaseModel):
+    id: float
+    createdAt: str
+    paymentType: str
+    payment: Payment
+
+
+class V2AccessEarningsChargebacksGetResponse(BaseModel):
+    list: list[ListItem5]
+    hasMore: bool
+    nextMarker: float
@@ -0,0 +1,129 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import AnyUrl, BaseModel, Field
+
+from .common import (
+    V2AccountWhoamiGetResponse1,
+)
+
+
+class Geolocation(BaseModel):
+    country: str
+    """
+    Geolocation country code override (e.g. US).
+    """
+    state: str | None = None
+    """
+    Geolocation state/region override (e.g. CA for California).
+    """
+    city: str | None = None
+    """
+    Geolocation city override (e.g. San Francisco).
+    """
+
+
+class V2LinkInitPostRequest(BaseModel):
+    redirectUrl: AnyUrl | None = None
+    """
+    URL to redirect to after completion. If omitted, uses first allowed redirect URI.
+    """
+    clientReferenceId: str | None = None
+    """
+    Your internal reference ID for webhook correlation.
+    """
+    connectionId: str | None = None
+    """
+    Existing connection ID to reconnect.
+    """
+    geolocation: Geolocation | None = None
+
+
+class V2LinkInitPostResponse(BaseModel):
+    url: str
+    """
+    URL to redirect the user to
+    """
+    expiresAt: str
+    """
+    ISO timestamp when the session expires
+    """
+
+
+class Status4(Enum):
+    INITIALIZED = "initialized"
+    PENDING = "pending"
+    AWAITING_2FA = "awaiting_2fa"
+    DENIED = "denied"
+    COMPLETED = "completed"
+    INVALID_CREDENTIALS = "invalid_credentials"
+    FAILED = "failed"
+    NOT_FOUND = "not_found"
+
+
+class Option25(Enum):
+    PHONE = "phone"
+    APP = "app"
+    FACE = "face"
+    FORCE_FACE = "forceFace"
+
+
+class PhoneCode(BaseModel):
+    requestAttemptsLimit: float
+    requestAttemptsLeft: float
+    checkAttemptsLimit: float | None = None
+    checkAttemptsLeft: float | None = None
+    expirationDate: str | None = None
+    expirationSeconds: float | None = None
+    lastSentDate: str | None = None
+
+
+class FaceCode(BaseModel):
+    requestAttemptsLimit: float
+    requestAttemptsLeft: float
+
+
+class TwoFactorState(BaseModel):
+    options: list[Option25]
+    phoneCode: PhoneCode | None = None
+    faceCode: FaceCode | None = None
+    phoneLast4: str | None = None
+
+
+class Data(BaseModel):
+    twoFactorState: TwoFactorState
+
+
+class Session(BaseModel):
+    user_id: str = Field(..., alias="user-id")
+    user_agent: str = Field(..., alias="user-agent")
+    cookie: str
+    x_bc: str = Field(..., alias="x-bc")
+
+
+class UserData3(BaseModel):
+    id: str
+    name: str
+    username: str
+    avatar: str
+
+
+class Data1(BaseModel):
+    id: str
+    session: Session
+    userData: UserData3
+
+
+class V2LinkClientSecretGetResponse(BaseModel):
+    status: Status4
+    data: Data | Data1 | None = None
+
+
+# Structural duplicates of the schemas above, under their generated names
+V2LinkInitPostResponse1 = V2AccountWhoamiGetResponse1
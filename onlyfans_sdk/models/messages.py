@@ -0,0 +1,369 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .common import (
+    Type2,
+    User3,
+    ReleaseForm,
+    Full,
+    Preview,
+    Files,
+    MediaItem,
+    Author,
+    MediaItems,
+    MediaItems1,
+    User13,
+    ReleaseForms,
+    FromUser,
+)
+
+
+class V2AccessChatsUserIdMessagesPostRequest(BaseModel):
+    isForwardedMessage: bool | None = False
+    """
+    Whether this is a forwarded message
+    """
+    text: str | None = Field("", max_length=10000)
+    """
+    Text content. Supports markdown by default. See [Text Formatting Guide](/guides/how-to/text-formatting).
+    """
+    mediaItems: list[MediaItems | MediaItems1] | None = []
+    """
+    Media references to attach. Accepts vault media IDs, upload references (mediaUploadId), or http(s) URLs. See [mediaItems reference](/guides/media-items).
+    """
+    isLockedText: bool | None = False
+    """
+    Whether text is locked behind paywall (defaults to false).
+    """
+    price: float | None = Field(0, ge=0.0, le=200.0)
+    """
+    Price to unlock message content (0 for free)
+    """
+    previewMediaCount: int | None = Field(0, ge=0)
+    """
+    How many items in mediaItems should be previews. Uses the first N items from left to right.
+    """
+    releaseForms: ReleaseForms | None = None
+    """
+    Release form participants
+    """
+    userTags: list[User13] | None = Field(default_factory=list)
+    """
+    Users to tag
+    """
+    isMarkdown: bool | None = True
+    """
+    Whether to parse text as markdown (default: true). See [Text Formatting Guide](/guides/how-to/text-formatting).
+    """
+
+
+class V2AccessChatsUserIdMessagesPostResponse(BaseModel):
+    id: float
+    text: str
+    fromUser: FromUser | Author
+    media: list[MediaItem]
+    isMediaReady: bool | None = None
+    mediaCount: float | None = None
+    previews: list[float]
+    lockedText: bool | None = None
+    responseType: str | None = None
+    giphyId: str | None = None
+    isFree: bool | None = None
+    isTip: bool | None = None
+    isReportedByMe: bool | None = None
+    isCouplePeopleMedia: bool | None = None
+    queueId: float | None = None
+    isMarkdownDisabled: bool | None = None
+    releaseForms: Any | None = None
+    isFromQueue: bool | None = None
+    canUnsendQueue: bool | None = None
+    unsendSecondsQueue: float | None = None
+    isOpened: bool | None = None
+    isNew: bool | None = None
+    createdAt: str | None = None
+    changedAt: str | None = None
+    cancelSeconds: float | None = None
+    isLiked: bool | None = None
+    canPurchase: bool | None = None
+    canPurchaseReason: str | None = None
+    canReport: bool | None = None
+    canBePinned: bool | None = None
+    isPinned: bool | None = None
+
+
+class V2AccessChatsUserIdMessagesGetResponse(BaseModel):
+    list: list[V2AccessChatsUserIdMessagesPostResponse]
+    hasMore: bool
+
+
+class V2AccessChatsUserIdMessagesMessageIdDeleteRequest(BaseModel):
+    withUserId: str | float
+
+
+class MediaTypes(BaseModel):
+    video: float | None = None
+    photo: float | None = None
+    gif: float | None = None
+    audio: float | None = None
+
+
+class Queue(BaseModel):
+    id: float
+    text: str
+    fromUser: FromUser | Author
+    media: list[MediaItem]
+    isMediaReady: bool | None = None
+    mediaCount: float | None = None
+    previews: list[float]
+    lockedText: bool | None = None
+    responseType: str | None = None
+    giphyId: str | None = None
+    isFree: bool | None = None
+    isTip: bool | None = None
+    isReportedByMe: bool | None = None
+    isCouplePeopleMedia: bool | None = None
+    queueId: float | None = None
+    isMarkdownDisabled: bool | None = None
+    releaseForms: Any | None = None
+    isFromQueue: bool | None = None
+    canUnsendQueue: bool | None = None
+    unsendSecondsQueue: float | None = None
+    isOpened: bool | None = None
+    isNew: bool | None = None
+    createdAt: str | None = None
+    changedAt: str | None = None
+    cancelSeconds: float | None = None
+    isLiked: bool | None = None
+    canPurchase: bool | None = None
+    canPurchaseReason: str | None = None
+    canReport: bool | None = None
+    canBePinned: bool | None = None
+    isPinned: bool | None = None
+    date: str | None = None
+    textCropped: str | None = None
+    sentCount: float | None = None
+    viewedCount: float | None = None
+    canUnsend: bool | None = None
+    unsendSeconds: float | None = None
+    isCanceled: bool | None = None
+    mediaTypes: MediaTypes | None = None
+    hasError: bool | None = None
+    price: str | None = None
+    purchasedCount: float | None = None
+    canSendMessageToBuyers: bool | None = None
+
+
+class V2AccessChatsUserIdMessagesMessageIdDeleteResponse(BaseModel):
+    success: bool
+    queue: Queue | None = None
+
+
+class V2AccessMassMessagesPostRequest(BaseModel):
+    isForwardedMessage: bool | None = False
+    """
+    Whether this is a forwarded message
+    """
+    text: str | None = Field("", max_length=10000)
+    """
+    Text content. Supports markdown by default. See [Text Formatting Guide](/guides/how-to/text-formatting).
+    """
+    mediaItems: list[MediaItems | MediaItems1] | None = []
+    """
+    Media references to attach. Accepts vault media IDs, upload references (mediaUploadId), or http(s) URLs. See [mediaItems reference](/guides/media-items).
+    """
+    isLockedText: bool | None = False
+    """
+    Whether text is locked behind paywall (defaults to false).
+    """
+    price: float | None = Field(0, ge=0.0, le=200.0)
+    """
+    Price to unlock message content (0 for free)
+    """
+    previewMediaCount: int | None = Field(0, ge=0)
+    """
+    How many items in mediaItems should be previews. Uses the first N items from left to right.
+    """
+    releaseForms: ReleaseForms | None = None
+    """
+    Release form participants
+    """
+    userTags: list[User13] | None = Field(default_factory=list)
+    """
+    Users to tag
+    """
+    isMarkdown: bool | None = True
+    """
+    Whether to parse text as markdown (default: true). See [Text Formatting Guide](/guides/how-to/text-formatting).
+    """
+    scheduledDate: str | Any | None = None
+    """
+    When to send the message (omit for immediate)
+    """
+    userIds: list[User13 | MediaItems1] | None = None
+    """
+    Specific user IDs to send to
+    """
+    userLists: list[User13 | MediaItems1] | None = None
+    """
+    User list IDs to send to
+    """
+    subscribedAfterDate: str | Any | None = None
+    """
+    Only send to users subscribed after this date
+    """
+    excludeUserLists: list[User13 | MediaItems1] | None = None
+    """
+    User list IDs to exclude
+    """
+
+
+class V2AccessMassMessagesPostResponse(BaseModel):
+    id: float
+    date: str
+    isReady: bool | None = None
+    isDone: bool | None = None
+    total: float | None = None
+    pending: float | None = None
+    canUnsend: bool | None = None
+    unsendSeconds: float | None = None
+    hasError: bool | None = None
+    isCanceled: bool | None = None
+    isCouplePeopleMedia: bool | None = None
+
+
+class Order(Enum):
+    RECENT = "recent"
+    OLD = "old"
+
+
+class Filter2(Enum):
+    PRIORITY = "priority"
+    WHO_TIPPED = "who_tipped"
+    UNREAD = "unread"
+
+
+class ListItem11(BaseModel):
+    withUser: Author
+    canNotSendReason: bool | str | None = None
+    canSendMessage: bool | None = None
+    canGoToProfile: bool | None = None
+    unreadMessagesCount: float | None = None
+    hasUnreadTips: bool | None = None
+    isMutedNotifications: bool | None = None
+    lastMessage: V2AccessChatsUserIdMessagesPostResponse | None = None
+    lastReadMessageId: float | None = None
+    hasPurchasedFeed: bool | None = None
+    countPinnedMessages: float | None = None
+
+
+class V2AccessChatsGetResponse(BaseModel):
+    list: list[ListItem11]
+    hasMore: bool
+    nextOffset: float | None = None
+
+
+class Type20(Enum):
+    PHOTOS = "photos"
+    VIDEOS = "videos"
+    AUDIOS = "audios"
+
+
+# Structural duplicates of the schemas above, under their generated names
+MediaItems4 = MediaItems
+MediaItems5 = MediaItems1
+User21 = User13
+ReleaseForms2 = ReleaseForms
+FromUser1 = Author
+User22 = User3
+ReleaseForm16 = ReleaseForm
+Full12 = Full
+Preview14 = Preview
+Files12 = Files
+MediaItem10 = MediaItem
+FromUser2 = FromUser
+FromUser3 = Author
+User23 = User3
+ReleaseForm17 = ReleaseForm
+Full13 = Full
+Preview15 = Preview
+Files13 = Files
+MediaItem11 = MediaItem
+ListItem10 = V2AccessChatsUserIdMessagesPostResponse
+FromUser4 = FromUser
+FromUser5 = Author
+User24 = User3
+ReleaseForm18 = ReleaseForm
+Full14 = Full
+Preview16 = Preview
+Files14 = Files
+MediaItem12 = MediaItem
+MediaItems6 = MediaItems
+MediaItems7 = MediaItems1
+User25 = User13
+ReleaseForms3 = ReleaseForms
+UserIds = User13
+UserIds1 = MediaItems1
+UserLists = User13
+UserLists1 = MediaItems1
+ExcludeUserLists = User13
+ExcludeUserLists1 = MediaItems1
+MediaItems8 = MediaItems
+MediaItems9 = MediaItems1
+ReleaseForms4 = ReleaseForms
+UserIds2 = User13
+UserIds3 = MediaItems1
+UserLists2 = User13
+UserLists3 = MediaItems1
+ExcludeUserLists2 = User13
+ExcludeUserLists3 = MediaItems1
+V2AccessMassMessagesMassMessageIdPutRequest = V2AccessMassMessagesPostRequest
+V2AccessMassMessagesMassMessageIdPutResponse = V2AccessMassMessagesPostResponse
+FromUser6 = FromUser
+FromUser7 = Author
+User27 = User3
+ReleaseForm19 = ReleaseForm
+Full15 = Full
+Preview17 = Preview
+Files15 = Files
+MediaItem13 = MediaItem
+Queue1 = Queue
+V2AccessMassMessagesMassMessageIdDeleteResponse = V2AccessChatsUserIdMessagesMessageIdDeleteResponse
+FromUser8 = FromUser
+FromUser9 = Author
+User28 = User3
+ReleaseForm20 = ReleaseForm
+Full16 = Full
+Preview18 = Preview
+Files16 = Files
+MediaItem14 = MediaItem
+V2AccessMassMessagesMassMessageIdGetResponse = V2AccessChatsUserIdMessagesPostResponse
+WithUser = Author
+FromUser10 = FromUser
+FromUser11 = Author
+User29 = User3
+ReleaseForm21 = ReleaseForm
+Full17 = Full
+Preview19 = Preview
+Files17 = Files
+MediaItem15 = MediaItem
+LastMessage = V2AccessChatsUserIdMessagesPostResponse
+FromUser12 = FromUser
+FromUser13 = Author
+Type21 = Type2
+User30 = User3
+ReleaseForm22 = ReleaseForm
+Full18 = Full
+Preview20 = Preview
+Files18 = Files
+MediaItem16 = MediaItem
+ListItem12 = V2AccessChatsUserIdMessagesPostResponse
+V2AccessChatsUserIdMediaGetResponse = V2AccessChatsUserIdMessagesGetResponse
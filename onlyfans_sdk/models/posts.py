@@ -0,0 +1,197 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field, RootModel
+
+from .common import (
+    User3,
+    ReleaseForm,
+    Full,
+    Preview,
+    Files,
+    MediaItem,
+    Author,
+    MediaItems,
+    MediaItems1,
+    User13,
+    ReleaseForms,
+)
+
+
+class V2AccessPostsPostRequest(BaseModel):
+    text: str | None = Field("", max_length=10000)
+    """
+    Text content. Supports markdown by default. See [Text Formatting Guide](/guides/how-to/text-formatting).
+    """
+    mediaItems: list[MediaItems | MediaItems1] | None = []
+    """
+    Media references to attach. Accepts vault media IDs, upload references (mediaUploadId), or http(s) URLs. See [mediaItems reference](/guides/media-items).
+    """
+    isLockedText: bool | None = False
+    """
+    Whether text is locked behind paywall (defaults to false).
+    """
+    price: float | None = Field(0, ge=0.0, le=200.0)
+    """
+    Price to unlock message content (0 for free)
+    """
+    previewMediaCount: int | None = Field(0, ge=0)
+    """
+    How many items in mediaItems should be previews. Uses the first N items from left to right.
+    """
+    releaseForms: ReleaseForms | None = None
+    """
+    Release form participants
+    """
+    userTags: list[User13] | None = Field(default_factory=list)
+    """
+    Users to tag
+    """
+    isMarkdown: bool | None = True
+    """
+    Whether to parse text as markdown (default: true). See [Text Formatting Guide](/guides/how-to/text-formatting).
+    """
+    scheduledDate: str | None = None
+    """
+    When to publish the post (omit for immediate)
+    """
+    fundRaisingTargetAmount: float | None = Field(None, ge=10.0)
+    """
+    Target amount for fund raising post
+    """
+    fundRaisingTipsPresets: list[float] | None = Field(None, max_length=4)
+    """
+    Preset tip amounts for fund raising
+    """
+    expireAfter: float | None = Field(None, ge=1.0, le=30.0)
+    """
+    Days until post expires (1-30)
+    """
+
+
+class V2AccessPostsPostResponse(BaseModel):
+    id: float
+    canDelete: bool
+    canEdit: bool
+    mediaCount: float
+    media: list[MediaItem]
+    canViewMedia: bool
+    author: Author | None = None
+    responseType: str
+    postedAt: str
+    postedAtPrecise: str
+    isMarkdownDisabled: bool
+    isOpened: bool
+    canToggleFavorite: bool
+    tipsAmount: str
+    text: str
+    isFavorite: bool
+    canComment: bool
+    favoritesCount: float
+    isMediaReady: bool
+    rawText: str
+
+
+class SortBy2(Enum):
+    PUBLISH_DATE = "publish_date"
+    TIPS = "tips"
+    FAVORITES_COUNT = "favorites_count"
+
+
+class Counters(BaseModel):
+    audiosCount: float
+    photosCount: float
+    videosCount: float
+    mediasCount: float
+    postsCount: float
+    streamsCount: float
+    archivedPostsCount: float
+    privateArchivedPostsCount: float
+
+
+class V2AccessPostsGetResponse(BaseModel):
+    list: list[V2AccessPostsPostResponse]
+    hasMore: bool
+    headMarker: str
+    tailMarker: str
+    counters: Counters
+
+
+class V2AccessPostsPostIdGetResponse1(BaseModel):
+    id: float
+    canDelete: bool
+    canEdit: bool
+    mediaCount: float
+    media: list[MediaItem]
+    canViewMedia: bool
+    author: Author | None = None
+    responseType: str
+    postedAt: str
+    postedAtPrecise: str
+    isMarkdownDisabled: bool
+    isOpened: bool
+    canToggleFavorite: bool
+    tipsAmount: str
+    isMediaReady: bool
+    price: float | None = None
+    releaseForms: list[ReleaseForm]
+    canEditText: bool
+    canEditMedia: bool
+    canEditSchedule: bool
+    canEditVote: bool
+    preview: list[float]
+
+
+class V2AccessPostsPostIdGetResponse(RootModel[V2AccessPostsPostIdGetResponse1 | Any]):
+    root: V2AccessPostsPostIdGetResponse1 | Any
+
+
+# Structural duplicates of the schemas above, under their generated names
+User14 = User3
+ReleaseForm10 = ReleaseForm
+Full7 = Full
+Preview9 = Preview
+Files7 = Files
+MediaItem5 = MediaItem
+User15 = User3
+ReleaseForm11 = ReleaseForm
+Full8 = Full
+Preview10 = Preview
+Files8 = Files
+MediaItem6 = MediaItem
+ListItem8 = V2AccessPostsPostResponse
+MediaItems2 = MediaItems
+MediaItems3 = MediaItems1
+User16 = User13
+ReleaseForms1 = ReleaseForms
+V2AccessPostsPostIdPutRequest = V2AccessPostsPostRequest
+User17 = User3
+ReleaseForm12 = ReleaseForm
+Full9 = Full
+Preview11 = Preview
+Files9 = Files
+MediaItem7 = MediaItem
+V2AccessPostsPostIdPutResponse = V2AccessPostsPostResponse
+User18 = User3
+ReleaseForm13 = ReleaseForm
+Full10 = Full
+Preview12 = Preview
+Files10 = Files
+MediaItem8 = MediaItem
+User19 = User3
+ReleaseForm14 = ReleaseForm
+User20 = User3
+ReleaseForm15 = ReleaseForm
+Full11 = Full
+Preview13 = Preview
+Files11 = Files
+MediaItem9 = MediaItem
+ListItem9 = V2AccessPostsPostResponse
+V2AccessUsersUserIdPostsGetResponse = V2AccessPostsGetResponse
@@ -0,0 +1,293 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field, RootModel
+
+from .common import (
+    Imported,
+    Item5,
+    FromUser,
+)
+
+
+class V2AccessPromotionsTrackingLinksGetResponse(BaseModel):
+    list: list[FromUser]
+    hasMore: bool
+
+
+class V2AccessPromotionsTrackingLinksPostRequest(BaseModel):
+    name: str = Field(..., max_length=100, min_length=1)
+    """
+    Name for the tracking link
+    """
+
+
+class V2AccessPromotionsTrackingLinksPostResponse(
+    RootModel[
+        list[FromUser]
+        | FromUser
+    ]
+):
+    root: (
+        list[FromUser]
+        | FromUser
+    )
+
+
+class V2AccessPromotionsTrackingLinksShareAccessPostRequest(BaseModel):
+    campaignId: int = Field(..., gt=0)
+    """
+    Campaign ID to share
+    """
+    userId: int = Field(..., gt=0)
+    """
+    User ID to share with
+    """
+
+
+class V2AccessPromotionsTrackingLinksShareAccessPostResponse(BaseModel):
+    success: bool
+
+
+class V2AccessPromotionsTrackingLinksTrackingLinkIdPutRequest(BaseModel):
+    name: str | None = Field(None, max_length=100, min_length=1)
+    """
+    Name for the tracking link
+    """
+
+
+class V2AccessPromotionsTrackingLinksTrackingLinkIdClaimersGetResponse(BaseModel):
+    list: list[Any]
+    hasMore: bool | None = None
+
+
+class ListItem17(BaseModel):
+    id: float
+    trialLinkName: str
+    url: str
+    subscribeDays: float
+    subscribeCounts: float
+    claimCounts: float
+    clicksCounts: float
+    expiredAt: str
+    createdAt: str
+    isFinished: bool
+    user: Any | None = None
+    sharedWith: str | None = None
+
+
+class V2AccessPromotionsTrialLinksGetResponse1(BaseModel):
+    list: list[ListItem17]
+    hasMore: bool
+
+
+class V2AccessPromotionsTrialLinksGetResponse(
+    RootModel[
+        V2AccessPromotionsTrialLinksGetResponse1
+        | list[ListItem17]
+    ]
+):
+    root: (
+        V2AccessPromotionsTrialLinksGetResponse1
+        | list[ListItem17]
+    )
+
+
+class V2AccessPromotionsTrialLinksPostRequest(BaseModel):
+    trialLinkName: str = Field(..., max_length=100, min_length=1)
+    """
+    Name for the trial link
+    """
+    subscribeDays: int = Field(..., ge=1, le=365)
+    """
+    Number of days for trial subscription
+    """
+    subscribeCounts: int | None = Field(None, ge=1)
+    """
+    Maximum number of times trial can be claimed
+    """
+    expiredAt: str | None = None
+    """
+    When the trial link expires
+    """
+
+
+class V2AccessPromotionsTrialLinksShareAccessPostRequest(BaseModel):
+    trialId: int = Field(..., gt=0)
+    """
+    Trial ID to share
+    """
+    userId: int = Field(..., gt=0)
+    """
+    User ID to share with
+    """
+
+
+class V2AccessPromotionsTrialLinksTrialLinkIdPutRequest(BaseModel):
+    trialLinkName: str | None = Field(None, max_length=100, min_length=1)
+    """
+    New name for trial link
+    """
+    subscribeDays: int | None = Field(None, ge=1, le=365)
+    """
+    New trial duration in days
+    """
+    subscribeCounts: int | None = Field(None, ge=1)
+    """
+    New maximum claim count
+    """
+    expiredAt: str | None = None
+    """
+    New expiration date
+    """
+
+
+class V2AccessPromotionsBundlesGetResponseItem(BaseModel):
+    id: float
+    discount: float
+    duration: float
+    price: float
+    canBuy: bool
+
+
+class V2AccessPromotionsBundlesGetResponse1(BaseModel):
+    list: list[V2AccessPromotionsBundlesGetResponseItem]
+    hasMore: bool
+
+
+class V2AccessPromotionsBundlesGetResponse(
+    RootModel[
+        list[V2AccessPromotionsBundlesGetResponseItem]
+        | V2AccessPromotionsBundlesGetResponse1
+    ]
+):
+    root: (
+        list[V2AccessPromotionsBundlesGetResponseItem]
+        | V2AccessPromotionsBundlesGetResponse1
+    )
+
+
+class V2AccessPromotionsBundlesPostRequest(BaseModel):
+    discount: int = Field(..., ge=1, le=100)
+    """
+    Discount percentage for bundle
+    """
+    duration: int = Field(..., ge=1, le=365)
+    """
+    Bundle subscription duration in days
+    """
+
+
+class V2AccessPromotionsBundlesBundleIdPutRequest(BaseModel):
+    discount: int | None = Field(None, ge=1, le=100)
+    """
+    Discount percentage for bundle
+    """
+    duration: int | None = Field(None, ge=1, le=365)
+    """
+    Bundle subscription duration in days
+    """
+
+
+class V2AccessPromotionsGetResponse1(BaseModel):
+    list: list[Item5]
+    hasMore: bool
+
+
+class V2AccessPromotionsGetResponse(
+    RootModel[list[Item5] | V2AccessPromotionsGetResponse1]
+):
+    root: list[Item5] | V2AccessPromotionsGetResponse1
+
+
+class V2AccessPromotionsPostRequest(BaseModel):
+    discount: int = Field(..., ge=1, le=100)
+    """
+    Discount percentage to offer
+    """
+    message: str = Field(..., max_length=1000)
+    """
+    Promotion message
+    """
+    finishDays: int = Field(..., ge=1, le=365)
+    """
+    Days until promotion ends
+    """
+    subscribeCounts: int = Field(..., ge=1)
+    """
+    Maximum subscribers
+    """
+    subscribeDays: int = Field(..., ge=1, le=365)
+    """
+    Subscription duration in days
+    """
+    type: list[str] = Field(..., min_length=1)
+    """
+    Promotion types
+    """
+
+
+class V2AccessPromotionsPromotionIdPutRequest(BaseModel):
+    discount: int | None = Field(None, ge=1, le=100)
+    """
+    Discount percentage to offer
+    """
+    message: str | None = Field(None, max_length=1000)
+    """
+    Promotion message
+    """
+    finishDays: int | None = Field(None, ge=1, le=365)
+    """
+    Days until promotion ends
+    """
+    subscribeCounts: int | None = Field(None, ge=1)
+    """
+    Maximum subscribers
+    """
+    subscribeDays: int | None = Field(None, ge=1, le=365)
+    """
+    Subscription duration in days
+    """
+    type: list[str] | None = Field(None, min_length=1)
+    """
+    Promotion types
+    """
+
+
+# Structural duplicates of the schemas above, under their generated names
+Stats4 = Imported
+ListItem16 = FromUser
+V2AccessPromotionsTrackingLinksPostResponseItem = FromUser
+V2AccessPromotionsTrackingLinksPostResponse1 = FromUser
+V2AccessPromotionsTrackingLinksShareAccessDeleteRequest = V2AccessPromotionsTrackingLinksShareAccessPostRequest
+V2AccessPromotionsTrackingLinksShareAccessDeleteResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+V2AccessPromotionsTrackingLinksTrackingLinkIdGetResponse = FromUser
+V2AccessPromotionsTrackingLinksTrackingLinkIdPutResponse = FromUser
+V2AccessPromotionsTrackingLinksTrackingLinkIdDeleteResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+V2AccessPromotionsTrialLinksGetResponseItem = ListItem17
+V2AccessPromotionsTrialLinksPostResponse = ListItem17
+V2AccessPromotionsTrialLinksShareAccessPostResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+V2AccessPromotionsTrialLinksShareAccessDeleteRequest = V2AccessPromotionsTrialLinksShareAccessPostRequest
+V2AccessPromotionsTrialLinksShareAccessDeleteResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+V2AccessPromotionsTrialLinksTrialLinkIdGetResponse = ListItem17
+V2AccessPromotionsTrialLinksTrialLinkIdPutResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+V2AccessPromotionsTrialLinksTrialLinkIdDeleteResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+ListItem18 = V2AccessPromotionsBundlesGetResponseItem
+V2AccessPromotionsBundlesPostResponse = V2AccessPromotionsBundlesGetResponseItem
+V2AccessPromotionsBundlesBundleIdGetResponse = V2AccessPromotionsBundlesGetResponseItem
+V2AccessPromotionsBundlesBundleIdPutResponse = V2AccessPromotionsBundlesGetResponseItem
+V2AccessPromotionsBundlesBundleIdDeleteResponse = V2AccessPromotionsBundlesGetResponseItem
+V2AccessPromotionsGetResponseItem = Item5
+ListItem19 = Item5
+V2AccessPromotionsPostResponseItem = Item5
+V2AccessPromotionsPostResponse1 = V2AccessPromotionsGetResponse1
+V2AccessPromotionsPostResponse = V2AccessPromotionsGetResponse
+V2AccessPromotionsPromotionIdPutResponse = Item5
+V2AccessPromotionsPromotionIdDeleteResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
+V2AccessPromotionsPromotionIdStopPostResponse = V2AccessPromotionsTrackingLinksShareAccessPostResponse
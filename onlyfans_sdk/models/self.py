@@ -0,0 +1,136 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field, RootModel
+
+
+class IsAuth(Enum):
+    BOOLEAN_TRUE = True
+
+
+class V2AccessSelfGetResponse1(BaseModel):
+    id: float
+    username: str
+    name: str
+    isAuth: IsAuth
+    isVerified: bool
+    avatar: str
+    subscribersCount: float
+    postsCount: float
+    photosCount: float
+    videosCount: float
+
+
+class IsAuth1(Enum):
+    BOOLEAN_FALSE = False
+
+
+class V2AccessSelfGetResponse2(BaseModel):
+    isAuth: IsAuth1
+
+
+class V2AccessSelfGetResponse(
+    RootModel[V2AccessSelfGetResponse1 | V2AccessSelfGetResponse2]
+):
+    root: V2AccessSelfGetResponse1 | V2AccessSelfGetResponse2
+
+
+class V2AccessSelfPatchRequest(BaseModel):
+    name: str | None = Field(None, max_length=100)
+    """
+    Display name
+    """
+    about: str | None = Field(None, max_length=1000)
+    """
+    Profile bio/description
+    """
+
+
+class Type(Enum):
+    SUBSCRIBED = "subscribed"
+    PURCHASES = "purchases"
+    TIP = "tip"
+    POST = "post"
+    COMMENTED = "commented"
+    MENTIONED = "mentioned"
+    FAVORITED = "favorited"
+    MESSAGE = "message"
+
+
+class ListItem1(BaseModel):
+    id: float
+    type: str
+    subType: str
+    createdAt: str
+    isRead: bool
+    text: str
+    replacePairs: dict[str, str]
+    canGoToProfile: bool
+    userId: float
+
+
+class V2AccessSelfNotificationsGetResponse(BaseModel):
+    list: list[ListItem1]
+    hasMore: bool
+
+
+class Filter(Enum):
+    ALL = "all"
+    PENDING = "pending"
+
+
+class SortBy(Enum):
+    DATE = "date"
+    NAME = "name"
+
+
+class SortDirection(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class ListItem2(BaseModel):
+    id: float
+    type: str
+    name: str
+    partnerId: float
+    code: str
+    status: str
+    createdAt: str
+    approvedAt: str
+    lastChangedAt: str
+    userName: str
+    hasUser: bool
+    isHidden: bool
+
+
+class V2AccessSelfReleaseFormsGetResponse(BaseModel):
+    list: list[ListItem2]
+    hasMore: bool
+
+
+class User(BaseModel):
+    id: float
+    name: str
+    username: str
+    isVerified: bool
+    avatar: str
+    isHidden: bool
+
+
+class ListItem3(BaseModel):
+    id: float
+    type: str
+    name: str
+    user: User
+
+
+class V2AccessSelfTaggedFriendUsersGetResponse(BaseModel):
+    list: list[ListItem3]
+    hasMore: bool
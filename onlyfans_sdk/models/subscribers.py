@@ -0,0 +1,156 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from .common import (
+    AvatarThumbs,
+    V2AccessPostsPostIdDeleteResponse,
+    Opened,
+)
+
+
+class Filter3(BaseModel):
+    promoId: str | None = None
+    """
+    Filter by promotion ID
+    """
+    trial_id: str | None = None
+    """
+    Filter by trial link ID
+    """
+    duration: str | None = None
+    """
+    Filter by subscription duration
+    """
+    tips: str | None = None
+    """
+    Filter by tips amount
+    """
+    total_spent: str | None = None
+    """
+    Filter by total spent
+    """
+    online: Opened | None = None
+    """
+    Filter by online status
+    """
+
+
+class Type23(Enum):
+    LATEST = "latest"
+
+
+class LatestType(Enum):
+    TOTAL = "total"
+    NEW = "new"
+    RENEWALS = "renewals"
+
+
+class HistoryItem(BaseModel):
+    id: float
+    startDate: str
+    expireDate: str
+    price: float
+    regularPrice: float
+    discount: float
+    type: str
+    action: str
+    isCurrent: bool
+
+
+class Subscription(BaseModel):
+    isActive: bool
+    isExpired: bool
+    subscribedAt: str
+    expiresAt: str
+    renewedAt: str
+    price: float
+    regularPrice: float
+    discountPercent: float
+    discountPeriod: float
+    discountStartedAt: str
+    discountFinishedAt: str
+    history: list[HistoryItem]
+
+
+class Spending(BaseModel):
+    total: float
+    tips: float
+    subscriptions: float
+    messages: float
+    posts: float
+    streams: float
+
+
+class Capabilities(BaseModel):
+    canRestrict: bool
+    canBlock: bool
+    canReport: bool
+    canUnsubscribe: bool
+    canReceiveMessages: bool
+    canSendTrial: bool
+
+
+class List1(BaseModel):
+    id: str | float
+    name: str
+
+
+class ListItem13(BaseModel):
+    id: float
+    name: str
+    username: str
+    displayName: str
+    isVerified: bool
+    avatar: str
+    avatarThumbs: AvatarThumbs
+    lastSeen: str
+    subscription: Subscription
+    spending: Spending
+    isRestricted: bool
+    isBlocked: bool
+    capabilities: Capabilities
+    lists: list[List1]
+
+
+class V2AccessSubscribersGetResponse(BaseModel):
+    list: list[ListItem13]
+    hasMore: bool
+
+
+class V2AccessSubscribersUserIdNotePutRequest(BaseModel):
+    notice: str = Field(..., max_length=1000)
+    """
+    Note about the subscriber
+    """
+
+
+class V2AccessSubscribersUserIdDiscountPutRequest(BaseModel):
+    discount: int = Field(..., ge=5, le=60)
+    """
+    Discount percentage (1-100)
+    """
+    period: int = Field(..., ge=1, le=12)
+    """
+    Number of months to apply discount
+    """
+
+
+class V2AccessSubscribersUserIdCustomNamePutRequest(BaseModel):
+    displayName: str = Field(..., max_length=100, min_length=1)
+    """
+    Custom display name for subscriber
+    """
+
+
+# Structural duplicates of the schemas above, under their generated names
+V2AccessSubscribersUserIdNotePutResponse = V2AccessPostsPostIdDeleteResponse
+V2AccessSubscribersUserIdDiscountPutResponse = V2AccessPostsPostIdDeleteResponse
+V2AccessSubscribersUserIdCustomNamePutResponse = V2AccessPostsPostIdDeleteResponse
@@ -0,0 +1,94 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from .common import (
+    AvatarThumbs,
+    List,
+    Opened,
+    Type22,
+)
+
+
+class Filter4(BaseModel):
+    online: Opened | None = None
+    """
+    Filter by online status
+    """
+    paid: Opened | None = None
+    """
+    Filter by paid subscriptions only
+    """
+
+
+class ListItem14(BaseModel):
+    id: float
+    username: str
+    name: str
+    avatar: str
+    avatarThumbs: AvatarThumbs | None = None
+    lists: list[List]
+    subscribedAt: str
+    expiredAt: str
+    renewedAt: str
+    isActive: bool
+    subscriptionPrice: float
+    tipsSumm: float | None = None
+    subscribesSumm: float | None = None
+    messagesSumm: float | None = None
+    postsSumm: float | None = None
+    streamsSumm: float | None = None
+    totalSumm: float | None = None
+
+
+class V2AccessSubscriptionsGetResponse(BaseModel):
+    list: list[ListItem14]
+    hasMore: bool
+
+
+class Subscriptions(BaseModel):
+    active: float
+    muted: float
+    restricted: float
+    expired: float
+    blocked: float
+    attention: float
+    all: float
+
+
+class Subscribers(BaseModel):
+    active: float
+    muted: float
+    restricted: float
+    expired: float
+    blocked: float
+    all: float
+    activeOnline: float
+
+
+class V2AccessSubscriptionsCountGetResponse(BaseModel):
+    subscriptions: Subscriptions
+    subscribers: Subscribers
+    bookmarks: float
+
+
+class ListItem15(BaseModel):
+    subscribeDate: str
+    expireDate: str
+    price: float
+
+
+class V2AccessSubscriptionsSubscriptionIdHistoryGetResponse(BaseModel):
+    list: list[ListItem15]
+    hasMore: bool
+
+
+# Structural duplicates of the schemas above, under their generated names
+Paid = Opened
+Type24 = Type22
+All = Opened
@@ -0,0 +1,113 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from .common import (
+    User3,
+    ReleaseForm,
+    Full,
+    Preview,
+    Files,
+    MediaItem,
+)
+
+
+class V2AccessUploadsCheckPostRequest(BaseModel):
+    etag: str = Field(..., min_length=1)
+    """
+    ETag from the upload response
+    """
+    size: int = Field(..., gt=0)
+    """
+    Uploaded file size in bytes
+    """
+
+
+class V2AccessUploadsCheckPostResponse(BaseModel):
+    exists: bool
+    media: MediaItem | None = None
+
+
+class Mode(Enum):
+    MESSAGE = "message"
+
+
+class VaultUpload(BaseModel):
+    mode: Mode | None = "message"
+    """
+    Upload mode
+    """
+    userId: str | None = Field(None, min_length=1)
+    """
+    Target user ID for the upload
+    """
+
+
+class V2AccessUploadsInitPostRequest(BaseModel):
+    filename: str = Field(..., min_length=1)
+    """
+    Name of the file to upload
+    """
+    size: int = Field(..., gt=0)
+    """
+    File size in bytes
+    """
+    contentType: str = Field(..., min_length=1)
+    """
+    MIME type of the file (e.g., image/jpeg, video/mp4)
+    """
+    vaultUpload: VaultUpload | None = None
+    """
+    Options for vault upload (if uploading to vault)
+    """
+
+
+class V2AccessUploadsInitPostResponse(BaseModel):
+    mediaUploadId: str
+
+
+class V2AccessUploadsMediaUploadIdPartsPartNumberPutResponse(BaseModel):
+    mediaUploadId: str
+    partNumber: int = Field(..., gt=0)
+    etag: str
+
+
+class V2AccessUploadsMediaUploadIdPutResponse(BaseModel):
+    mediaUploadId: str
+    media: MediaItem | None = None
+
+
+class V2AccessUploadsCompletePostRequest(BaseModel):
+    mediaUploadId: str = Field(..., min_length=1)
+    """
+    Upload session ID to complete
+    """
+
+
+# Structural duplicates of the schemas above, under their generated names
+User39 = User3
+ReleaseForm25 = ReleaseForm
+Full21 = Full
+Preview23 = Preview
+Files21 = Files
+Media5 = MediaItem
+User40 = User3
+ReleaseForm26 = ReleaseForm
+Full22 = Full
+Preview24 = Preview
+Files22 = Files
+Media6 = MediaItem
+User41 = User3
+ReleaseForm27 = ReleaseForm
+Full23 = Full
+Preview25 = Preview
+Files23 = Files
+Media7 = MediaItem
+V2AccessUploadsCompletePostResponse = V2AccessUploadsMediaUploadIdPutResponse
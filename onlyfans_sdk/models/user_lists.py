@@ -0,0 +1,138 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field, RootModel
+
+from .common import (
+    ListItem6,
+    V2AccessPostsPostIdDeleteResponse,
+)
+
+
+class SortListItem(BaseModel):
+    order: str
+    direction: str
+
+
+class ListItem23(BaseModel):
+    id: str | float
+    type: str
+    name: str
+    usersCount: float | None = None
+    postsCount: float | None = None
+    order: str | None = None
+    direction: str | None = None
+    canUpdate: bool | None = None
+    canDelete: bool | None = None
+    canManageUsers: bool | None = None
+    canAddUsers: bool | None = None
+    canPinnedToFeed: bool | None = None
+    isPinnedToFeed: bool | None = None
+    canPinnedToChat: bool | None = None
+    isPinnedToChat: bool | None = None
+    sortList: list[SortListItem]
+    users: list[ListItem6]
+
+
+class V2AccessUsersListsGetResponse(BaseModel):
+    list: list[ListItem23]
+    hasMore: bool
+    order: str | None = None
+    sort: str | None = None
+
+
+class V2AccessUsersListsPostRequest(BaseModel):
+    name: str = Field(..., max_length=100, min_length=1)
+    """
+    Name for the new user list
+    """
+
+
+class V2AccessUsersListsListIdPatchRequest(BaseModel):
+    name: str = Field(..., max_length=100, min_length=1)
+    """
+    New name for the user list
+    """
+
+
+class V2AccessUsersListsListIdUsersGetResponse(BaseModel):
+    list: list[ListItem6]
+    hasMore: bool
+    nextOffset: float | None = None
+
+
+class UserState(BaseModel):
+    id: str | float
+    type: str
+    name: str
+    hasUser: bool
+    canAddUser: bool | None = None
+    cannotAddUserReason: str | None = None
+
+
+class V2AccessUsersListsListIdUsersUserIdPostResponse1(BaseModel):
+    list: ListItem23
+    userState: UserState
+
+
+class V2AccessUsersListsListIdUsersUserIdPostResponse(
+    RootModel[V2AccessUsersListsListIdUsersUserIdPostResponse1 | dict[str, Any]]
+):
+    root: V2AccessUsersListsListIdUsersUserIdPostResponse1 | dict[str, Any]
+
+
+class V2AccessUsersListsListIdUsersUserIdDeleteResponse(
+    RootModel[V2AccessUsersListsListIdUsersGetResponse | dict[str, Any]]
+):
+    root: V2AccessUsersListsListIdUsersGetResponse | dict[str, Any]
+
+
+class ListId(RootModel[int]):
+    root: int = Field(..., gt=0)
+    """
+    List ID
+    """
+
+
+class V2AccessUsersUserIdListsPostRequest(BaseModel):
+    listIds: list[ListId] = Field(..., max_length=5, min_length=1)
+    """
+    List IDs to add the user to
+    """
+
+
+class Succes(BaseModel):
+    listId: float
+    success: bool
+
+
+class Error(BaseModel):
+    listId: float
+    error: str
+
+
+class V2AccessUsersUserIdListsPostResponse(BaseModel):
+    success: list[Succes]
+    errors: list[Error] | None = None
+
+
+# Structural duplicates of the schemas above, under their generated names
+User32 = ListItem6
+User33 = ListItem6
+V2AccessUsersListsPostResponse = ListItem23
+User34 = ListItem6
+V2AccessUsersListsListIdPatchResponse = ListItem23
+V2AccessUsersListsListIdDeleteResponse = V2AccessPostsPostIdDeleteResponse
+User35 = ListItem6
+V2AccessUsersListsListIdGetResponse = ListItem23
+ListItem24 = ListItem6
+User36 = ListItem6
+List7 = ListItem23
+ListItem25 = ListItem6
+V2AccessUsersListsListIdUsersUserIdDeleteResponse1 = V2AccessUsersListsListIdUsersGetResponse
@@ -0,0 +1,110 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field, RootModel
+
+from .common import (
+    AvatarThumbs,
+    List,
+    SubscribedByData,
+    SubscribedOnData,
+    V2AccessSelfPatchResponse,
+    V2AccessPostsPostIdDeleteResponse,
+)
+
+
+class ListItem21(BaseModel):
+    id: float
+    username: str
+    name: str
+    isVerified: bool
+    avatar: str
+    avatarThumbs: AvatarThumbs | None = None
+    lists: list[List]
+    displayName: str | None = None
+    notice: str | None = None
+    isRestricted: bool | None = None
+    canRestrict: bool | None = None
+    subscribedBy: bool | None = None
+    subscribedByExpire: bool | None = None
+    subscribedByExpireDate: str | None = None
+    subscribedByAutoprolong: bool | None = None
+    subscribedIsExpiredNow: bool | None = None
+    currentSubscribePrice: float | None = None
+    subscribedOn: bool | None = None
+    subscribedOnExpiredNow: bool | None = None
+    subscribedOnDuration: str | None = None
+    canReport: bool | None = None
+    canReceiveChatMessage: bool | None = None
+    hideChat: bool | None = None
+    lastSeen: str | None = None
+    isPerformer: bool | None = None
+    isRealPerformer: bool | None = None
+    subscribedByData: SubscribedByData | None = None
+    subscribedOnData: SubscribedOnData | None = None
+    canTrialSend: bool | None = None
+    isBlocked: bool | None = None
+    canUnsubscribe: bool | None = None
+    isPendingAutoprolong: bool | None = None
+
+
+class V2AccessUsersRestrictGetResponse(BaseModel):
+    list: list[ListItem21]
+    hasMore: bool
+
+
+class UserIds4(RootModel[list[str]]):
+    root: list[str] = Field(..., max_length=10, min_length=1)
+    """
+    User IDs to fetch (comma-separated string or array)
+    """
+
+
+class UserIds5(RootModel[str]):
+    root: str = Field(..., min_length=1)
+    """
+    User IDs to fetch (comma-separated string or array)
+    """
+
+
+class V2AccessUsersListGetResponse(BaseModel):
+    users: list[V2AccessSelfPatchResponse]
+
+
+class V2AccessUsersSearchGetResponse(
+    RootModel[list[V2AccessSelfPatchResponse] | dict[str, Any]]
+):
+    root: list[V2AccessSelfPatchResponse] | dict[str, Any]
+
+
+class V2AccessUsersUserIdGetResponse(
+    RootModel[V2AccessSelfPatchResponse | dict[str, Any]]
+):
+    root: V2AccessSelfPatchResponse | dict[str, Any]
+
+
+# Structural duplicates of the schemas above, under their generated names
+SubscribedByData1 = SubscribedByData
+SubscribedOnData1 = SubscribedOnData
+SubscribedByData2 = SubscribedByData
+SubscribedOnData2 = SubscribedOnData
+ListItem22 = ListItem21
+V2AccessUsersBlockedGetResponse = V2AccessUsersRestrictGetResponse
+SubscribedByData3 = SubscribedByData
+SubscribedOnData3 = SubscribedOnData
+User31 = V2AccessSelfPatchResponse
+SubscribedByData4 = SubscribedByData
+SubscribedOnData4 = SubscribedOnData
+V2AccessUsersSearchGetResponseItem = V2AccessSelfPatchResponse
+List8 = List
+SubscribedByData5 = SubscribedByData
+SubscribedOnData5 = SubscribedOnData
+V2AccessUsersUserIdGetResponse1 = V2AccessSelfPatchResponse
+V2AccessUsersUserIdRestrictPostResponse = V2AccessPostsPostIdDeleteResponse
+V2AccessUsersUserIdRestrictDeleteResponse = V2AccessPostsPostIdDeleteResponse
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+from .common import (
+    Type2,
+    User3,
+    ReleaseForm,
+    Full,
+    Preview,
+    Files,
+)
+
+
+class SortBy4(Enum):
+    RECENT = "recent"
+    MOST_LIKED = "most-liked"
+    HIGHEST_TIPS = "highest-tips"
+
+
+class MediaType(Enum):
+    PHOTO = "photo"
+    VIDEO = "video"
+    AUDIO = "audio"
+    GIF = "gif"
+
+
+# Structural duplicates of the schemas above, under their generated names
+Type25 = Type2
+User37 = User3
+ReleaseForm23 = ReleaseForm
+Full19 = Full
+Preview21 = Preview
+Files19 = Files
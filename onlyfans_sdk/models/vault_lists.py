@@ -0,0 +1,115 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .common import (
+    Type2,
+    User3,
+    ReleaseForm,
+    Full,
+    Preview,
+    Files,
+    MediaItems,
+    V2AccessPostsPostIdDeleteResponse,
+    ListItem26,
+    V2AccessVaultMediaGetResponse,
+)
+
+
+class Type26(Enum):
+    CUSTOM = "custom"
+    MESSAGES = "messages"
+    POSTS = "posts"
+    STORIES = "stories"
+    STREAMS = "streams"
+    MEDIA_STICKERS = "media_stickers"
+
+
+class Media(BaseModel):
+    type: Type2
+    url: str | None = None
+
+
+class ListItem27(BaseModel):
+    id: float
+    type: Type26
+    name: str
+    hasMedia: bool
+    canUpdate: bool
+    canDelete: bool
+    medias: list[Media]
+
+
+class Media1(BaseModel):
+    type: Any
+
+
+class All1(BaseModel):
+    videosCount: float
+    photosCount: float
+    gifsCount: float
+    audiosCount: float
+    medias: list[Media1]
+
+
+class V2AccessVaultListsGetResponse(BaseModel):
+    list: list[ListItem27]
+    all: All1
+    hasMore: bool
+    canCreateVaultLists: bool
+    order: str
+    sort: str
+
+
+class V2AccessVaultListsPostRequest(BaseModel):
+    name: str
+
+
+class V2AccessVaultListsListIdPatchRequest(BaseModel):
+    name: str = Field(..., max_length=100, min_length=1)
+    """
+    New name for the vault list
+    """
+    clearMedia: bool | None = False
+    """
+    Remove all media from the list
+    """
+
+
+class V2AccessVaultListsListIdMediaPostRequest(BaseModel):
+    mediaIds: list[MediaItems] = Field(..., max_length=100, min_length=1)
+    """
+    Media IDs to add to the list
+    """
+
+
+# Structural duplicates of the schemas above, under their generated names
+Type27 = Type2
+Type28 = Type26
+Type29 = Type2
+Media2 = Media
+V2AccessVaultListsPostResponse = ListItem27
+Type30 = Type26
+Type31 = Type2
+Media3 = Media
+V2AccessVaultListsListIdPatchResponse = ListItem27
+V2AccessVaultListsListIdDeleteResponse = V2AccessPostsPostIdDeleteResponse
+MediaId = MediaItems
+Type32 = Type26
+Media4 = Media
+V2AccessVaultListsListIdMediaPostResponse = ListItem27
+User38 = User3
+ReleaseForm24 = ReleaseForm
+Full20 = Full
+Preview22 = Preview
+Files20 = Files
+ListItem28 = ListItem26
+V2AccessVaultListsListIdMediaGetResponse = V2AccessVaultMediaGetResponse
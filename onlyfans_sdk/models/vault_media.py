@@ -0,0 +1,85 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class Type38(Enum):
+    IMAGE = "image"
+    VIDEO = "video"
+    AUDIO = "audio"
+
+
+class Status5(Enum):
+    EDGE_ONLY = "edge_only"
+    PENDING = "pending"
+    STORING = "storing"
+    STORED = "stored"
+    REMOVED = "removed"
+
+
+class Source24(Enum):
+    VAULT = "vault"
+    MESSAGES = "messages"
+    POSTS = "posts"
+    STORIES = "stories"
+
+
+class Media8(BaseModel):
+    id: str
+    status: Status5
+    quality: str
+    sizeBytes: float
+    contentType: str
+    source: Source24
+    accessCount: float
+    createdAt: float
+    expiresAt: float
+    storedAt: float
+    lastAccessedAt: float
+    url: str
+
+
+class V2VaultPlusMediaIdGetResponse(BaseModel):
+    id: str
+    type: Type38
+    duration: float
+    media: dict[str, Media8]
+
+
+class V2VaultPlusMediaIdDeleteResponse(BaseModel):
+    success: bool
+    mediaId: str
+    freedBytes: float
+
+
+class V2VaultPlusBatchPostRequest(BaseModel):
+    mediaIds: list[str] = Field(..., max_length=100)
+
+
+class V2VaultPlusBatchPostResponse(BaseModel):
+    items: list[V2VaultPlusMediaIdGetResponse]
+
+
+class V2VaultPlusListGetResponse(BaseModel):
+    items: list[V2VaultPlusMediaIdGetResponse]
+    nextCursor: str | None = None
+
+
+class V2VaultPlusPurgeDeleteResponse(BaseModel):
+    success: bool
+    purgedCount: float
+    freedBytes: float
+
+
+# Structural duplicates of the schemas above, under their generated names
+Media9 = Media8
+Item7 = V2VaultPlusMediaIdGetResponse
+Media10 = Media8
+Item8 = V2VaultPlusMediaIdGetResponse
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class V2VaultPlusStoreStatusGetResponse(BaseModel):
+    connectionId: str
+    totalMedia: float
+    storedCount: float
+    pendingCount: float
+    totalSizeBytes: float
+
+
+class V2VaultPlusStoreStatsGetResponse(BaseModel):
+    totalConnections: float
+    connectionsWithVaultPlus: float
+    totalStorageBytes: float
+    totalMediaCount: float
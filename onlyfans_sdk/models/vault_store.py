@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  openapi-normalized.json
+#   timestamp: 2026-02-13T10:24:09+00:00
+#   split by:  scripts/split_models.py
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from .common import (
+    V2DynamicRulesGetResponse,
+    V2DynamicRulesGetResponse1,
+    V2DynamicRulesSignPostRequest,
+    V2DynamicRulesSignPostResponse,
+)
+
+
+class V2VaultPlusStoreListListIdPostResponse(BaseModel):
+    queued: bool
+    listId: str
+    estimatedItems: float | None = None
+
+
+# Structural duplicates of the schemas above, under their generated names
+RulesGetResponse = V2DynamicRulesGetResponse
+RulesGetResponse1 = V2DynamicRulesGetResponse1
+SignPostRequest = V2DynamicRulesSignPostRequest
+SignPostResponse = V2DynamicRulesSignPostResponse
+SignPostResponse1 = V2DynamicRulesGetResponse1
@@ -0,0 +1,1057 @@
+"""
+Pagination engine behind every ``iter_*`` / ``aiter_*`` helper.
+
+A strategy describes how an endpoint pages (offset/``nextOffset``,
+marker/``nextMarker`` or cursor/``nextCursor``); a ``Paginator`` drives a
+generated ``list_*`` function with it, on either ``OFAuthClient`` (``for``)
+or ``AsyncOFAuthClient`` (``async for``).
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+import inspect
+import queue
+import threading
+import weakref
+from dataclasses import asdict, dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ._client import OFAuthError
+
+# ============================================================================
+# Strategies
+# ============================================================================
+
+
+class PaginationStrategy:
+    """
+    How an endpoint pages.
+
+    Subclasses translate a continuation token into request parameters and
+    read the next token back out of a response.
+    """
+
+    name = "base"
+    initial_token: Any = None
+
+    def __init__(self, items_key: str = "list", limit_param: Optional[str] = "limit") -> None:
+        self.items_key = items_key
+        self.limit_param = limit_param
+
+    def request_params(self, token: Any, page_size: Optional[int]) -> Dict[str, Any]:
+        """Query arguments for the page identified by ``token``."""
+        raise NotImplementedError
+
+    def advance(self, response: Dict[str, Any], token: Any, items: List[Any]) -> Tuple[bool, Any]:
+        """Return ``(has_more, next_token)`` for a fetched page."""
+        raise NotImplementedError
+
+    def items(self, response: Any) -> List[Any]:
+        """Extract the page items from a response."""
+        return _field(response, self.items_key) or []
+
+    def _with_limit(self, params: Dict[str, Any], page_size: Optional[int]) -> Dict[str, Any]:
+        if self.limit_param is not None:
+            params[self.limit_param] = page_size
+        return params
+
+
+class OffsetStrategy(PaginationStrategy):
+    """``limit``/``offset`` requests, continued from ``nextOffset``."""
+
+    name = "offset"
+    initial_token = 0
+
+    def __init__(
+        self,
+        items_key: str = "list",
+        limit_param: Optional[str] = "limit",
+        offset_param: str = "offset",
+        next_key: str = "nextOffset",
+    ) -> None:
+        super().__init__(items_key, limit_param)
+        self.offset_param = offset_param
+        self.next_key = next_key
+
+    def request_params(self, token: Any, page_size: Optional[int]) -> Dict[str, Any]:
+        return self._with_limit({self.offset_param: token}, page_size)
+
+    def advance(self, response: Dict[str, Any], token: Any, items: List[Any]) -> Tuple[bool, Any]:
+        next_offset = _token(_field(response, self.next_key))
+        if next_offset is None:
+            next_offset = token + len(items)
+        return bool(_field(response, "hasMore", False)), next_offset
+
+
+class MarkerStrategy(PaginationStrategy):
+    """``marker`` requests, continued from ``nextMarker`` (or a legacy ``marker``)."""
+
+    name = "marker"
+
+    def __init__(
+        self,
+        items_key: str = "list",
+        limit_param: Optional[str] = None,
+        marker_param: str = "marker",
+        next_keys: Tuple[str, ...] = ("nextMarker", "marker"),
+    ) -> None:
+        super().__init__(items_key, limit_param)
+        self.marker_param = marker_param
+        self.next_keys = next_keys
+
+    def request_params(self, token: Any, page_size: Optional[int]) -> Dict[str, Any]:
+        return self._with_limit({self.marker_param: token}, page_size)
+
+    def advance(self, response: Dict[str, Any], token: Any, items: List[Any]) -> Tuple[bool, Any]:
+        next_marker = None
+        for key in self.next_keys:
+            next_marker = _token(_field(response, key))
+            if next_marker is not None:
+                break
+        # Without a new marker the next request would restart the listing
+        has_more = bool(_field(response, "hasMore", False)) and next_marker is not None
+        return has_more, next_marker
+
+
+class CursorStrategy(PaginationStrategy):
+    """Opaque ``cursor`` requests, continued from ``nextCursor`` until it is null."""
+
+    name = "cursor"
+
+    def __init__(
+        self,
+        items_key: str = "items",
+        limit_param: Optional[str] = "limit",
+        cursor_param: str = "cursor",
+        next_key: str = "nextCursor",
+    ) -> None:
+        super().__init__(items_key, limit_param)
+        self.cursor_param = cursor_param
+        self.next_key = next_key
+
+    def request_params(self, token: Any, page_size: Optional[int]) -> Dict[str, Any]:
+        return self._with_limit({self.cursor_param: token}, page_size)
+
+    def advance(self, response: Dict[str, Any], token: Any, items: List[Any]) -> Tuple[bool, Any]:
+        next_cursor = _field(response, self.next_key)
+        return next_cursor is not None and next_cursor != token, next_cursor
+
+
+def _field(response: Any, key: str, default: Any = None) -> Any:
+    """Read ``key`` from a decoded response or from a model (``response_mode``)."""
+    if isinstance(response, dict):
+        return response.get(key, default)
+    return getattr(response, key, default)
+
+
+def _token(value: Any) -> Any:
+    """
+    A paging token as the API sent it: the models type offsets and markers
+    as ``float``, so under a typed ``response_mode`` whole numbers come back
+    as ``20.0`` and must not be sent (or checkpointed) that way.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+OFFSET = OffsetStrategy()
+MARKER = MarkerStrategy()
+CURSOR = CursorStrategy()
+
+
+# ============================================================================
+# Pages
+# ============================================================================
+
+
+class Page:
+    """
+    One fetched page: the raw ``list`` payload plus its paging metadata.
+
+    Attributes:
+        items: Items of the page, as returned by the ``list_*`` function
+            (decoded JSON, or models under a typed ``response_mode``).
+        has_more: Whether the endpoint reported more pages.
+        token: Offset, marker or cursor this page was requested with.
+        next_token: Offset, marker or cursor of the following page.
+        strategy: Name of the pagination strategy (``offset``, ``marker``, ``cursor``).
+        response: The full response body.
+    """
+
+    __slots__ = ("items", "has_more", "token", "next_token", "strategy", "response")
+
+    def __init__(
+        self,
+        items: List[Any],
+        has_more: bool,
+        token: Any,
+        next_token: Any,
+        strategy: str,
+        response: Any = None,
+    ) -> None:
+        self.items = items
+        self.has_more = has_more
+        self.token = token
+        self.next_token = next_token
+        self.strategy = strategy
+        self.response = response
+
+    @property
+    def next_offset(self) -> Any:
+        return self.next_token if self.strategy == "offset" else None
+
+    @property
+    def next_marker(self) -> Any:
+        return self.next_token if self.strategy == "marker" else None
+
+    @property
+    def next_cursor(self) -> Any:
+        return self.next_token if self.strategy == "cursor" else None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __repr__(self) -> str:
+        return (
+            f"Page(items={len(self.items)}, has_more={self.has_more}, "
+            f"token={self.token!r}, next_token={self.next_token!r})"
+        )
+
+
+@dataclass
+class PaginationState:
+    """
+    Serializable position of a crawl, for resuming after a restart.
+
+    Attributes:
+        endpoint: Qualified name of the ``list_*`` function being paged.
+        strategy: Pagination strategy name.
+        params: Filter arguments of the crawl; a resume must use the same ones.
+        token: Offset, marker or cursor of the page being consumed.
+        skip: Items of that page already handed out.
+        fetched: Total items handed out so far.
+        last_id: ``id`` of the last item handed out, if items have one.
+        done: True once the endpoint reported no more pages.
+
+    Example::
+
+        crawl = messages.iter_chats_chats_messages(client, user_id, state=load())
+        for message in crawl:
+            handle(message)
+            save(crawl.state.to_dict())
+    """
+
+    endpoint: str
+    strategy: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    token: Any = None
+    skip: int = 0
+    fetched: int = 0
+    last_id: Any = None
+    done: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, JSON-serializable form of the state."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PaginationState":
+        """Rebuild a state from ``to_dict()`` output."""
+        return cls(**data)
+
+    def record(self, item: Any, position: int) -> None:
+        self.skip = position
+        self.fetched += 1
+        self.last_id = _item_id(item)
+
+    def finish(self, page: Page) -> None:
+        self.token = page.next_token
+        self.skip = 0
+        self.done = not page.has_more or not page.items
+
+
+def _item_id(item: Any) -> Any:
+    return _field(item, "id")
+
+
+# ============================================================================
+# Paginator
+# ============================================================================
+
+
+class Paginator:
+    """
+    Lazily walks every page of a list endpoint.
+
+    Iterate with ``for`` on an ``OFAuthClient`` or ``async for`` on an
+    ``AsyncOFAuthClient``; each item of each page is yielded in order. Use
+    ``pages()`` / ``apages()`` instead to receive whole ``Page`` batches.
+
+    Args:
+        fetch: Generated ``list_*`` function to call for each page.
+        client: Client passed as the first argument to ``fetch``.
+        strategy: How the endpoint pages (``OFFSET``, ``MARKER``, ``CURSOR``...).
+        params: Fixed keyword arguments (filters) passed to every ``fetch`` call.
+        page_size: Number of items per page, for endpoints that accept a limit.
+        max_items: Maximum total items to yield (default: unlimited).
+        prefetch: Number of pages to fetch ahead in the background while the
+            current page is consumed (default: 0, fetch on demand). Uses a
+            thread for ``OFAuthClient`` and a task for ``AsyncOFAuthClient``.
+        total: Known item count (offset endpoints only). When given, page
+            offsets are computed up front and fetched concurrently instead of
+            one after another; ``prefetch`` is then ignored.
+        workers: Maximum pages in flight in parallel mode (default: 4).
+        ordered: Yield parallel pages in offset order (default) or as soon as
+            each one arrives. Unordered crawls cannot be checkpointed.
+        dedupe_key: Item field used to drop duplicates that shift across page
+            boundaries during a parallel crawl (default: ``"id"``).
+        adaptive: Grow the page size from ``page_size`` towards
+            ``max_page_size``, doubling after every full page. A page the
+            server truncates caps the size at what it returned; a size it
+            rejects (400/422) is halved and retried. The working maximum is
+            remembered per endpoint for the life of the client, so later
+            crawls start there.
+        max_page_size: Upper bound for adaptive page sizes (default: 1000).
+        state: A ``PaginationState`` (or its ``to_dict()``) saved from an
+            earlier crawl of the same endpoint and filters; iteration resumes
+            right after the last item or page it recorded. ``max_items``
+            counts items from the start of the original crawl.
+
+    Example::
+
+        counts = subscriptions.list_counts(client)
+        for sub in subscribers.iter_subscribers(
+            client,
+            type="active",
+            page_size=100,
+            total=int(counts["subscribers"]["active"]),
+            workers=8,
+        ):
+            ...
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        client: Any,
+        strategy: PaginationStrategy,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        page_size: int = 20,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        total: Optional[int] = None,
+        workers: int = 4,
+        ordered: bool = True,
+        dedupe_key: Optional[str] = "id",
+        adaptive: bool = False,
+        max_page_size: int = 1000,
+        state: Optional[Union["PaginationState", Dict[str, Any]]] = None,
+    ) -> None:
+        if total is not None and not isinstance(strategy, OffsetStrategy):
+            raise ValueError("parallel pagination (total=...) requires an offset-paginated endpoint")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if state is not None and total is not None and not ordered:
+            raise ValueError("resuming from state requires ordered=True")
+        self.fetch = fetch
+        self.client = client
+        self.strategy = strategy
+        self.params = dict(params or {})
+        self.page_size = page_size
+        self.max_items = max_items
+        self.prefetch = prefetch
+        self.total = total
+        self.workers = workers
+        self.ordered = ordered
+        self.dedupe_key = dedupe_key
+        self.adaptive = adaptive
+        self.max_page_size = max_page_size
+        self._state = self._resume(state)
+        if adaptive and strategy.limit_param is not None:
+            self._sizer: _PageSizer = _AdaptivePageSizer(
+                page_size,
+                max_page_size,
+                _learned_sizes_for(client),
+                self._state.endpoint,
+            )
+        else:
+            self._sizer = _PageSizer(page_size)
+        self._items: Optional[Iterator[Any]] = None
+        self._aitems: Optional[AsyncIterator[Any]] = None
+
+    # -- item iteration -----------------------------------------------------
+
+    def __iter__(self) -> "Paginator":
+        return self
+
+    def __next__(self) -> Any:
+        if self._items is None:
+            self._items = self._iter_items()
+        return next(self._items)
+
+    def __aiter__(self) -> "Paginator":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._aitems is None:
+            self._aitems = self._aiter_items()
+        return await self._aitems.__anext__()
+
+    def close(self) -> None:
+        """Stop iterating early and release any background prefetcher."""
+        if self._items is not None:
+            self._items.close()
+
+    async def aclose(self) -> None:
+        """Async counterpart of ``close``."""
+        if self._aitems is not None:
+            await self._aitems.aclose()
+
+    def _iter_items(self) -> Iterator[Any]:
+        state = self._state
+        if state.done:
+            return
+        skip = state.skip
+        for page in self._pages():
+            state.token = page.token
+            items = page.items
+            for index in range(skip, len(items)):
+                if self.max_items is not None and state.fetched >= self.max_items:
+                    return
+                state.record(items[index], index + 1)
+                yield items[index]
+            skip = 0
+            state.finish(page)
+
+    async def _aiter_items(self) -> AsyncIterator[Any]:
+        state = self._state
+        if state.done:
+            return
+        skip = state.skip
+        async for page in self._apages():
+            state.token = page.token
+            items = page.items
+            for index in range(skip, len(items)):
+                if self.max_items is not None and state.fetched >= self.max_items:
+                    return
+                state.record(items[index], index + 1)
+                yield items[index]
+            skip = 0
+            state.finish(page)
+
+    # -- page iteration -----------------------------------------------------
+
+    def pages(self) -> Iterator[Page]:
+        """
+        Walk the endpoint page by page.
+
+        Yields each ``Page`` with its raw ``items`` list, so batch writers can
+        work on whole pages without re-buffering. ``max_items`` still applies:
+        the last page is trimmed to the limit.
+
+        Example::
+
+            for page in earnings.iter_transactions(client).pages():
+                db.insert_many(page.items)
+        """
+        state = self._state
+        if state.done:
+            return
+        skip = state.skip
+        for page in self._pages():
+            if not self._consume(page, skip):
+                return
+            skip = 0
+            yield page
+
+    async def apages(self) -> AsyncIterator[Page]:
+        """Async counterpart of ``pages`` for ``AsyncOFAuthClient``."""
+        state = self._state
+        if state.done:
+            return
+        skip = state.skip
+        async for page in self._apages():
+            if not self._consume(page, skip):
+                return
+            skip = 0
+            yield page
+
+    def _consume(self, page: Page, skip: int) -> bool:
+        """Trim a page for resume/max_items and record it; False once the budget is spent."""
+        state = self._state
+        size = len(page.items)
+        items = page.items[skip:] if skip else page.items
+        if self.max_items is not None:
+            remaining = self.max_items - state.fetched
+            if remaining <= 0:
+                return False
+            if len(items) > remaining:
+                items = items[:remaining]
+        page.items = items
+        state.fetched += len(items)
+        if items:
+            state.last_id = _item_id(items[-1])
+        if skip + len(items) < size:
+            # Only part of the page was handed out; resume inside it
+            state.token = page.token
+            state.skip = skip + len(items)
+        else:
+            state.finish(page)
+        return True
+
+    # -- checkpointing ------------------------------------------------------
+
+    def _resume(self, state: Optional[Union["PaginationState", Dict[str, Any]]]) -> "PaginationState":
+        endpoint = f"{self.fetch.__module__}.{self.fetch.__qualname__}"
+        if state is None:
+            return PaginationState(
+                endpoint=endpoint,
+                strategy=self.strategy.name,
+                params=dict(self.params),
+                token=self.strategy.initial_token,
+            )
+        if isinstance(state, PaginationState):
+            state = state.to_dict()
+        resumed = PaginationState.from_dict(state)
+        if (
+            resumed.endpoint != endpoint
+            or resumed.strategy != self.strategy.name
+            or resumed.params != self.params
+        ):
+            raise ValueError(
+                f"pagination state was saved for {resumed.endpoint} with params "
+                f"{resumed.params!r}, not {endpoint} with {self.params!r}"
+            )
+        return resumed
+
+    @property
+    def state(self) -> "PaginationState":
+        """
+        Snapshot of how far this Paginator has been consumed.
+
+        Everything handed out so far is counted, so saving the state after
+        processing an item or page and passing it back as ``state=`` resumes
+        right after it.
+
+        Raises ``ValueError`` for a parallel crawl with ``ordered=False``:
+        its pages finish out of order, so no single offset marks what has
+        been handed out.
+        """
+        if self.total is not None and not self.ordered:
+            raise ValueError("an unordered parallel crawl has no resumable state; use ordered=True")
+        return PaginationState.from_dict(self._state.to_dict())
+
+    def _pages(self) -> Iterator[Page]:
+        if self.total is not None:
+            return _dedupe(_parallel_pages(self._plan()), self.dedupe_key)
+        pages = _walk_pages(
+            self.fetch,
+            self.client,
+            self.strategy,
+            self.params,
+            self._sizer,
+            self._budget(),
+            self._state.token,
+        )
+        if self.prefetch > 0:
+            return _prefetch(pages, self.prefetch)
+        return pages
+
+    def _apages(self) -> AsyncIterator[Page]:
+        if self.total is not None:
+            return _adedupe(_aparallel_pages(self._plan()), self.dedupe_key)
+        pages = _awalk_pages(
+            self.fetch,
+            self.client,
+            self.strategy,
+            self.params,
+            self._sizer,
+            self._budget(),
+            self._state.token,
+        )
+        if self.prefetch > 0:
+            return _aprefetch(pages, self.prefetch)
+        return pages
+
+    def _budget(self) -> Optional[int]:
+        """Items still to fetch from the resume token, counting the skipped ones."""
+        if self.max_items is None:
+            return None
+        return max(self.max_items - self._state.fetched, 0) + self._state.skip
+
+    def _plan(self) -> "_ParallelPlan":
+        start = self._state.token
+        budget = self._budget()
+        end = None if budget is None else start + budget
+        stop = self.total if end is None else min(self.total, end)
+        page_size = self._sizer.size()
+        return _ParallelPlan(
+            self.fetch,
+            self.client,
+            self.strategy,
+            self.params,
+            page_size,
+            list(range(start, max(stop, start), page_size)),
+            self.workers,
+            self.ordered,
+            end,
+        )
+
+
+# ============================================================================
+# Page sizing
+# ============================================================================
+
+
+class _PageSizer:
+    """A fixed page size."""
+
+    def __init__(self, page_size: int) -> None:
+        self.page_size = page_size
+
+    def size(self) -> int:
+        return self.page_size
+
+    def observe(self, requested: int, received: int, has_more: bool) -> None:
+        pass
+
+    def rejected(self, requested: int, error: OFAuthError) -> bool:
+        """Whether to retry the page with a smaller size after ``error``."""
+        return False
+
+
+_REJECTED_PAGE_SIZE_STATUSES = (400, 422)
+
+# Working maximum page size per client and endpoint: {client: {endpoint: (size, capped)}}
+_learned_sizes: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[int, bool]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_learned_sizes_lock = threading.Lock()
+
+
+def _learned_sizes_for(client: Any) -> Dict[str, Tuple[int, bool]]:
+    with _learned_sizes_lock:
+        try:
+            return _learned_sizes.setdefault(client, {})
+        except TypeError:
+            # Not weak-referenceable; learn for this Paginator only
+            return {}
+
+
+class _AdaptivePageSizer(_PageSizer):
+    """Ramps the page size up towards what the endpoint accepts."""
+
+    def __init__(
+        self,
+        page_size: int,
+        ceiling: int,
+        learned: Dict[str, Tuple[int, bool]],
+        endpoint: str,
+    ) -> None:
+        super().__init__(page_size)
+        self.floor = page_size
+        self.ceiling = max(ceiling, page_size)
+        self.learned = learned
+        self.endpoint = endpoint
+        size, self.capped = learned.get(endpoint, (page_size, False))
+        self.page_size = max(size, page_size) if not self.capped else size
+
+    def _remember(self, size: int, capped: bool) -> None:
+        with _learned_sizes_lock:
+            known, known_capped = self.learned.get(self.endpoint, (0, False))
+            if capped or (not known_capped and size > known):
+                self.learned[self.endpoint] = (size, capped)
+
+    def observe(self, requested: int, received: int, has_more: bool) -> None:
+        if has_more and 0 < received < requested:
+            # The server truncated the page: that is its maximum
+            self.page_size = received
+            self.capped = True
+            self._remember(received, True)
+        elif received >= requested and requested == self.page_size:
+            self._remember(self.page_size, self.capped)
+            if not self.capped and self.page_size < self.ceiling:
+                self.page_size = min(self.page_size * 2, self.ceiling)
+
+    def rejected(self, requested: int, error: OFAuthError) -> bool:
+        if error.status not in _REJECTED_PAGE_SIZE_STATUSES or requested <= self.floor:
+            return False
+        self.page_size = max(requested // 2, self.floor)
+        self.capped = True
+        self._remember(self.page_size, True)
+        return True
+
+
+# ============================================================================
+# Page walking
+# ============================================================================
+
+# The walkers are module-level so a background prefetcher holds no reference
+# to its Paginator; an abandoned Paginator is then collected, which closes
+# its item generator and stops the prefetcher.
+
+
+def _page_limit(page_size: int, max_items: Optional[int], fetched: int) -> int:
+    if max_items is None:
+        return page_size
+    return min(page_size, max_items - fetched)
+
+
+def _require_sync(response: Any) -> None:
+    if inspect.isawaitable(response):
+        if hasattr(response, "close"):
+            response.close()
+        raise TypeError(
+            "this client is asynchronous; iterate with 'async for' instead of 'for'"
+        )
+
+
+def _walk_pages(
+    fetch: Callable[..., Any],
+    client: Any,
+    strategy: PaginationStrategy,
+    params: Dict[str, Any],
+    sizer: "_PageSizer",
+    max_items: Optional[int],
+    token: Any = None,
+) -> Iterator[Page]:
+    if token is None:
+        token = strategy.initial_token
+    fetched = 0
+    while max_items is None or fetched < max_items:
+        requested = _page_limit(sizer.size(), max_items, fetched)
+        try:
+            response = fetch(client, **params, **strategy.request_params(token, requested))
+            _require_sync(response)
+        except OFAuthError as exc:
+            if sizer.rejected(requested, exc):
+                continue
+            raise
+        items = strategy.items(response)
+        has_more, next_token = strategy.advance(response, token, items)
+        sizer.observe(requested, len(items), has_more)
+        fetched += len(items)
+        yield Page(items, has_more, token, next_token, strategy.name, response)
+        if not has_more or not items:
+            return
+        token = next_token
+
+
+async def _awalk_pages(
+    fetch: Callable[..., Any],
+    client: Any,
+    strategy: PaginationStrategy,
+    params: Dict[str, Any],
+    sizer: "_PageSizer",
+    max_items: Optional[int],
+    token: Any = None,
+) -> AsyncIterator[Page]:
+    if token is None:
+        token = strategy.initial_token
+    fetched = 0
+    while max_items is None or fetched < max_items:
+        requested = _page_limit(sizer.size(), max_items, fetched)
+        try:
+            response = fetch(client, **params, **strategy.request_params(token, requested))
+            if inspect.isawaitable(response):
+                response = await response
+        except OFAuthError as exc:
+            if sizer.rejected(requested, exc):
+                continue
+            raise
+        items = strategy.items(response)
+        has_more, next_token = strategy.advance(response, token, items)
+        sizer.observe(requested, len(items), has_more)
+        fetched += len(items)
+        yield Page(items, has_more, token, next_token, strategy.name, response)
+        if not has_more or not items:
+            return
+        token = next_token
+
+
+# ============================================================================
+# Parallel fan-out
+# ============================================================================
+
+
+class _ParallelPlan:
+    """Everything a parallel crawl needs, detached from its Paginator."""
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        client: Any,
+        strategy: "OffsetStrategy",
+        params: Dict[str, Any],
+        page_size: int,
+        offsets: List[int],
+        workers: int,
+        ordered: bool,
+        end: Optional[int],
+    ) -> None:
+        self.fetch = fetch
+        self.client = client
+        self.strategy = strategy
+        self.params = params
+        self.page_size = page_size
+        self.offsets = offsets
+        self.workers = workers
+        self.ordered = ordered
+        # Offset at which the max_items budget runs out (None: unlimited)
+        self.end = end
+
+    def limit(self, offset: int) -> int:
+        if self.end is None:
+            return self.page_size
+        return min(self.page_size, self.end - offset)
+
+    def tail(self, last: Page) -> Any:
+        """Offset to keep walking from if the total was stale, else None."""
+        if not last.has_more or not last.items:
+            return None
+        offset = last.next_token
+        if self.end is not None and offset >= self.end:
+            return None
+        return offset
+
+    def tail_max_items(self, offset: int) -> Optional[int]:
+        return None if self.end is None else self.end - offset
+
+
+def _fetch_range(plan: _ParallelPlan, offset: int) -> Page:
+    """Fetch ``[offset, offset + limit)``, topping up if the server truncates a page."""
+    limit = plan.limit(offset)
+    items: List[Any] = []
+    token: Any = offset
+    has_more = False
+    response: Any = None
+    while len(items) < limit:
+        response = plan.fetch(
+            plan.client,
+            **plan.params,
+            **plan.strategy.request_params(token, limit - len(items)),
+        )
+        _require_sync(response)
+        page = plan.strategy.items(response)
+        has_more, token = plan.strategy.advance(response, token, page)
+        items.extend(page)
+        if not has_more or not page:
+            break
+    return Page(items, has_more, offset, token, plan.strategy.name, response)
+
+
+async def _afetch_range(plan: _ParallelPlan, offset: int) -> Page:
+    limit = plan.limit(offset)
+    items: List[Any] = []
+    token: Any = offset
+    has_more = False
+    response: Any = None
+    while len(items) < limit:
+        response = plan.fetch(
+            plan.client,
+            **plan.params,
+            **plan.strategy.request_params(token, limit - len(items)),
+        )
+        if inspect.isawaitable(response):
+            response = await response
+        page = plan.strategy.items(response)
+        has_more, token = plan.strategy.advance(response, token, page)
+        items.extend(page)
+        if not has_more or not page:
+            break
+    return Page(items, has_more, offset, token, plan.strategy.name, response)
+
+
+def _parallel_pages(plan: _ParallelPlan) -> Iterator[Page]:
+    """Fetch precomputed offsets on a thread pool, ``plan.workers`` at a time."""
+    if not plan.offsets:
+        return
+    pending = collections.deque(plan.offsets)
+    in_flight: "collections.OrderedDict[Future, int]" = collections.OrderedDict()
+    last: Optional[Page] = None
+    executor = ThreadPoolExecutor(max_workers=plan.workers, thread_name_prefix="ofauth-page")
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < plan.workers:
+                offset = pending.popleft()
+                in_flight[executor.submit(_fetch_range, plan, offset)] = offset
+            if plan.ordered:
+                future = next(iter(in_flight))
+                done = [future]
+                future.result()
+            else:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                page = future.result()
+                if in_flight.pop(future) == plan.offsets[-1]:
+                    last = page
+                yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    token = plan.tail(last)
+    if token is not None:
+        yield from _walk_pages(
+            plan.fetch,
+            plan.client,
+            plan.strategy,
+            plan.params,
+            _PageSizer(plan.page_size),
+            plan.tail_max_items(token),
+            token,
+        )
+
+
+async def _aparallel_pages(plan: _ParallelPlan) -> AsyncIterator[Page]:
+    """Fetch precomputed offsets as tasks, ``plan.workers`` at a time."""
+    if not plan.offsets:
+        return
+    pending = collections.deque(plan.offsets)
+    in_flight: "collections.OrderedDict[asyncio.Future, int]" = collections.OrderedDict()
+    last: Optional[Page] = None
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < plan.workers:
+                offset = pending.popleft()
+                in_flight[asyncio.ensure_future(_afetch_range(plan, offset))] = offset
+            if plan.ordered:
+                future = next(iter(in_flight))
+                await asyncio.wait([future])
+                done = [future]
+            else:
+                done, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                page = future.result()
+                if in_flight.pop(future) == plan.offsets[-1]:
+                    last = page
+                yield page
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+    token = plan.tail(last)
+    if token is not None:
+        async for page in _awalk_pages(
+            plan.fetch,
+            plan.client,
+            plan.strategy,
+            plan.params,
+            _PageSizer(plan.page_size),
+            plan.tail_max_items(token),
+            token,
+        ):
+            yield page
+
+
+def _dedupe(pages: Iterator[Page], key: Optional[str]) -> Iterator[Page]:
+    seen: set = set()
+    for page in pages:
+        if key is not None:
+            page.items = _unseen(page.items, key, seen)
+        yield page
+
+
+async def _adedupe(pages: AsyncIterator[Page], key: Optional[str]) -> AsyncIterator[Page]:
+    seen: set = set()
+    async for page in pages:
+        if key is not None:
+            page.items = _unseen(page.items, key, seen)
+        yield page
+
+
+def _unseen(items: List[Any], key: str, seen: set) -> List[Any]:
+    fresh = []
+    for item in items:
+        value = _field(item, key)
+        if value is not None:
+            if value in seen:
+                continue
+            seen.add(value)
+        fresh.append(item)
+    return fresh
+
+
+# ============================================================================
+# Prefetching
+# ============================================================================
+
+_DONE = object()
+
+
+def _prefetch(pages: Iterator[Any], depth: int) -> Iterator[Any]:
+    """Fetch ``pages`` on a background thread, keeping up to ``depth`` ready."""
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        # After ``stop`` the consumer has drained the buffer, so at most one
+        # more put can happen here and it never blocks.
+        try:
+            for page in pages:
+                buffer.put((page, None))
+                if stop.is_set():
+                    return
+            buffer.put((_DONE, None))
+        except BaseException as exc:
+            buffer.put((_DONE, exc))
+        finally:
+            pages.close()
+
+    threading.Thread(target=produce, name="ofauth-prefetch", daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        stop.set()
+        while True:
+            try:
+                buffer.get_nowait()
+            except queue.Empty:
+                break
+
+
+async def _aprefetch(pages: AsyncIterator[Any], depth: int) -> AsyncIterator[Any]:
+    """Fetch ``pages`` in a background task, keeping up to ``depth`` ready."""
+    buffer: "asyncio.Queue[Tuple[Any, Optional[BaseException]]]" = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+            await buffer.put((_DONE, None))
+        except Exception as exc:
+            await buffer.put((_DONE, exc))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        task.cancel()
@@ -0,0 +1,156 @@
+"""
+Typed response parsing.
+
+Every generated endpoint function names the model that describes its
+response, and the client's ``response_mode`` decides what callers get:
+
+- ``"raw"`` (default): the decoded JSON, as plain dicts and lists.
+- ``"validated"``: an instance of the model, validated by pydantic. Bodies
+  are validated straight from the response bytes when nothing has decoded
+  them yet.
+- ``"trusted"``: an instance of the model built without validation, in the
+  spirit of ``BaseModel.model_construct``, and shallow: only the top-level
+  object is a model; nested objects and lists stay the decoded dicts and
+  lists, and values are not coerced. Missing required fields are not
+  reported. It costs little more than ``"raw"``.
+- ``"lazy"``: a read-only view of the decoded JSON that validates each
+  field the first time it is read (see ``onlyfans_sdk.views``).
+
+Validators (``TypeAdapter``) and construction plans are built once per model
+and reused.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Type, Union
+
+from pydantic import RootModel, TypeAdapter
+
+from .middleware import Response
+
+# ============================================================================
+# Model lookup
+# ============================================================================
+
+
+def resolve_model(model: Union[str, type]) -> type:
+    """Return the model class for a generated model name (or the class itself)."""
+    if isinstance(model, str):
+        return _model_named(model)
+    return model
+
+
+@lru_cache(maxsize=None)
+def _model_named(name: str) -> type:
+    # Only the models submodule defining ``name`` is imported
+    from . import models
+
+    return getattr(models, name)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(model: type) -> TypeAdapter:
+    """The cached validator for ``model``."""
+    return TypeAdapter(model)
+
+
+# ============================================================================
+# Validated
+# ============================================================================
+
+
+def validate(model: type, response: Response) -> Any:
+    """Validate a response body into ``model``."""
+    adapter = type_adapter(model)
+    if response.decoded:
+        return adapter.validate_python(response.data)
+    if response.is_json:
+        return adapter.validate_json(response.content)
+    # Not JSON, nothing to validate
+    return response.data
+
+
+# ============================================================================
+# Trusted
+# ============================================================================
+
+
+def construct(model: type, data: Any) -> Any:
+    """
+    Build ``model`` from decoded JSON without validating it.
+
+    Construction is shallow: top-level fields are set from their JSON
+    names and every value, nested objects included, is kept exactly as
+    decoded. Missing optional fields get their defaults.
+    """
+    plan = _plan(model)
+    if plan.root:
+        return model.model_construct(data)
+    if not isinstance(data, dict):
+        return data
+    names = plan.names
+    values = {names[key]: value for key, value in data.items() if key in names}
+    fields_set = set(values)
+    if plan.defaults:
+        values = plan.defaults | values
+    if not plan.direct:
+        return model.model_construct(fields_set, **values)
+    # What model_construct does, minus its per-field default handling
+    instance = model.__new__(model)
+    _setattr(instance, "__dict__", values)
+    _setattr(instance, "__pydantic_fields_set__", fields_set)
+    _setattr(instance, "__pydantic_extra__", None)
+    _setattr(instance, "__pydantic_private__", None)
+    return instance
+
+
+_setattr = object.__setattr__
+
+
+class _Plan:
+    """How ``construct`` builds one model, worked out once per model."""
+
+    __slots__ = ("root", "names", "defaults", "direct")
+
+    def __init__(self, model: type) -> None:
+        self.root = issubclass(model, RootModel)
+        # JSON name -> field name
+        self.names: Dict[str, str] = {}
+        self.defaults: Dict[str, Any] = {}
+        # Fields can be set directly unless the model needs model_construct's extras
+        self.direct = not model.__private_attributes__ and model.model_config.get("extra") != "allow"
+        if self.root:
+            return
+        for name, field in model.model_fields.items():
+            self.names[field.alias or name] = name
+            if field.is_required():
+                continue
+            if field.default_factory is not None:
+                # A fresh default per instance: leave it to model_construct
+                self.direct = False
+            else:
+                self.defaults[name] = field.default
+
+
+@lru_cache(maxsize=None)
+def _plan(model: type) -> _Plan:
+    return _Plan(model)
+
+
+# ============================================================================
+# Entry point
+# ============================================================================
+
+
+def parse_response(response: Response, model: Union[str, Type[Any]], mode: str) -> Any:
+    """Return the body of a successful response in the given ``response_mode``."""
+    if mode == "raw" or response.status_code == 204:
+        return response.data
+    model = resolve_model(model)
+    if mode == "validated":
+        return validate(model, response)
+    if mode == "lazy":
+        from .views import view
+
+        return view(model, response.data)
+    return construct(model, response.data)
@@ -1,14 +1,18 @@
 """
 Posts API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
 
 from ._client import OFAuthClient
-from .models import (
-    V2AccessPostsGetResponse,
-    V2AccessPostsPostRequest,
-    V2AccessPostsPostResponse,
-)
+
+if TYPE_CHECKING:
+    from .models.posts import (
+        V2AccessPostsGetResponse,
+        V2AccessPostsPostRequest,
+        V2AccessPostsPostResponse,
+    )
 
 def list_posts(
     client: OFAuthClient,
@@ -38,6 +42,7 @@ def list_posts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessPostsGetResponse",
     )
 
 def create_posts(
@@ -55,6 +60,7 @@ def create_posts(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPostsPostResponse",
     )
 
 def get_posts(
@@ -71,6 +77,8 @@ def get_posts(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/posts/{post_id}",
+        response_model="V2AccessPostsGetResponse",
     )
 
 def replace_posts(
@@ -88,6 +96,7 @@ def replace_posts(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/posts/{post_id}",
         body=body,
     )
 
@@ -105,6 +114,7 @@ def delete_posts(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/posts/{post_id}",
     )
 
 def list_users_users_posts(
@@ -135,5 +145,6 @@ def list_users_users_posts(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/users/{user_id}/posts",
         query=query,
     )
@@ -1,31 +1,36 @@
 """
 Promotions API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
-
-from ._client import OFAuthClient
-from .models import (
-    V2AccessPromotionsBundlesGetResponse,
-    V2AccessPromotionsBundlesPostRequest,
-    V2AccessPromotionsBundlesPostResponse,
-    V2AccessPromotionsGetResponse,
-    V2AccessPromotionsPostRequest,
-    V2AccessPromotionsPostResponse,
-    V2AccessPromotionsTrackingLinksGetResponse,
-    V2AccessPromotionsTrackingLinksPostRequest,
-    V2AccessPromotionsTrackingLinksPostResponse,
-    V2AccessPromotionsTrackingLinksShareAccessDeleteRequest,
-    V2AccessPromotionsTrackingLinksShareAccessDeleteResponse,
-    V2AccessPromotionsTrackingLinksShareAccessPostRequest,
-    V2AccessPromotionsTrackingLinksShareAccessPostResponse,
-    V2AccessPromotionsTrialLinksGetResponse,
-    V2AccessPromotionsTrialLinksPostRequest,
-    V2AccessPromotionsTrialLinksPostResponse,
-    V2AccessPromotionsTrialLinksShareAccessDeleteRequest,
-    V2AccessPromotionsTrialLinksShareAccessDeleteResponse,
-    V2AccessPromotionsTrialLinksShareAccessPostRequest,
-    V2AccessPromotionsTrialLinksShareAccessPostResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.promotions import (
+        V2AccessPromotionsBundlesGetResponse,
+        V2AccessPromotionsBundlesPostRequest,
+        V2AccessPromotionsBundlesPostResponse,
+        V2AccessPromotionsGetResponse,
+        V2AccessPromotionsPostRequest,
+        V2AccessPromotionsPostResponse,
+        V2AccessPromotionsTrackingLinksGetResponse,
+        V2AccessPromotionsTrackingLinksPostRequest,
+        V2AccessPromotionsTrackingLinksPostResponse,
+        V2AccessPromotionsTrackingLinksShareAccessDeleteRequest,
+        V2AccessPromotionsTrackingLinksShareAccessDeleteResponse,
+        V2AccessPromotionsTrackingLinksShareAccessPostRequest,
+        V2AccessPromotionsTrackingLinksShareAccessPostResponse,
+        V2AccessPromotionsTrialLinksGetResponse,
+        V2AccessPromotionsTrialLinksPostRequest,
+        V2AccessPromotionsTrialLinksPostResponse,
+        V2AccessPromotionsTrialLinksShareAccessDeleteRequest,
+        V2AccessPromotionsTrialLinksShareAccessDeleteResponse,
+        V2AccessPromotionsTrialLinksShareAccessPostRequest,
+        V2AccessPromotionsTrialLinksShareAccessPostResponse,
+    )
 
 def list_tracking_links(
     client: OFAuthClient,
@@ -55,6 +60,7 @@ def list_tracking_links(
         "GET",
         path,
         query=query,
+        response_model="V2AccessPromotionsTrackingLinksGetResponse",
     )
 
 def iter_tracking_links(
@@ -64,17 +70,19 @@ def iter_tracking_links(
     sorting_deleted: Optional[str] = None,
     stats: Optional[Literal["true", "false"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List tracking links
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -83,34 +91,63 @@ def iter_tracking_links(
         for item in iter_tracking_links(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_tracking_links,
+        client,
+        OFFSET,
+        {
+            "pagination": pagination,
+            "with_deleted": with_deleted,
+            "sorting_deleted": sorting_deleted,
+            "stats": stats,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_tracking_links(
+    client: AsyncOFAuthClient,
+    pagination: Optional[int] = None,
+    with_deleted: Optional[int] = None,
+    sorting_deleted: Optional[str] = None,
+    stats: Optional[Literal["true", "false"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List tracking links
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_tracking_links(
-            client=client,
-            pagination=pagination,
-            with_deleted=with_deleted,
-            sorting_deleted=sorting_deleted,
-            stats=stats,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_tracking_links(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_tracking_links,
+        client,
+        OFFSET,
+        {
+            "pagination": pagination,
+            "with_deleted": with_deleted,
+            "sorting_deleted": sorting_deleted,
+            "stats": stats,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def create_tracking_links(
     client: OFAuthClient,
@@ -127,6 +164,7 @@ def create_tracking_links(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPromotionsTrackingLinksPostResponse",
     )
 
 def create_tracking_links_share_access(
@@ -144,6 +182,7 @@ def create_tracking_links_share_access(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPromotionsTrackingLinksShareAccessPostResponse",
     )
 
 def delete_tracking_links_share_access(
@@ -161,6 +200,7 @@ def delete_tracking_links_share_access(
         "DELETE",
         path,
         body=body,
+        response_model="V2AccessPromotionsTrackingLinksShareAccessDeleteResponse",
     )
 
 def get_tracking_links(
@@ -177,6 +217,8 @@ def get_tracking_links(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/promotions/tracking-links/{tracking_link_id}",
+        response_model="V2AccessPromotionsTrackingLinksGetResponse",
     )
 
 def replace_tracking_links(
@@ -194,6 +236,7 @@ def replace_tracking_links(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/promotions/tracking-links/{tracking_link_id}",
         body=body,
     )
 
@@ -211,6 +254,7 @@ def delete_tracking_links(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/promotions/tracking-links/{tracking_link_id}",
     )
 
 def list_tracking_links_claimers(
@@ -227,6 +271,7 @@ def list_tracking_links_claimers(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/promotions/tracking-links/{tracking_link_id}/claimers",
     )
 
 def list_trial_links(
@@ -249,6 +294,7 @@ def list_trial_links(
         "GET",
         path,
         query=query,
+        response_model="V2AccessPromotionsTrialLinksGetResponse",
     )
 
 def create_trial_links(
@@ -266,6 +312,7 @@ def create_trial_links(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPromotionsTrialLinksPostResponse",
     )
 
 def create_trial_links_share_access(
@@ -283,6 +330,7 @@ def create_trial_links_share_access(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPromotionsTrialLinksShareAccessPostResponse",
     )
 
 def delete_trial_links_share_access(
@@ -300,6 +348,7 @@ def delete_trial_links_share_access(
         "DELETE",
         path,
         body=body,
+        response_model="V2AccessPromotionsTrialLinksShareAccessDeleteResponse",
     )
 
 def get_trial_links(
@@ -316,6 +365,8 @@ def get_trial_links(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/promotions/trial-links/{trial_link_id}",
+        response_model="V2AccessPromotionsTrialLinksGetResponse",
     )
 
 def replace_trial_links(
@@ -333,6 +384,7 @@ def replace_trial_links(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/promotions/trial-links/{trial_link_id}",
         body=body,
     )
 
@@ -350,6 +402,7 @@ def delete_trial_links(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/promotions/trial-links/{trial_link_id}",
     )
 
 def list_bundles(
@@ -372,6 +425,7 @@ def list_bundles(
         "GET",
         path,
         query=query,
+        response_model="V2AccessPromotionsBundlesGetResponse",
     )
 
 def create_bundles(
@@ -389,6 +443,7 @@ def create_bundles(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPromotionsBundlesPostResponse",
     )
 
 def get_bundles(
@@ -405,6 +460,8 @@ def get_bundles(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/promotions/bundles/{bundle_id}",
+        response_model="V2AccessPromotionsBundlesGetResponse",
     )
 
 def replace_bundles(
@@ -422,6 +479,7 @@ def replace_bundles(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/promotions/bundles/{bundle_id}",
         body=body,
     )
 
@@ -439,6 +497,7 @@ def delete_bundles(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/promotions/bundles/{bundle_id}",
     )
 
 def list_promotions(
@@ -461,6 +520,7 @@ def list_promotions(
         "GET",
         path,
         query=query,
+        response_model="V2AccessPromotionsGetResponse",
     )
 
 def create_promotions(
@@ -478,6 +538,7 @@ def create_promotions(
         "POST",
         path,
         body=body,
+        response_model="V2AccessPromotionsPostResponse",
     )
 
 def replace_promotions(
@@ -495,6 +556,7 @@ def replace_promotions(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/promotions/{promotion_id}",
         body=body,
     )
 
@@ -512,6 +574,7 @@ def delete_promotions(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/promotions/{promotion_id}",
     )
 
 def create_stop(
@@ -528,4 +591,5 @@ def create_stop(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/access/promotions/{promotion_id}/stop",
     )
@@ -0,0 +1,198 @@
+"""
+Client-side rate limiting.
+
+Token buckets keyed by API key, by connection ID and by endpoint family pace
+requests before they reach the server, instead of discovering limits from
+429s. One ``RateLimiter`` can be shared by any number of clients and
+threads; ``SQLiteBucketStore`` extends that across processes.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# ============================================================================
+# Limits
+# ============================================================================
+
+
+class RateLimit:
+    """
+    A sustained request rate with an optional burst allowance.
+
+    Args:
+        rate: Requests per second refilled into the bucket.
+        burst: Bucket capacity, i.e. requests allowed back to back
+            (default: ``max(1, rate)``).
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+
+    @classmethod
+    def per_minute(cls, count: float, burst: Optional[float] = None) -> "RateLimit":
+        return cls(count / 60.0, burst)
+
+    def __repr__(self) -> str:
+        return f"RateLimit(rate={self.rate}, burst={self.burst})"
+
+
+# ============================================================================
+# Bucket stores
+# ============================================================================
+
+
+class MemoryBucketStore:
+    """In-process token buckets, safe to share between threads."""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, limit: RateLimit, now: float) -> float:
+        """Take one token from bucket ``key``; return seconds until it is valid."""
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (limit.burst, now))
+            tokens = min(limit.burst, tokens + (now - updated) * limit.rate) - 1.0
+            self._buckets[key] = (tokens, now)
+        return 0.0 if tokens >= 0 else -tokens / limit.rate
+
+
+class SQLiteBucketStore:
+    """
+    Token buckets in a SQLite file, shared by every process that opens it.
+
+    Each reservation is one ``BEGIN IMMEDIATE`` transaction, so concurrent
+    workers on the same host serialize on the database lock. Bucket keys
+    never contain the raw API key.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ofauth_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def reserve(self, key: str, limit: RateLimit, now: float) -> float:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM ofauth_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (limit.burst, now)
+            tokens = min(limit.burst, tokens + max(0.0, now - updated) * limit.rate) - 1.0
+            conn.execute(
+                "INSERT OR REPLACE INTO ofauth_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, max(now, updated)),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return 0.0 if tokens >= 0 else -tokens / limit.rate
+
+
+# ============================================================================
+# Limiter
+# ============================================================================
+
+
+class RateLimiter:
+    """
+    Paces requests with token buckets per API key, per connection and per
+    endpoint family.
+
+    Args:
+        per_api_key: Limit shared by every request made with one API key.
+        per_connection: Limit per ``x-connection-id``.
+        endpoints: Limits per endpoint family, keyed by path prefix
+            (e.g. ``"/v2/access/messages"``). The longest matching prefix
+            applies, counted per connection (or per API key for requests
+            without one).
+        store: Bucket storage; ``MemoryBucketStore`` (default) for one
+            process, ``SQLiteBucketStore`` to share limits across processes.
+
+    Example::
+
+        limiter = RateLimiter(
+            per_api_key=RateLimit(20),
+            per_connection=RateLimit(5, burst=10),
+            endpoints={"/v2/access/uploads": RateLimit(1)},
+        )
+        client = OFAuthClient(api_key="...", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        per_api_key: Optional[RateLimit] = None,
+        per_connection: Optional[RateLimit] = None,
+        endpoints: Optional[Mapping[str, RateLimit]] = None,
+        store: Optional[object] = None,
+    ) -> None:
+        self.per_api_key = per_api_key
+        self.per_connection = per_connection
+        # Longest prefix first, so the most specific family wins
+        self.endpoints: List[Tuple[str, RateLimit]] = sorted(
+            (endpoints or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.store = store if store is not None else MemoryBucketStore()
+
+    def reserve(
+        self, api_key: str, connection_id: Optional[str], path: str, now: Optional[float] = None
+    ) -> float:
+        """
+        Take a token from every applicable bucket; return the seconds to wait.
+
+        ``now`` defaults to ``time.time()``.
+        """
+        if now is None:
+            now = time.time()
+        key_id = _fingerprint(api_key)
+        scope = f"conn:{connection_id}" if connection_id else f"key:{key_id}"
+        wait = 0.0
+        if self.per_api_key is not None:
+            wait = max(wait, self.store.reserve(f"key:{key_id}", self.per_api_key, now))
+        if self.per_connection is not None and connection_id:
+            wait = max(wait, self.store.reserve(scope, self.per_connection, now))
+        for prefix, limit in self.endpoints:
+            if path.startswith(prefix):
+                wait = max(wait, self.store.reserve(f"{scope}:{prefix}", limit, now))
+                break
+        return wait
+
+    def acquire(self, api_key: str, connection_id: Optional[str], path: str) -> float:
+        """Block until a request may be sent; return the time waited."""
+        wait = self.reserve(api_key, connection_id, path)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, api_key: str, connection_id: Optional[str], path: str) -> float:
+        """Async counterpart of ``acquire``."""
+        wait = self.reserve(api_key, connection_id, path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def _fingerprint(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,141 @@
+"""
+Retry policy for transient API failures.
+
+Exponential backoff with full jitter, ``Retry-After`` support, an
+idempotency-aware method allowlist and an overall time budget. Pass a
+``RetryPolicy`` to ``OFAuthClient`` / ``AsyncOFAuthClient`` via ``retry=``.
+"""
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Collection, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from .middleware import Response
+
+# Methods that can be repeated without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before repeating a failed request.
+
+    Args:
+        max_attempts: Total attempts including the first one (default 3).
+        backoff_factor: Base delay in seconds; attempt ``n`` waits up to
+            ``backoff_factor * 2 ** (n - 1)`` (default 0.5).
+        max_backoff: Cap for a single computed delay in seconds (default 30).
+        jitter: Randomize each delay over ``[0, delay]`` ("full jitter") so
+            concurrent clients do not retry in lockstep (default True).
+        max_elapsed: Give up once another wait would take the request past
+            this many seconds since the first attempt (default 60, None: no budget).
+        statuses: Response statuses worth retrying.
+        allowed_methods: Methods retried on a retryable status or transport
+            error. Defaults to idempotent methods; add ``"POST"`` only for
+            endpoints where a duplicate is harmless.
+        respect_retry_after: Wait as long as a ``Retry-After`` header asks,
+            within ``max_elapsed`` (default True).
+
+    Connection failures are retried for every method, since the request
+    never reached the server.
+
+    Example::
+
+        client = OFAuthClient(api_key="...", retry=RetryPolicy(max_attempts=5))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        max_elapsed: Optional[float] = 60.0,
+        statuses: Collection[int] = RETRYABLE_STATUSES,
+        allowed_methods: Collection[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.statuses = frozenset(statuses)
+        self.allowed_methods = frozenset(m.upper() for m in allowed_methods)
+        self.respect_retry_after = respect_retry_after
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based), jitter included."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def delay_after_response(
+        self,
+        method: str,
+        response: "Response",
+        attempt: int,
+        elapsed: float,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying ``response``, or None to return it."""
+        if response.status_code not in self.statuses:
+            return None
+        if method.upper() not in self.allowed_methods:
+            return None
+        delay = None
+        if self.respect_retry_after:
+            delay = parse_retry_after(response.headers.get("retry-after"))
+        if delay is None:
+            delay = self.backoff(attempt)
+        return self._within_budget(attempt, elapsed, delay)
+
+    def delay_after_error(
+        self,
+        method: str,
+        error: Exception,
+        attempt: int,
+        elapsed: float,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying after a transport ``error``, or None to raise it."""
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            pass
+        elif not isinstance(error, httpx.TransportError):
+            return None
+        elif method.upper() not in self.allowed_methods:
+            return None
+        return self._within_budget(attempt, elapsed, self.backoff(attempt))
+
+    def _within_budget(self, attempt: int, elapsed: float, delay: float) -> Optional[float]:
+        if attempt >= self.max_attempts:
+            return None
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
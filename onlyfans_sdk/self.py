@@ -1,17 +1,24 @@
 """
 Self API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessSelfGetResponse,
-    V2AccessSelfNotificationsGetResponse,
-    V2AccessSelfPatchRequest,
-    V2AccessSelfPatchResponse,
-    V2AccessSelfReleaseFormsGetResponse,
-    V2AccessSelfTaggedFriendUsersGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.common import (
+        V2AccessSelfPatchResponse,
+    )
+    from .models.self import (
+        V2AccessSelfGetResponse,
+        V2AccessSelfNotificationsGetResponse,
+        V2AccessSelfPatchRequest,
+        V2AccessSelfReleaseFormsGetResponse,
+        V2AccessSelfTaggedFriendUsersGetResponse,
+    )
 
 def list_selfs(
     client: OFAuthClient
@@ -26,6 +33,7 @@ def list_selfs(
     return client.request(
         "GET",
         path,
+        response_model="V2AccessSelfGetResponse",
     )
 
 def update_self(
@@ -43,6 +51,7 @@ def update_self(
         "PATCH",
         path,
         body=body,
+        response_model="V2AccessSelfPatchResponse",
     )
 
 def list_notifications(
@@ -69,6 +78,7 @@ def list_notifications(
         "GET",
         path,
         query=query,
+        response_model="V2AccessSelfNotificationsGetResponse",
     )
 
 def iter_notifications(
@@ -76,17 +86,19 @@ def iter_notifications(
     type: Optional[Literal["subscribed", "purchases", "tip", "post", "commented", "mentioned", "favorited", "message"]] = None,
     related_username: Optional[str] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List notifications
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -95,32 +107,57 @@ def iter_notifications(
         for item in iter_notifications(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_notifications,
+        client,
+        OFFSET,
+        {
+            "type": type,
+            "related_username": related_username,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_notifications(
+    client: AsyncOFAuthClient,
+    type: Optional[Literal["subscribed", "purchases", "tip", "post", "commented", "mentioned", "favorited", "message"]] = None,
+    related_username: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List notifications
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_notifications(
-            client=client,
-            type=type,
-            related_username=related_username,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_notifications(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_notifications,
+        client,
+        OFFSET,
+        {
+            "type": type,
+            "related_username": related_username,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_release_forms(
     client: OFAuthClient,
@@ -150,6 +187,7 @@ def list_release_forms(
         "GET",
         path,
         query=query,
+        response_model="V2AccessSelfReleaseFormsGetResponse",
     )
 
 def iter_release_forms(
@@ -159,17 +197,19 @@ def iter_release_forms(
     sort_direction: Optional[Literal["asc", "desc"]] = None,
     search: Optional[str] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List release forms
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -178,34 +218,63 @@ def iter_release_forms(
         for item in iter_release_forms(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_release_forms,
+        client,
+        OFFSET,
+        {
+            "filter": filter,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "search": search,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_release_forms(
+    client: AsyncOFAuthClient,
+    filter: Optional[Literal["all", "pending"]] = None,
+    sort_by: Optional[Literal["date", "name"]] = None,
+    sort_direction: Optional[Literal["asc", "desc"]] = None,
+    search: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List release forms
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_release_forms(
-            client=client,
-            filter=filter,
-            sort_by=sort_by,
-            sort_direction=sort_direction,
-            search=search,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_release_forms(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_release_forms,
+        client,
+        OFFSET,
+        {
+            "filter": filter,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "search": search,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_tagged_friend_users(
     client: OFAuthClient,
@@ -235,6 +304,7 @@ def list_tagged_friend_users(
         "GET",
         path,
         query=query,
+        response_model="V2AccessSelfTaggedFriendUsersGetResponse",
     )
 
 def iter_tagged_friend_users(
@@ -244,17 +314,19 @@ def iter_tagged_friend_users(
     sort_direction: Optional[Literal["asc", "desc"]] = None,
     search: Optional[str] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List tagged friend users
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -263,31 +335,60 @@ def iter_tagged_friend_users(
         for item in iter_tagged_friend_users(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_tagged_friend_users,
+        client,
+        OFFSET,
+        {
+            "filter": filter,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "search": search,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_tagged_friend_users(
+    client: AsyncOFAuthClient,
+    filter: Optional[Literal["all", "pending"]] = None,
+    sort_by: Optional[Literal["date", "name"]] = None,
+    sort_direction: Optional[Literal["asc", "desc"]] = None,
+    search: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List tagged friend users
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_tagged_friend_users(
-            client=client,
-            filter=filter,
-            sort_by=sort_by,
-            sort_direction=sort_direction,
-            search=search,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_tagged_friend_users(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_tagged_friend_users,
+        client,
+        OFFSET,
+        {
+            "filter": filter,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "search": search,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
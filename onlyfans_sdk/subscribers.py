@@ -1,12 +1,17 @@
 """
 Subscribers API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessSubscribersGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.subscribers import (
+        V2AccessSubscribersGetResponse,
+    )
 
 def list_subscribers(
     client: OFAuthClient,
@@ -40,6 +45,7 @@ def list_subscribers(
         "GET",
         path,
         query=query,
+        response_model="V2AccessSubscribersGetResponse",
     )
 
 def iter_subscribers(
@@ -51,17 +57,19 @@ def iter_subscribers(
     end_date: Optional[str] = None,
     latest_type: Optional[Literal["total", "new", "renewals"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List subscribers
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -70,36 +78,69 @@ def iter_subscribers(
         for item in iter_subscribers(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_subscribers,
+        client,
+        OFFSET,
+        {
+            "query": query,
+            "filter": filter,
+            "type": type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "latest_type": latest_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_subscribers(
+    client: AsyncOFAuthClient,
+    query: Optional[str] = None,
+    filter: Optional[Dict[str, Any]] = None,
+    type: Optional[Union[Literal["all", "active", "expired"], Literal["latest"]]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    latest_type: Optional[Literal["total", "new", "renewals"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List subscribers
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_subscribers(
-            client=client,
-            query=query,
-            filter=filter,
-            type=type,
-            start_date=start_date,
-            end_date=end_date,
-            latest_type=latest_type,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_subscribers(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_subscribers,
+        client,
+        OFFSET,
+        {
+            "query": query,
+            "filter": filter,
+            "type": type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "latest_type": latest_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def set_note(
     client: OFAuthClient,
@@ -116,6 +157,7 @@ def set_note(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/subscribers/{user_id}/note",
         body=body,
     )
 
@@ -134,6 +176,7 @@ def set_discount(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/subscribers/{user_id}/discount",
         body=body,
     )
 
@@ -152,5 +195,6 @@ def set_custom_name(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/subscribers/{user_id}/custom-name",
         body=body,
     )
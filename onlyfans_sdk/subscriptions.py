@@ -1,13 +1,18 @@
 """
 Subscriptions API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessSubscriptionsCountGetResponse,
-    V2AccessSubscriptionsGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.subscriptions import (
+        V2AccessSubscriptionsCountGetResponse,
+        V2AccessSubscriptionsGetResponse,
+    )
 
 def list_subscriptions(
     client: OFAuthClient,
@@ -35,6 +40,7 @@ def list_subscriptions(
         "GET",
         path,
         query=query,
+        response_model="V2AccessSubscriptionsGetResponse",
     )
 
 def iter_subscriptions(
@@ -43,17 +49,19 @@ def iter_subscriptions(
     filter: Optional[Dict[str, Any]] = None,
     type: Optional[Literal["all", "active", "expired"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List subscriptions
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -62,33 +70,60 @@ def iter_subscriptions(
         for item in iter_subscriptions(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_subscriptions,
+        client,
+        OFFSET,
+        {
+            "query": query,
+            "filter": filter,
+            "type": type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_subscriptions(
+    client: AsyncOFAuthClient,
+    query: Optional[str] = None,
+    filter: Optional[Dict[str, Any]] = None,
+    type: Optional[Literal["all", "active", "expired"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List subscriptions
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_subscriptions(
-            client=client,
-            query=query,
-            filter=filter,
-            type=type,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Example:
+        async for item in aiter_subscriptions(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_subscriptions,
+        client,
+        OFFSET,
+        {
+            "query": query,
+            "filter": filter,
+            "type": type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_counts(
     client: OFAuthClient
@@ -103,6 +138,7 @@ def list_counts(
     return client.request(
         "GET",
         path,
+        response_model="V2AccessSubscriptionsCountGetResponse",
     )
 
 def list_historys(
@@ -123,5 +159,6 @@ def list_historys(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/subscriptions/{subscription_id}/history",
         query=query,
     )
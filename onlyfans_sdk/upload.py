@@ -1,17 +1,21 @@
 """
 Upload API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
 
 from ._client import OFAuthClient
-from .models import (
-    V2AccessUploadsCheckPostRequest,
-    V2AccessUploadsCheckPostResponse,
-    V2AccessUploadsCompletePostRequest,
-    V2AccessUploadsCompletePostResponse,
-    V2AccessUploadsInitPostRequest,
-    V2AccessUploadsInitPostResponse,
-)
+
+if TYPE_CHECKING:
+    from .models.upload import (
+        V2AccessUploadsCheckPostRequest,
+        V2AccessUploadsCheckPostResponse,
+        V2AccessUploadsCompletePostRequest,
+        V2AccessUploadsCompletePostResponse,
+        V2AccessUploadsInitPostRequest,
+        V2AccessUploadsInitPostResponse,
+    )
 
 def create_uploads_uploads_check(
     client: OFAuthClient,
@@ -28,6 +32,7 @@ def create_uploads_uploads_check(
         "POST",
         path,
         body=body,
+        response_model="V2AccessUploadsCheckPostResponse",
     )
 
 def init_uploads(
@@ -45,6 +50,7 @@ def init_uploads(
         "POST",
         path,
         body=body,
+        response_model="V2AccessUploadsInitPostResponse",
     )
 
 def replace_uploads_uploads_parts(
@@ -62,6 +68,7 @@ def replace_uploads_uploads_parts(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/uploads/{media_upload_id}/parts/{part_number}",
     )
 
 def replace_uploads(
@@ -78,6 +85,7 @@ def replace_uploads(
     return client.request(
         "PUT",
         path,
+        endpoint="/v2/access/uploads/{media_upload_id}",
     )
 
 def complete_uploads(
@@ -95,4 +103,5 @@ def complete_uploads(
         "POST",
         path,
         body=body,
+        response_model="V2AccessUploadsCompletePostResponse",
     )
@@ -1,14 +1,19 @@
 """
 User Lists API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessUsersListsGetResponse,
-    V2AccessUsersListsPostRequest,
-    V2AccessUsersListsPostResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.user_lists import (
+        V2AccessUsersListsGetResponse,
+        V2AccessUsersListsPostRequest,
+        V2AccessUsersListsPostResponse,
+    )
 
 def list_users_users_lists(
     client: OFAuthClient,
@@ -32,23 +37,26 @@ def list_users_users_lists(
         "GET",
         path,
         query=query,
+        response_model="V2AccessUsersListsGetResponse",
     )
 
 def iter_users_users_lists(
     client: OFAuthClient,
     query: Optional[str] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List user lists
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -57,31 +65,54 @@ def iter_users_users_lists(
         for item in iter_users_users_lists(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_users_users_lists,
+        client,
+        OFFSET,
+        {
+            "query": query,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_users_users_lists(
+    client: AsyncOFAuthClient,
+    query: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List user lists
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_users_users_lists(
-            client=client,
-            query=query,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_users_users_lists(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_users_users_lists,
+        client,
+        OFFSET,
+        {
+            "query": query,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def create_users_users_lists(
     client: OFAuthClient,
@@ -98,6 +129,7 @@ def create_users_users_lists(
         "POST",
         path,
         body=body,
+        response_model="V2AccessUsersListsPostResponse",
     )
 
 def get_users_users_lists(
@@ -114,6 +146,8 @@ def get_users_users_lists(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/users/lists/{list_id}",
+        response_model="V2AccessUsersListsGetResponse",
     )
 
 def update_users_users_lists(
@@ -131,6 +165,7 @@ def update_users_users_lists(
     return client.request(
         "PATCH",
         path,
+        endpoint="/v2/access/users/lists/{list_id}",
         body=body,
     )
 
@@ -148,6 +183,7 @@ def delete_users_users_lists(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/users/lists/{list_id}",
     )
 
 def list_users_lists_users(
@@ -170,6 +206,7 @@ def list_users_lists_users(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/users/lists/{list_id}/users",
         query=query,
     )
 
@@ -177,17 +214,19 @@ def iter_users_lists_users(
     client: OFAuthClient,
     list_id: str,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List users in user list
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -196,31 +235,54 @@ def iter_users_lists_users(
         for item in iter_users_lists_users(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_users_lists_users,
+        client,
+        OFFSET,
+        {
+            "list_id": list_id,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_users_lists_users(
+    client: AsyncOFAuthClient,
+    list_id: str,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List users in user list
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_users_lists_users(
-            client=client,
-            list_id=list_id,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Example:
+        async for item in aiter_users_lists_users(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_users_lists_users,
+        client,
+        OFFSET,
+        {
+            "list_id": list_id,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def create_users_lists_users(
     client: OFAuthClient,
@@ -237,6 +299,7 @@ def create_users_lists_users(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/access/users/lists/{list_id}/users/{user_id}",
     )
 
 def delete_users_lists_users(
@@ -254,6 +317,7 @@ def delete_users_lists_users(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/users/lists/{list_id}/users/{user_id}",
     )
 
 def create_users_users_lists_2(
@@ -271,5 +335,7 @@ def create_users_users_lists_2(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/access/users/{user_id}/lists",
         body=body,
+        response_model="V2AccessUsersListsPostResponse",
     )
@@ -1,15 +1,20 @@
 """
 Users API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessUsersBlockedGetResponse,
-    V2AccessUsersListGetResponse,
-    V2AccessUsersRestrictGetResponse,
-    V2AccessUsersSearchGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.users import (
+        V2AccessUsersBlockedGetResponse,
+        V2AccessUsersListGetResponse,
+        V2AccessUsersRestrictGetResponse,
+        V2AccessUsersSearchGetResponse,
+    )
 
 def list_restricts(
     client: OFAuthClient,
@@ -31,22 +36,25 @@ def list_restricts(
         "GET",
         path,
         query=query,
+        response_model="V2AccessUsersRestrictGetResponse",
     )
 
 def iter_restricts(
     client: OFAuthClient,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List restricted users
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -55,30 +63,47 @@ def iter_restricts(
         for item in iter_restricts(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
-    
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_restricts(
-            client=client,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    return Paginator(
+        list_restricts,
+        client,
+        OFFSET,
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_restricts(
+    client: AsyncOFAuthClient,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List restricted users
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_restricts(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_restricts,
+        client,
+        OFFSET,
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_blockeds(
     client: OFAuthClient,
@@ -100,22 +125,25 @@ def list_blockeds(
         "GET",
         path,
         query=query,
+        response_model="V2AccessUsersBlockedGetResponse",
     )
 
 def iter_blockeds(
     client: OFAuthClient,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List blocked users
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -124,30 +152,47 @@ def iter_blockeds(
         for item in iter_blockeds(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
-    
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_blockeds(
-            client=client,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    return Paginator(
+        list_blockeds,
+        client,
+        OFFSET,
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_blockeds(
+    client: AsyncOFAuthClient,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List blocked users
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_blockeds(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_blockeds,
+        client,
+        OFFSET,
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def list_lists(
     client: OFAuthClient,
@@ -167,6 +212,7 @@ def list_lists(
         "GET",
         path,
         query=query,
+        response_model="V2AccessUsersListGetResponse",
     )
 
 def list_searchs(
@@ -191,6 +237,7 @@ def list_searchs(
         "GET",
         path,
         query=query,
+        response_model="V2AccessUsersSearchGetResponse",
     )
 
 def get_users(
@@ -207,6 +254,7 @@ def get_users(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/users/{user_id}",
     )
 
 def create_restrict(
@@ -223,6 +271,7 @@ def create_restrict(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/access/users/{user_id}/restrict",
     )
 
 def delete_restrict(
@@ -239,4 +288,5 @@ def delete_restrict(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/users/{user_id}/restrict",
     )
@@ -1,12 +1,17 @@
 """
 Vault API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessVaultMediaGetResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.common import (
+        V2AccessVaultMediaGetResponse,
+    )
 
 def list_media(
     client: OFAuthClient,
@@ -38,6 +43,7 @@ def list_media(
         "GET",
         path,
         query=query,
+        response_model="V2AccessVaultMediaGetResponse",
     )
 
 def iter_media(
@@ -48,17 +54,19 @@ def iter_media(
     query: Optional[str] = None,
     media_type: Optional[Literal["photo", "video", "audio", "gif"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List vault media
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -67,32 +75,63 @@ def iter_media(
         for item in iter_media(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
+    return Paginator(
+        list_media,
+        client,
+        OFFSET,
+        {
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "list_id": list_id,
+            "query": query,
+            "media_type": media_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_media(
+    client: AsyncOFAuthClient,
+    sort_by: Optional[Literal["recent", "most-liked", "highest-tips"]] = None,
+    sort_direction: Optional[Literal["asc", "desc"]] = None,
+    list_id: Optional[int] = None,
+    query: Optional[str] = None,
+    media_type: Optional[Literal["photo", "video", "audio", "gif"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List vault media
     
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_media(
-            client=client,
-            sort_by=sort_by,
-            sort_direction=sort_direction,
-            list_id=list_id,
-            query=query,
-            media_type=media_type,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_media(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_media,
+        client,
+        OFFSET,
+        {
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "list_id": list_id,
+            "query": query,
+            "media_type": media_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
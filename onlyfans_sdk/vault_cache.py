@@ -18,5 +18,6 @@ def create_v2_vault_cache_list(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/vault/cache/list/{list_id}",
         connection_id=connection_id,
     )
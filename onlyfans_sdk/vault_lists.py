@@ -1,14 +1,19 @@
 """
 Vault Lists API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2AccessVaultListsGetResponse,
-    V2AccessVaultListsPostRequest,
-    V2AccessVaultListsPostResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import OFFSET, Paginator
+
+if TYPE_CHECKING:
+    from .models.vault_lists import (
+        V2AccessVaultListsGetResponse,
+        V2AccessVaultListsPostRequest,
+        V2AccessVaultListsPostResponse,
+    )
 
 def list_vault_vault_lists(
     client: OFAuthClient,
@@ -32,23 +37,26 @@ def list_vault_vault_lists(
         "GET",
         path,
         query=query,
+        response_model="V2AccessVaultListsGetResponse",
     )
 
 def iter_vault_vault_lists(
     client: OFAuthClient,
     query: Optional[str] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List vault folders
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -57,31 +65,54 @@ def iter_vault_vault_lists(
         for item in iter_vault_vault_lists(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
-    
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_vault_vault_lists(
-            client=client,
-            query=query,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    return Paginator(
+        list_vault_vault_lists,
+        client,
+        OFFSET,
+        {
+            "query": query,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_vault_vault_lists(
+    client: AsyncOFAuthClient,
+    query: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List vault folders
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_vault_vault_lists(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_vault_vault_lists,
+        client,
+        OFFSET,
+        {
+            "query": query,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def create_vault_vault_lists(
     client: OFAuthClient,
@@ -98,6 +129,7 @@ def create_vault_vault_lists(
         "POST",
         path,
         body=body,
+        response_model="V2AccessVaultListsPostResponse",
     )
 
 def update_vault_vault_lists(
@@ -115,6 +147,7 @@ def update_vault_vault_lists(
     return client.request(
         "PATCH",
         path,
+        endpoint="/v2/access/vault/lists/{list_id}",
         body=body,
     )
 
@@ -132,6 +165,7 @@ def delete_vault_vault_lists(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/access/vault/lists/{list_id}",
     )
 
 def list_vault_vault_lists_media(
@@ -162,6 +196,7 @@ def list_vault_vault_lists_media(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/access/vault/lists/{list_id}/media",
         query=query,
     )
 
@@ -173,17 +208,19 @@ def iter_vault_vault_lists_media(
     query: Optional[str] = None,
     media_type: Optional[Literal["photo", "video", "audio", "gif"]] = None,
     page_size: int = 20,
-    max_items: Optional[int] = None
-) -> Generator[Any, None, None]:
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
     """
     List media in vault list
     
-    Returns a generator that yields items one at a time, automatically
+    Returns a Paginator that yields items one at a time, automatically
     handling pagination.
     
     Args:
         page_size: Number of items per page (default: 20)
         max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
     
     Yields:
         Individual items from the list response
@@ -192,35 +229,66 @@ def iter_vault_vault_lists_media(
         for item in iter_vault_vault_lists_media(client, connection_id="..."):
             print(item)
     """
-    offset = 0
-    fetched = 0
-    
-    while True:
-        if max_items is not None and fetched >= max_items:
-            return
-        
-        remaining = page_size if max_items is None else min(page_size, max_items - fetched)
-        response = list_vault_vault_lists_media(
-            client=client,
-            list_id=list_id,
-            sort_by=sort_by,
-            sort_direction=sort_direction,
-            query=query,
-            media_type=media_type,
-            limit=remaining,
-            offset=offset,
-        )
-        
-        for item in response.get("list", []):
-            if max_items is not None and fetched >= max_items:
-                return
-            yield item
-            fetched += 1
-        
-        if not response.get("hasMore", False):
-            return
-        
-        offset = response.get("nextOffset", offset + len(response.get("list", [])))
+    return Paginator(
+        list_vault_vault_lists_media,
+        client,
+        OFFSET,
+        {
+            "list_id": list_id,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "query": query,
+            "media_type": media_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_vault_vault_lists_media(
+    client: AsyncOFAuthClient,
+    list_id: float,
+    sort_by: Optional[Literal["recent", "most-liked", "highest-tips"]] = None,
+    sort_direction: Optional[Literal["asc", "desc"]] = None,
+    query: Optional[str] = None,
+    media_type: Optional[Literal["photo", "video", "audio", "gif"]] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List media in vault list
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_vault_vault_lists_media(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_vault_vault_lists_media,
+        client,
+        OFFSET,
+        {
+            "list_id": list_id,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "query": query,
+            "media_type": media_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
 
 def create_vault_vault_lists_media(
     client: OFAuthClient,
@@ -237,5 +305,6 @@ def create_vault_vault_lists_media(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/access/vault/lists/{list_id}/media",
         body=body,
     )
@@ -1,15 +1,20 @@
 """
 Vault+ Media API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
 
-from ._client import OFAuthClient
-from .models import (
-    V2VaultPlusBatchPostRequest,
-    V2VaultPlusBatchPostResponse,
-    V2VaultPlusListGetResponse,
-    V2VaultPlusPurgeDeleteResponse,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
+
+from ._client import AsyncOFAuthClient, OFAuthClient
+from .pagination import CURSOR, Paginator
+
+if TYPE_CHECKING:
+    from .models.vault_media import (
+        V2VaultPlusBatchPostRequest,
+        V2VaultPlusBatchPostResponse,
+        V2VaultPlusListGetResponse,
+        V2VaultPlusPurgeDeleteResponse,
+    )
 
 def get_v2_vault_plus(
     client: OFAuthClient,
@@ -24,6 +29,7 @@ def get_v2_vault_plus(
     return client.request(
         "GET",
         path,
+        endpoint="/v2/vault-plus/{media_id}",
         connection_id=connection_id,
     )
 
@@ -40,6 +46,7 @@ def delete_v2_vault_plus(
     return client.request(
         "DELETE",
         path,
+        endpoint="/v2/vault-plus/{media_id}",
         connection_id=connection_id,
     )
 
@@ -58,6 +65,7 @@ def create_v2_vault_plus_batch(
         path,
         body=body,
         connection_id=connection_id,
+        response_model="V2VaultPlusBatchPostResponse",
     )
 
 def list_v2_vault_plus_lists(
@@ -86,6 +94,93 @@ def list_v2_vault_plus_lists(
         path,
         query=query,
         connection_id=connection_id,
+        response_model="V2VaultPlusListGetResponse",
+    )
+
+def iter_v2_vault_plus_lists(
+    client: OFAuthClient,
+    connection_id: str,
+    status: Optional[Literal["edge_only", "pending", "storing", "stored", "removed"]] = None,
+    source: Optional[Literal["vault", "messages", "posts", "stories"]] = None,
+    content_type: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List stored media for a connection
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        for item in iter_v2_vault_plus_lists(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_v2_vault_plus_lists,
+        client,
+        CURSOR,
+        {
+            "connection_id": connection_id,
+            "status": status,
+            "source": source,
+            "content_type": content_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
+    )
+
+def aiter_v2_vault_plus_lists(
+    client: AsyncOFAuthClient,
+    connection_id: str,
+    status: Optional[Literal["edge_only", "pending", "storing", "stored", "removed"]] = None,
+    source: Optional[Literal["vault", "messages", "posts", "stories"]] = None,
+    content_type: Optional[str] = None,
+    page_size: int = 20,
+    max_items: Optional[int] = None,
+    **options: Any
+) -> Paginator:
+    """
+    List stored media for a connection
+    
+    Returns a Paginator that yields items one at a time, automatically
+    handling pagination.
+    
+    Args:
+        page_size: Number of items per page (default: 20)
+        max_items: Maximum total items to yield (default: unlimited)
+        **options: Paginator options such as ``prefetch`` (see ``onlyfans_sdk.pagination.Paginator``)
+    
+    Yields:
+        Individual items from the list response
+    
+    Example:
+        async for item in aiter_v2_vault_plus_lists(client, connection_id="..."):
+            print(item)
+    """
+    return Paginator(
+        list_v2_vault_plus_lists,
+        client,
+        CURSOR,
+        {
+            "connection_id": connection_id,
+            "status": status,
+            "source": source,
+            "content_type": content_type,
+        },
+        page_size=page_size,
+        max_items=max_items,
+        **options,
     )
 
 def delete_v2_vault_plus_purge(
@@ -101,4 +196,5 @@ def delete_v2_vault_plus_purge(
         "DELETE",
         path,
         connection_id=connection_id,
+        response_model="V2VaultPlusPurgeDeleteResponse",
     )
@@ -1,13 +1,17 @@
 """
 Vault+ Stats API
 """
-from typing import Any, Dict, List, Literal, Optional, Union, Generator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, Generator
 
 from ._client import OFAuthClient
-from .models import (
-    V2VaultPlusStoreStatsGetResponse,
-    V2VaultPlusStoreStatusGetResponse,
-)
+
+if TYPE_CHECKING:
+    from .models.vault_stats import (
+        V2VaultPlusStoreStatsGetResponse,
+        V2VaultPlusStoreStatusGetResponse,
+    )
 
 def list_v2_vault_plus_store_status(
     client: OFAuthClient,
@@ -22,6 +26,7 @@ def list_v2_vault_plus_store_status(
         "GET",
         path,
         connection_id=connection_id,
+        response_model="V2VaultPlusStoreStatusGetResponse",
     )
 
 def list_v2_vault_plus_store_stats(
@@ -35,4 +40,5 @@ def list_v2_vault_plus_store_stats(
     return client.request(
         "GET",
         path,
+        response_model="V2VaultPlusStoreStatsGetResponse",
     )
@@ -18,5 +18,6 @@ def create_v2_vault_plus_store_list(
     return client.request(
         "POST",
         path,
+        endpoint="/v2/vault-plus/store/list/{list_id}",
         connection_id=connection_id,
     )
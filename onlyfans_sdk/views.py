@@ -0,0 +1,266 @@
+"""
+Lazy model views over decoded responses.
+
+A view wraps the decoded JSON of one object and exposes the fields of its
+generated model as attributes. A field is validated (and converted, e.g.
+to an enum or a nested view) the first time it is read, then stored in a
+slot so later reads cost a plain attribute lookup. Fields that are never
+read are never touched:
+
+    page = view("V2AccessEarningsTransactionsGetResponse", client.request(...))
+    for tx in page.list:          # list of ListItem views, nothing validated yet
+        print(tx.amounts.net)     # validates `amounts` and `net` only
+
+Clients with ``response_mode="lazy"`` return views from every endpoint
+function, so ``iter_*`` helpers yield views too. Views are read-only;
+``to_model()`` validates the whole object into its model and ``to_dict()``
+returns the wrapped JSON.
+"""
+from __future__ import annotations
+
+import types
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel, ValidationError
+
+from .parsing import resolve_model, type_adapter
+
+Converter = Optional[Callable[[Any], Any]]
+
+_REQUIRED: Any = object()
+
+
+# ============================================================================
+# View base class
+# ============================================================================
+
+
+class ModelView:
+    """
+    Base class of the view classes generated for each model.
+
+    Subclasses have one slot per model field; ``__getattr__`` only runs for
+    fields not read yet.
+    """
+
+    __slots__ = ("_data",)
+
+    # Set on each generated subclass
+    _model: type = BaseModel
+    # Field name -> (JSON name, converter, default), where default is a
+    # value, a _Factory or _REQUIRED
+    _fields: Dict[str, Tuple[str, Converter, Any]] = {}
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_data", data)
+
+    def __getattr__(self, name: str) -> Any:
+        field = type(self)._fields.get(name)
+        if field is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        key, convert, default = field
+        try:
+            value = self._data[key]
+        except KeyError:
+            if default is _REQUIRED:
+                raise _missing(self._model, key, self._data) from None
+            value = default.factory() if type(default) is _Factory else default
+        else:
+            if convert is not None:
+                value = convert(value)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ModelView):
+            return self._model is other._model and self._data == other._data
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __dir__(self) -> list:
+        return sorted(set(super().__dir__()) | set(self._fields))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def to_model(self) -> Any:
+        """Validate the whole object into its model."""
+        return self._model.model_validate(self._data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The wrapped JSON object (not a copy)."""
+        return self._data
+
+
+def _missing(model: type, key: str, data: Dict[str, Any]) -> ValidationError:
+    return ValidationError.from_exception_data(
+        model.__name__, [{"type": "missing", "loc": (key,), "input": data}]
+    )
+
+
+# ============================================================================
+# View classes
+# ============================================================================
+
+
+class _Factory:
+    """A field default made fresh for each view, like pydantic's ``default_factory``."""
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.factory = factory
+
+
+def view_class(model: Union[str, type]) -> type:
+    """The view class for a generated model (or its name), created once."""
+    return _view_class(resolve_model(model))
+
+
+@lru_cache(maxsize=None)
+def _view_class(model: type) -> type:
+    namespace = {"__slots__": tuple(model.model_fields), "_model": model, "__module__": __name__}
+    cls = type(f"{model.__name__}View", (ModelView,), namespace)
+    cls._fields = {}
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            default = _REQUIRED
+        elif field.default_factory is not None:
+            default = _Factory(field.default_factory)
+        else:
+            default = field.default
+        cls._fields[name] = (field.alias or name, _converter(field.annotation), default)
+    return cls
+
+
+def view(model: Union[str, type], data: Any) -> Any:
+    """
+    Wrap decoded JSON in a lazy view of ``model`` (a class or its name in
+    ``onlyfans_sdk.models``). Root models yield their converted root value.
+    """
+    model = resolve_model(model)
+    if issubclass(model, RootModel):
+        convert = _converter(model.model_fields["root"].annotation)
+        return convert(data) if convert is not None else data
+    return _view_or_validate(model, data)
+
+
+def _view_or_validate(model: type, value: Any) -> Any:
+    if issubclass(model, RootModel):
+        return view(model, value)
+    if isinstance(value, dict):
+        return _view_class(model)(value)
+    # Not an object: let pydantic report it
+    return type_adapter(model).validate_python(value)
+
+
+# ============================================================================
+# Field converters
+# ============================================================================
+
+
+@lru_cache(maxsize=None)
+def _converter(annotation: Any) -> Converter:
+    """How to turn a raw value of ``annotation`` into its attribute value."""
+    if annotation is Any:
+        return None
+    if not _has_model(annotation):
+        # The core validator directly: a field read should not pay TypeAdapter's call overhead
+        return type_adapter(annotation).validator.validate_python
+    origin = get_origin(annotation)
+    if _is_model(annotation):
+        return _model_converter(annotation)
+    if origin is list:
+        (item_type,) = get_args(annotation)
+        return _list_converter(annotation, _converter(item_type))
+    if origin is dict:
+        return _dict_converter(annotation, _converter(get_args(annotation)[1]))
+    if origin is Union or origin is types.UnionType:
+        options = tuple(arg for arg in get_args(annotation) if arg is not type(None))
+        return _union_converter(annotation, options)
+    return type_adapter(annotation).validate_python
+
+
+def _model_converter(model: type) -> Callable[[Any], Any]:
+    if issubclass(model, RootModel):
+        return lambda value: view(model, value)
+    cls = None
+
+    def convert_model(value: Any) -> Any:
+        nonlocal cls
+        if not isinstance(value, dict):
+            return type_adapter(model).validate_python(value)
+        if cls is None:
+            # Looked up on first use, so self-referencing models terminate
+            cls = _view_class(model)
+        return cls(value)
+
+    return convert_model
+
+
+def _list_converter(annotation: Any, convert: Converter) -> Callable[[Any], Any]:
+    def convert_list(value: Any) -> Any:
+        if not isinstance(value, list):
+            return type_adapter(annotation).validate_python(value)
+        if convert is None:
+            return value
+        return [convert(item) for item in value]
+
+    return convert_list
+
+
+def _dict_converter(annotation: Any, convert: Converter) -> Callable[[Any], Any]:
+    def convert_dict(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return type_adapter(annotation).validate_python(value)
+        if convert is None:
+            return value
+        return {key: convert(item) for key, item in value.items()}
+
+    return convert_dict
+
+
+def _union_converter(annotation: Any, options: Tuple[Any, ...]) -> Callable[[Any], Any]:
+    nullable = len(options) < len(get_args(annotation))
+
+    def convert_union(value: Any) -> Any:
+        if value is None and nullable:
+            return None
+        for option in options:
+            # Without validating the object, pick the first model whose required fields are present
+            if _is_model(option) and not issubclass(option, RootModel):
+                if isinstance(value, dict) and _required(option) <= value.keys():
+                    return _view_class(option)(value)
+                continue
+            try:
+                convert = _converter(option)
+                return convert(value) if convert is not None else value
+            except ValidationError:
+                continue
+        # Nothing fits: validate the whole union for a complete error
+        return type_adapter(annotation).validate_python(value)
+
+    return convert_union
+
+
+@lru_cache(maxsize=None)
+def _required(model: type) -> frozenset:
+    return frozenset(
+        field.alias or name for name, field in model.model_fields.items() if field.is_required()
+    )
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _has_model(annotation: Any) -> bool:
+    if _is_model(annotation):
+        return True
+    return any(_has_model(arg) for arg in get_args(annotation))
@@ -0,0 +1,297 @@
+"""
+Split the generated models into per-API submodules.
+
+datamodel-codegen emits every schema of the OpenAPI spec into one module,
+with a numbered copy (``User3``, ``User4``, ...) each time the same shape
+appears under another endpoint. This script post-processes that output into
+the ``onlyfans_sdk/models`` package:
+
+- Structural duplicates (same fields, types, defaults and docstrings, after
+  resolving nested duplicates) are collapsed to the first definition; the
+  other generated names remain as aliases of it.
+- Each schema goes to the submodule of the API module whose endpoints use
+  it (``models/earnings.py`` for ``earnings``, ...). Schemas used by more
+  than one API module go to ``models/common.py``.
+- ``models/__init__.py`` maps every generated name to its submodule and
+  imports submodules on first access, so ``models.X`` keeps working.
+
+Usage (after regenerating the single-file models)::
+
+    datamodel-codegen --input openapi-normalized.json --output models_generated.py ...
+    python scripts/split_models.py models_generated.py
+"""
+import argparse
+import ast
+import os
+import re
+import sys
+from collections import defaultdict
+from typing import Dict, List, Set
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+PACKAGE = os.path.join(ROOT, "onlyfans_sdk")
+SHARED = "common"
+
+# Names the generated code imports from outside the models
+EXTERNAL = {
+    "Enum": "from enum import Enum",
+    "Any": "from typing import Any",
+}
+PYDANTIC = ("AnyUrl", "BaseModel", "Field", "RootModel")
+
+REQUEST_CALL = re.compile(r'path = f"([^"]+)"\n(?:.*\n)*?\s*return client\.request\(\n\s*"(\w+)"')
+ROOT_SUFFIX = re.compile(r"(Request|Response)(Item)?\d*")
+
+
+class Schema:
+    def __init__(self, node: ast.ClassDef, source: str) -> None:
+        self.name = node.name
+        self.node = node
+        self.source = ast.get_source_segment(source, node)
+        self.refs: Set[str] = set()
+
+
+def load_schemas(source: str) -> Dict[str, Schema]:
+    schemas: Dict[str, Schema] = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            schemas[node.name] = Schema(node, source)
+        elif not isinstance(node, (ast.Import, ast.ImportFrom)):
+            raise SystemExit(f"unexpected top-level statement on line {node.lineno}")
+    for schema in schemas.values():
+        schema.refs = {
+            n.id for n in ast.walk(schema.node)
+            if isinstance(n, ast.Name) and n.id in schemas and n.id != schema.name
+        }
+    return schemas
+
+
+def _camel(path: str) -> str:
+    parts = []
+    for segment in path.strip("/").split("/"):
+        words = re.split(r"[_\-.]", segment.strip("{}"))
+        parts.append("".join(word[:1].upper() + word[1:] for word in words if word))
+    return "".join(parts)
+
+
+def endpoint_prefixes(package: str) -> Dict[str, str]:
+    """Generated class-name prefix (path + method) -> API module using it."""
+    prefixes = {}
+    for filename in sorted(os.listdir(package)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        with open(os.path.join(package, filename), encoding="utf-8") as f:
+            text = f.read()
+        for match in REQUEST_CALL.finditer(text):
+            prefixes[_camel(match.group(1)) + match.group(2).capitalize()] = filename[:-3]
+    return prefixes
+
+
+def canonical_names(schemas: Dict[str, Schema]) -> Dict[str, str]:
+    """Map every name to the first schema with the same structure."""
+    canon = {name: name for name in schemas}
+    while True:
+        first: Dict[str, str] = {}
+        updated = {}
+        for name, schema in schemas.items():
+            key = _structure(schema, canon)
+            updated[name] = first.setdefault(key, name)
+        if updated == canon:
+            return canon
+        canon = updated
+
+
+def _structure(schema: Schema, canon: Dict[str, str]) -> str:
+    node = ast.parse(schema.source).body[0]
+    for n in ast.walk(node):
+        if isinstance(n, ast.Name) and n.id in canon:
+            n.id = canon[n.id]
+    node.name = ""
+    return ast.dump(node)
+
+
+def assign_modules(schemas: Dict[str, Schema], prefixes: Dict[str, str]) -> Dict[str, Set[str]]:
+    """Set of API modules that use each schema, directly or nested."""
+    users: Dict[str, Set[str]] = defaultdict(set)
+
+    def mark(name: str, module: str) -> None:
+        if module in users[name]:
+            return
+        users[name].add(module)
+        for ref in schemas[name].refs:
+            mark(ref, module)
+
+    for name in schemas:
+        for prefix, module in prefixes.items():
+            if name.startswith(prefix) and ROOT_SUFFIX.fullmatch(name[len(prefix):]):
+                mark(name, module)
+    # Schemas no endpoint refers to (e.g. query parameter enums) stay next
+    # to the endpoint they were generated with.
+    names = list(schemas)
+    for index, name in enumerate(names):
+        if not users[name]:
+            neighbour = next(
+                (n for n in names[index + 1:] + names[index::-1] if users[n]), None
+            )
+            if neighbour is None:
+                raise SystemExit(f"cannot place {name}")
+            mark(name, sorted(users[neighbour])[0])
+    return users
+
+
+def plan(schemas: Dict[str, Schema], canon: Dict[str, str], users: Dict[str, Set[str]]) -> Dict[str, str]:
+    """Submodule for every generated name."""
+    group_users: Dict[str, Set[str]] = defaultdict(set)
+    for name in schemas:
+        group_users[canon[name]] |= users[name]
+    home = {}
+    for name in schemas:
+        modules = group_users[name] if canon[name] == name else users[name]
+        home[name] = next(iter(modules)) if len(modules) == 1 else SHARED
+    return home
+
+
+def render_class(schema: Schema, canon: Dict[str, str]) -> str:
+    """Class source with references to duplicates pointed at their canonical schema."""
+    lines = schema.source.splitlines()
+    first_line = schema.node.lineno
+    first_col = schema.node.col_offset
+    edits = sorted(
+        (
+            (n.lineno - first_line, n.col_offset - (first_col if n.lineno == first_line else 0), n.id)
+            for n in ast.walk(schema.node)
+            if isinstance(n, ast.Name) and canon.get(n.id, n.id) != n.id
+        ),
+        reverse=True,
+    )
+    for row, col, name in edits:
+        line = lines[row]
+        lines[row] = line[:col] + canon[name] + line[col + len(name):]
+    return "\n".join(lines)
+
+
+def render_module(
+    module: str,
+    header: str,
+    schemas: Dict[str, Schema],
+    canon: Dict[str, str],
+    home: Dict[str, str],
+) -> str:
+    classes = [n for n in schemas if home[n] == module and canon[n] == n]
+    aliases = [n for n in schemas if home[n] == module and canon[n] != n]
+    bodies = [render_class(schemas[n], canon) for n in classes]
+
+    used = set()
+    for name in classes:
+        used |= {n.id for n in ast.walk(schemas[name].node) if isinstance(n, ast.Name)}
+    imports = ["from __future__ import annotations", ""]
+    external = [EXTERNAL[n] for n in sorted(EXTERNAL) if n in used]
+    external.sort(key=lambda line: line.split()[1])
+    imports += external
+    if external:
+        imports.append("")
+    pydantic = [n for n in PYDANTIC if n in used]
+    if pydantic:
+        imports.append(f"from pydantic import {', '.join(pydantic)}")
+    local = sorted(
+        {canon[ref] for n in classes for ref in schemas[n].refs}
+        | {canon[n] for n in aliases},
+        key=list(schemas).index,
+    )
+    shared = [n for n in local if home[n] != module]
+    if shared:
+        imports += ["", f"from .{SHARED} import ("] + [f"    {n}," for n in shared] + [")"]
+
+    text = header + "\n".join(imports) + "\n\n\n" + "\n\n\n".join(bodies) + "\n"
+    if aliases:
+        text += "\n\n# Structural duplicates of the schemas above, under their generated names\n"
+        text += "".join(f"{n} = {canon[n]}\n" for n in aliases)
+    return text
+
+
+def render_index(header: str, schemas: Dict[str, Schema], home: Dict[str, str], modules: List[str]) -> str:
+    by_module: Dict[str, List[str]] = defaultdict(list)
+    for name in schemas:
+        by_module[home[name]].append(name)
+    lines = [
+        '"""',
+        "Generated Pydantic models for API requests and responses.",
+        "",
+        "Schemas live in one submodule per API module (``models.earnings``,",
+        "``models.messages``, ...), with schemas used by several API modules in",
+        "``models.common``. Every generated name is also available here; its",
+        "submodule is imported on first access, so only the schemas in use are",
+        "ever built.",
+        '"""',
+        header.rstrip("\n"),
+        "",
+        "from __future__ import annotations",
+        "",
+        "import importlib",
+        "from typing import TYPE_CHECKING, Any",
+        "",
+        "if TYPE_CHECKING:",
+    ]
+    for module in modules:
+        lines.append(f"    from .{module} import (")
+        lines += [f"        {n}," for n in by_module[module]]
+        lines.append("    )")
+    lines += ["", "_SUBMODULES = ("]
+    lines += [f'    "{m}",' for m in modules]
+    lines += [")", "", "# Generated name -> submodule defining it", "_SCHEMAS = {"]
+    lines += [f'    "{n}": "{home[n]}",' for n in schemas]
+    lines += [
+        "}",
+        "",
+        "__all__ = list(_SCHEMAS)",
+        "",
+        "",
+        "def __getattr__(name: str) -> Any:",
+        "    module = _SCHEMAS.get(name)",
+        "    if module is not None:",
+        "        value = getattr(importlib.import_module(f\".{module}\", __name__), name)",
+        "    elif name in _SUBMODULES:",
+        "        value = importlib.import_module(f\".{name}\", __name__)",
+        "    else:",
+        "        raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")",
+        "    globals()[name] = value",
+        "    return value",
+        "",
+        "",
+        "def __dir__() -> list[str]:",
+        "    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Split generated models into per-API submodules.")
+    parser.add_argument("source", help="single-file output of datamodel-codegen")
+    parser.add_argument("--output", default=os.path.join(PACKAGE, "models"), help="package directory to write")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as f:
+        source = f.read()
+    header = "".join(line for line in source.splitlines(True)[:4] if line.startswith("#"))
+    header += "#   split by:  scripts/split_models.py\n\n"
+
+    schemas = load_schemas(source)
+    canon = canonical_names(schemas)
+    home = plan(schemas, canon, assign_modules(schemas, endpoint_prefixes(PACKAGE)))
+    modules = [SHARED] + sorted({m for m in home.values() if m != SHARED})
+
+    os.makedirs(args.output, exist_ok=True)
+    for module in modules:
+        with open(os.path.join(args.output, f"{module}.py"), "w", encoding="utf-8") as f:
+            f.write(render_module(module, header, schemas, canon, home))
+    with open(os.path.join(args.output, "__init__.py"), "w", encoding="utf-8") as f:
+        f.write(render_index(header, schemas, home, modules))
+
+    unique = sum(1 for name in schemas if canon[name] == name)
+    print(f"{len(schemas)} generated schemas -> {unique} unique in {len(modules)} submodules")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Shared helpers for the offline test suite.
+
+``FakeAPI`` answers the handful of endpoints the tests page through from
+in-memory data, via ``httpx.MockTransport``, and records every request it
+served so tests can assert on what went over the wire.
+"""
+import threading
+from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import pytest
+
+PYTHON_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+if str(PYTHON_PACKAGE_ROOT) not in sys.path:
+    sys.path.insert(0, str(PYTHON_PACKAGE_ROOT))
+
+from onlyfans_sdk import AsyncOFAuthClient, OFAuthClient  # noqa: E402
+
+CHATS = "/v2/access/chats"
+TRACKING_LINKS = "/v2/access/promotions/tracking-links"
+TRANSACTIONS = "/v2/access/earnings/transactions"
+VAULT_LIST = "/v2/vault-plus/list"
+
+
+def chat(i: int) -> Dict[str, Any]:
+    return {
+        "withUser": {"id": 100000 + i, "_view": "s"},
+        "canSendMessage": True,
+        "unreadMessagesCount": i % 5,
+        "hasUnreadTips": False,
+        "lastMessage": {
+            "id": 5000000 + i,
+            "text": f"message {i}",
+            "fromUser": {"id": 100000 + i, "_view": "s"},
+            "media": [],
+            "previews": [],
+            "isFree": True,
+            "createdAt": "2024-05-01T10:00:00+00:00",
+        },
+    }
+
+
+def tracking_link(i: int) -> Dict[str, Any]:
+    return {"id": 700000 + i, "name": f"link {i}"}
+
+
+def transaction(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"tx_{i:08d}",
+        "type": "tip",
+        "createdAt": "2024-05-01T10:00:00+00:00",
+        "amounts": {"gross": 12.5, "net": 10.0, "fee": 2.5, "vat": 0.0, "tax": 0.0},
+        "currency": "USD",
+        "description": "Tip",
+        "status": "done",
+        "payoutPendingDays": 7,
+        "user": {"id": 100000 + i, "name": f"Fan {i}", "username": f"fan_{i}", "avatar": f"https://public.onlyfans.com/{i}/avatar.jpg"},
+    }
+
+
+def media(i: int) -> Dict[str, Any]:
+    return {"id": f"media_{i:04d}", "type": "photo", "duration": 0, "media": {}}
+
+
+class FakeAPI:
+    """
+    In-memory stand-in for the list endpoints used by the pagination tests.
+
+    - ``/v2/access/chats``: ``offset``/``limit``, answered with ``nextOffset``.
+    - ``/v2/access/promotions/tracking-links``: ``offset``/``limit``, without
+      ``nextOffset``; items have an ``id``.
+    - ``/v2/access/earnings/transactions``: ``marker``, ``marker_page`` items
+      per page, answered with ``nextMarker`` (a millisecond timestamp).
+    - ``/v2/vault-plus/list``: ``cursor``/``limit``, answered with ``nextCursor``.
+
+    ``max_limit`` truncates offset and cursor pages like the real API caps
+    page sizes; ``reject_above`` answers larger limits with a 400.
+    ``created`` items appear at the head of offset listings for every page
+    past the first, shifting later pages the way items created during a
+    crawl do. ``routes`` maps extra paths to handlers.
+    """
+
+    MARKER_BASE = 1718000000000
+
+    def __init__(
+        self,
+        total: int = 60,
+        marker_page: int = 10,
+        max_limit: Optional[int] = None,
+        reject_above: Optional[int] = None,
+        created: int = 0,
+    ) -> None:
+        self.chats = [chat(i) for i in range(total)]
+        self.tracking_links = [tracking_link(i) for i in range(total)]
+        self.transactions = [transaction(i) for i in range(total)]
+        self.media = [media(i) for i in range(total)]
+        self.marker_page = marker_page
+        self.max_limit = max_limit
+        self.reject_above = reject_above
+        self.created = created
+        self.routes: Dict[str, Callable[[httpx.Request], httpx.Response]] = {}
+        self.requests: List[httpx.Request] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        path = request.url.path
+        if path in self.routes:
+            return self.routes[path](request)
+        params = request.url.params
+        limit = int(params.get("limit", 20))
+        if self.reject_above is not None and limit > self.reject_above:
+            return httpx.Response(400, json={"message": "limit too large"})
+        if self.max_limit is not None:
+            limit = min(limit, self.max_limit)
+        if path in (CHATS, TRACKING_LINKS):
+            offset = int(params.get("offset", 0))
+            listing = self.chats if path == CHATS else self.tracking_links
+            if offset > 0 and self.created:
+                listing = [tracking_link(-1 - i) for i in range(self.created)] + listing
+            page = listing[offset:offset + limit]
+            end = offset + len(page)
+            body = {"list": page, "hasMore": end < len(listing)}
+            if path == CHATS:
+                body["nextOffset"] = end
+            return httpx.Response(200, json=body)
+        if path == TRANSACTIONS:
+            start = int(params["marker"]) - self.MARKER_BASE if "marker" in params else 0
+            page = self.transactions[start:start + self.marker_page]
+            end = start + len(page)
+            return httpx.Response(
+                200,
+                json={"list": page, "hasMore": end < len(self.transactions), "nextMarker": self.MARKER_BASE + end},
+            )
+        if path == VAULT_LIST:
+            start = int(params["cursor"]) if "cursor" in params else 0
+            page = self.media[start:start + limit]
+            end = start + len(page)
+            return httpx.Response(
+                200, json={"items": page, "nextCursor": str(end) if end < len(self.media) else None}
+            )
+        return httpx.Response(404, json={"message": f"no route for {path}"})
+
+    def served(self, path: str) -> List[httpx.Request]:
+        """Requests served for ``path``, in arrival order."""
+        return [request for request in self.requests if request.url.path == path]
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    return FakeAPI()
+
+
+@pytest.fixture
+def make_client(api: FakeAPI) -> Callable[..., OFAuthClient]:
+    """Build ``OFAuthClient``s on the ``api`` fixture; closed after the test."""
+    clients: List[OFAuthClient] = []
+
+    def make(**options: Any) -> OFAuthClient:
+        options.setdefault("transport", httpx.MockTransport(api))
+        client = OFAuthClient(api_key="test-key", **options)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_client(api: FakeAPI) -> Callable[..., AsyncOFAuthClient]:
+    """Build ``AsyncOFAuthClient``s on the ``api`` fixture (use inside ``asyncio.run``)."""
+
+    def make(**options: Any) -> AsyncOFAuthClient:
+        options.setdefault("transport", httpx.MockTransport(api))
+        return AsyncOFAuthClient(api_key="test-key", **options)
+
+    return make
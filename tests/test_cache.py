@@ -0,0 +1,174 @@
+"""
+``ResponseCache`` through the client: hits, per-endpoint lifetimes,
+conditional revalidation, invalidation and the SQLite store.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from onlyfans_sdk import ResponseCache, self as self_
+from onlyfans_sdk.cache import SQLiteCacheStore
+
+SELF = "/v2/access/self"
+USERS = "/v2/access/users"
+
+
+class Profile:
+    """``/v2/access/self`` with an ETag; answers matching conditional requests with a 304."""
+
+    def __init__(self, etag: str = '"v1"') -> None:
+        self.etag = etag
+        self.name = "Creator"
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"etag": self.etag})
+        headers = {"etag": self.etag} if self.etag else {}
+        return httpx.Response(200, json={"id": 1, "name": self.name}, headers=headers)
+
+
+@pytest.fixture
+def profile(api):
+    handler = Profile()
+    api.routes[SELF] = handler
+    api.routes[USERS] = lambda request: httpx.Response(200, json={"list": [], "hasMore": False})
+    return handler
+
+
+def _events(make_client, **options):
+    events = []
+    return make_client(on_request=events.append, **options), events
+
+
+def test_repeated_get_is_served_from_cache(api, make_client, profile):
+    cache = ResponseCache(ttl=60)
+    client, events = _events(make_client, cache=cache)
+    first = self_.list_selfs(client)
+    second = self_.list_selfs(client)
+    assert first == second == {"id": 1, "name": "Creator"}
+    assert len(api.served(SELF)) == 1
+    assert [event.cache for event in events] == ["miss", "hit"]
+    assert cache.stats.hits == 1 and cache.stats.misses == 1 and cache.stats.stores == 1
+
+
+def test_key_ignores_query_order_and_none(api, make_client, profile):
+    client = make_client(cache=ResponseCache(ttl=60))
+    client.request("GET", USERS, query={"a": 1, "b": 2})
+    client.request("GET", USERS, query={"b": 2, "a": 1, "c": None})
+    client.request("GET", USERS, query={"a": 2})
+    assert len(api.served(USERS)) == 2
+
+
+def test_cache_is_per_connection(api, make_client, profile):
+    client = make_client(cache=ResponseCache(ttl=60))
+    client.request("GET", SELF, connection_id="conn_1")
+    client.request("GET", SELF, connection_id="conn_2")
+    client.request("GET", SELF, connection_id="conn_1")
+    assert len(api.served(SELF)) == 2
+
+
+def test_writes_are_never_cached(api, make_client, profile):
+    client = make_client(cache=ResponseCache(ttl=60))
+    client.request("PATCH", SELF, body={"name": "x"})
+    client.request("PATCH", SELF, body={"name": "x"})
+    assert len(api.served(SELF)) == 2
+
+
+def test_uncached_endpoints_pass_straight_through(api, make_client, profile):
+    cache = ResponseCache(ttl=None, endpoints={SELF: 300})
+    client, events = _events(make_client, cache=cache)
+    self_.list_selfs(client)
+    self_.list_selfs(client)
+    for _ in range(8):
+        client.request("GET", USERS)
+    assert len(api.served(USERS)) == 8
+    assert cache.stats.hits == 1 and cache.stats.misses == 1 and cache.stats.hit_ratio == 0.5
+    assert [event.cache for event in events if event.path == USERS] == [None] * 8
+    assert len(cache.store) == 1
+
+
+def test_longest_prefix_sets_the_lifetime(profile):
+    cache = ResponseCache(ttl=None, endpoints={"/v2/access": 60, SELF: 0, "/v2/access/self/notifications": None})
+    assert cache.ttl_for(USERS) == 60
+    assert cache.ttl_for(SELF) == 0
+    assert cache.ttl_for("/v2/access/self/notifications") is None
+    assert cache.ttl_for("/v2/dynamic-rules") is None
+
+
+def test_stale_entry_is_revalidated(api, make_client, profile):
+    cache = ResponseCache(ttl=0.05)
+    client, events = _events(make_client, cache=cache)
+    self_.list_selfs(client)
+    time.sleep(0.1)
+    assert self_.list_selfs(client) == {"id": 1, "name": "Creator"}
+    assert api.served(SELF)[1].headers["if-none-match"] == '"v1"'
+    assert [event.cache for event in events] == ["miss", "revalidated"]
+    assert cache.stats.revalidations == 1
+    # The 304 refreshed the entry
+    self_.list_selfs(client)
+    assert len(api.served(SELF)) == 2 and events[-1].cache == "hit"
+
+
+def test_changed_resource_replaces_the_entry(api, make_client, profile):
+    client = make_client(cache=ResponseCache(ttl=0))
+    self_.list_selfs(client)
+    profile.etag, profile.name = '"v2"', "Renamed"
+    assert self_.list_selfs(client)["name"] == "Renamed"
+    assert self_.list_selfs(client)["name"] == "Renamed"
+    assert [r.headers.get("if-none-match") for r in api.served(SELF)] == [None, '"v1"', '"v2"']
+
+
+def test_zero_ttl_keeps_only_revalidatable_responses(api, make_client, profile):
+    profile.etag = None
+    cache = ResponseCache(ttl=0)
+    client = make_client(cache=cache)
+    self_.list_selfs(client)
+    self_.list_selfs(client)
+    assert len(api.served(SELF)) == 2
+    assert "if-none-match" not in api.served(SELF)[1].headers
+    assert cache.stats.hits == 0
+
+
+def test_invalidate_forces_a_refetch(api, make_client, profile):
+    cache = ResponseCache(ttl=60)
+    client = make_client(cache=cache)
+    client.request("GET", SELF, connection_id="conn_1")
+    client.request("GET", SELF, connection_id="conn_2")
+    assert cache.invalidate(SELF, connection_id="conn_1") == 1
+    client.request("GET", SELF, connection_id="conn_1")
+    client.request("GET", SELF, connection_id="conn_2")
+    assert len(api.served(SELF)) == 3
+    assert cache.invalidate() == 2 and len(cache.store) == 0
+
+
+def test_least_recently_used_entries_are_evicted(api, make_client, profile):
+    cache = ResponseCache(ttl=60, max_entries=2)
+    client = make_client(cache=cache)
+    for query in ({"q": 1}, {"q": 2}, {"q": 1}, {"q": 3}, {"q": 1}, {"q": 2}):
+        client.request("GET", USERS, query=query)
+    assert [r.url.params["q"] for r in api.served(USERS)] == ["1", "2", "3", "2"]
+    assert cache.stats.evictions == 2
+
+
+def test_sqlite_store_survives_restarts(api, make_client, profile, tmp_path):
+    path = tmp_path / "cache.db"
+    self_.list_selfs(make_client(cache=ResponseCache(ttl=60, store=SQLiteCacheStore(path))))
+    cache = ResponseCache(ttl=60, store=SQLiteCacheStore(path))
+    assert self_.list_selfs(make_client(cache=cache)) == {"id": 1, "name": "Creator"}
+    assert len(api.served(SELF)) == 1 and cache.stats.hits == 1
+
+
+def test_async_client_uses_the_cache(api, make_async_client, profile):
+    cache = ResponseCache(ttl=None, endpoints={SELF: 300})
+
+    async def run():
+        async with make_async_client(cache=cache) as client:
+            for _ in range(3):
+                await client.request("GET", SELF)
+                await client.request("GET", USERS)
+
+    asyncio.run(run())
+    assert len(api.served(SELF)) == 1 and len(api.served(USERS)) == 3
+    assert cache.stats.hits == 2 and cache.stats.misses == 1
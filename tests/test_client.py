@@ -0,0 +1,82 @@
+"""
+Client construction: transport and connection-pool options, and ``warm_up``.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from conftest import CHATS
+from onlyfans_sdk import AsyncOFAuthClient, OFAuthClient, messages
+
+
+def _recording(monkeypatch, name):
+    """Replace ``httpx.<name>`` as seen by the clients with a subclass recording its options."""
+    seen = {}
+    base = getattr(httpx, name)
+
+    class Recording(base):
+        def __init__(self, **options):
+            seen.update(options)
+            # Check the options without needing h2 installed
+            super().__init__(**dict(options, http2=False))
+
+    monkeypatch.setattr(f"onlyfans_sdk._client.httpx.{name}", Recording)
+    return seen
+
+
+def test_injected_transport_is_used(api, make_client):
+    client = make_client()
+    messages.list_chats(client, limit=5)
+    assert len(api.served(CHATS)) == 1
+    assert api.served(CHATS)[0].headers["apiKey"] == "test-key"
+
+
+@pytest.mark.parametrize("client_class, name", [(OFAuthClient, "Client"), (AsyncOFAuthClient, "AsyncClient")])
+def test_pool_options_reach_httpx(monkeypatch, client_class, name):
+    seen = _recording(monkeypatch, name)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    client_class(
+        api_key="test-key",
+        timeout=12.0,
+        max_connections=50,
+        max_keepalive_connections=10,
+        keepalive_expiry=2.5,
+        http2=True,
+        transport=transport,
+    )
+    assert seen["http2"] is True and seen["transport"] is transport
+    assert seen["limits"] == httpx.Limits(max_connections=50, max_keepalive_connections=10, keepalive_expiry=2.5)
+    assert seen["timeout"] == 12.0
+
+
+def test_default_pool_options(monkeypatch):
+    seen = _recording(monkeypatch, "Client")
+    OFAuthClient(api_key="test-key")
+    assert seen["http2"] is False and seen["transport"] is None
+    assert seen["limits"] == httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+
+@pytest.mark.parametrize("connections", [0, -1, 1, 4])
+def test_warm_up_returns_completed_requests(api, make_client, connections):
+    assert make_client().warm_up(connections) == max(0, connections)
+    assert [r.method for r in api.requests] == ["HEAD"] * max(0, connections)
+
+
+@pytest.mark.parametrize("connections", [0, -1, 1, 4])
+def test_async_warm_up_returns_completed_requests(api, make_async_client, connections):
+    async def run():
+        async with make_async_client() as client:
+            return await client.warm_up(connections)
+
+    assert asyncio.run(run()) == max(0, connections)
+    assert [r.method for r in api.requests] == ["HEAD"] * max(0, connections)
+
+
+def test_warm_up_raises_transport_errors():
+    def refuse(request):
+        raise httpx.ConnectError("refused")
+
+    with OFAuthClient(api_key="test-key", transport=httpx.MockTransport(refuse)) as client:
+        with pytest.raises(httpx.ConnectError):
+            client.warm_up(2)
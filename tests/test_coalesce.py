@@ -0,0 +1,140 @@
+"""
+``coalesce=True``: identical concurrent GETs share one request, on both clients.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from onlyfans_sdk import OFAuthError
+
+PATH = "/v2/access/users/42"
+
+
+class Slow:
+    """Answers after ``delay`` seconds, counting the calls that reached it."""
+
+    def __init__(self, delay: float = 0.2, status: int = 200) -> None:
+        self.delay = delay
+        self.status = status
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _answer(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+        if self.status != 200:
+            return httpx.Response(self.status, json={"message": "unavailable"})
+        return httpx.Response(200, json={"query": dict(request.url.params)})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        return self._answer(request)
+
+
+class AsyncSlow(Slow):
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.delay)
+        return self._answer(request)
+
+
+def _together(calls):
+    """Run the callables at once on their own threads; results or exceptions, in order."""
+    barrier = threading.Barrier(len(calls))
+
+    def run(call):
+        barrier.wait()
+        try:
+            return call()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(len(calls)) as pool:
+        return list(pool.map(run, calls))
+
+
+@pytest.fixture
+def slow(api):
+    api.routes[PATH] = handler = Slow()
+    return handler
+
+
+def test_identical_gets_share_one_request(make_client, slow):
+    client = make_client(coalesce=True)
+    results = _together([lambda: client.request("GET", PATH)] * 8)
+    assert slow.calls == 1
+    assert results == [{"query": {}}] * 8
+
+
+def test_finished_calls_are_not_reused(make_client, slow):
+    slow.delay = 0
+    client = make_client(coalesce=True)
+    client.request("GET", PATH)
+    client.request("GET", PATH)
+    assert slow.calls == 2
+
+
+def test_different_queries_and_connections_are_separate(make_client, slow):
+    client = make_client(coalesce=True)
+    _together(
+        [
+            lambda: client.request("GET", PATH, query={"a": 1}),
+            lambda: client.request("GET", PATH, query={"a": 1, "b": None}),
+            lambda: client.request("GET", PATH, query={"a": 2}),
+            lambda: client.request("GET", PATH, connection_id="conn_1"),
+            lambda: client.request("GET", PATH, connection_id="conn_2"),
+        ]
+    )
+    assert slow.calls == 4
+
+
+def test_writes_are_not_coalesced(make_client, slow):
+    client = make_client(coalesce=True)
+    _together([lambda: client.request("POST", PATH, body={})] * 4)
+    assert slow.calls == 4
+
+
+def test_without_coalesce_every_call_goes_out(make_client, slow):
+    client = make_client()
+    _together([lambda: client.request("GET", PATH)] * 4)
+    assert slow.calls == 4
+
+
+def test_errors_are_shared(make_client, slow):
+    slow.status = 503
+    client = make_client(coalesce=True)
+    results = _together([lambda: client.request("GET", PATH)] * 4)
+    assert slow.calls == 1
+    assert all(isinstance(result, OFAuthError) for result in results)
+
+
+def test_async_identical_gets_share_one_request(api, make_async_client):
+    api.routes[PATH] = handler = AsyncSlow()
+
+    async def run():
+        async with make_async_client(coalesce=True) as client:
+            same = await asyncio.gather(*(client.request("GET", PATH) for _ in range(8)))
+            other = await client.request("GET", PATH, query={"a": 1})
+            return same, other
+
+    same, other = asyncio.run(run())
+    assert same == [{"query": {}}] * 8 and other == {"query": {"a": "1"}}
+    assert handler.calls == 2
+
+
+def test_async_cancelled_waiter_does_not_cancel_the_others(api, make_async_client):
+    api.routes[PATH] = handler = AsyncSlow()
+
+    async def run():
+        async with make_async_client(coalesce=True) as client:
+            first = asyncio.ensure_future(client.request("GET", PATH))
+            second = asyncio.ensure_future(client.request("GET", PATH))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            return await second, first.cancelled()
+
+    assert asyncio.run(run()) == ({"query": {}}, True)
+    assert handler.calls == 1
@@ -0,0 +1,76 @@
+"""
+JSON codecs: every backend round-trips like the standard library, including
+the inputs orjson and msgspec hand back to it.
+"""
+import json
+
+import pytest
+
+from conftest import chat, transaction
+from onlyfans_sdk.codec import (
+    JSONCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibCodec,
+    default_codec,
+    encode_body,
+)
+
+
+def _available():
+    codecs = [StdlibCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+CODECS = _available()
+BIG = 123456789012345678901234567890
+
+
+@pytest.fixture(params=CODECS, ids=lambda codec: codec.name)
+def codec(request) -> JSONCodec:
+    return request.param
+
+
+def test_default_codec_is_the_fastest_installed():
+    fastest = CODECS[1] if len(CODECS) > 1 else CODECS[0]
+    assert default_codec().name == fastest.name
+
+
+def test_round_trip(codec):
+    body = {"list": [chat(1), transaction(2)], "hasMore": True, "text": "héllo ✓", "none": None}
+    encoded = codec.encode(body)
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == body == json.loads(encoded)
+
+
+def test_non_string_keys_are_encoded_as_strings(codec):
+    assert json.loads(encode_body({1: "a", 2.5: "b", None: "c"}, codec)) == {"1": "a", "2.5": "b", "null": "c"}
+
+
+def test_integers_beyond_64_bits(codec):
+    assert codec.decode(codec.encode({"n": BIG, "m": -BIG})) == {"n": BIG, "m": -BIG}
+    assert codec.decode(f'[{BIG}, 1.5, 18446744073709551615]'.encode()) == [BIG, 1.5, 2 ** 64 - 1]
+
+
+def test_long_digit_runs_in_strings_decode_unchanged(codec):
+    data = b'{"id": "12345678901234567890123", "n": 1}'
+    assert codec.decode(data) == {"id": "12345678901234567890123", "n": 1}
+
+
+def test_byte_order_mark_is_accepted(codec):
+    assert codec.decode(b'\xef\xbb\xbf{"a": 1}') == {"a": 1}
+
+
+def test_invalid_json_still_raises(codec):
+    with pytest.raises(ValueError):
+        codec.decode(b'{"a": ')
+
+
+def test_unserializable_values_still_raise(codec):
+    with pytest.raises(TypeError):
+        codec.encode({"a": object()})
@@ -0,0 +1,64 @@
+"""
+Endpoint labels reported to ``on_request``.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from conftest import CHATS
+from onlyfans_sdk import messages
+from onlyfans_sdk.metrics import MetricsAggregator
+
+
+@pytest.fixture
+def echo(api):
+    api.routes.update(
+        {
+            path: lambda request: httpx.Response(200, json={})
+            for path in (
+                "/v2/access/proxy/users/me",
+                "/v2/access/proxy/users/someone",
+                "/v2/access/proxy/users/other_fan/posts",
+                "/v2/access/proxy/subscriptions",
+                "/v2/access/users/12345",
+            )
+        }
+    )
+
+
+def test_proxy_calls_share_one_label_per_resource(make_client, echo):
+    metrics = MetricsAggregator()
+    client = make_client(on_request=metrics)
+    for path in ("/users/me", "/users/someone", "/api2/v2/users/other_fan/posts"):
+        client.proxy(path, connection_id="conn_1")
+    client.proxy("/subscriptions", connection_id="conn_1")
+    endpoints = sorted(endpoint for _, endpoint, _ in metrics.slowest_endpoints(10))
+    assert endpoints == ["/v2/access/proxy/subscriptions", "/v2/access/proxy/users/*"]
+
+
+def test_proxy_endpoint_can_be_given(make_client, echo):
+    events = []
+    client = make_client(on_request=events.append)
+    client.proxy("/users/someone", endpoint="/v2/access/proxy/users/{username}")
+    assert events[0].endpoint == "/v2/access/proxy/users/{username}"
+    assert events[0].path == "/v2/access/proxy/users/someone"
+
+
+def test_request_replaces_ids_and_typed_calls_use_their_template(make_client, echo):
+    events = []
+    client = make_client(on_request=events.append)
+    client.request("GET", "/v2/access/users/12345")
+    messages.list_chats(client)
+    assert [event.endpoint for event in events] == ["/v2/access/users/{id}", CHATS]
+
+
+def test_async_proxy_label(make_async_client, echo):
+    events = []
+
+    async def run():
+        async with make_async_client(on_request=events.append) as client:
+            await client.proxy("/users/someone")
+
+    asyncio.run(run())
+    assert events[0].endpoint == "/v2/access/proxy/users/*"
@@ -0,0 +1,144 @@
+"""
+The middleware pipeline: layer order, what caller middleware sees, and
+``ahandle`` on the async client.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from onlyfans_sdk import Middleware, RateLimit, RateLimiter, ResponseCache, RetryPolicy
+from onlyfans_sdk.metrics import InstrumentationMiddleware
+from onlyfans_sdk.middleware import (
+    CacheMiddleware,
+    CoalesceMiddleware,
+    RateLimitMiddleware,
+    Response,
+    RetryMiddleware,
+    default_middleware,
+)
+
+SELF = "/v2/access/self"
+
+
+class Probe(Middleware):
+    """Records each call it handles: which hook ran, and the context around ``call_next``."""
+
+    def __init__(self):
+        self.calls = []
+
+    def handle(self, request, call_next):
+        before = dict(request.context)
+        response = call_next(request)
+        self.calls.append(("handle", request.method, request.endpoint, before, dict(request.context)))
+        return response
+
+    async def ahandle(self, request, call_next):
+        before = dict(request.context)
+        response = await call_next(request)
+        self.calls.append(("ahandle", request.method, request.endpoint, before, dict(request.context)))
+        return response
+
+
+def uploads(request: httpx.Request) -> httpx.Response:
+    """Two-part upload endpoints."""
+    path = request.url.path
+    if path.endswith("/init"):
+        size = json.loads(request.content)["filesize"]
+        headers = {"x-ofauth-upload-total-parts": "2", "x-ofauth-upload-part-size": str(-(-size // 2))}
+        return httpx.Response(200, json={"mediaUploadId": "upl_1"}, headers=headers)
+    return httpx.Response(200, json={"mediaId": 42})
+
+
+@pytest.fixture
+def routes(api):
+    statuses = [503]
+    api.routes[SELF] = lambda request: httpx.Response(statuses.pop() if statuses else 200, json={"id": 1})
+    api.routes["/v2/access/proxy/users/me"] = lambda request: httpx.Response(200, json={"id": 1})
+    for path in ("/v2/access/uploads/init", "/v2/access/uploads/upl_1/parts/1",
+                 "/v2/access/uploads/upl_1/parts/2", "/v2/access/uploads/complete"):
+        api.routes[path] = uploads
+    return api
+
+
+def _options(probe, events):
+    return dict(
+        middleware=[probe],
+        on_request=events.append,
+        coalesce=True,
+        cache=ResponseCache(ttl=60),
+        retry=RetryPolicy(backoff_factor=0),
+        rate_limiter=RateLimiter(per_api_key=RateLimit(1000)),
+    )
+
+
+def test_layer_order(make_client):
+    probe = Probe()
+    client = make_client(**_options(probe, []))
+    assert [type(layer) for layer in client.middleware] == [
+        InstrumentationMiddleware,
+        Probe,
+        CoalesceMiddleware,
+        CacheMiddleware,
+        RetryMiddleware,
+        RateLimitMiddleware,
+    ]
+    assert client.middleware[1] is probe
+
+
+def test_default_middleware_only_adds_configured_layers():
+    assert default_middleware() == []
+    layers = default_middleware(retry=RetryPolicy(), cache=ResponseCache())
+    assert [type(layer) for layer in layers] == [CacheMiddleware, RetryMiddleware]
+
+
+def test_caller_middleware_sees_every_call(routes, make_client):
+    probe = Probe()
+    events = []
+    client = make_client(**_options(probe, events))
+    client.request("GET", SELF)
+    client.request("GET", SELF)
+    client.proxy("/users/me")
+    client.upload_media("conn_1", "a.jpg", b"0123456789", "image/jpeg")
+
+    assert [(hook, method, endpoint) for hook, method, endpoint, _, _ in probe.calls] == [
+        ("handle", "GET", SELF),
+        ("handle", "GET", SELF),
+        ("handle", "GET", "/v2/access/proxy/users/*"),
+        ("handle", "POST", "/v2/access/uploads/init"),
+        ("handle", "PUT", "/v2/access/uploads/{media_upload_id}/parts/{part_number}"),
+        ("handle", "PUT", "/v2/access/uploads/{media_upload_id}/parts/{part_number}"),
+        ("handle", "POST", "/v2/access/uploads/complete"),
+    ]
+    # Instrumentation wraps the probe; cache, retries and throttling run inside it
+    _, _, _, before, after = probe.calls[0]
+    assert "timings" in before and "cache" not in before
+    assert after["cache"] == "miss" and after["retries"] == 1 and "throttle" in after
+    assert probe.calls[1][4]["cache"] == "hit" and "throttle" not in probe.calls[1][4]
+    assert len(events) == len(probe.calls)
+    assert len(routes.served(SELF)) == 2
+
+
+def test_middleware_can_answer_without_the_network(api, make_client):
+    class Canned(Middleware):
+        def handle(self, request, call_next):
+            return Response(200, data={"canned": True}, request=request)
+
+    assert make_client(middleware=[Canned()]).request("GET", SELF) == {"canned": True}
+    assert api.requests == []
+
+
+def test_async_client_uses_ahandle(routes, make_async_client):
+    probe = Probe()
+    events = []
+
+    async def run():
+        async with make_async_client(**_options(probe, events)) as client:
+            await client.request("GET", SELF)
+            await client.proxy("/users/me")
+            await client.upload_media("conn_1", "a.jpg", b"0123456789", "image/jpeg")
+
+    asyncio.run(run())
+    assert [hook for hook, *_ in probe.calls] == ["ahandle"] * 6
+    assert probe.calls[0][4]["retries"] == 1 and len(events) == 6
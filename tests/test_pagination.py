@@ -0,0 +1,286 @@
+"""
+Pagination engine: strategies, prefetch, parallel fan-out, checkpoints and
+adaptive page sizes, on both clients, against ``FakeAPI``.
+"""
+import asyncio
+
+import pytest
+
+from conftest import CHATS, TRACKING_LINKS, TRANSACTIONS, VAULT_LIST, FakeAPI
+from onlyfans_sdk import OFAuthError, earnings, messages, promotions, vault_media
+from onlyfans_sdk.pagination import PaginationState
+
+
+def _chat_ids(items):
+    return [item["withUser"]["id"] - 100000 for item in items]
+
+
+async def _collect(paginator):
+    return [item async for item in paginator]
+
+
+# ============================================================================
+# Strategies
+# ============================================================================
+
+
+def test_offset_walks_every_page(api, make_client):
+    items = list(messages.iter_chats(make_client(), page_size=25))
+    assert _chat_ids(items) == list(range(60))
+    offsets = [int(r.url.params["offset"]) for r in api.served(CHATS)]
+    assert offsets == [0, 25, 50]
+
+
+def test_offset_without_next_offset_counts_items(api, make_client):
+    items = list(promotions.iter_tracking_links(make_client(), page_size=20))
+    assert [item["id"] for item in items] == [700000 + i for i in range(60)]
+    assert [r.url.params["offset"] for r in api.served(TRACKING_LINKS)] == ["0", "20", "40"]
+
+
+def test_marker_follows_next_marker(api, make_client):
+    items = list(earnings.iter_transactions(make_client()))
+    assert [item["id"] for item in items] == [f"tx_{i:08d}" for i in range(60)]
+    markers = [r.url.params.get("marker") for r in api.served(TRANSACTIONS)]
+    assert markers == [None] + [str(FakeAPI.MARKER_BASE + n) for n in range(10, 60, 10)]
+
+
+def test_cursor_stops_at_null_cursor(api, make_client):
+    items = list(vault_media.iter_v2_vault_plus_lists(make_client(), "conn_1", page_size=30))
+    assert [item["id"] for item in items] == [f"media_{i:04d}" for i in range(60)]
+    assert [r.url.params.get("cursor") for r in api.served(VAULT_LIST)] == [None, "30"]
+
+
+def test_max_items_trims_the_last_request(api, make_client):
+    items = list(messages.iter_chats(make_client(), page_size=20, max_items=45))
+    assert _chat_ids(items) == list(range(45))
+    assert [r.url.params["limit"] for r in api.served(CHATS)] == ["20", "20", "5"]
+
+
+def test_pages_yields_whole_batches(make_client):
+    pages = list(messages.iter_chats(make_client(), page_size=25).pages())
+    assert [len(page) for page in pages] == [25, 25, 10]
+    assert [page.token for page in pages] == [0, 25, 50]
+    assert [page.has_more for page in pages] == [True, True, False]
+    assert pages[0].next_offset == 25 and pages[0].next_marker is None
+
+
+def test_filters_are_sent_on_every_page(api, make_client):
+    list(messages.iter_chats(make_client(), order="recent", filter="unread"))
+    assert all(r.url.params["order"] == "recent" for r in api.served(CHATS))
+    assert all(r.url.params["filter"] == "unread" for r in api.served(CHATS))
+
+
+def test_async_strategies(make_async_client):
+    async def crawl():
+        async with make_async_client() as client:
+            chats = await _collect(messages.aiter_chats(client, page_size=25))
+            transactions = await _collect(earnings.aiter_transactions(client))
+            media = await _collect(vault_media.aiter_v2_vault_plus_lists(client, "conn_1"))
+            return chats, transactions, media
+
+    chats, transactions, media = asyncio.run(crawl())
+    assert _chat_ids(chats) == list(range(60))
+    assert len(transactions) == 60 and len(media) == 60
+
+
+def test_sync_iteration_of_async_client_raises(make_async_client):
+    client = make_async_client()
+    with pytest.raises(TypeError, match="async for"):
+        next(messages.iter_chats(client))
+
+
+# ============================================================================
+# Prefetch
+# ============================================================================
+
+
+def test_prefetch_yields_the_same_items(make_client):
+    items = list(messages.iter_chats(make_client(), page_size=10, prefetch=2))
+    assert _chat_ids(items) == list(range(60))
+
+
+def test_prefetch_stops_when_closed_early(api, make_client):
+    crawl = messages.iter_chats(make_client(), page_size=10, prefetch=1)
+    assert _chat_ids([next(crawl) for _ in range(5)]) == list(range(5))
+    crawl.close()
+    served = len(api.served(CHATS))
+    # At most the consumed page, the one in the buffer and one in hand
+    assert served <= 3
+
+
+def test_prefetch_reraises_errors(api, make_client):
+    api.reject_above = 5
+    with pytest.raises(OFAuthError, match="limit too large"):
+        list(messages.iter_chats(make_client(), page_size=10, prefetch=2))
+
+
+def test_async_prefetch(make_async_client):
+    async def crawl():
+        async with make_async_client() as client:
+            return await _collect(messages.aiter_chats(client, page_size=10, prefetch=2))
+
+    assert _chat_ids(asyncio.run(crawl())) == list(range(60))
+
+
+# ============================================================================
+# Parallel fan-out
+# ============================================================================
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parallel_fetches_every_offset(api, make_client, ordered):
+    items = list(messages.iter_chats(make_client(), page_size=10, total=60, workers=4, ordered=ordered))
+    ids = _chat_ids(items)
+    assert sorted(ids) == list(range(60))
+    if ordered:
+        assert ids == list(range(60))
+    assert sorted(int(r.url.params["offset"]) for r in api.served(CHATS)) == list(range(0, 60, 10))
+
+
+def test_parallel_walks_past_a_stale_total(make_client):
+    items = list(messages.iter_chats(make_client(), page_size=10, total=35, workers=3))
+    assert _chat_ids(items) == list(range(60))
+
+
+def test_parallel_tops_up_truncated_pages(api, make_client):
+    api.max_limit = 7
+    items = list(messages.iter_chats(make_client(), page_size=20, total=60, workers=3))
+    assert _chat_ids(items) == list(range(60))
+
+
+def test_parallel_respects_max_items(make_client):
+    items = list(messages.iter_chats(make_client(), page_size=10, total=60, max_items=25))
+    assert _chat_ids(items) == list(range(25))
+
+
+def test_parallel_drops_boundary_duplicates(api, make_client):
+    api.created = 1
+    items = list(promotions.iter_tracking_links(make_client(), page_size=20, total=60, workers=3))
+    ids = [item["id"] for item in items]
+    assert len(ids) == len(set(ids)) == 60
+
+
+def test_parallel_requires_offset_strategy(make_client):
+    with pytest.raises(ValueError, match="offset"):
+        earnings.iter_transactions(make_client(), total=60)
+
+
+def test_async_parallel(make_async_client):
+    async def crawl():
+        async with make_async_client() as client:
+            return await _collect(messages.aiter_chats(client, page_size=10, total=60, workers=4))
+
+    assert _chat_ids(asyncio.run(crawl())) == list(range(60))
+
+
+# ============================================================================
+# Checkpoints
+# ============================================================================
+
+
+def test_resume_inside_a_page(api, make_client):
+    client = make_client()
+    crawl = messages.iter_chats(client, page_size=20)
+    first = [next(crawl) for _ in range(25)]
+    saved = crawl.state.to_dict()
+    assert saved["token"] == 20 and saved["skip"] == 5 and saved["fetched"] == 25
+
+    rest = list(messages.iter_chats(client, page_size=20, state=PaginationState.from_dict(saved)))
+    assert _chat_ids(first + rest) == list(range(60))
+
+
+def test_resume_after_pages(make_client):
+    client = make_client()
+    crawl = messages.iter_chats(client, page_size=20, max_items=40)
+    assert [page.token for page in crawl.pages()] == [0, 20]
+    state = crawl.state
+    assert state.token == 40 and state.skip == 0 and state.fetched == 40 and not state.done
+
+    rest = list(messages.iter_chats(client, page_size=20, state=state))
+    assert _chat_ids(rest) == list(range(40, 60))
+
+
+def test_resume_finished_crawl_yields_nothing(make_client):
+    client = make_client()
+    crawl = messages.iter_chats(client)
+    list(crawl)
+    assert crawl.state.done
+    assert list(messages.iter_chats(client, state=crawl.state)) == []
+
+
+def test_resume_parallel_crawl(make_client):
+    client = make_client()
+    crawl = messages.iter_chats(client, page_size=10, total=60)
+    head = [next(crawl) for _ in range(10)]
+    crawl.close()
+    rest = list(messages.iter_chats(client, page_size=10, total=60, state=crawl.state))
+    assert _chat_ids(head + rest) == list(range(60))
+
+
+def test_unordered_parallel_crawl_has_no_state(make_client):
+    crawl = messages.iter_chats(make_client(), page_size=10, total=60, ordered=False)
+    next(crawl)
+    with pytest.raises(ValueError, match="ordered=True"):
+        crawl.state
+    crawl.close()
+
+
+def test_resume_rejects_other_filters(make_client):
+    client = make_client()
+    crawl = messages.iter_chats(client, order="recent")
+    next(crawl)
+    with pytest.raises(ValueError, match="pagination state"):
+        messages.iter_chats(client, order="old", state=crawl.state)
+
+
+def test_async_resume(make_async_client):
+    async def crawl():
+        async with make_async_client() as client:
+            first = messages.aiter_chats(client, page_size=20)
+            head = [await first.__anext__() for _ in range(25)]
+            await first.aclose()
+            rest = await _collect(messages.aiter_chats(client, page_size=20, state=first.state))
+            return head + rest
+
+    assert _chat_ids(asyncio.run(crawl())) == list(range(60))
+
+
+# ============================================================================
+# Adaptive page sizes
+# ============================================================================
+
+
+def test_adaptive_grows_page_size(api, make_client):
+    items = list(messages.iter_chats(make_client(), page_size=5, adaptive=True, max_page_size=40))
+    assert _chat_ids(items) == list(range(60))
+    assert [r.url.params["limit"] for r in api.served(CHATS)] == ["5", "10", "20", "40"]
+
+
+def test_adaptive_caps_at_truncated_size(api, make_client):
+    api.max_limit = 12
+    items = list(messages.iter_chats(make_client(), page_size=5, adaptive=True, max_page_size=100))
+    assert _chat_ids(items) == list(range(60))
+    limits = [int(r.url.params["limit"]) for r in api.served(CHATS)]
+    assert limits[:4] == [5, 10, 20, 12]
+    assert set(limits[4:]) == {12}
+
+
+def test_adaptive_halves_rejected_size(api, make_client):
+    api.reject_above = 15
+    items = list(messages.iter_chats(make_client(), page_size=5, adaptive=True, max_page_size=100))
+    assert _chat_ids(items) == list(range(60))
+    limits = [int(r.url.params["limit"]) for r in api.served(CHATS)]
+    assert limits[:4] == [5, 10, 20, 10]
+    assert max(limits[4:]) <= 10
+
+
+def test_adaptive_size_is_remembered_per_client(api, make_client):
+    client = make_client()
+    list(messages.iter_chats(client, page_size=5, adaptive=True, max_page_size=40))
+    api.requests.clear()
+    # The last page (25 of 40 at offset 35) was short, so 20 is the largest full page seen
+    list(messages.iter_chats(client, page_size=5, adaptive=True, max_page_size=40))
+    assert api.served(CHATS)[0].url.params["limit"] == "20"
+    api.requests.clear()
+    list(messages.iter_chats(make_client(), page_size=5, adaptive=True, max_page_size=40))
+    assert api.served(CHATS)[0].url.params["limit"] == "5"
@@ -0,0 +1,121 @@
+"""
+Token buckets: burst, refill, scopes and endpoint families, shared stores,
+and how the client spends tokens.
+"""
+import httpx
+import pytest
+
+from onlyfans_sdk import RateLimit, RateLimiter, RetryPolicy
+from onlyfans_sdk.ratelimit import MemoryBucketStore, SQLiteBucketStore
+
+MESSAGES = "/v2/access/messages"
+
+
+def _waits(limiter, count, now=0.0, api_key="key", connection_id=None, path="/v2/access/self"):
+    return [limiter.reserve(api_key, connection_id, path, now=now) for _ in range(count)]
+
+
+def test_rate_limit_validation():
+    assert RateLimit(4).burst == 4 and RateLimit(0.5).burst == 1
+    assert RateLimit.per_minute(60).rate == 1
+    with pytest.raises(ValueError, match="rate"):
+        RateLimit(0)
+
+
+def test_burst_then_paced():
+    limiter = RateLimiter(per_api_key=RateLimit(4, burst=1))
+    assert _waits(limiter, 5) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def test_burst_is_spent_back_to_back():
+    limiter = RateLimiter(per_api_key=RateLimit(2, burst=3))
+    assert _waits(limiter, 4) == [0.0, 0.0, 0.0, 0.5]
+
+
+def test_tokens_refill_up_to_the_burst():
+    limiter = RateLimiter(per_api_key=RateLimit(2, burst=2))
+    assert _waits(limiter, 2, now=0.0) == [0.0, 0.0]
+    assert _waits(limiter, 2, now=0.5) == [0.0, 0.5]
+    # A long idle period refills only ``burst`` tokens
+    assert _waits(limiter, 3, now=100.0) == [0.0, 0.0, 0.5]
+
+
+def test_per_api_key_is_shared_across_connections():
+    limiter = RateLimiter(per_api_key=RateLimit(1, burst=1))
+    assert limiter.reserve("key", "conn_1", MESSAGES, now=0) == 0
+    assert limiter.reserve("key", "conn_2", MESSAGES, now=0) == 1
+    assert limiter.reserve("other", "conn_1", MESSAGES, now=0) == 0
+
+
+def test_per_connection_is_separate_per_connection():
+    limiter = RateLimiter(per_connection=RateLimit(1, burst=1))
+    assert limiter.reserve("key", "conn_1", MESSAGES, now=0) == 0
+    assert limiter.reserve("key", "conn_2", MESSAGES, now=0) == 0
+    assert limiter.reserve("key", "conn_1", MESSAGES, now=0) == 1
+    # Requests without a connection are not limited per connection
+    assert _waits(limiter, 3) == [0.0, 0.0, 0.0]
+
+
+def test_longest_endpoint_prefix_applies():
+    limiter = RateLimiter(
+        endpoints={"/v2/access": RateLimit(10, burst=1), MESSAGES: RateLimit(1, burst=1)}
+    )
+    assert _waits(limiter, 2, path=f"{MESSAGES}/123") == [0.0, 1.0]
+    assert _waits(limiter, 2, path="/v2/access/self") == [0.0, 0.1]
+    assert _waits(limiter, 2, path="/v2/account/connections") == [0.0, 0.0]
+
+
+def test_endpoint_families_count_per_connection_or_per_key():
+    limiter = RateLimiter(endpoints={MESSAGES: RateLimit(1, burst=1)})
+    assert limiter.reserve("key", "conn_1", MESSAGES, now=0) == 0
+    assert limiter.reserve("key", "conn_2", MESSAGES, now=0) == 0
+    assert limiter.reserve("key", None, MESSAGES, now=0) == 0
+    assert limiter.reserve("other", None, MESSAGES, now=0) == 0
+    assert limiter.reserve("key", None, MESSAGES, now=0) == 1
+
+
+def test_longest_wait_of_all_buckets_is_returned():
+    limiter = RateLimiter(
+        per_api_key=RateLimit(4, burst=1),
+        per_connection=RateLimit(1, burst=1),
+        endpoints={MESSAGES: RateLimit(2, burst=1)},
+    )
+    assert limiter.reserve("key", "conn_1", MESSAGES, now=0) == 0
+    assert limiter.reserve("key", "conn_1", MESSAGES, now=0) == 1
+
+
+def test_sqlite_stores_on_one_file_share_a_bucket(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    first = RateLimiter(per_api_key=RateLimit(1, burst=2), store=SQLiteBucketStore(path))
+    second = RateLimiter(per_api_key=RateLimit(1, burst=2), store=SQLiteBucketStore(path))
+    assert _waits(first, 1) == [0.0]
+    assert _waits(second, 1) == [0.0]
+    assert _waits(first, 1) == [1.0]
+    assert _waits(second, 1, now=1.0) == [1.0]
+
+
+def test_sqlite_keys_do_not_contain_the_api_key(tmp_path):
+    store = SQLiteBucketStore(str(tmp_path / "buckets.db"))
+    RateLimiter(per_api_key=RateLimit(1), store=store).reserve("secret-api-key", None, MESSAGES, now=0)
+    keys = [row[0] for row in store._connect().execute("SELECT key FROM ofauth_buckets")]
+    assert len(keys) == 1 and "secret-api-key" not in keys[0]
+
+
+class CountingStore(MemoryBucketStore):
+    def __init__(self):
+        super().__init__()
+        self.reserved = []
+
+    def reserve(self, key, limit, now):
+        self.reserved.append(key)
+        return super().reserve(key, limit, now)
+
+
+def test_each_retry_attempt_takes_a_token(api, make_client):
+    statuses = [503, 200]
+    api.routes["/v2/access/self"] = lambda request: httpx.Response(statuses.pop(0), json={})
+    store = CountingStore()
+    limiter = RateLimiter(per_api_key=RateLimit(1000), store=store)
+    client = make_client(rate_limiter=limiter, retry=RetryPolicy(backoff_factor=0))
+    client.request("GET", "/v2/access/self")
+    assert len(store.reserved) == 2
@@ -0,0 +1,89 @@
+"""
+Request bodies on the wire: pydantic models, aliases, dicts and lists.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from onlyfans_sdk import dynamic_rules, messages
+from onlyfans_sdk.codec import _DUMPERS, StdlibCodec, encode_body
+from onlyfans_sdk.models import V2AccessMassMessagesPostRequest, V2DynamicRulesSignPostRequest
+
+MASS_MESSAGES = "/v2/access/mass-messages"
+SIGN = "/v2/dynamic-rules/sign"
+
+
+@pytest.fixture
+def sent(api):
+    """Bodies received per path, as bytes."""
+    bodies = {}
+
+    def record(request: httpx.Request) -> httpx.Response:
+        bodies.setdefault(request.url.path, []).append(request.content)
+        return httpx.Response(200, json={"id": 1, "date": "2024-05-01", "signed": None})
+
+    api.routes.update({MASS_MESSAGES: record, SIGN: record, "/v2/access/echo": record})
+    return bodies
+
+
+def test_model_body_is_sent_as_json(make_client, sent):
+    body = V2AccessMassMessagesPostRequest(text="Hello!", userIds=[1, 2], price=5)
+    messages.create_mass_messages(make_client(), body)
+    [content] = sent[MASS_MESSAGES]
+    assert json.loads(content) == json.loads(body.model_dump_json(by_alias=True, exclude_none=True))
+    assert json.loads(content)["userIds"] == [1, 2]
+
+
+def test_none_fields_are_left_out(make_client, sent):
+    messages.create_mass_messages(make_client(), V2AccessMassMessagesPostRequest(text="Hi"))
+    sent_body = json.loads(sent[MASS_MESSAGES][0])
+    assert "scheduledDate" not in sent_body and "releaseForms" not in sent_body
+    assert sent_body["text"] == "Hi"
+
+
+def test_aliased_fields_use_their_alias(make_client, sent):
+    body = V2DynamicRulesSignPostRequest.model_validate({"endpoint": "/users/me", "user-id": "42"})
+    dynamic_rules.create_v2_dynamic_rules_sign(make_client(), body)
+    assert json.loads(sent[SIGN][0]) == {"endpoint": "/users/me", "user-id": "42"}
+
+
+def test_dict_bodies_are_passed_through(make_client, sent):
+    body = {"text": "Hi", "scheduledDate": None, "user-id": 7, "nested": {"a": [1, 2]}}
+    make_client(codec=StdlibCodec()).request("POST", "/v2/access/echo", body=body)
+    assert sent["/v2/access/echo"][0] == StdlibCodec().encode(body)
+    assert json.loads(sent["/v2/access/echo"][0]) == body
+
+
+def test_list_of_models(make_client, sent):
+    bodies = [
+        V2DynamicRulesSignPostRequest.model_validate({"endpoint": "/a", "user-id": "1"}),
+        V2DynamicRulesSignPostRequest(endpoint="/b"),
+    ]
+    make_client().request("POST", "/v2/access/echo", body=bodies)
+    assert json.loads(sent["/v2/access/echo"][0]) == [{"endpoint": "/a", "user-id": "1"}, {"endpoint": "/b"}]
+    assert json.loads(encode_body([], StdlibCodec())) == []
+    assert json.loads(encode_body([{"a": 1}, bodies[1]], StdlibCodec())) == [{"a": 1}, {"endpoint": "/b"}]
+
+
+def test_dumpers_are_cached_per_class():
+    _DUMPERS.clear()
+    codec = StdlibCodec()
+    encode_body(V2DynamicRulesSignPostRequest(endpoint="/a"), codec)
+    dump = _DUMPERS[V2DynamicRulesSignPostRequest]
+    encode_body(V2DynamicRulesSignPostRequest(endpoint="/b"), codec)
+    assert _DUMPERS[V2DynamicRulesSignPostRequest] is dump
+    encode_body({"a": 1}, codec)
+    assert list(_DUMPERS) == [V2DynamicRulesSignPostRequest]
+    encode_body("text", codec)
+    assert _DUMPERS[str] is None
+
+
+def test_async_client_sends_models(make_async_client, sent):
+    async def run():
+        async with make_async_client() as client:
+            await dynamic_rules.create_v2_dynamic_rules_sign(client, V2DynamicRulesSignPostRequest(endpoint="/x"))
+
+    asyncio.run(run())
+    assert json.loads(sent[SIGN][0]) == {"endpoint": "/x"}
@@ -0,0 +1,67 @@
+"""
+Typed ``response_mode``s through the pagination engine.
+"""
+import httpx
+import pytest
+
+from conftest import CHATS, TRANSACTIONS, FakeAPI
+from onlyfans_sdk import earnings, messages, models, promotions
+
+MODES = ("raw", "validated", "trusted", "lazy")
+
+
+def _field(item, *path):
+    for key in path:
+        item = item[key] if isinstance(item, dict) else getattr(item, key)
+    return item
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_offset_tokens_stay_integers(api, make_client, mode):
+    crawl = messages.iter_chats(make_client(response_mode=mode), page_size=20, max_items=40)
+    items = list(crawl)
+    assert [_field(item, "withUser", "id") for item in items] == [100000 + i for i in range(40)]
+    assert [r.url.params["offset"] for r in api.served(CHATS)] == ["0", "20"]
+    state = crawl.state
+    assert state.token == 40 and type(state.token) is int
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_marker_tokens_stay_integers(api, make_client, mode):
+    items = list(earnings.iter_transactions(make_client(response_mode=mode), max_items=20))
+    assert len(items) == 20
+    markers = [r.url.params.get("marker") for r in api.served(TRANSACTIONS)]
+    assert markers == [None, str(FakeAPI.MARKER_BASE + 10)]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_parallel_crawl_resumes_from_typed_state(make_client, mode):
+    client = make_client(response_mode=mode)
+    crawl = messages.iter_chats(client, page_size=10, max_items=30)
+    list(crawl)
+    rest = list(messages.iter_chats(client, page_size=10, max_items=60, total=60, state=crawl.state.to_dict()))
+    assert [_field(item, "withUser", "id") for item in rest] == [100000 + i for i in range(30, 60)]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_parallel_dedupe_reads_typed_items(api, make_client, mode):
+    api.created = 1
+    crawl = promotions.iter_tracking_links(make_client(response_mode=mode), page_size=20, total=60, workers=3)
+    ids = [_field(item, "id") for item in crawl]
+    assert len(ids) == len(set(ids)) == 60
+
+
+def test_trusted_builds_only_the_top_level_model(make_client):
+    page = messages.list_chats(make_client(response_mode="trusted"), limit=2)
+    assert isinstance(page, models.V2AccessChatsGetResponse)
+    assert page.hasMore is True and page.nextOffset == 2
+    # Nested values are the decoded JSON, untouched
+    assert page.list[0]["withUser"] == {"id": 100000, "_view": "s"}
+    assert page.model_fields_set == {"list", "hasMore", "nextOffset"}
+
+
+def test_trusted_fills_defaults_for_missing_fields(api, make_client):
+    api.routes[CHATS] = lambda request: httpx.Response(200, json={"list": [], "hasMore": False})
+    page = messages.list_chats(make_client(response_mode="trusted"))
+    assert isinstance(page, models.V2AccessChatsGetResponse)
+    assert page.nextOffset is None and page.model_fields_set == {"list", "hasMore"}
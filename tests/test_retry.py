@@ -0,0 +1,137 @@
+"""
+``RetryPolicy`` through the client: statuses, transport errors, method
+allowlist, ``Retry-After`` and the time budget, on both clients.
+"""
+import asyncio
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from onlyfans_sdk import OFAuthError, RetryPolicy
+from onlyfans_sdk.retry import parse_retry_after
+
+PATH = "/v2/access/self"
+
+
+class Script:
+    """Answers with the scripted statuses (or raises the scripted exceptions), then 200s."""
+
+    def __init__(self, *steps, headers=None) -> None:
+        self.steps = list(steps)
+        self.headers = headers or {}
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if not self.steps:
+            return httpx.Response(200, json={"ok": True})
+        step = self.steps.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        return httpx.Response(step, json={"message": f"status {step}"}, headers=self.headers)
+
+
+@pytest.fixture
+def script(api):
+    def install(*steps, headers=None):
+        api.routes[PATH] = handler = Script(*steps, headers=headers)
+        return handler
+
+    return install
+
+
+def _policy(**options):
+    options.setdefault("backoff_factor", 0)
+    return RetryPolicy(**options)
+
+
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+def test_retryable_status_is_retried(make_client, script, status):
+    handler = script(status, status)
+    events = []
+    client = make_client(retry=_policy(), on_request=events.append)
+    assert client.request("GET", PATH) == {"ok": True}
+    assert handler.calls == 3 and events[0].retries == 2 and events[0].status == 200
+
+
+def test_gives_up_after_max_attempts(make_client, script):
+    handler = script(503, 503, 503, 503)
+    with pytest.raises(OFAuthError, match="status 503"):
+        make_client(retry=_policy(max_attempts=3)).request("GET", PATH)
+    assert handler.calls == 3
+
+
+def test_other_statuses_are_not_retried(make_client, script):
+    handler = script(400)
+    with pytest.raises(OFAuthError):
+        make_client(retry=_policy()).request("GET", PATH)
+    assert handler.calls == 1
+
+
+def test_non_idempotent_methods_are_not_retried(make_client, script):
+    handler = script(503)
+    with pytest.raises(OFAuthError):
+        make_client(retry=_policy()).request("POST", PATH, body={})
+    assert handler.calls == 1
+    handler = script(503)
+    make_client(retry=_policy(allowed_methods={"GET", "POST"})).request("POST", PATH, body={})
+    assert handler.calls == 2
+
+
+def test_read_errors_follow_the_method_allowlist(make_client, script):
+    handler = script(httpx.ReadError("reset"))
+    assert make_client(retry=_policy()).request("GET", PATH) == {"ok": True}
+    assert handler.calls == 2
+    handler = script(httpx.ReadError("reset"))
+    with pytest.raises(httpx.ReadError):
+        make_client(retry=_policy()).request("POST", PATH, body={})
+    assert handler.calls == 1
+
+
+def test_connect_errors_are_retried_for_every_method(make_client, script):
+    handler = script(httpx.ConnectError("refused"))
+    make_client(retry=_policy()).request("POST", PATH, body={})
+    assert handler.calls == 2
+
+
+def test_retry_after_is_respected(make_client, script):
+    handler = script(429, headers={"retry-after": "0.2"})
+    started = time.monotonic()
+    make_client(retry=_policy()).request("GET", PATH)
+    assert time.monotonic() - started >= 0.2 and handler.calls == 2
+
+
+def test_retry_after_past_the_budget_returns_at_once(make_client, script):
+    handler = script(429, headers={"retry-after": "120"})
+    started = time.monotonic()
+    with pytest.raises(OFAuthError):
+        make_client(retry=_policy(max_elapsed=60)).request("GET", PATH)
+    assert time.monotonic() - started < 1 and handler.calls == 1
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1, 2, 3, 3]
+    jittered = RetryPolicy(backoff_factor=1)
+    assert all(0 <= jittered.backoff(3) <= 4 for _ in range(50))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None and parse_retry_after("soon") is None
+    assert 50 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+
+
+def test_async_retries(make_async_client, script):
+    handler = script(503, httpx.ConnectError("refused"))
+    events = []
+
+    async def run():
+        async with make_async_client(retry=_policy(), on_request=events.append) as client:
+            return await client.request("GET", PATH)
+
+    assert asyncio.run(run()) == {"ok": True}
+    assert handler.calls == 3 and events[0].retries == 2
@@ -0,0 +1,266 @@
+"""
+``upload_media``: inputs, streaming, parallel parts and failures, on both clients.
+"""
+import asyncio
+import io
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import httpx
+import pytest
+
+from onlyfans_sdk import AsyncOFAuthClient, OFAuthClient, OFAuthError
+
+PART = 64 * 1024
+
+
+class UploadServer:
+    """
+    Fake upload endpoints: init answers with ``part_size`` parts (one part
+    when the file fits), PUTs are stored by part number (only their sizes
+    with ``keep=False``), complete returns the reassembled size.
+    """
+
+    def __init__(self, part_size: int = PART, fail_part: int = 0, delay: float = 0.0, keep: bool = True) -> None:
+        self.part_size = part_size
+        self.keep = keep
+        self.fail_part = fail_part
+        self.delay = delay
+        self.filesize = None
+        self.parts = {}
+        self.single = None
+        self.completed = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/init"):
+            self.filesize = json.loads(request.content)["filesize"]
+            total_parts = max(1, -(-self.filesize // self.part_size))
+            headers = {
+                "x-ofauth-upload-total-parts": str(total_parts),
+                "x-ofauth-upload-part-size": str(self.part_size),
+            }
+            return httpx.Response(200, json={"mediaUploadId": "upl_1"}, headers=headers)
+        if path.endswith("/complete"):
+            self.completed = True
+            return httpx.Response(200, json={"mediaId": 42, "size": self.size()})
+        if "/parts/" not in path:
+            self.single = request.content
+            return httpx.Response(200, json={"mediaId": 42, "size": len(request.content)})
+        number = int(path.rsplit("/", 1)[1])
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if number == self.fail_part:
+                return httpx.Response(400, json={"message": f"part {number} rejected"})
+            self.parts[number] = request.content if self.keep else len(request.content)
+            return httpx.Response(200, json={})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def size(self) -> int:
+        if self.single is not None:
+            return len(self.single)
+        return sum(part if isinstance(part, int) else len(part) for part in self.parts.values())
+
+    def body(self) -> bytes:
+        if self.single is not None:
+            return self.single
+        return b"".join(self.parts[n] for n in sorted(self.parts))
+
+
+def _client(server: UploadServer) -> OFAuthClient:
+    return OFAuthClient(api_key="test-key", transport=httpx.MockTransport(server))
+
+
+def _upload(client, file, **options):
+    return client.upload_media("conn_1", "video.mp4", file, "video/mp4", **options)
+
+
+DATA = os.urandom(5 * PART + 123)
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(DATA)
+    return path
+
+
+# ============================================================================
+# Inputs
+# ============================================================================
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_bytes_like_inputs(wrap):
+    server = UploadServer()
+    assert _upload(_client(server), wrap(DATA)) == {"mediaId": 42, "size": len(DATA)}
+    assert server.filesize == len(DATA) and server.body() == DATA
+    assert len(server.parts) == 6
+
+
+def test_memoryview_slice_sends_only_the_slice():
+    data = b"header|payload!|trailer"
+    for size in (4, 1024):
+        server = UploadServer(part_size=size)
+        _upload(_client(server), memoryview(data)[7:15])
+        assert server.filesize == 8
+        assert server.body() == b"payload!"
+
+
+def test_path_input(video):
+    server = UploadServer()
+    _upload(_client(server), str(video))
+    assert server.body() == DATA
+    server = UploadServer()
+    _upload(_client(server), video)
+    assert server.body() == DATA
+
+
+def test_file_object_is_read_from_its_position_and_left_open(video):
+    server = UploadServer()
+    with open(video, "rb") as f:
+        f.seek(100)
+        _upload(_client(server), f)
+        assert not f.closed
+    assert server.filesize == len(DATA) - 100 and server.body() == DATA[100:]
+
+
+def test_non_seekable_stream_is_read_whole():
+    class Pipe(io.RawIOBase):
+        def __init__(self):
+            self._buffer = io.BytesIO(DATA)
+
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            return self._buffer.readinto(b)
+
+    server = UploadServer()
+    _upload(_client(server), io.BufferedReader(Pipe()))
+    assert server.body() == DATA
+
+
+def test_file_truncated_during_upload_raises(video):
+    server = UploadServer()
+
+    def shrink(uploaded, total):
+        if uploaded == PART:
+            os.truncate(video, 2 * PART)
+
+    with pytest.raises(ValueError, match="ended early"):
+        _upload(_client(server), video, on_progress=shrink)
+    assert not server.completed
+
+
+def test_streamed_upload_memory_does_not_grow_with_file_size(tmp_path):
+    path = tmp_path / "big.mp4"
+    with open(path, "wb") as f:
+        for _ in range(64):
+            f.write(os.urandom(PART))
+    server = UploadServer(keep=False)
+    client = _client(server)
+    tracemalloc.start()
+    try:
+        _upload(client, path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert server.size() == 64 * PART
+    # About one part in flight, whatever the file size
+    assert peak < 4 * PART
+
+
+# ============================================================================
+# Progress and parallel parts
+# ============================================================================
+
+
+def test_progress_reports_running_total():
+    calls = []
+    _upload(_client(UploadServer()), DATA, on_progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(min(n * PART, len(DATA)), len(DATA)) for n in range(1, 7)]
+
+
+def test_single_part_progress():
+    calls = []
+    _upload(_client(UploadServer(part_size=len(DATA))), DATA, on_progress=lambda *args: calls.append(args))
+    assert calls == [(len(DATA), len(DATA))]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_parts_are_bounded(video, workers):
+    server = UploadServer(delay=0.02)
+    calls = []
+    _upload(
+        _client(server),
+        video,
+        workers=workers,
+        on_progress=lambda done, total: calls.append((done, threading.current_thread())),
+    )
+    assert server.body() == DATA and server.completed
+    assert server.max_in_flight == workers
+    assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+    assert calls[-1][0] == len(DATA) and len(calls) == 6
+    assert all(thread is threading.current_thread() for _, thread in calls)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_failed_part_skips_complete(video, workers):
+    server = UploadServer(fail_part=3)
+    with pytest.raises(OFAuthError, match="part 3 rejected"):
+        _upload(_client(server), video, workers=workers)
+    assert not server.completed
+    assert server.in_flight == 0
+
+
+def test_workers_must_be_positive():
+    with pytest.raises(ValueError, match="workers"):
+        _upload(_client(UploadServer()), DATA, workers=0)
+
+
+# ============================================================================
+# Async client
+# ============================================================================
+
+
+def _aupload(server, file, **options):
+    async def run():
+        async with AsyncOFAuthClient(api_key="test-key", transport=httpx.MockTransport(server)) as client:
+            return await client.upload_media("conn_1", "video.mp4", file, "video/mp4", **options)
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_async_upload(video, workers):
+    server = UploadServer(delay=0.01)
+    calls = []
+    result = _aupload(server, video, workers=workers, on_progress=lambda done, total: calls.append(done))
+    assert result == {"mediaId": 42, "size": len(DATA)}
+    assert server.body() == DATA and server.max_in_flight <= workers
+    assert calls == sorted(calls) and calls[-1] == len(DATA)
+
+
+def test_async_memoryview_slice():
+    server = UploadServer()
+    _aupload(server, memoryview(b"header|payload!|trailer")[7:15])
+    assert server.filesize == 8 and server.body() == b"payload!"
+
+
+def test_async_failed_part_skips_complete(video):
+    server = UploadServer(fail_part=2)
+    with pytest.raises(OFAuthError, match="part 2 rejected"):
+        _aupload(server, video, workers=3)
+    assert not server.completed
@@ -0,0 +1,46 @@
+"""
+Lazy model views (``response_mode="lazy"``).
+"""
+import pytest
+from pydantic import ValidationError
+
+from conftest import transaction
+from onlyfans_sdk import models
+from onlyfans_sdk.views import ModelView, view
+
+
+def test_fields_are_validated_on_first_read():
+    tx = view("ListItem4", transaction(1))
+    assert isinstance(tx, ModelView)
+    assert tx.amounts.net == 10.0
+    assert tx.to_model() == models.ListItem4.model_validate(transaction(1))
+
+
+def test_invalid_field_raises_only_when_read():
+    data = dict(transaction(1), amounts="not an object")
+    tx = view("ListItem4", data)
+    assert tx.id == "tx_00000001"
+    with pytest.raises(ValidationError):
+        tx.amounts
+
+
+def test_missing_required_field_raises():
+    data = transaction(1)
+    del data["currency"]
+    with pytest.raises(ValidationError, match="currency"):
+        view("ListItem4", data).currency
+
+
+def test_views_are_read_only():
+    tx = view("ListItem4", transaction(1))
+    with pytest.raises(AttributeError):
+        tx.id = "other"
+
+
+def test_default_factory_is_fresh_per_view():
+    first = view(models.ReleaseForms, {})
+    second = view(models.ReleaseForms, {})
+    assert first.users == [] and second.users == []
+    first.users.append("someone")
+    assert second.users == []
+    assert view(models.ReleaseForms, {}).partners is not view(models.ReleaseForms, {}).partners